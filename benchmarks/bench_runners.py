@@ -0,0 +1,201 @@
+"""
+Benchmark the service runners against the in-memory dtlpy stand-in.
+
+Reports executions/sec, platform API calls per item and p50/p99 execution latency for each node and dataset size.
+
+    python -m benchmarks.bench_runners --sizes 1000 10000 100000 1000000 --latency 0.002
+    python -m benchmarks.bench_runners --nodes data_split --latency 0.02 --concurrency 32
+"""
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import fake_dtlpy  # noqa: E402
+
+DATA_SPLIT_CONFIG = {
+    'name': 'Data Split',
+    'distributeEqually': False,
+    'groups': [
+        {'name': 'train', 'distribution': 80},
+        {'name': 'validation', 'distribution': 10},
+        {'name': 'test', 'distribution': 10},
+    ],
+    'itemMetadata': True,
+}
+
+
+def _percentile(values: list, percentile: float) -> float:
+    if len(values) == 0:
+        return float('nan')
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percentile / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _report(node: str, size: int, n_items: int, latencies: list, total_time: float, backend) -> dict:
+    n_executions = len(latencies)
+    total_calls = backend.total_calls()
+    return {
+        'node': node,
+        'size': size,
+        'executions': n_executions,
+        'executions_per_sec': n_executions / total_time if total_time > 0 else float('inf'),
+        'items_per_sec': n_items / total_time if total_time > 0 else float('inf'),
+        'calls_per_item': total_calls / max(n_items, 1),
+        'calls_per_execution': total_calls / max(n_executions, 1),
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+        'calls': dict(backend.calls),
+    }
+
+
+def _timed(func, **kwargs):
+    tic = time.perf_counter()
+    result = func(**kwargs)
+    return result, time.perf_counter() - tic
+
+
+def _split_setup(size: int, latency: float, seed: int):
+    backend = fake_dtlpy.install(latency=latency)
+    dataset = backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    items = backend.populate_items(dataset=dataset, n_items=size, seed=seed)
+    pipeline = backend.create_pipeline(node_id='data-split-node',
+                                       node_metadata={'customNodeConfig': json.loads(json.dumps(DATA_SPLIT_CONFIG))})
+    backend.reset_calls()
+    return backend, dataset, items, pipeline
+
+
+def bench_data_split(size: int, latency: float, max_executions: int, concurrency: int = 1, seed: int = 0) -> dict:
+    from concurrent.futures import ThreadPoolExecutor
+    from modules.data_split import DataSplitter
+    backend, dataset, items, pipeline = _split_setup(size=size, latency=latency, seed=seed)
+    items = items[:max_executions]
+
+    def _execution(item):
+        context = fake_dtlpy.Context(pipeline=pipeline, node_id='data-split-node')
+        return _timed(DataSplitter.data_split, item=item, progress=fake_dtlpy.Progress(), context=context)[1]
+
+    # the service runtime runs up to `concurrency` executions at once, each on its own thread
+    tic = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as runner:
+        latencies = list(runner.map(_execution, items))
+    total_time = time.perf_counter() - tic
+    return _report('data_split', size, len(items), latencies, total_time, backend)
+
+
+def bench_split_filter(size: int, latency: float, seed: int = 0) -> dict:
+    from modules.data_split import DataSplitter
+    backend, dataset, items, pipeline = _split_setup(size=size, latency=latency, seed=seed)
+    context = fake_dtlpy.Context(pipeline=pipeline, node_id='data-split-node')
+    tic = time.perf_counter()
+    _, elapsed = _timed(DataSplitter.split_filter, dataset=dataset, query={'filter': {'hidden': False}},
+                        context=context)
+    total_time = time.perf_counter() - tic
+    return _report('split_filter', size, len(items), [elapsed], total_time, backend)
+
+
+def bench_create_new_model(size: int, latency: float, max_executions: int, seed: int = 0) -> dict:
+    from modules.create_new_model import ModelCreator
+    backend = fake_dtlpy.install(latency=latency)
+    dataset = backend.create_dataset()
+    backend.populate_items(dataset=dataset, n_items=min(size, 1000), seed=seed)
+    base_model = backend.create_model(project=dataset.project, dataset=dataset, name='base',
+                                      configuration={'epochs': 10})
+    pipeline = backend.create_pipeline(node_id='create-model-node',
+                                       node_metadata={'customNodeConfig': {'modelName': 'base_{dataset.name}'}})
+    n_executions = min(max_executions, 200)
+    backend.reset_calls()
+    latencies = list()
+    tic = time.perf_counter()
+    for _ in range(n_executions):
+        context = fake_dtlpy.Context(pipeline=pipeline, node_id='create-model-node')
+        _, elapsed = _timed(ModelCreator.create_new_model,
+                            base_model=base_model,
+                            dataset=dataset,
+                            train_subset={'filter': {'metadata.system.tags.train': True}},
+                            validation_subset={'filter': {'metadata.system.tags.validation': True}},
+                            model_configuration=dict(),
+                            context=context)
+        latencies.append(elapsed)
+    total_time = time.perf_counter() - tic
+    return _report('create_new_model', size, n_executions, latencies, total_time, backend)
+
+
+def bench_compare_models(size: int, latency: float, max_executions: int, seed: int = 0) -> dict:
+    from modules.model_compare import ModelComparer
+    backend = fake_dtlpy.install(latency=latency)
+    dataset = backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    previous_model = backend.create_model(project=dataset.project, dataset=dataset, name='previous')
+    new_model = backend.create_model(project=dataset.project, dataset=dataset, name='new')
+    backend.add_model_scores(dataset=dataset, model=previous_model, n_rows=size, seed=seed)
+    backend.add_model_scores(dataset=dataset, model=new_model, n_rows=size, seed=seed + 1)
+    pipeline = backend.create_pipeline(node_id='compare-node', node_metadata={'customNodeConfig': dict()})
+    n_executions = min(max_executions, 20)
+    backend.reset_calls()
+    latencies = list()
+    tic = time.perf_counter()
+    for _ in range(n_executions):
+        context = fake_dtlpy.Context(pipeline=pipeline, node_id='compare-node')
+        _, elapsed = _timed(ModelComparer.compare_models,
+                            previous_model=previous_model,
+                            new_model=new_model,
+                            progress=fake_dtlpy.Progress(),
+                            context=context,
+                            compare_config={'precision_recall': {'iou_threshold': 0.5, 'min_delta': 0}},
+                            dataset=dataset)
+        latencies.append(elapsed)
+    total_time = time.perf_counter() - tic
+    return _report('compare_models', size, n_executions, latencies, total_time, backend)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='dataset sizes (items, or score rows for compare_models)')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds injected on every platform request')
+    parser.add_argument('--max-executions', type=int, default=5000,
+                        help='maximum number of per-item executions measured for each size')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='executions of data_split running at once (the service runtime concurrency)')
+    parser.add_argument('--nodes', nargs='+',
+                        default=['data_split', 'split_filter', 'create_new_model', 'compare_models'])
+    parser.add_argument('--json', type=str, default=None, help='optional path to write the results as JSON')
+    args = parser.parse_args(argv)
+
+    # the runners must import the stand-in, not the real SDK
+    fake_dtlpy.install(latency=args.latency)
+
+    # keep the runners quiet, their per-execution logs would dominate the timing
+    logging.disable(logging.INFO)
+
+    benches = {
+        'data_split': lambda size: bench_data_split(size, args.latency, args.max_executions, args.concurrency),
+        'split_filter': lambda size: bench_split_filter(size, args.latency),
+        'create_new_model': lambda size: bench_create_new_model(size, args.latency, args.max_executions),
+        'compare_models': lambda size: bench_compare_models(size, args.latency, args.max_executions),
+    }
+    results = list()
+    header = f"{'node':<18}{'size':>10}{'execs':>8}{'execs/s':>12}{'items/s':>12}{'calls/item':>12}" \
+             f"{'p50 ms':>10}{'p99 ms':>10}"
+    print(header)
+    print('-' * len(header))
+    for node in args.nodes:
+        for size in args.sizes:
+            result = benches[node](size)
+            results.append(result)
+            print(f"{result['node']:<18}{result['size']:>10}{result['executions']:>8}"
+                  f"{result['executions_per_sec']:>12.1f}{result['items_per_sec']:>12.1f}"
+                  f"{result['calls_per_item']:>12.3f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}")
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
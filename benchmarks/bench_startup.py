@@ -0,0 +1,145 @@
+"""
+Benchmark the cold start of the service runners.
+
+Every measure runs in a fresh interpreter, as on a new pod:
+- import: import time of each runner module with the installed SDK, the time of `import dtlpy` itself is
+  reported apart since every service pays it
+- first execution: import of the runner module and its first execution against the in-memory dtlpy stand-in
+
+    python -m benchmarks.bench_startup --repeat 5
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODULES = {
+    'data_split': 'modules.data_split',
+    'create_new_model': 'modules.create_new_model',
+    'model_compare': 'modules.model_compare',
+}
+# first executions, one per node (and per comparison mode)
+EXECUTIONS = ['data_split', 'create_new_model', 'compare_training', 'compare_evaluation']
+
+
+def _child_import(node: str) -> dict:
+    import importlib
+    tic = time.perf_counter()
+    import dtlpy  # noqa: F401
+    sdk = time.perf_counter() - tic
+    tic = time.perf_counter()
+    importlib.import_module(MODULES[node])
+    return {'sdk_s': sdk, 'module_s': time.perf_counter() - tic}
+
+
+def _child_first_execution(execution: str) -> dict:
+    import logging
+    # the real SDK loads numpy and pandas on import, preload them so the stand-in only measures the runner
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    from benchmarks import fake_dtlpy
+    logging.disable(logging.INFO)
+    backend = fake_dtlpy.install()
+    dataset = backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    items = backend.populate_items(dataset=dataset, n_items=100)
+    progress = fake_dtlpy.Progress()
+
+    if execution == 'data_split':
+        pipeline = backend.create_pipeline(node_id='node', node_metadata={'customNodeConfig': {
+            'groups': [{'name': 'train', 'distribution': 80}, {'name': 'validation', 'distribution': 20}]}})
+        context = fake_dtlpy.Context(pipeline=pipeline, node_id='node')
+        tic = time.perf_counter()
+        from modules.data_split import DataSplitter
+        DataSplitter.data_split(item=items[0], progress=progress, context=context)
+    elif execution == 'create_new_model':
+        base_model = backend.create_model(project=dataset.project, dataset=dataset, name='base')
+        pipeline = backend.create_pipeline(node_id='node', node_metadata={
+            'customNodeConfig': {'modelName': '{base_model.name}_{dataset.name}'}})
+        context = fake_dtlpy.Context(pipeline=pipeline, node_id='node')
+        tic = time.perf_counter()
+        from modules.create_new_model import ModelCreator
+        ModelCreator.create_new_model(base_model=base_model,
+                                      dataset=dataset,
+                                      train_subset={'filter': {'metadata.system.tags.train': True}},
+                                      validation_subset={'filter': {'metadata.system.tags.validation': True}},
+                                      model_configuration=dict(),
+                                      context=context)
+    else:
+        previous_model = backend.create_model(project=dataset.project, dataset=dataset, name='previous')
+        new_model = backend.create_model(project=dataset.project, dataset=dataset, name='new')
+        pipeline = backend.create_pipeline(node_id='node', node_metadata={'customNodeConfig': dict()})
+        context = fake_dtlpy.Context(pipeline=pipeline, node_id='node')
+        if execution == 'compare_training':
+            for i_model, model in enumerate([previous_model, new_model]):
+                backend.add_model_metrics(model=model, figures={'loss': ['val']}, seed=i_model)
+            compare_config = {'wins': 'any', 'checks': [{'figure': 'loss', 'legend': 'val', 'maximize': False}]}
+            compare_dataset = None
+        else:
+            for i_model, model in enumerate([previous_model, new_model]):
+                backend.add_model_scores(dataset=dataset, model=model, n_rows=1000, seed=i_model)
+            compare_config = {'precision_recall': {'iou_threshold': 0.5, 'min_delta': 0}}
+            compare_dataset = dataset
+        os.environ['ACTIVE_LEARNING_CACHE_MAX_MB'] = '0'
+        tic = time.perf_counter()
+        from modules.model_compare import ModelComparer
+        ModelComparer.compare_models(previous_model=previous_model,
+                                     new_model=new_model,
+                                     progress=progress,
+                                     context=context,
+                                     compare_config=compare_config,
+                                     dataset=compare_dataset)
+    return {'first_execution_s': time.perf_counter() - tic}
+
+
+def _run_child(mode: str, name: str) -> dict:
+    output = subprocess.run([sys.executable, '-m', 'benchmarks.bench_startup', '--child', mode, name],
+                            cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _median(results: list, key: str) -> float:
+    return statistics.median(result[key] for result in results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3, help='fresh interpreters per measure, the median is reported')
+    parser.add_argument('--json', type=str, default=None, help='optional path to write the results as JSON')
+    parser.add_argument('--child', nargs=2, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child is not None:
+        mode, name = args.child
+        result = _child_import(name) if mode == 'import' else _child_first_execution(name)
+        print(json.dumps(result))
+        return result
+
+    results = list()
+    header = f"{'measure':<14}{'node':<22}{'median ms':>12}{'sdk ms':>10}"
+    print(header)
+    print('-' * len(header))
+    for node in MODULES:
+        runs = [_run_child('import', node) for _ in range(args.repeat)]
+        result = {'measure': 'import', 'node': node,
+                  'median_s': _median(runs, 'module_s'), 'sdk_s': _median(runs, 'sdk_s')}
+        results.append(result)
+        print(f"{'import':<14}{node:<22}{result['median_s'] * 1000:>12.1f}{result['sdk_s'] * 1000:>10.1f}")
+    for execution in EXECUTIONS:
+        runs = [_run_child('first', execution) for _ in range(args.repeat)]
+        result = {'measure': 'first_execution', 'node': execution, 'median_s': _median(runs, 'first_execution_s')}
+        results.append(result)
+        print(f"{'first exec':<14}{execution:<22}{result['median_s'] * 1000:>12.1f}{'':>10}")
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1184 @@
+"""
+In-memory stand-in for the parts of dtlpy (and dtlpymetrics) used by the service runners.
+
+Every method that would send a request to the platform goes through FakeBackend.request(), which counts the call
+by name and sleeps for the injected latency, so runners can be measured without a live Dataloop backend.
+
+Usage:
+    from benchmarks import fake_dtlpy
+    backend = fake_dtlpy.install(latency=0.005)   # before importing the modules
+    from modules.data_split import DataSplitter
+"""
+import sys
+import copy
+import bisect
+import math
+import time
+import types
+import fnmatch
+import threading
+import collections
+from enum import Enum
+
+_MISSING = object()
+_backend = None
+
+
+def _now() -> str:
+    # one clock reading, so the seconds and the milliseconds agree
+    now = time.time()
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now)) + f'.{int(now * 1000) % 1000:03d}Z'
+
+
+########
+# core #
+########
+class ClientApi:
+    """
+    Request entry point of the SDK, the requests are served by the FakeBackend
+    """
+
+    def gen_request(self, req_type, path, data=None, json_req=None, files=None, stream=False, headers=None,
+                    log_error=True, dataset_id=None, **kwargs):
+        return True, None
+
+
+client_api = ClientApi()
+
+
+class FakeBackend:
+    """
+    Holds the fake platform state, counts the requests made to it and injects latency
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = collections.Counter()
+        self.datasets = dict()
+        self.projects = dict()
+        self.models = dict()
+        self.pipelines = dict()
+        self.metrics = collections.defaultdict(list)
+        self.model_scores = dict()
+        self.feature_sets = dict()
+        self._ids = 0
+        self._lock = threading.Lock()
+
+    def new_id(self) -> str:
+        with self._lock:
+            self._ids += 1
+            return f'{self._ids:024x}'
+
+    def request(self, name: str, count: int = 1):
+        """
+        Count a platform request and wait for the injected latency
+
+        :param name: name of the request, e.g. "items.update"
+        :param count: number of requests (e.g. the SDK fans out annotation updates one per annotation)
+        """
+        with self._lock:
+            self.calls[name] += count
+        # the platform requests of the SDK go through client_api.gen_request
+        for _ in range(count):
+            client_api.gen_request(req_type='GET', path=f'/{name}')
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset_calls(self):
+        with self._lock:
+            self.calls.clear()
+
+    ###############
+    # populating #
+    ###############
+    def create_project(self, name: str = 'project'):
+        project = Project(backend=self, id=self.new_id(), name=name)
+        self.projects[project.id] = project
+        return project
+
+    def create_dataset(self, project=None, name: str = 'dataset', labels: list = None):
+        if project is None:
+            project = self.create_project()
+        dataset = Dataset(backend=self, id=self.new_id(), name=name, project=project, labels=labels)
+        self.datasets[dataset.id] = dataset
+        return dataset
+
+    def create_model(self, project, dataset=None, name: str = 'model', configuration: dict = None, metadata=None):
+        model = Model(backend=self,
+                      id=self.new_id(),
+                      name=name,
+                      project=project,
+                      dataset=dataset,
+                      configuration=configuration if configuration is not None else dict(),
+                      metadata=metadata if metadata is not None else dict())
+        self.models[model.id] = model
+        return model
+
+    def create_pipeline(self, node_id: str, node_metadata: dict, variables: list = None):
+        pipeline = Pipeline(id=self.new_id(),
+                            nodes=[PipelineNode(node_id=node_id, metadata=node_metadata)],
+                            variables=variables if variables is not None else list(),
+                            updated_at=time.strftime('%Y-%m-%dT%H:%M:%S.000Z'))
+        self.pipelines[pipeline.id] = pipeline
+        return pipeline
+
+    def populate_items(self, dataset, n_items: int, labels: list = None, annotations_per_item: int = 2,
+                       model_annotation_ratio: float = 0.5, seed: int = 0):
+        """
+        Add items with annotations to a dataset. Part of the annotations carry model metadata.
+
+        :return: list of the new items
+        """
+        import random
+        rng = random.Random(seed)
+        if labels is None:
+            labels = ['cat', 'dog', 'bird']
+        items = list()
+        for i_item in range(n_items):
+            item = dataset._add_item(name=f'item_{i_item}.jpg')
+            n_annotations = rng.randint(0, 2 * annotations_per_item)
+            for _ in range(n_annotations):
+                metadata = {'system': dict(), 'user': dict()}
+                if rng.random() < model_annotation_ratio:
+                    metadata['user']['model'] = {'name': 'model', 'confidence': rng.random()}
+                dataset._add_annotation(item=item, label=rng.choice(labels), metadata=metadata)
+            items.append(item)
+        return items
+
+    def add_model_scores(self, dataset, model, n_rows: int, labels: list = None, seed: int = 0):
+        """
+        Add a synthetic matched-annotations table for a model evaluation on a dataset (dtlpymetrics csv format)
+        """
+        import numpy as np
+        import pandas as pd
+        rng = np.random.default_rng(seed)
+        if labels is None:
+            labels = ['cat', 'dog', 'bird']
+        labels = np.asarray(labels)
+        n_items = max(1, n_rows // 4)
+        is_pair = rng.random(n_rows) < 0.7
+        has_gt = is_pair | (rng.random(n_rows) < 0.5)
+        gt_labels = labels[rng.integers(0, len(labels), n_rows)]
+        pred_labels = np.where(rng.random(n_rows) < 0.9, gt_labels, labels[rng.integers(0, len(labels), n_rows)])
+        scores = pd.DataFrame({
+            'item_id': [f'{i:024x}' for i in rng.integers(0, n_items, n_rows)],
+            'first_id': np.where(has_gt, [f'g{i}' for i in range(n_rows)], None),
+            'first_label': np.where(has_gt, gt_labels, None),
+            'second_id': np.where(is_pair | ~has_gt, [f'p{i}' for i in range(n_rows)], None),
+            'second_label': np.where(is_pair | ~has_gt, pred_labels, None),
+            'second_confidence': rng.random(n_rows),
+            'geometry_score': np.where(is_pair, rng.beta(5, 2, n_rows), 0.0),
+            'annotation_score': np.where(is_pair, rng.beta(5, 2, n_rows), 0.0),
+        })
+        self.model_scores[(dataset.id, model.id)] = scores
+        # dtlpymetrics uploads the table as a hidden "/.modelscores/{model_id}.csv" item (overwritten on re-evaluation)
+        name = f'{model.id}.csv'
+        scores_item = next((item for item in dataset._items.values() if item.name == name), None)
+        if scores_item is None:
+            scores_item = dataset._add_item(name=name)
+            scores_item.filename = f'/.modelscores/{name}'
+            scores_item.hidden = True
+        scores_item.updated_at = _now()
+        return scores
+
+    def add_predictions(self, dataset, model, items: list, labels: list = None, predictions_per_item: int = 1,
+                        seed: int = 0):
+        """
+        Add model predictions (annotations with the model info and a confidence) to items
+        """
+        import random
+        rng = random.Random(seed)
+        if labels is None:
+            labels = [label.tag for label in dataset.labels] or ['cat', 'dog', 'bird']
+        for item in items:
+            for _ in range(predictions_per_item):
+                metadata = {'system': dict(),
+                            'user': {'model': {'name': model.name, 'model_id': model.id, 'confidence': rng.random()}}}
+                dataset._add_annotation(item=item, label=rng.choice(labels), metadata=metadata)
+
+    def add_embeddings(self, dataset, items: list, dim: int = 64, model=None, name: str = 'embeddings',
+                       seed: int = 0):
+        """
+        Add a feature set with a random float vector for each item
+
+        :return: the new FeatureSet
+        """
+        import random
+        rng = random.Random(seed)
+        feature_set = FeatureSet(backend=self,
+                                 id=self.new_id(),
+                                 name=name,
+                                 project=dataset.project,
+                                 model_id=model.id if model is not None else None)
+        for item in items:
+            feature_set._vectors[item.id] = {'id': self.new_id(),
+                                             'entityId': item.id,
+                                             'featureSetId': feature_set.id,
+                                             'value': [rng.gauss(0, 1) for _ in range(dim)]}
+        self.feature_sets[feature_set.id] = feature_set
+        return feature_set
+
+    def add_model_metrics(self, model, figures: dict, n_epochs: int = 100, seed: int = 0):
+        """
+        Add training metric samples to a model
+
+        :param figures: dict of figure name to list of legends
+        """
+        import random
+        rng = random.Random(seed)
+        for figure, legends in figures.items():
+            for legend in legends:
+                for epoch in range(n_epochs):
+                    self.metrics[model.id].append(
+                        {'modelId': model.id, 'figure': figure, 'legend': legend,
+                         'data': {'x': epoch, 'y': rng.random()}})
+
+
+def install(latency: float = 0.0, backend: FakeBackend = None) -> FakeBackend:
+    """
+    Register this module as `dtlpy` (and a minimal `dtlpymetrics`) in sys.modules
+
+    :param latency: seconds to sleep on every platform request, or a callable returning the seconds
+    :param backend: optional existing backend to activate
+    :return: the active FakeBackend
+    """
+    global _backend
+    _backend = backend if backend is not None else FakeBackend(latency=latency)
+    module = sys.modules[__name__]
+    sys.modules['dtlpy'] = module
+    sys.modules['dtlpy.exceptions'] = exceptions
+    metrics_module = types.ModuleType('dtlpymetrics')
+    utils_module = types.ModuleType('dtlpymetrics.utils')
+    matching_module = types.ModuleType('dtlpymetrics.utils.matching')
+    matching_module.measure_annotations = measure_annotations
+    utils_module.matching = matching_module
+    scoring_module = types.ModuleType('dtlpymetrics.scoring')
+    evaluating_module = types.ModuleType('dtlpymetrics.evaluating')
+    scoring_module.calc_precision_recall = calc_precision_recall
+    evaluating_module.get_model_scores_df = get_model_scores_df
+    metrics_module.scoring = scoring_module
+    metrics_module.evaluating = evaluating_module
+    metrics_module.utils = utils_module
+    metrics_module.calc_precision_recall = calc_precision_recall
+    metrics_module.get_model_scores_df = get_model_scores_df
+    sys.modules['dtlpymetrics'] = metrics_module
+    sys.modules['dtlpymetrics.scoring'] = scoring_module
+    sys.modules['dtlpymetrics.evaluating'] = evaluating_module
+    sys.modules['dtlpymetrics.utils'] = utils_module
+    sys.modules['dtlpymetrics.utils.matching'] = matching_module
+    return _backend
+
+
+def get_backend() -> FakeBackend:
+    return _backend
+
+
+##############
+# exceptions #
+##############
+class ExceptionMain(Exception):
+    def __init__(self, status_code='Unknown Status Code', message='Unknown Error Message'):
+        self.status_code = status_code
+        self.message = message
+        super().__init__(status_code, message)
+
+
+class BadRequest(ExceptionMain):
+    pass
+
+
+class NotFound(ExceptionMain):
+    pass
+
+
+class Forbidden(ExceptionMain):
+    pass
+
+
+class InternalServerError(ExceptionMain):
+    pass
+
+
+class UnknownException(ExceptionMain):
+    pass
+
+
+exceptions = types.ModuleType('dtlpy.exceptions')
+exceptions.ExceptionMain = ExceptionMain
+exceptions.PlatformException = ExceptionMain
+exceptions.BadRequest = BadRequest
+exceptions.NotFound = NotFound
+exceptions.Forbidden = Forbidden
+exceptions.InternalServerError = InternalServerError
+exceptions.UnknownException = UnknownException
+
+
+###########
+# filters #
+###########
+class FiltersResource(str, Enum):
+    ITEM = 'items'
+    ANNOTATION = 'annotations'
+    MODEL = 'models'
+    FEATURE = 'feature_vectors'
+    FEATURE_SET = 'feature_sets'
+    METRICS = 'metrics'
+
+
+class FiltersOperations(str, Enum):
+    OR = 'or'
+    AND = 'and'
+    IN = 'in'
+    NOT_EQUAL = 'ne'
+    EQUAL = 'eq'
+    GREATER_THAN = 'gt'
+    LESS_THAN = 'lt'
+    EXISTS = 'exists'
+    NIN = 'nin'
+    GREATER_THAN_OR_EQUAL = 'gte'
+    LESS_THAN_OR_EQUAL = 'lte'
+
+
+class FiltersMethod(str, Enum):
+    OR = 'or'
+    AND = 'and'
+
+
+class FiltersOrderByDirection(str, Enum):
+    DESCENDING = 'descending'
+    ASCENDING = 'ascending'
+
+
+class Filters:
+    def __init__(self, field=None, values=None, operator=None, method=None, custom_filter=None,
+                 resource=FiltersResource.ITEM, use_defaults=True, context=None, page_size=None):
+        self.resource = resource
+        self.custom_filter = custom_filter
+        self.and_filter_list = list()
+        self.or_filter_list = list()
+        self.page = 0
+        self.page_size = page_size if page_size is not None else 1000
+        self.sort = dict()
+        if field is not None:
+            self.add(field=field, values=values, operator=operator, method=method)
+
+    def add(self, field, values, operator=None, method=None):
+        if operator is None or operator == FiltersOperations.EQUAL:
+            condition = {field: values}
+        else:
+            condition = {field: {'$' + str(getattr(operator, 'value', operator)): values}}
+        if method == FiltersMethod.OR:
+            self.or_filter_list.append(condition)
+        else:
+            self.and_filter_list.append(condition)
+
+    def has_field(self, field) -> bool:
+        return any(field in condition for condition in self.and_filter_list + self.or_filter_list)
+
+    def sort_by(self, field, value=FiltersOrderByDirection.ASCENDING):
+        self.sort[field] = getattr(value, 'value', value)
+
+    def prepare(self, operation=None, update=None, query_only=False, system_update=None, system_metadata=False):
+        if self.custom_filter is not None:
+            query = self.custom_filter if 'filter' in self.custom_filter else {'filter': self.custom_filter}
+            return dict(query)
+        query_filter = dict()
+        if len(self.and_filter_list) > 0:
+            query_filter['$and'] = list(self.and_filter_list)
+        if len(self.or_filter_list) > 0:
+            query_filter['$or'] = list(self.or_filter_list)
+        _json = {'filter': query_filter, 'page': self.page, 'pageSize': self.page_size,
+                 'resource': getattr(self.resource, 'value', self.resource)}
+        if len(self.sort) > 0:
+            _json['sort'] = dict(self.sort)
+        if operation == 'update':
+            _json['update'] = {'metadata': dict()}
+            if update:
+                _json['update']['metadata']['user'] = update
+            if system_metadata and system_update:
+                _json['update']['metadata']['system'] = system_update
+        return _json
+
+
+def _get_field(document: dict, field: str):
+    value = document
+    for key in field.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _equals(value, expected) -> bool:
+    if isinstance(expected, str) and '*' in expected and isinstance(value, str):
+        return fnmatch.fnmatchcase(value, expected)
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+
+def _in(value, options) -> bool:
+    if isinstance(value, str):
+        options_set = _as_set(options)
+        if options_set is not None:
+            return value in options_set
+    return any(_equals(value, option) for option in options)
+
+
+_set_cache = dict()
+
+
+def _as_set(options):
+    """
+    Set of a plain string $in list, None when it holds wildcards or other values.
+    The same list is matched against every entity of a query, so the set is built once per list
+    """
+    key = id(options)
+    cached = _set_cache.get(key)
+    if cached is None or cached[0] is not options:
+        if len(_set_cache) > 64:
+            _set_cache.clear()
+        plain = all(isinstance(option, str) and '*' not in option for option in options)
+        cached = (options, frozenset(options) if plain else None)
+        _set_cache[key] = cached
+    return cached[1]
+
+
+def _match_operators(value, conditions: dict) -> bool:
+    for operator, expected in conditions.items():
+        if operator == '$exists':
+            if (value is not _MISSING) != bool(expected):
+                return False
+            continue
+        if value is _MISSING:
+            if operator in ('$ne', '$nin'):
+                continue
+            return False
+        if operator == '$eq' and not _equals(value, expected):
+            return False
+        if operator == '$ne' and _equals(value, expected):
+            return False
+        if operator == '$in' and not _in(value, expected):
+            return False
+        if operator == '$nin' and any(_equals(value, option) for option in expected):
+            return False
+        if operator == '$gt' and not value > expected:
+            return False
+        if operator == '$gte' and not value >= expected:
+            return False
+        if operator == '$lt' and not value < expected:
+            return False
+        if operator == '$lte' and not value <= expected:
+            return False
+    return True
+
+
+def match(document: dict, query: dict) -> bool:
+    """
+    Evaluate a (subset of) DQL filter against an entity json
+    """
+    for key, condition in query.items():
+        if key == '$and':
+            if not all(match(document, sub_query) for sub_query in condition):
+                return False
+        elif key == '$or':
+            if not any(match(document, sub_query) for sub_query in condition):
+                return False
+        else:
+            value = _get_field(document, key)
+            if isinstance(condition, dict) and any(str(k).startswith('$') for k in condition):
+                if not _match_operators(value, condition):
+                    return False
+            elif isinstance(condition, dict):
+                if not isinstance(value, dict) or not match(value, condition):
+                    return False
+            elif value is _MISSING or not _equals(value, condition):
+                return False
+    return True
+
+
+def _in_values(filters, field: str):
+    """
+    Values of a top level "field $in [...]" condition of a query, None when there is none.
+    Lets the repositories look entities up by id instead of scanning the whole dataset
+    """
+    if filters is None:
+        return None
+    query = filters.prepare().get('filter', dict())
+    for condition in [query] + list(query.get('$and', list())):
+        value = condition.get(field)
+        if isinstance(value, dict) and isinstance(value.get('$in'), list):
+            return value['$in']
+    return None
+
+
+def _query(entities: list, filters, to_json=lambda entity: entity.to_json()) -> list:
+    prepared = filters.prepare() if filters is not None else {'filter': dict()}
+    query = prepared.get('filter', dict())
+    selected = [entity for entity in entities if match(to_json(entity), query)]
+    for field, direction in reversed(list(prepared.get('sort', dict()).items())):
+        selected.sort(key=lambda entity: _get_field(to_json(entity), field),
+                      reverse=getattr(direction, 'value', direction) == 'descending')
+    return selected
+
+
+class PagedEntities:
+    """
+    Pages over a query result. The first page is fetched by the list() call, every other page is a request.
+    """
+
+    def __init__(self, entities: list, page_size: int = 1000, page_offset: int = 0, request_name: str = None):
+        self._entities = entities
+        self._request_name = request_name
+        self.page_size = page_size
+        self.page_offset = page_offset
+        self.items_count = len(entities)
+        self.total_pages_count = max(1, math.ceil(len(entities) / page_size)) if page_size else 1
+        self.items = self._page(page_offset)
+
+    def _page(self, page_offset: int) -> list:
+        start = page_offset * self.page_size
+        return self._entities[start:start + self.page_size]
+
+    def __len__(self):
+        return self.items_count
+
+    def __iter__(self):
+        for page_offset in range(self.page_offset, self.total_pages_count):
+            if page_offset != self.page_offset and self._request_name is not None:
+                _backend.request(self._request_name)
+            page = self._page(page_offset)
+            if len(page) == 0:
+                break
+            yield page
+
+    def all(self):
+        for page in self:
+            for entity in page:
+                yield entity
+
+    def to_df(self):
+        import pandas as pd
+        return pd.DataFrame([entity.to_json() for entity in self.all()])
+
+
+############
+# entities #
+############
+class BaseServiceRunner:
+    pass
+
+
+class Progress:
+    def __init__(self):
+        self.actions = list()
+
+    def update(self, status=None, progress=None, message=None, output=None, duration=None, action=None):
+        if action is not None:
+            self.actions.append(action)
+
+
+class PipelineNode:
+    def __init__(self, node_id: str, metadata: dict):
+        self.node_id = node_id
+        self.metadata = metadata
+
+
+class Pipeline:
+    def __init__(self, id, nodes, variables, updated_at):
+        self.id = id
+        self.nodes = nodes
+        self.variables = variables
+        self.updated_at = updated_at
+
+
+class Context:
+    """
+    Execution context, the pipeline is fetched from the platform the first time the node is needed
+    """
+
+    def __init__(self, pipeline: Pipeline = None, node_id: str = None):
+        self.pipeline_id = pipeline.id if pipeline is not None else None
+        self.node_id = node_id
+        self._pipeline_entity = pipeline
+        self._pipeline = None
+        self._node = None
+
+    @property
+    def pipeline(self):
+        if self._pipeline is None and self._pipeline_entity is not None:
+            _backend.request('pipelines.get')
+            self._pipeline = self._pipeline_entity
+        return self._pipeline
+
+    @property
+    def node(self):
+        if self._node is None and self.pipeline is not None:
+            self._node = [node for node in self.pipeline.nodes if node.node_id == self.node_id][0]
+        return self._node
+
+
+class Project:
+    def __init__(self, backend: FakeBackend, id: str, name: str):
+        self._backend = backend
+        self.id = id
+        self.name = name
+        self.models = Models(backend=backend, project=self)
+        self.feature_sets = FeatureSets(backend=backend, project=self)
+
+
+class Annotation:
+    def __init__(self, backend: FakeBackend, id: str, item, label: str, metadata: dict, type='box'):
+        self._backend = backend
+        self.id = id
+        self.item = item
+        self.item_id = item.id
+        self.label = label
+        self.metadata = metadata
+        self.type = type
+        self.updated_at = _now()
+
+    def to_json(self) -> dict:
+        return {'id': self.id, 'itemId': self.item_id, 'label': self.label, 'type': self.type,
+                'metadata': self.metadata, 'updatedAt': self.updated_at}
+
+    @classmethod
+    def from_json(cls, _json: dict, item=None, **kwargs):
+        annotation = cls(backend=_backend, id=_json['id'], item=item, label=_json['label'],
+                         metadata=_json.get('metadata') or dict(), type=_json.get('type', 'box'))
+        annotation.updated_at = _json.get('updatedAt', annotation.updated_at)
+        return annotation
+
+    def update(self, system_metadata=False):
+        self._backend.request('annotations.update')
+        # as on the platform, editing an annotation updates the annotation and not its item
+        self.updated_at = _now()
+        return self
+
+
+class AnnotationCollection(list):
+    def __init__(self, annotations, item=None):
+        super().__init__(annotations)
+        self.item = item
+
+
+class Annotations:
+    def __init__(self, backend: FakeBackend, dataset, item=None):
+        self._backend = backend
+        self._dataset = dataset
+        self._item = item
+
+    def _candidates(self, filters: Filters = None) -> list:
+        if self._item is not None:
+            return list(self._item._annotations)
+        item_ids = _in_values(filters, 'itemId')
+        if item_ids is not None:
+            items = [self._dataset._items[item_id] for item_id in item_ids if item_id in self._dataset._items]
+        else:
+            items = self._dataset._items.values()
+        return [annotation for item in items for annotation in item._annotations]
+
+    def list(self, filters: Filters = None, page_offset: int = None, page_size: int = None):
+        self._backend.request('annotations.list')
+        candidates = self._candidates(filters)
+        selected = _query(candidates, filters) if filters is not None else candidates
+        if self._item is not None:
+            return AnnotationCollection(annotations=selected, item=self._item)
+        page_size = page_size or (filters.page_size if filters is not None else 1000)
+        return PagedEntities(selected, page_size=page_size, request_name='annotations.list')
+
+    def _list(self, filters: Filters):
+        """
+        Raw query of one page of annotations, as the platform response JSON
+        """
+        self._backend.request('annotations.list')
+        selected = _query(self._candidates(filters), filters)
+        page, page_size = filters.page, filters.page_size
+        return {'items': [annotation.to_json() for annotation in selected[page * page_size:(page + 1) * page_size]],
+                'totalItemsCount': len(selected),
+                'totalPagesCount': math.ceil(len(selected) / page_size),
+                'hasNextPage': (page + 1) * page_size < len(selected)}
+
+    def update(self, annotations, system_metadata=False):
+        if not isinstance(annotations, list):
+            annotations = [annotations]
+        # the SDK sends one request per annotation over its own thread pool
+        self._backend.request('annotations.update', count=len(annotations))
+        return annotations
+
+
+class Item:
+    def __init__(self, backend: FakeBackend, id: str, name: str, dataset, metadata: dict = None):
+        self._backend = backend
+        self.id = id
+        self.name = name
+        self.filename = f'/{name}'
+        self.dataset = dataset
+        self.dataset_id = dataset.id
+        self.metadata = metadata if metadata is not None else {'system': dict()}
+        self.hidden = False
+        self.type = 'file'
+        self.updated_at = time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        self._annotations = list()
+        self.annotations = Annotations(backend=backend, dataset=dataset, item=self)
+
+    @property
+    def annotated(self) -> bool:
+        return len(self._annotations) > 0
+
+    @property
+    def annotations_count(self) -> int:
+        return len(self._annotations)
+
+    def to_json(self) -> dict:
+        return {'id': self.id, 'name': self.name, 'filename': self.filename, 'hidden': self.hidden,
+                'type': self.type, 'metadata': self.metadata, 'annotated': self.annotated,
+                'annotationsCount': self.annotations_count, 'updatedAt': self.updated_at,
+                'datasetId': self.dataset_id}
+
+    def update(self, system_metadata=False):
+        self._backend.request('items.update')
+        self.updated_at = time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        return self
+
+    def download(self, local_path: str = None, to_items_folder: bool = True, overwrite: bool = False, **kwargs):
+        import os
+        self._backend.request('items.download')
+        directory = os.path.join(local_path, 'items') if to_items_folder else local_path
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, self.name)
+        with open(path, 'wb') as f:
+            f.write(self._bytes)
+        return path
+
+
+class Items:
+    def __init__(self, backend: FakeBackend, dataset):
+        self._backend = backend
+        self._dataset = dataset
+
+    def list(self, filters: Filters = None, page_offset: int = None, page_size: int = None):
+        self._backend.request('items.list')
+        prepared = filters.prepare() if filters is not None else dict()
+        page_size = page_size or prepared.get('pageSize', 1000)
+        page_offset = page_offset if page_offset is not None else prepared.get('page', 0)
+        candidates = list(self._dataset._items.values())
+        keyset = self._keyset(prepared)
+        if keyset is not None and page_offset == 0:
+            # keyset pages (sorted by id, "id > last id") only need the next page of matches.
+            # items are created with increasing ids, so the candidates are already sorted
+            start = bisect.bisect_right([item.id for item in candidates], keyset) if keyset else 0
+            query = prepared.get('filter', dict())
+            selected = list()
+            for item in candidates[start:]:
+                if match(item.to_json(), query):
+                    selected.append(item)
+                    if len(selected) == page_size:
+                        break
+            return PagedEntities(selected, page_size=page_size, request_name='items.list')
+        selected = _query(candidates, filters) if filters is not None else candidates
+        return PagedEntities(selected, page_size=page_size, page_offset=page_offset, request_name='items.list')
+
+    @staticmethod
+    def _keyset(prepared: dict):
+        """
+        Return the last seen id of a keyset query ('' for its first page), or None for any other query
+        """
+        if prepared.get('sort') != {'id': 'ascending'}:
+            return None
+        for condition in prepared.get('filter', dict()).get('$and', list()):
+            if isinstance(condition.get('id'), dict) and '$gt' in condition['id']:
+                return condition['id']['$gt']
+        return ''
+
+    def get(self, item_id: str = None, filepath: str = None):
+        self._backend.request('items.get')
+        if item_id is None:
+            item = next((item for item in self._dataset._items.values() if item.filename == filepath), None)
+            if item is None:
+                raise NotFound('404', f'Item not found: {filepath}')
+            return item
+        return self._dataset._items[item_id]
+
+    def update(self, item=None, filters: Filters = None, update_values=None, system_update_values=None,
+               system_metadata=False):
+        self._backend.request('items.update')
+        if item is not None:
+            return item
+        item_ids = _in_values(filters, 'id')
+        if item_ids is not None:
+            candidates = [self._dataset._items[item_id] for item_id in item_ids if item_id in self._dataset._items]
+        else:
+            candidates = list(self._dataset._items.values())
+        for selected in _query(candidates, filters):
+            if update_values:
+                selected.metadata.setdefault('user', dict()).update(copy.deepcopy(update_values))
+            if system_metadata and system_update_values:
+                system = selected.metadata.setdefault('system', dict())
+                for key, value in copy.deepcopy(system_update_values).items():
+                    if isinstance(value, dict) and isinstance(system.get(key), dict):
+                        system[key].update(value)
+                    else:
+                        system[key] = value
+        return True
+
+    def upload(self, local_path: str = None, remote_path: str = None, remote_name: str = None, overwrite=False,
+               item_metadata: dict = None):
+        import os
+        self._backend.request('items.upload')
+        name = remote_name or os.path.basename(local_path)
+        filename = f'{(remote_path or "").rstrip("/")}/{name}'
+        item = next((item for item in self._dataset._items.values() if item.filename == filename), None)
+        if item is None or overwrite is False:
+            item = self._dataset._add_item(name=name, metadata=item_metadata)
+        elif item_metadata is not None:
+            item.metadata = copy.deepcopy(item_metadata)
+        item.filename = filename
+        item.hidden = item.filename.startswith('/.')
+        item.updated_at = _now()
+        item._local_path = local_path
+        # keep a copy, uploaded files are usually removed right after the upload
+        with open(local_path, 'rb') as f:
+            item._bytes = f.read()
+        return item
+
+
+class Dataset:
+    def __init__(self, backend: FakeBackend, id: str, name: str, project: Project, labels: list = None):
+        self._backend = backend
+        self.id = id
+        self.name = name
+        self.project = project
+        self.metadata = {'system': dict()}
+        self.labels = [types.SimpleNamespace(tag=label) for label in (labels or list())]
+        self._items = dict()
+        self.items = Items(backend=backend, dataset=self)
+        self.annotations = Annotations(backend=backend, dataset=self)
+
+    def _add_item(self, name: str, metadata: dict = None):
+        item = Item(backend=self._backend, id=self._backend.new_id(), name=name, dataset=self, metadata=metadata)
+        self._items[item.id] = item
+        return item
+
+    def _add_annotation(self, item, label: str, metadata: dict = None):
+        annotation = Annotation(backend=self._backend, id=self._backend.new_id(), item=item, label=label,
+                                metadata=metadata if metadata is not None else {'system': dict(), 'user': dict()})
+        item._annotations.append(annotation)
+        return annotation
+
+    def update(self, system_metadata=False):
+        self._backend.request('datasets.update')
+        return self
+
+
+class Datasets:
+    def get(self, dataset_name: str = None, dataset_id: str = None):
+        _backend.request('datasets.get')
+        if dataset_id is not None:
+            return _backend.datasets[dataset_id]
+        return [dataset for dataset in _backend.datasets.values() if dataset.name == dataset_name][0]
+
+
+datasets = Datasets()
+
+
+class PlotSample:
+    def __init__(self, figure, legend, x, y):
+        self.figure = figure
+        self.legend = legend
+        self.x = x
+        self.y = y
+
+    def to_json(self) -> dict:
+        return {'figure': self.figure, 'legend': self.legend, 'data': {'x': self.x, 'y': self.y}}
+
+
+class Metrics:
+    def __init__(self, backend: FakeBackend, model):
+        self._backend = backend
+        self._model = model
+
+    def list(self, filters: Filters = None):
+        self._backend.request('metrics.list')
+        samples = self._backend.metrics[self._model.id]
+        selected = _query(samples, filters, to_json=lambda sample: sample) if filters is not None else samples
+        page_size = filters.page_size if filters is not None else 1000
+        entities = [PlotSample(figure=sample['figure'], legend=sample['legend'],
+                               x=sample['data']['x'], y=sample['data']['y']) for sample in selected]
+        return PagedEntities(entities, page_size=page_size, request_name='metrics.list')
+
+    def _list(self, filters: Filters):
+        """
+        Raw query of one page of samples, as the platform response JSON
+        """
+        import json
+        self._backend.request('metrics.list')
+        prepared = filters.prepare()
+        all_samples = self._backend.metrics[self._model.id]
+        # the pages of one query share the matching, as a database cursor would
+        key = (json.dumps(prepared.get('filter', dict()), sort_keys=True, default=str), len(all_samples))
+        if getattr(self, '_matched', (None, None))[0] != key:
+            self._matched = (key, [sample for sample in all_samples if match(sample, prepared.get('filter', dict()))])
+        samples = self._matched[1]
+        page, page_size = prepared.get('page', 0), prepared.get('pageSize', 1000)
+        return {'items': copy.deepcopy(samples[page * page_size:(page + 1) * page_size]),
+                'totalItemsCount': len(samples),
+                'totalPagesCount': math.ceil(len(samples) / page_size),
+                'hasNextPage': (page + 1) * page_size < len(samples)}
+
+
+class Artifacts:
+    def __init__(self, backend: FakeBackend, model):
+        self._backend = backend
+        self._model = model
+        self.files = dict()
+        self._saved_bytes = dict()
+
+    def upload(self, filepath: str, overwrite: bool = False, **kwargs):
+        import os
+        self._backend.request('artifacts.upload')
+        self.files[os.path.basename(filepath)] = filepath
+        # keep a copy, uploaded files are usually removed right after the upload
+        with open(filepath, 'rb') as f:
+            self._saved_bytes[os.path.basename(filepath)] = f.read()
+        return types.SimpleNamespace(id=self._backend.new_id(), filename=os.path.basename(filepath))
+
+    def download(self, artifact_name: str = None, local_path: str = None, overwrite: bool = False, **kwargs):
+        import os
+        self._backend.request('artifacts.download')
+        os.makedirs(local_path, exist_ok=True)
+        path = os.path.join(local_path, artifact_name)
+        with open(path, 'wb') as f:
+            f.write(self._saved_bytes[artifact_name])
+        return path
+
+
+class Model:
+    def __init__(self, backend: FakeBackend, id: str, name: str, project: Project, dataset, configuration: dict,
+                 metadata: dict):
+        self._backend = backend
+        self.id = id
+        self.name = name
+        self.project = project
+        self.project_id = project.id
+        self.dataset = dataset
+        self.dataset_id = dataset.id if dataset is not None else None
+        self.configuration = configuration
+        self.metadata = metadata
+        self.status = 'created'
+        self.metrics = Metrics(backend=backend, model=self)
+        self.artifacts = Artifacts(backend=backend, model=self)
+
+    def to_json(self) -> dict:
+        return {'id': self.id, 'name': self.name, 'projectId': self.project_id, 'metadata': self.metadata,
+                'status': self.status}
+
+    def update(self, system_metadata=False):
+        self._backend.request('models.update')
+        return self
+
+    def clone(self, model_name: str, dataset=None, configuration: dict = None, status=None, project_id: str = None,
+              train_filter: Filters = None, validation_filter: Filters = None, **kwargs):
+        self._backend.request('models.clone')
+        project = self._backend.projects.get(project_id, self.project)
+        if any(model.name == model_name and model.project_id == project.id for model in self._backend.models.values()):
+            raise BadRequest('400', f'Model with name {model_name} already exist')
+        metadata = copy.deepcopy(self.metadata)
+        metadata.setdefault('system', dict())['subsets'] = {
+            'train': train_filter.prepare() if train_filter is not None else None,
+            'validation': validation_filter.prepare() if validation_filter is not None else None,
+        }
+        return self._backend.create_model(project=project,
+                                          dataset=dataset if dataset is not None else self.dataset,
+                                          name=model_name,
+                                          configuration=copy.deepcopy(configuration or self.configuration),
+                                          metadata=metadata)
+
+
+class Models:
+    def __init__(self, backend: FakeBackend, project: Project):
+        self._backend = backend
+        self._project = project
+
+    def list(self, filters: Filters = None):
+        self._backend.request('models.list')
+        candidates = [model for model in self._backend.models.values() if model.project_id == self._project.id]
+        selected = _query(candidates, filters) if filters is not None else candidates
+        return PagedEntities(selected, page_size=filters.page_size if filters is not None else 1000,
+                             request_name='models.list')
+
+    def get(self, model_id: str = None):
+        self._backend.request('models.get')
+        return self._backend.models[model_id]
+
+
+class FeatureSet:
+    def __init__(self, backend: FakeBackend, id: str, name: str, project, model_id: str = None):
+        self._backend = backend
+        self.id = id
+        self.name = name
+        self.project = project
+        self.project_id = project.id
+        self.model_id = model_id
+        # item id to the feature JSON
+        self._vectors = dict()
+        self.features = Features(backend=backend, feature_set=self)
+
+    def to_json(self) -> dict:
+        return {'id': self.id, 'name': self.name, 'project': self.project_id, 'modelId': self.model_id}
+
+
+class Features:
+    def __init__(self, backend: FakeBackend, feature_set: FeatureSet):
+        self._backend = backend
+        self._feature_set = feature_set
+
+    def _list(self, filters: Filters):
+        """
+        Raw query of one page of feature vectors, as the platform response JSON
+        """
+        self._backend.request('features.list')
+        entity_ids = _in_values(filters, 'entityId')
+        vectors = self._feature_set._vectors
+        if entity_ids is not None:
+            candidates = [vectors[entity_id] for entity_id in entity_ids if entity_id in vectors]
+        else:
+            candidates = list(vectors.values())
+        selected = _query(candidates, filters, to_json=lambda feature: feature)
+        page, page_size = filters.page, filters.page_size
+        return {'items': copy.deepcopy(selected[page * page_size:(page + 1) * page_size]),
+                'totalItemsCount': len(selected),
+                'totalPagesCount': math.ceil(len(selected) / page_size),
+                'hasNextPage': (page + 1) * page_size < len(selected)}
+
+
+class FeatureSets:
+    def __init__(self, backend: FakeBackend, project: Project):
+        self._backend = backend
+        self._project = project
+
+    def list(self, filters: Filters = None):
+        self._backend.request('feature_sets.list')
+        candidates = [feature_set for feature_set in self._backend.feature_sets.values()
+                      if feature_set.project_id == self._project.id]
+        selected = _query(candidates, filters) if filters is not None else candidates
+        return PagedEntities(selected, page_size=filters.page_size if filters is not None else 1000,
+                             request_name='feature_sets.list')
+
+    def get(self, feature_set_name: str = None, feature_set_id: str = None):
+        self._backend.request('feature_sets.get')
+        for feature_set in self._backend.feature_sets.values():
+            if feature_set.project_id != self._project.id:
+                continue
+            if feature_set.id == feature_set_id or (feature_set_id is None and feature_set.name == feature_set_name):
+                return feature_set
+        raise NotFound('404', f'Feature set not found: {feature_set_name or feature_set_id}')
+
+
+################
+# dtlpymetrics #
+################
+def get_model_scores_df(dataset, model):
+    """
+    Stand-in for dtlpymetrics.evaluating.get_model_scores_df: query and download the scores csv
+    """
+    _backend.request('items.list')
+    _backend.request('items.download')
+    try:
+        return _backend.model_scores[(dataset.id, model.id)].copy()
+    except KeyError:
+        raise ValueError(f'No matched annotations file found for model {model.id} on dataset {dataset.id}.')
+
+
+class _MatchResults:
+    def __init__(self, rows: list):
+        self._rows = rows
+
+    def to_df(self):
+        import pandas as pd
+        return pd.DataFrame(self._rows)
+
+
+def _pair_score(first, second) -> float:
+    # deterministic stand-in IoU of a pair, higher when the labels agree
+    import zlib
+    value = zlib.crc32(f'{first.id}:{second.id}'.encode()) / 2 ** 32
+    return 0.5 + 0.5 * value if first.label == second.label else 0.5 * value
+
+
+def measure_annotations(annotations_set_one, annotations_set_two, match_threshold=0.5, **kwargs):
+    """
+    Stand-in for dtlpymetrics.utils.matching.measure_annotations: greedy matching of the predictions (most confident
+    first) with the ground truth, same label first, one "box" result with the dtlpymetrics match columns
+    """
+    def _confidence(annotation):
+        return annotation.metadata.get('user', dict()).get('model', dict()).get('confidence', 1.0)
+
+    unmatched = list(annotations_set_one)
+    rows = list()
+    for second in sorted(annotations_set_two, key=_confidence, reverse=True):
+        candidates = [(_pair_score(first, second), i_first) for i_first, first in enumerate(unmatched)]
+        candidates = [candidate for candidate in candidates if candidate[0] >= match_threshold]
+        if len(candidates) > 0:
+            geometry_score, i_first = max(candidates)
+            first = unmatched.pop(i_first)
+            label_score = 1.0 if first.label == second.label else 0.0
+            rows.append({'first_id': first.id, 'first_label': first.label, 'second_id': second.id,
+                         'second_label': second.label, 'second_confidence': _confidence(second),
+                         'geometry_score': geometry_score, 'label_score': label_score,
+                         'annotation_score': (geometry_score + label_score) / 2})
+        else:
+            rows.append({'first_id': None, 'first_label': None, 'second_id': second.id,
+                         'second_label': second.label, 'second_confidence': _confidence(second),
+                         'geometry_score': 0.0, 'label_score': 0.0, 'annotation_score': 0.0})
+    for first in unmatched:
+        rows.append({'first_id': first.id, 'first_label': first.label, 'second_id': None, 'second_label': None,
+                     'second_confidence': None, 'geometry_score': 0.0, 'label_score': 0.0, 'annotation_score': 0.0})
+    if len(rows) == 0:
+        return {'total_mean_score': float('nan')}
+    return {'box': _MatchResults(rows), 'total_mean_score': sum(row['annotation_score'] for row in rows) / len(rows)}
+
+
+def calc_precision_recall(dataset_id: str, model_id: str, iou_threshold=0.01, method_type=None, each_label=True,
+                          n_points=None):
+    """
+    Stand-in for dtlpymetrics.scoring.calc_precision_recall, same output columns (every point curves)
+    """
+    import numpy as np
+    import pandas as pd
+    dataset = datasets.get(dataset_id=dataset_id)
+    scores = get_model_scores_df(dataset=dataset, model=_backend.models[model_id])
+
+    def _curve(detections, n_gts):
+        detections = detections.sort_values('second_confidence', ascending=False)
+        true_positives = np.cumsum(detections['geometry_score'].values >= iou_threshold)
+        false_positives = np.cumsum(detections['geometry_score'].values < iou_threshold)
+        recall = true_positives / max(n_gts, 1)
+        precision = true_positives / np.maximum(true_positives + false_positives, 1)
+        confidence = detections['second_confidence'].values
+        if len(recall) == 0:
+            return [0], [0], [0]
+        precision = np.concatenate([[0], precision, [0]])
+        precision = np.maximum.accumulate(precision[::-1])[::-1]
+        recall = np.concatenate([[0], recall, [recall[-1]]])
+        confidence = np.concatenate([[confidence[0]], confidence, [confidence[-1]]])
+        return precision, recall, confidence
+
+    n_gts = int(scores['first_id'].notna().sum())
+    detections = scores[scores['second_id'].notna()]
+    frames = list()
+    precision, recall, confidence = _curve(detections, n_gts)
+    frames.append(pd.DataFrame({'iou_threshold': iou_threshold, 'data': 'dataset', 'label_name': '_NA',
+                                'precision': precision, 'recall': recall, 'confidence': confidence}))
+    if each_label is True:
+        labels = pd.concat([scores['first_label'], scores['second_label']]).dropna().unique()
+        for label in labels:
+            label_detections = detections[(detections['first_label'] == label) | (detections['second_label'] == label)]
+            precision, recall, confidence = _curve(label_detections, n_gts)
+            frames.append(pd.DataFrame({'iou_threshold': iou_threshold, 'data': 'label', 'label_name': label,
+                                        'precision': precision, 'recall': recall, 'confidence': confidence}))
+    return pd.concat(frames, ignore_index=True).drop_duplicates()
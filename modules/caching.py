@@ -0,0 +1,149 @@
+import os
+import pickle
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger('Caching')
+
+
+class LRUCache:
+    """
+    Small thread-safe least-recently-used cache, shared by the executions running on the same worker
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Get a cached value and mark it as recently used
+
+        :param key: cache key
+        :param default: value to return if the key is not cached
+        :return: cached value or default
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        """
+        Cache a value, evicting the least recently used entry when the cache is full
+
+        :param key: cache key
+        :param value: value to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate):
+        """
+        Remove all the entries whose key matches the predicate
+
+        :param predicate: function of the key, returns True for entries to remove
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """
+    Pickle file cache on the worker disk with size-based eviction, least recently used files are removed first.
+    Survives the executions and restarts of the service on the same machine.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 ** 2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key) -> str:
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{digest}.pkl')
+
+    def get(self, key, default=None):
+        """
+        Load a cached value and mark it as recently used
+
+        :param key: cache key, any value with a stable repr (e.g. a tuple of strings and numbers)
+        :param default: value to return if the key is not cached or the file can not be read
+        :return: cached value or default
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                stored_key, value = pickle.load(f)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return default
+        if stored_key != key:
+            return default
+        return value
+
+    def put(self, key, value):
+        """
+        Save a value, then evict the least recently used files above the size limit
+
+        :param key: cache key, any value with a stable repr (e.g. a tuple of strings and numbers)
+        :param value: picklable value to cache
+        """
+        path = self._path(key)
+        tmp_path = f'{path}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic, concurrent readers see either the old file or the complete new one
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning(f'Could not write cache file {path}', exc_info=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries = list()
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.pkl'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total_bytes -= size
+
+    def clear(self):
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.pkl'):
+                    os.remove(entry.path)
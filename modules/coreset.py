@@ -0,0 +1,160 @@
+import os
+import logging
+import numpy as np
+import dtlpy as dl
+
+from modules import instrumentation
+from modules.paging import iterate_pages
+
+logger = logging.getLogger("[CoreSet]")
+
+EMBEDDINGS_FILENAME = 'embeddings.f32'
+# rows of the embeddings matrix read at a time, about 128MB of 512-d float32 vectors
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def _page_embeddings(feature_set, item_ids: list, page_size: int = 1000) -> dict:
+    """
+    Get the feature vectors of a page of items from the raw feature pages
+
+    :param feature_set: dl.FeatureSet of the vectors
+    :param item_ids: ids of the items of the page
+    :param page_size: number of vectors in each page
+    :return: dict of item id to its vector (the first one if an item has several)
+    """
+    filters = dl.Filters(resource=dl.FiltersResource.FEATURE, field='featureSetId', values=feature_set.id)
+    filters.add(field='entityId', values=item_ids, operator=dl.FiltersOperations.IN)
+    filters.page_size = page_size
+    vectors = dict()
+    page = 0
+    while True:
+        filters.page = page
+        with instrumentation.phase('embeddings listing'):
+            response = feature_set.features._list(filters=filters)
+        features = response.get('items', list()) if response else list()
+        for feature in features:
+            vectors.setdefault(feature['entityId'], feature['value'])
+        if len(features) == 0 or not response.get('hasNextPage', False):
+            break
+        page += 1
+    return vectors
+
+
+def load_embeddings(dataset: dl.Dataset, feature_set, query: dict, directory: str, page_size: int = 1000):
+    """
+    Write the feature vectors of the items of a DQL query to a float32 file, a page of items at a time,
+    and map it in memory
+
+    :param dataset: dl.Dataset of the items
+    :param feature_set: dl.FeatureSet of the vectors
+    :param query: DQL filter JSON of the items
+    :param directory: directory of the embeddings file
+    :param page_size: number of items in each page
+    :return: tuple of a np.ndarray of the item ids and the read-only np.memmap of their vectors (rows aligned),
+             items without a vector are left out
+    """
+    path = os.path.join(directory, EMBEDDINGS_FILENAME)
+    item_ids = list()
+    dim = None
+    with open(path, 'wb') as f:
+        for page in iterate_pages(dataset=dataset, query=query, page_size=page_size):
+            page_ids = [item.id for item in page]
+            vectors = _page_embeddings(feature_set=feature_set, item_ids=page_ids, page_size=page_size)
+            page_ids = [item_id for item_id in page_ids if item_id in vectors]
+            if len(page_ids) == 0:
+                continue
+            rows = np.asarray([vectors[item_id] for item_id in page_ids], dtype=np.float32)
+            if dim is None:
+                dim = rows.shape[1]
+            elif rows.shape[1] != dim:
+                raise ValueError(f"Feature set {feature_set.id} mixes vectors of size {dim} and {rows.shape[1]}")
+            f.write(rows.tobytes())
+            item_ids.extend(page_ids)
+    if len(item_ids) == 0:
+        return np.empty(0, dtype='S24'), np.empty((0, 0), dtype=np.float32)
+    embeddings = np.memmap(path, dtype=np.float32, mode='r', shape=(len(item_ids), dim))
+    return np.asarray(item_ids, dtype='S24'), embeddings
+
+
+def _squared_norms(embeddings: np.ndarray, chunk_size: int) -> np.ndarray:
+    norms = np.empty(len(embeddings), dtype=np.float32)
+    for start in range(0, len(embeddings), chunk_size):
+        rows = np.asarray(embeddings[start:start + chunk_size], dtype=np.float32)
+        norms[start:start + len(rows)] = np.einsum('ij,ij->i', rows, rows)
+    return norms
+
+
+def _update_distances(embeddings: np.ndarray, squared_norms: np.ndarray, min_distances: np.ndarray,
+                      centers: np.ndarray, chunk_size: int) -> int:
+    """
+    Lower the squared distance of every row to its nearest center with new centers, chunk by chunk
+
+    :param embeddings: (n, d) float32 matrix, may be a np.memmap
+    :param squared_norms: squared norm of each row
+    :param min_distances: squared distance of each row to its nearest center so far, updated in place
+    :param centers: indices of the new centers
+    :param chunk_size: number of rows read at a time
+    :return: index of the row farthest from all the centers
+    """
+    center_rows = np.asarray(embeddings[np.sort(centers)], dtype=np.float32)
+    center_norms = np.einsum('ij,ij->i', center_rows, center_rows)
+    farthest, farthest_distance = -1, -np.inf
+    for start in range(0, len(embeddings), chunk_size):
+        end = min(start + chunk_size, len(embeddings))
+        rows = np.asarray(embeddings[start:end], dtype=np.float32)
+        # |x - c|^2 = |x|^2 - 2 x.c + |c|^2, for all the rows of the chunk and all the new centers at once
+        distances = squared_norms[start:end, None] - 2 * (rows @ center_rows.T) + center_norms[None, :]
+        chunk_distances = min_distances[start:end]
+        np.minimum(chunk_distances, distances.min(axis=1), out=chunk_distances)
+        position = int(np.argmax(chunk_distances))
+        if chunk_distances[position] > farthest_distance:
+            farthest, farthest_distance = start + position, chunk_distances[position]
+    return farthest
+
+
+def k_center_greedy(embeddings: np.ndarray, k: int, initial_indices: np.ndarray = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, seed: int = 0) -> np.ndarray:
+    """
+    Select k rows that cover the embeddings (core-set): every new row is the one farthest from the rows selected
+    so far (and from the initial rows, e.g. the items already labeled).
+    The matrix is read chunk by chunk, the memory only holds a chunk and two float32 values per row. Each selected
+    row is one pass over the matrix.
+
+    :param embeddings: (n, d) float32 matrix, may be a np.memmap
+    :param k: number of rows to select
+    :param initial_indices: optional rows already covered, not selected again
+    :param chunk_size: number of rows read at a time
+    :param seed: seed of the first row when there are no initial rows
+    :return: np.ndarray of the selected row indices, in selection order
+    """
+    n_rows = len(embeddings)
+    if initial_indices is None:
+        initial_indices = np.empty(0, dtype=np.int64)
+    initial_indices = np.unique(np.asarray(initial_indices, dtype=np.int64))
+    k = min(int(k), n_rows - len(initial_indices))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    squared_norms = _squared_norms(embeddings=embeddings, chunk_size=chunk_size)
+    min_distances = np.full(n_rows, np.inf, dtype=np.float32)
+    if len(initial_indices) > 0:
+        # covered rows are never the farthest, even among duplicates at distance 0
+        min_distances[initial_indices] = -np.inf
+        # cover the initial rows a block of centers at a time
+        for start in range(0, len(initial_indices), 256):
+            farthest = _update_distances(embeddings=embeddings,
+                                         squared_norms=squared_norms,
+                                         min_distances=min_distances,
+                                         centers=initial_indices[start:start + 256],
+                                         chunk_size=chunk_size)
+    else:
+        farthest = int(np.random.default_rng(seed).integers(n_rows))
+    selected = np.empty(k, dtype=np.int64)
+    for i_selected in range(k):
+        selected[i_selected] = farthest
+        min_distances[farthest] = -np.inf
+        farthest = _update_distances(embeddings=embeddings,
+                                     squared_norms=squared_norms,
+                                     min_distances=min_distances,
+                                     centers=selected[i_selected:i_selected + 1],
+                                     chunk_size=chunk_size)
+    return selected
@@ -1,15 +1,62 @@
+import re
 import datetime
 import logging
+import functools
 import dtlpy as dl
 
+from modules import instrumentation
+from modules.manifest import build_manifest, load_split_manifest, subsets_from_split_manifest, upload_manifest
+
 logger = logging.getLogger("[ModelCreator]")
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_name_template(template: str) -> tuple:
+    """
+    Split a model name template into its parts and compile the variables once per template
+
+    :param template: model name with python expressions in curly braces, e.g. "{base_model.name}_{dataset.name}"
+    :return: tuple of (literal text, expression, compiled expression) parts
+    """
+    parts = list()
+    rest = template
+    while "{" in rest:
+        literal, rest = rest.split("{", 1)
+        var_expr, rest = rest.split("}", 1)
+        try:
+            code = compile(var_expr, '<modelName>', 'eval') if var_expr else None
+        except SyntaxError:
+            # evaluated as text, so the execution reports it like any other unresolved variable
+            code = var_expr
+        parts.append((literal, var_expr, code))
+    parts.append((rest, "", None))
+    return tuple(parts)
+
+
 class ModelCreator(dl.BaseServiceRunner):
     def __init__(self):
         pass
 
     @staticmethod
+    def _next_free_name(project: dl.Project, name: str) -> str:
+        """
+        Find a free model name in the project with a single list query on the name prefix
+
+        :param project: project of the new model
+        :param name: requested model name
+        :return: the requested name if it is free, otherwise "{name}_v{N}" with N one above the highest existing version
+        """
+        filters = dl.Filters(resource=dl.FiltersResource.MODEL, field='name', values=f'{name}*', use_defaults=False)
+        filters.page_size = 1000
+        taken = {model.name for model in project.models.list(filters=filters).all()}
+        if name not in taken:
+            return name
+        version_pattern = re.compile(rf"^{re.escape(name)}_v(\d+)$")
+        versions = [int(match.group(1)) for match in map(version_pattern.match, taken) if match is not None]
+        return f"{name}_v{max(versions, default=0) + 1}"
+
+    @staticmethod
+    @instrumentation.instrumented('create_new_model')
     def create_new_model(
         base_model: dl.Model,
         dataset: dl.Dataset,
@@ -53,34 +100,41 @@ class ModelCreator(dl.BaseServiceRunner):
             input_name = node.metadata['customNodeConfig']['modelName']
         except (KeyError, TypeError, AttributeError):
             input_name = f"{base_model.name}_{datetime.datetime.now().strftime('%Y_%m_%d-T%H_%M_%S')}"
-        new_name = input_name
+        try:
+            materialize_subsets = node.metadata['customNodeConfig'].get('materializeSubsets', False) is True
+        except (KeyError, TypeError, AttributeError):
+            materialize_subsets = False
+        try:
+            use_split_manifest = node.metadata['customNodeConfig'].get('useSplitManifest', False) is True
+        except (KeyError, TypeError, AttributeError):
+            use_split_manifest = False
         safe_namespace = {
             "__builtins__": {},
             "base_model": base_model,
             "dataset": dataset,
             "datetime": datetime,
         }
-        while "{" in new_name:
-            name_start, name_end = new_name.split("{", 1)
-            var_expr, name_end = name_end.split("}", 1)
+        name_parts = list()
+        for literal, var_expr, code in _compile_name_template(input_name):
             try:
-                exec_var = str(eval(var_expr, safe_namespace)) if var_expr else ""
+                exec_var = str(eval(code, safe_namespace)) if var_expr else ""
             except Exception:
                 logger.warning(f"Could not resolve template variable '{var_expr}', replacing with empty string.")
                 exec_var = ""
-            new_name = name_start + exec_var + name_end
+            name_parts.append(literal + exec_var)
+        new_name = "".join(name_parts)
         new_dataset = dataset if dataset else base_model.dataset
         new_project = new_dataset.project
 
         if train_subset is None or len(train_subset) == 0:
             # get the train subset from the base model
-            base_train_subset = base_model.metadata.get("system", {}).get("subsets", {}).get("train", {})
-            pipeline_variables_dict["train_subset"] = base_train_subset
+            train_subset = base_model.metadata.get("system", {}).get("subsets", {}).get("train", {})
+            pipeline_variables_dict["train_subset"] = train_subset
 
         if validation_subset is None or len(validation_subset) == 0:
             # get the validation subset from the base model
-            base_validation_subset = base_model.metadata.get("system", {}).get("subsets", {}).get("validation", {})
-            pipeline_variables_dict["validation_subset"] = base_validation_subset
+            validation_subset = base_model.metadata.get("system", {}).get("subsets", {}).get("validation", {})
+            pipeline_variables_dict["validation_subset"] = validation_subset
 
         # update back to pipeline variables
         try:
@@ -90,24 +144,46 @@ class ModelCreator(dl.BaseServiceRunner):
 
         train_filter = dl.Filters(custom_filter=train_subset)
         validation_filter = dl.Filters(custom_filter=validation_subset)
-        # try creating model clone with the given name, if it fails, add a number to the end of the name and try again
-        i = 1
-        new_model = None
-        while new_model is None:
+        # allocate the next free "_vN" version of the name, and look again once if another execution took it meanwhile
+        requested_name = new_name
+        with instrumentation.phase('name lookup'):
+            new_name = ModelCreator._next_free_name(project=new_project, name=requested_name)
+        for attempt in range(2):
             try:
-                new_model = base_model.clone(
-                    model_name=new_name,
-                    project_id=new_project.id,
-                    dataset=new_dataset,
-                    configuration=_model_configuration,
-                    train_filter=train_filter,
-                    validation_filter=validation_filter,
-                    status="created",
-                )
+                with instrumentation.phase('clone'):
+                    new_model = base_model.clone(
+                        model_name=new_name,
+                        project_id=new_project.id,
+                        dataset=new_dataset,
+                        configuration=_model_configuration,
+                        train_filter=train_filter,
+                        validation_filter=validation_filter,
+                        status="created",
+                    )
                 break
             except dl.exceptions.BadRequest:
-                new_name = f"{new_name}_v{i}"
-                i += 1
+                if attempt > 0:
+                    raise
+                logger.warning(f"Model name {new_name} was taken while cloning, allocating a new version.")
+                with instrumentation.phase('name lookup'):
+                    new_name = ModelCreator._next_free_name(project=new_project, name=requested_name)
 
         logger.info(f"New model {new_model.name} created from {base_model.name}.")
+
+        if use_split_manifest is True:
+            # the train and validation items of the dataset split manifest, without running the subset queries
+            with instrumentation.phase('subsets manifest'):
+                split_manifest, split_subsets, manifest_item = load_split_manifest(dataset=new_dataset)
+                manifest = subsets_from_split_manifest(split_manifest=split_manifest, split_subsets=split_subsets)
+                upload_manifest(model=new_model,
+                                manifest=manifest,
+                                source={"itemId": manifest_item.id,
+                                        "createdAt": manifest_item.metadata["user"]["splitManifest"]["createdAt"]})
+        elif materialize_subsets is True:
+            # resolve the subsets once, so the training uses the items as they were when the model was created
+            with instrumentation.phase('subsets manifest'):
+                manifest = build_manifest(dataset=new_dataset,
+                                          subsets={"train": train_filter.prepare(),
+                                                   "validation": validation_filter.prepare()})
+                upload_manifest(model=new_model, manifest=manifest)
         return new_model, base_model
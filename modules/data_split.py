@@ -1,16 +1,319 @@
+import os
+import json
+import time
+import socket
 import logging
 import random
+import threading
+import functools
+import numpy as np
 import dtlpy as dl
 
+from modules import instrumentation
+from modules.caching import LRUCache
+from modules.manifest import MANIFEST_DTYPE, label_counts_matrix, manifest_rows, upload_split_manifest
+from modules.io_executor import run_concurrently, with_retries
+from modules.paging import iterate_pages, page_annotations
+from modules.subset_assignment import QuotaState, SplitPlan, assign_by_hash, merge_counters
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('DataSplit')
 
+# compiled node configs and quota counters are shared by all the executions running on this worker
+_split_plans = LRUCache(max_size=64)
+_quota_states = dict()
+_quota_states_lock = threading.Lock()
+_quota_sync_lock = threading.Lock()
+# the shared quota counters of a node hold one entry per worker process (pod replica)
+REPLICA_ID = f'{socket.gethostname()}-{os.getpid()}'
+QUOTA_SYNC_RETRIES = 3
+# the entries of the replicas that did not sync for this long (restarted or scaled down workers) are folded into one
+# base entry, so the shared counters do not grow with every worker the service ever had
+BASE_REPLICA_ID = 'base'
+QUOTA_STALE_S = 3600
+# ids of the latest folded replicas, kept in the base entry so a replica that was only idle finds out about the fold
+QUOTA_FOLDED_IDS = 100
+
+
+def _entry_counters(entry: dict) -> dict:
+    """
+    Counters snapshot of an entry of the shared quota counters, without its sync info
+
+    :param entry: entry of a replica, or the base entry
+    :return: counters snapshot, None for a missing entry
+    """
+    if entry is None:
+        return None
+    return {'groups': entry.get('groups', dict()), 'labels': entry.get('labels', dict())}
+
+
+def _fold_stale_replicas(replicas: dict, now: float) -> bool:
+    """
+    Fold the entries of the replicas that did not sync for QUOTA_STALE_S into the base entry
+
+    :param replicas: shared quota counters of a node, replica id to entry
+    :param now: current time, seconds since epoch
+    :return: True if entries were folded
+    """
+    stale = [replica_id for replica_id, entry in replicas.items()
+             if replica_id not in (REPLICA_ID, BASE_REPLICA_ID) and now - entry.get('syncedAt', 0) > QUOTA_STALE_S]
+    if len(stale) == 0:
+        return False
+    base = replicas.get(BASE_REPLICA_ID, dict())
+    counters = functools.reduce(merge_counters,
+                                [_entry_counters(replicas.pop(replica_id)) for replica_id in stale],
+                                _entry_counters(base))
+    folded = [replica_id for replica_id in base.get('folded', list()) if replica_id not in stale] + stale
+    replicas[BASE_REPLICA_ID] = dict(counters, folded=folded[-QUOTA_FOLDED_IDS:])
+    return True
+
 
 class DataSplitter(dl.BaseServiceRunner):
 
     def __init__(self): ...
 
     @staticmethod
+    def _get_split_plan(context: dl.Context, split_config: dict = None) -> SplitPlan:
+        """
+        Get the compiled split plan of the node, cached by node id and pipeline revision.
+        An explicit split config (the same JSON as the node config) takes precedence over the node config,
+        for the functions that do not run as a Data Split node.
+
+        :param context: entity IDs of related entities
+        :param split_config: optional split config with the subset "groups"
+        :return: SplitPlan
+        """
+        if split_config is not None:
+            key = ('split_config', json.dumps(split_config, sort_keys=True))
+            plan = _split_plans.get(key)
+            if plan is None:
+                plan = SplitPlan.from_config(split_config)
+                _split_plans.put(key, plan)
+            return plan
+
+        node = context.node if context is not None else None
+        if node is None or 'customNodeConfig' not in (node.metadata or dict()):
+            raise ValueError("No subset groups: the split config comes from the Data Split node panel, "
+                             "pass a split_config with the groups when running outside of it.")
+        revision = getattr(context.pipeline, 'updated_at', None)
+        if revision is None:
+            revision = json.dumps(node.metadata.get('customNodeConfig'), sort_keys=True)
+        key = (context.node_id, revision)
+        plan = _split_plans.get(key)
+        if plan is None:
+            plan = SplitPlan.from_config(node.metadata['customNodeConfig'])
+            # the node config changed, drop the plans of the older revisions
+            _split_plans.invalidate(lambda cached_key: cached_key[0] == context.node_id)
+            _split_plans.put(key, plan)
+        return plan
+
+    @staticmethod
+    def _counters_key(context: dl.Context, plan: SplitPlan) -> str:
+        """
+        Key of the shared quota counters: the node id, or the subsets when running outside of a pipeline node
+
+        :param context: entity IDs of related entities
+        :param plan: compiled split plan
+        :return: key of the counters in the dataset metadata
+        """
+        node_id = getattr(context, 'node_id', None)
+        if node_id is None:
+            node_id = 'subsets-' + '-'.join(plan.population)
+        return node_id
+
+    @staticmethod
+    def _get_quota_state(context: dl.Context, plan: SplitPlan, dataset: dl.Dataset) -> QuotaState:
+        """
+        Get the quota counters of the node, loading the shared counters on first use
+
+        :param context: entity IDs of related entities
+        :param plan: compiled split plan of the node
+        :param dataset: dataset that holds the shared counters
+        :return: QuotaState
+        """
+        node_id = DataSplitter._counters_key(context=context, plan=plan)
+        key = (node_id, plan.population, plan.distribution, plan.stratify)
+        with _quota_states_lock:
+            state = _quota_states.get(key)
+            if state is None:
+                state = QuotaState(population=plan.population, distribution=plan.distribution, stratify=plan.stratify)
+                DataSplitter._sync_quota_state(state=state, dataset=dataset, node_id=node_id)
+                _quota_states[key] = state
+        return state
+
+    @staticmethod
+    def _sync_quota_state(state: QuotaState, dataset: dl.Dataset, node_id: str):
+        """
+        Write the counts of this replica to the counters shared on the dataset metadata, and load the counts of the
+        other replicas back into the state.
+        Each replica only writes its own running totals (metadata.system.dataSplit.<nodeId>.<replicaId>), so a failed
+        update or an update overwritten by another replica is repaired by the next sync. The update is read back,
+        and written again if another replica overwrote it in between.
+        The entries of the replicas that did not sync for QUOTA_STALE_S are folded into the base entry, a replica
+        whose entry was folded keeps counting from the folded counts.
+
+        :param state: QuotaState of the node
+        :param dataset: dataset that holds the shared counters
+        :param node_id: id of the data split node
+        """
+        with _quota_sync_lock:
+            written = None
+            for attempt in range(QUOTA_SYNC_RETRIES + 1):
+                dataset = dl.datasets.get(dataset_id=dataset.id)
+                replicas = dataset.metadata.setdefault('system', dict()).setdefault('dataSplit', dict()).setdefault(
+                    node_id, dict())
+                entry = _entry_counters(replicas.get(REPLICA_ID))
+                if entry is not None:
+                    state.shared = entry
+                elif state.shared is not None and \
+                        REPLICA_ID in replicas.get(BASE_REPLICA_ID, dict()).get('folded', list()):
+                    # another replica folded the shared counts of this one into the base entry
+                    state.rebase(folded=state.shared)
+                others = functools.reduce(merge_counters,
+                                          [_entry_counters(replica_entry) for replica_id, replica_entry
+                                           in replicas.items() if replica_id != REPLICA_ID],
+                                          None)
+                state.load(others)
+                if written is not None and entry == written[0]:
+                    # the assignments of the written snapshot are shared, the newer ones stay pending
+                    state.synced(written[1])
+                    return
+                own, n_pending = state.snapshot()
+                folded = _fold_stale_replicas(replicas=replicas, now=time.time())
+                if not folded and (len(own['groups']) == 0 or entry == own):
+                    state.synced(n_pending)
+                    return
+                if attempt == QUOTA_SYNC_RETRIES:
+                    break
+                replicas[REPLICA_ID] = dict(own, syncedAt=time.time())
+                try:
+                    dataset.update(system_metadata=True)
+                except dl.exceptions.ExceptionMain:
+                    logger.warning(f'Failed to update the shared subset counters of node {node_id}, '
+                                   f'{n_pending} assignments stay pending')
+                    return
+                written = (own, n_pending)
+            logger.warning(f'The shared subset counters of node {node_id} were overwritten {QUOTA_SYNC_RETRIES} '
+                           f'times, {state.n_pending} assignments stay pending')
+
+    @staticmethod
+    def _item_labels(items: list, dataset: dl.Dataset) -> dict:
+        """
+        Get the annotation labels of the items, with one annotations query
+
+        :param items: list of dl.Item
+        :param dataset: dataset of the items
+        :return: dict of item id to list of labels
+        """
+        filters = dl.Filters(resource=dl.FiltersResource.ANNOTATION,
+                             field='itemId',
+                             values=[item.id for item in items],
+                             operator=dl.FiltersOperations.IN)
+        item_labels = dict()
+        with instrumentation.phase('annotation listing'):
+            for annotation in dataset.annotations.list(filters=filters).all():
+                item_labels.setdefault(annotation.item_id, list()).append(annotation.label)
+        return item_labels
+
+    @staticmethod
+    def _choose_subsets(items: list, plan: SplitPlan, context: dl.Context, dataset: dl.Dataset) -> list:
+        """
+        Choose a subset for each item: randomly by the subset weights, deterministically by hashing the item ids,
+        or by exact quota (optionally stratified by label) using running counters
+
+        :param items: list of dl.Item to assign
+        :param plan: compiled split plan of the node
+        :param context: entity IDs of related entities
+        :param dataset: dataset of the items
+        :return: list of subset names, one per item
+        """
+        if plan.assignment == 'hash':
+            indices = assign_by_hash(item_ids=[item.id for item in items],
+                                     distribution=plan.distribution,
+                                     salt=plan.salt,
+                                     cumulative=plan.cumulative)
+            return [plan.population[index] for index in indices]
+        if plan.assignment == 'quota':
+            state = DataSplitter._get_quota_state(context=context, plan=plan, dataset=dataset)
+            item_labels = DataSplitter._item_labels(items=items, dataset=dataset) if state.stratify else dict()
+            actions = [state.assign(labels=item_labels.get(item.id)) for item in items]
+            if state.n_pending >= plan.sync_every:
+                DataSplitter._sync_quota_state(state=state,
+                                               dataset=dataset,
+                                               node_id=DataSplitter._counters_key(context=context, plan=plan))
+            return actions
+        return random.choices(population=plan.population, cum_weights=plan.cum_weights, k=len(items))
+
+    @staticmethod
+    def _existing_subset(item: dl.Item):
+        """
+        Get the subset an item was already assigned to, if any
+
+        :param item: dl.Item
+        :return: name of the subset or None
+        """
+        try:
+            return list(item.metadata.get('system', dict()).get('tags', dict()).keys())[0]
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return None
+
+    @staticmethod
+    def _strip_model_metadata(annotation: dl.Annotation) -> bool:
+        """
+        Remove the model info from the annotation metadata (in place)
+
+        :param annotation: dl.Annotation
+        :return: True if the annotation was changed and needs to be updated
+        """
+        update_annotation = False
+        if 'model' in annotation.metadata.get('user', dict()):
+            _ = annotation.metadata['user'].pop('model')
+            update_annotation = True
+        if 'model' in annotation.metadata.get('system', dict()):
+            _ = annotation.metadata['system'].pop('model')
+            update_annotation = True
+        return update_annotation
+
+    @staticmethod
+    def _model_annotations_filters(item_ids: list = None) -> dl.Filters:
+        """
+        Query for the annotations that still have model info in their metadata
+
+        :param item_ids: optional list of item ids to restrict the query to
+        :return: dl.Filters for the annotations resource
+        """
+        filters = dl.Filters(resource=dl.FiltersResource.ANNOTATION)
+        filters.add(field='metadata.user.model', values=True,
+                    operator=dl.FiltersOperations.EXISTS, method=dl.FiltersMethod.OR)
+        filters.add(field='metadata.system.model', values=True,
+                    operator=dl.FiltersOperations.EXISTS, method=dl.FiltersMethod.OR)
+        if item_ids is not None:
+            filters.add(field='itemId', values=item_ids, operator=dl.FiltersOperations.IN)
+        return filters
+
+    @staticmethod
+    def _clear_model_metadata(annotations, filters: dl.Filters) -> int:
+        """
+        Remove the model info from the metadata of the queried annotations, with a single batched update
+
+        :param annotations: annotations repository of the item or dataset
+        :param filters: query for the model-tagged annotations
+        :return: number of updated annotations
+        """
+        with instrumentation.phase('annotation listing'):
+            listed = annotations.list(filters=filters)
+            # item annotations come back as a single collection, dataset annotations are paged
+            if not isinstance(listed, dl.AnnotationCollection):
+                listed = listed.all()
+            changed = [annotation for annotation in listed if DataSplitter._strip_model_metadata(annotation) is True]
+        if len(changed) > 0:
+            logger.info(f'removing model metadata from {len(changed)} annotations')
+            with instrumentation.phase('annotation updates'):
+                annotations.update(annotations=changed, system_metadata=True)
+        return len(changed)
+
+    @staticmethod
+    @instrumentation.instrumented('data_split')
     def data_split(item: dl.Item, progress: dl.Progress, context: dl.Context) -> dl.Item:
         """
         Split data into subsets (e.g. train, validation and test sets)
@@ -21,42 +324,165 @@ class DataSplitter(dl.BaseServiceRunner):
         :return:
         """
 
-        try:
-            # If subset already exists, use the same subset name as action.
-            action = list(item.metadata.get('system', dict()).get('tags', dict()).keys())[0]
-        except (KeyError, IndexError, TypeError, AttributeError) as e:
-            action = None
+        # If subset already exists, use the same subset name as action.
+        action = DataSplitter._existing_subset(item)
 
         if action is not None:
             progress.update(action=action)
         else:
-            node = context.node
-            groups = node.metadata['customNodeConfig']['groups']
-            population = [group['name'] for group in groups]
-            distribution = [int(group['distribution']) for group in groups]
-            action = random.choices(population=population, weights=distribution)
+            plan = DataSplitter._get_split_plan(context)
+            action = DataSplitter._choose_subsets(items=[item], plan=plan, context=context, dataset=item.dataset)
             progress.update(action=action[0])
+            calls = list()
             # once the item passes through tasks and data split node,
             # the annotation metadata is cleared from the model info
-            annotations = item.annotations.list()
-            for annotation in annotations:
-                update_annotation = False
-                if 'model' in annotation.metadata.get('user', dict()):
-                    logger.info('removing model metadata from item annotations')
-                    _ = annotation.metadata['user'].pop('model')
-                    update_annotation = True
-                if 'model' in annotation.metadata.get('system', dict()):
-                    logger.info('removing model metadata from item annotations')
-                    _ = annotation.metadata['system'].pop('model')
-                    update_annotation = True
-                if update_annotation is True:
-                    annotation.update(True)
-            add_item_metadata = context.node.metadata.get('customNodeConfig', {}).get('itemMetadata', False)
-            if add_item_metadata:
+            if item.annotated is not False and item.annotations_count != 0:
+                calls.append(with_retries(functools.partial(DataSplitter._clear_model_metadata,
+                                                            annotations=item.annotations,
+                                                            filters=DataSplitter._model_annotations_filters())))
+            if plan.item_metadata:
                 if 'system' not in item.metadata:
                     item.metadata['system'] = {}
                 if 'tags' not in item.metadata['system']:
                     item.metadata['system']['tags'] = {}
                 item.metadata['system']['tags'][action[0]] = True
-                item = item.update(True)
+                calls.append(instrumentation.timed('item updates', with_retries(functools.partial(item.update, True))))
+            # the annotations and the item are updated independently, so the requests overlap
+            results = run_concurrently(*calls)
+            if plan.item_metadata:
+                item = results[-1]
+        return item
+
+    @staticmethod
+    @instrumentation.instrumented('split_filter')
+    def split_filter(dataset: dl.Dataset, query: dict, context: dl.Context = None, split_config: dict = None,
+                     page_size: int = 1000) -> dict:
+        """
+        Split all the items of a DQL filter into subsets, a page at a time.
+        The subsets of a whole page are decided in memory and written with one bulk update per subset,
+        instead of running the data split node once for every item.
+
+        :param dataset: dataset of the items to split
+        :param query: JSON for the DQL filter of the items to split (e.g. pipeline_configs/train_subset_filter.json)
+        :param context: entity IDs of related entities
+        :param split_config: JSON of the subset groups, in the Data Split node config format
+                             (e.g. pipeline_configs/split_config.json). Defaults to the config of the node panel
+        :param page_size: number of items to assign and update in each page
+        :return: dict with the number of items in each subset
+        """
+        if dataset is None:
+            raise ValueError("Dataset is required.")
+
+        plan = DataSplitter._get_split_plan(context, split_config=split_config)
+        summary = {name: 0 for name in plan.population}
+
+        for i_page, page in enumerate(iterate_pages(dataset=dataset, query=query, page_size=page_size)):
+            # items that were already assigned keep their subset
+            new_items = list()
+            for item in page:
+                subset = DataSplitter._existing_subset(item)
+                if subset is None:
+                    new_items.append(item)
+                else:
+                    summary[subset] = summary.get(subset, 0) + 1
+            if len(new_items) == 0:
+                continue
+
+            actions = DataSplitter._choose_subsets(items=new_items, plan=plan, context=context, dataset=dataset)
+            subset_ids = dict()
+            for item, action in zip(new_items, actions):
+                subset_ids.setdefault(action, list()).append(item.id)
+
+            calls = list()
+            # once the items pass through the data split, the annotation metadata is cleared from the model info
+            annotated_ids = [item.id for item in new_items
+                             if item.annotated is not False and item.annotations_count != 0]
+            if len(annotated_ids) > 0:
+                calls.append(with_retries(functools.partial(
+                    DataSplitter._clear_model_metadata,
+                    annotations=dataset.annotations,
+                    filters=DataSplitter._model_annotations_filters(item_ids=annotated_ids),
+                )))
+
+            for subset, item_ids in subset_ids.items():
+                filters = dl.Filters(field='id', values=item_ids, operator=dl.FiltersOperations.IN, use_defaults=False)
+                calls.append(instrumentation.timed('item updates', with_retries(functools.partial(
+                    dataset.items.update,
+                    filters=filters,
+                    system_update_values={'tags': {subset: True}},
+                    system_metadata=True,
+                ))))
+                summary[subset] = summary.get(subset, 0) + len(item_ids)
+            run_concurrently(*calls)
+            logger.info(f'Page {i_page}: assigned {len(new_items)} items to subsets {list(subset_ids.keys())}')
+
+        if plan.assignment == 'quota':
+            state = DataSplitter._get_quota_state(context=context, plan=plan, dataset=dataset)
+            DataSplitter._sync_quota_state(state=state,
+                                           dataset=dataset,
+                                           node_id=DataSplitter._counters_key(context=context, plan=plan))
+        logger.info(f'Finished splitting dataset {dataset.name}: {summary}')
+        return summary
+
+    @staticmethod
+    @instrumentation.instrumented('export_split_manifest')
+    def export_split_manifest(dataset: dl.Dataset, query: dict, context: dl.Context = None,
+                              page_size: int = 1000) -> dl.Item:
+        """
+        Export the subsets of the split items as a compact manifest file: one row per item with its id, subset,
+        annotation count and latest annotation update time, and a second file with the annotation count of each
+        label on the same rows. Training data loaders can memory-map them and build their shards without querying
+        the subset tags.
+        The label index starts with the dataset labels, labels of the annotations that are not in the dataset
+        recipe are added after them.
+
+        :param dataset: dataset of the split items
+        :param query: JSON for the DQL filter of the items to export, items without a subset are left out
+        :param context: entity IDs of related entities
+        :param page_size: number of items in each page
+        :return: the manifest item, a hidden item of the dataset (see modules.manifest.load_split_manifest)
+        """
+        if dataset is None:
+            raise ValueError("Dataset is required.")
+
+        subsets = dict()
+        chunks = list()
+        n_unassigned = 0
+        labels = {label.tag: i_label for i_label, label in enumerate(dataset.labels)}
+        # manifest row and label index of each annotation
+        label_rows, label_columns = list(), list()
+        n_rows = 0
+        for page in iterate_pages(dataset=dataset, query=query, page_size=page_size):
+            assigned, subset_indices = list(), list()
+            for item in page:
+                subset = DataSplitter._existing_subset(item)
+                if subset is None:
+                    n_unassigned += 1
+                    continue
+                assigned.append(item)
+                subset_indices.append(subsets.setdefault(subset, len(subsets)))
+            if len(assigned) == 0:
+                continue
+            annotations = page_annotations(dataset=dataset, item_ids=[item.id for item in assigned],
+                                           page_size=page_size)
+            chunks.append(manifest_rows(items=assigned, subset_indices=subset_indices, annotations=annotations))
+            for i_item, item in enumerate(assigned):
+                for annotation in annotations.get(item.id, list()):
+                    label_rows.append(n_rows + i_item)
+                    label_columns.append(labels.setdefault(annotation['label'], len(labels)))
+            n_rows += len(assigned)
+
+        # subsets in name order, whatever order the items came in
+        names = sorted(subsets)
+        manifest = np.concatenate(chunks) if len(chunks) > 0 else np.empty(0, dtype=MANIFEST_DTYPE)
+        if len(manifest) > 0:
+            remap = np.empty(len(subsets), dtype=np.uint8)
+            remap[[subsets[name] for name in names]] = np.arange(len(names))
+            manifest['subset'] = remap[manifest['subset']]
+        label_counts = label_counts_matrix(n_rows=n_rows, rows=label_rows, columns=label_columns, n_labels=len(labels))
+        if n_unassigned > 0:
+            logger.warning(f'{n_unassigned} items without a subset were left out of the split manifest')
+        with instrumentation.phase('manifest upload'):
+            item = upload_split_manifest(dataset=dataset, manifest=manifest, subsets=names, query=query,
+                                         label_counts=label_counts, labels=list(labels))
         return item
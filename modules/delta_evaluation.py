@@ -0,0 +1,187 @@
+import logging
+import numpy as np
+import pandas as pd
+import dtlpy as dl
+
+from modules import instrumentation
+from modules.paging import iterate_annotations, iterate_pages, page_annotations
+
+logger = logging.getLogger('DeltaEvaluation')
+
+# columns of the matched annotations table used by the comparisons (dtlpymetrics scores csv columns)
+MATCH_COLUMNS = ['item_id', 'first_id', 'first_label', 'second_id', 'second_label', 'second_confidence',
+                 'geometry_score', 'annotation_score']
+# match every overlapping pair, the IoU thresholds of the comparison are applied to the geometry score afterwards.
+# This is the match threshold of the model scores file of a full evaluation (dtlpymetrics create_model_score), not
+# the measure_annotations default (0.5) nor the iou_threshold of the comparison. A scores file created with another
+# match threshold keeps other low IoU pairs, so its curves can differ from the delta ones at low IoU thresholds.
+DEFAULT_MATCH_THRESHOLD = 0.01
+
+
+def item_revision(item: dl.Item) -> int:
+    """
+    Revision of the annotations of an item: adding or removing an annotation changes the count.
+    Editing an annotation does not update its item, edits are found by the annotation updatedAt (_edited_item_ids).
+
+    :param item: dl.Item
+    :return: number of annotations of the item
+    """
+    return item.annotations_count
+
+
+class LatestUpdate:
+    """
+    Most recent annotation updatedAt seen by an evaluation, with the ids of the annotations updated at that time.
+    The update times are set by the platform, so no local clock is compared with them
+    """
+
+    def __init__(self, updated_at: str = None, annotation_ids=()):
+        self.updated_at = updated_at
+        self.annotation_ids = set(annotation_ids)
+
+    def seen(self, annotation: dict) -> bool:
+        return annotation.get('updatedAt') == self.updated_at and annotation['id'] in self.annotation_ids
+
+    def add(self, annotation: dict):
+        # ISO 8601 UTC times, ordered as strings
+        updated_at = annotation.get('updatedAt')
+        if updated_at is None or (self.updated_at is not None and updated_at < self.updated_at):
+            return
+        if updated_at != self.updated_at:
+            self.updated_at = updated_at
+            self.annotation_ids = set()
+        self.annotation_ids.add(annotation['id'])
+
+    def to_json(self) -> dict:
+        return {'updatedAt': self.updated_at, 'annotationIds': sorted(self.annotation_ids)}
+
+    @classmethod
+    def from_json(cls, _json: dict):
+        _json = _json or dict()
+        return cls(updated_at=_json.get('updatedAt'), annotation_ids=_json.get('annotationIds', list()))
+
+
+def _edited_item_ids(dataset: dl.Dataset, since: LatestUpdate, page_size: int = 1000) -> tuple:
+    """
+    Get the items of a dataset with annotations created or edited since the previous evaluation, in one query of the
+    annotations
+
+    :param dataset: dl.Dataset
+    :param since: LatestUpdate of the previous evaluation
+    :param page_size: number of annotations in each page
+    :return: tuple of the set of item ids and the LatestUpdate including their annotations
+    """
+    # annotations are created in bulk within the same millisecond, so the bound is included and the annotations
+    # already seen at that time are skipped: an edit in the same millisecond is not missed, and the unchanged
+    # annotations of a bulk upload do not mark their items as changed
+    filters = dl.Filters(resource=dl.FiltersResource.ANNOTATION, field='updatedAt', values=since.updated_at,
+                         operator=dl.FiltersOperations.GREATER_THAN_OR_EQUAL)
+    filters.page_size = page_size
+    item_ids = set()
+    latest = LatestUpdate(updated_at=since.updated_at, annotation_ids=since.annotation_ids)
+    for annotation in iterate_annotations(dataset=dataset, filters=filters):
+        if since.seen(annotation):
+            continue
+        item_ids.add(annotation['itemId'])
+        latest.add(annotation)
+    return item_ids, latest
+
+
+def match_item(item: dl.Item, annotations: list, model: dl.Model,
+               match_threshold: float = DEFAULT_MATCH_THRESHOLD) -> pd.DataFrame:
+    """
+    Match the predictions of a model on an item with the item ground truth, as the model evaluation does:
+    the ground truth is the annotations without model metadata, the predictions carry the model name
+
+    :param item: dl.Item of the annotations
+    :param annotations: annotations JSON of the item
+    :param model: dl.Model of the predictions
+    :param match_threshold: minimal IoU of a matched pair
+    :return: DataFrame with the MATCH_COLUMNS columns, one row per matched pair or unmatched annotation
+    """
+    # dtlpymetrics loads scipy, seaborn and matplotlib, import it on the first match and not on startup
+    from dtlpymetrics.utils.matching import measure_annotations
+    ground_truth, predictions = list(), list()
+    for annotation_json in annotations:
+        model_info = (annotation_json.get('metadata') or dict()).get('user', dict()).get('model')
+        if model_info is None:
+            ground_truth.append(dl.Annotation.from_json(_json=annotation_json, item=item))
+        elif model_info.get('name', '') == model.name:
+            predictions.append(dl.Annotation.from_json(_json=annotation_json, item=item))
+    if len(ground_truth) == 0 and len(predictions) == 0:
+        return pd.DataFrame(columns=MATCH_COLUMNS)
+    results = measure_annotations(annotations_set_one=ground_truth,
+                                  annotations_set_two=predictions,
+                                  match_threshold=match_threshold)
+    frames = [result.to_df() for compare_type, result in results.items() if hasattr(result, 'to_df')]
+    frames = [frame for frame in frames if len(frame) > 0]
+    if len(frames) == 0:
+        return pd.DataFrame(columns=MATCH_COLUMNS)
+    matches = pd.concat(frames, ignore_index=True)
+    matches['item_id'] = item.id
+    return matches.reindex(columns=MATCH_COLUMNS)
+
+
+def update_item_matches(dataset: dl.Dataset, model: dl.Model, query: dict, previous: dict = None,
+                        page_size: int = 1000, match_threshold: float = DEFAULT_MATCH_THRESHOLD) -> dict:
+    """
+    Match the annotations of the items of a test subset, reusing the matches of a previous evaluation for the
+    items whose annotations did not change.
+    The annotations created or edited since the previous evaluation are found with one query on their updatedAt,
+    the removed ones by the annotation count of the items. The items are listed a page at a time, only the
+    annotations of the new and changed items are downloaded and matched, and the matches of the items that left
+    the subset are dropped.
+
+    :param dataset: dl.Dataset of the test subset
+    :param model: dl.Model of the predictions
+    :param query: DQL filter JSON of the test subset items
+    :param previous: optional result of the previous call for the same dataset, model and query
+    :param page_size: number of items in each page
+    :param match_threshold: minimal IoU of a matched pair
+    :return: dict with the "revisions" of the items (item id to revision), the "latestUpdate" of the annotations
+             seen (LatestUpdate JSON), the "scores" matched annotations table (MATCH_COLUMNS) and the number of
+             items matched again ("n_matched")
+    """
+    previous_revisions = previous.get('revisions', dict()) if previous else dict()
+    previous_scores = previous.get('scores') if previous else None
+    latest = LatestUpdate.from_json(previous.get('latestUpdate') if previous else None)
+    edited = set()
+    if len(previous_revisions) > 0 and latest.updated_at is not None:
+        edited, latest = _edited_item_ids(dataset=dataset, since=latest, page_size=page_size)
+    revisions = dict()
+    matched = set()
+    new_frames = list()
+    for page in iterate_pages(dataset=dataset, query=query, page_size=page_size):
+        changed = list()
+        for item in page:
+            revisions[item.id] = item_revision(item)
+            if item.id in edited or previous_revisions.get(item.id) != revisions[item.id]:
+                changed.append(item)
+        if len(changed) == 0:
+            continue
+        annotations = page_annotations(dataset=dataset, item_ids=[item.id for item in changed], page_size=page_size)
+        for item_annotations in annotations.values():
+            for annotation in item_annotations:
+                latest.add(annotation)
+        with instrumentation.phase('matching'):
+            new_frames.extend(match_item(item=item,
+                                         annotations=annotations.get(item.id, list()),
+                                         model=model,
+                                         match_threshold=match_threshold)
+                              for item in changed)
+        matched.update(item.id for item in changed)
+
+    frames = list()
+    if previous_scores is not None and len(previous_scores) > 0:
+        # unchanged items that are still in the subset
+        unchanged_ids = [item_id for item_id in revisions if item_id not in matched]
+        frames.append(previous_scores.loc[previous_scores['item_id'].isin(unchanged_ids)])
+    frames.extend(frame for frame in new_frames if len(frame) > 0)
+    if len(frames) > 0:
+        scores = pd.concat(frames, ignore_index=True)
+    else:
+        scores = pd.DataFrame({column: np.empty(0, dtype=object) for column in MATCH_COLUMNS})
+    n_matched = len(matched)
+    logger.info(f"Matched {n_matched} new or changed items of {len(revisions)} test items of model {model.name}, "
+                f"{len(revisions) - n_matched} items reused from the previous evaluation.")
+    return {'revisions': revisions, 'latestUpdate': latest.to_json(), 'scores': scores, 'n_matched': n_matched}
@@ -0,0 +1,261 @@
+import numpy as np
+import pandas as pd
+
+PR_COLUMNS = ['iou_threshold', 'data', 'label_name', 'precision', 'recall', 'confidence', 'dataset_name']
+
+
+def parse_iou_thresholds(iou_threshold) -> np.ndarray:
+    """
+    Parse the "iou_threshold" of a compare configuration
+
+    :param iou_threshold: a float, a list of floats, or a range dict {"start": 0.5, "stop": 0.95, "step": 0.05}
+                          (the stop value is included, as in COCO mAP@[.5:.95])
+    :return: sorted np.ndarray of unique float thresholds
+    """
+    if isinstance(iou_threshold, dict):
+        start = float(iou_threshold.get('start', 0.5))
+        stop = float(iou_threshold.get('stop', start))
+        step = float(iou_threshold.get('step', 0.05))
+        if step <= 0:
+            raise ValueError(f"iou_threshold step should be positive, got {step}")
+        thresholds = np.arange(start, stop + step / 2, step)
+    else:
+        thresholds = np.atleast_1d(np.asarray(iou_threshold, dtype=float))
+    if thresholds.size == 0:
+        raise ValueError(f"No IoU thresholds in {iou_threshold}")
+    # remove the float noise of the range, so the thresholds can be used as keys
+    return np.unique(np.round(thresholds, 6))
+
+
+def _grouped_reverse_cummax(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    Running maximum from the end of each group, for all the columns at once
+
+    :param values: (n, t) array, rows of a group are contiguous
+    :param groups: (n,) group of each row
+    :return: (n, t) array
+    """
+    reversed_max = pd.DataFrame(values[::-1]).groupby(groups[::-1], sort=False).cummax().to_numpy()
+    return reversed_max[::-1]
+
+
+def _same(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    # equal values, NaN equals NaN
+    return (first == second) | (np.isnan(first) & np.isnan(second))
+
+
+def precision_recall_sweep(scores: pd.DataFrame,
+                           iou_thresholds,
+                           label_names: list = None,
+                           each_label: bool = True,
+                           dataset_name: str = None) -> pd.DataFrame:
+    """
+    Every point precision-recall curves of a model for several IoU thresholds, from one matched annotations table.
+
+    Same points as dtlpymetrics calc_precision_recall(method_type='every_point') for each threshold,
+    but the detections are sorted once and the curves of all the thresholds (and all the labels)
+    are cumulative sums over one (detections x thresholds) matrix.
+
+    :param scores: matched annotations of the model (dtlpymetrics scores csv): first_id, first_label, second_id,
+                   second_label, second_confidence, geometry_score
+    :param iou_thresholds: IoU thresholds for accepting a matched detection as a true positive
+    :param label_names: labels to calculate curves for, defaults to the labels found in the scores
+    :param each_label: calculate a curve for each one of the labels as well as for the dataset
+    :param dataset_name: value of the "dataset_name" column
+    :return: DataFrame with the PR_COLUMNS columns
+    """
+    thresholds = parse_iou_thresholds(iou_thresholds)
+    n_thresholds = thresholds.size
+    num_gts = int(scores['first_id'].notna().sum())
+
+    detections = scores.loc[scores['second_id'].notna()]
+    order = np.argsort(-detections['second_confidence'].to_numpy(dtype=float), kind='stable')
+    detections = detections.iloc[order]
+    confidence = detections['second_confidence'].to_numpy(dtype=float)
+    true_positives = detections['geometry_score'].to_numpy(dtype=float)[:, None] >= thresholds[None, :]
+
+    if label_names is None or len(label_names) == 0:
+        label_names = pd.concat([scores['first_label'], scores['second_label']]).dropna().unique()
+    label_names = sorted(set(label_names))
+
+    # curve rows: the dataset curve (group 0) over all the detections, then one curve for each label,
+    # over the detections whose ground truth or prediction has the label
+    n_detections = len(detections)
+    rows = [np.arange(n_detections)]
+    groups = [np.zeros(n_detections, dtype=np.int64)]
+    if each_label is True and len(label_names) > 0:
+        codes = {label: i_label + 1 for i_label, label in enumerate(label_names)}
+        first_codes = detections['first_label'].map(codes).fillna(0).to_numpy(dtype=np.int64)
+        second_codes = detections['second_label'].map(codes).fillna(0).to_numpy(dtype=np.int64)
+        label_rows = np.concatenate([np.arange(n_detections), np.arange(n_detections)])
+        label_groups = np.concatenate([first_codes, second_codes])
+        # same label on both sides is counted once
+        keep = (label_groups > 0) & ~np.concatenate([np.zeros(n_detections, dtype=bool),
+                                                      first_codes == second_codes])
+        label_rows, label_groups = label_rows[keep], label_groups[keep]
+        # group by label, keeping the confidence order inside each label
+        by_label = np.lexsort((label_rows, label_groups))
+        rows.append(label_rows[by_label])
+        groups.append(label_groups[by_label])
+    rows = np.concatenate(rows)
+    groups = np.concatenate(groups)
+
+    # cumulative true positives inside each group, for every threshold
+    group_ids, group_starts, group_sizes = np.unique(groups, return_index=True, return_counts=True)
+    cumulative = np.cumsum(true_positives[rows], axis=0, dtype=np.int64)
+    before_group = np.zeros((group_ids.size, n_thresholds), dtype=np.int64)
+    before_group[1:] = cumulative[group_starts[1:] - 1]
+    group_index = np.repeat(np.arange(group_ids.size), group_sizes)
+    tps = cumulative - before_group[group_index]
+    n_seen = (np.arange(rows.size) - group_starts[group_index] + 1)[:, None]
+    recall = tps / num_gts if num_gts > 0 else np.full(tps.shape, np.nan)
+    precision = tps / n_seen
+
+    # every point curve: pad each group with a first (recall 0) and a last point, as dtlpymetrics does
+    n_groups = group_ids.size
+    padded_size = rows.size + 2 * n_groups
+    first_pad = group_starts + 2 * np.arange(n_groups)
+    last_pad = first_pad + group_sizes + 1
+    inner = np.arange(rows.size) + 2 * group_index + 1
+    padded_groups = np.repeat(group_ids, group_sizes + 2)
+
+    padded_precision = np.zeros((padded_size, n_thresholds))
+    padded_precision[inner] = precision
+    padded_precision = _grouped_reverse_cummax(padded_precision, padded_groups)
+    padded_recall = np.zeros((padded_size, n_thresholds))
+    padded_recall[inner] = recall
+    padded_recall[last_pad] = padded_recall[last_pad - 1]
+    padded_confidence = np.zeros(padded_size)
+    padded_confidence[inner] = confidence[rows]
+    padded_confidence[first_pad] = padded_confidence[first_pad + 1]
+    padded_confidence[last_pad] = padded_confidence[last_pad - 1]
+
+    # inside a curve the precision and confidence never increase and the recall never decreases, so repeated
+    # points are consecutive: keep the first point of each run (same rows as DataFrame.drop_duplicates)
+    keep = np.ones((padded_size, n_thresholds), dtype=bool)
+    same_point = (padded_groups[1:] == padded_groups[:-1])[:, None] & \
+        _same(padded_precision[1:], padded_precision[:-1]) & \
+        _same(padded_recall[1:], padded_recall[:-1]) & \
+        (padded_confidence[1:] == padded_confidence[:-1])[:, None]
+    keep[1:] = ~same_point
+    # threshold major order, as the curves of consecutive calc_precision_recall calls
+    i_threshold, i_point = np.nonzero(keep.T)
+
+    label_of_group = np.asarray(['_NA'] + list(label_names), dtype=object)
+    frames = [pd.DataFrame({
+        'iou_threshold': thresholds[i_threshold],
+        'data': np.where(padded_groups[i_point] == 0, 'dataset', 'label').astype(object),
+        'label_name': label_of_group[padded_groups[i_point]],
+        'precision': padded_precision[i_point, i_threshold],
+        'recall': padded_recall[i_point, i_threshold],
+        'confidence': padded_confidence[i_point],
+        'dataset_name': dataset_name,
+    })]
+
+    # curves without any detection get a single zero point
+    expected_groups = np.arange(len(label_names) + 1) if each_label is True else np.zeros(1, dtype=np.int64)
+    empty_groups = np.setdiff1d(expected_groups, group_ids)
+    if empty_groups.size > 0:
+        frames.append(pd.DataFrame({
+            'iou_threshold': np.repeat(thresholds, empty_groups.size),
+            'data': np.tile(np.where(empty_groups == 0, 'dataset', 'label').astype(object), n_thresholds),
+            'label_name': np.tile(label_of_group[empty_groups], n_thresholds),
+            'precision': 0.0,
+            'recall': 0.0,
+            'confidence': 0.0,
+            'dataset_name': dataset_name,
+        }))
+    return pd.concat(frames, ignore_index=True)[PR_COLUMNS]
+
+
+def auc_pr(pr_df: pd.DataFrame, by: tuple = ('iou_threshold', 'data', 'label_name')) -> pd.DataFrame:
+    """
+    Area under the precision-recall curve of every curve of a precision-recall table at once.
+
+    The points of all the curves are sorted in one pass (by curve, recall, then decreasing precision, the order of
+    an every point curve), and the trapezoids of each curve are summed with a bincount.
+
+    :param pr_df: precision-recall points, with the "precision", "recall" and the `by` columns
+    :param by: columns identifying a curve, missing columns are ignored
+    :return: DataFrame with the `by` columns and an "auc_pr" column, one row per curve
+    """
+    by = [column for column in by if column in pr_df.columns]
+    if len(pr_df) == 0:
+        return pd.DataFrame(columns=by + ['auc_pr'])
+    precision = pr_df['precision'].to_numpy(dtype=float)
+    recall = pr_df['recall'].to_numpy(dtype=float)
+
+    if len(by) > 0:
+        curves = pr_df.groupby(by, sort=False, dropna=False).ngroup().to_numpy()
+    else:
+        curves = np.zeros(len(pr_df), dtype=np.int64)
+    # the sweep and dtlpymetrics write each curve as one contiguous run of points, already in curve order
+    in_order = np.all((curves[1:] > curves[:-1]) |
+                      ((curves[1:] == curves[:-1]) &
+                       ((recall[1:] > recall[:-1]) | ((recall[1:] == recall[:-1]) & (precision[1:] <= precision[:-1])))))
+    n_curves = int(curves.max()) + 1
+
+    if in_order:
+        order = np.arange(len(pr_df))
+    else:
+        order = np.lexsort((-precision, recall, curves))
+        curves, precision, recall = curves[order], precision[order], recall[order]
+    same_curve = curves[1:] == curves[:-1]
+    trapezoids = np.where(same_curve, (recall[1:] - recall[:-1]) * (precision[1:] + precision[:-1]) / 2, 0.0)
+    areas = np.bincount(curves[1:], weights=trapezoids, minlength=n_curves)
+
+    _, first_points = np.unique(curves, return_index=True)
+    result = pr_df[by].iloc[order[first_points]].reset_index(drop=True) if len(by) > 0 else pd.DataFrame(index=[0])
+    result['auc_pr'] = areas
+    return result
+
+
+def paired_bootstrap(differences, n_resamples: int = 10000, alpha: float = 0.05, min_delta: float = 0.0,
+                     seed: int = None, n_bins: int = 256) -> dict:
+    """
+    One-sided paired bootstrap test of the mean of per-item score differences (new model - current model).
+
+    All the resamples are drawn as one (resamples x values) count matrix: the differences are reduced to a
+    histogram (the distinct values, or n_bins bins represented by the mean of their values), and the number of
+    times each bin is drawn is Poisson distributed (Poisson bootstrap), so the cost does not depend on the
+    number of items.
+
+    :param differences: per-item score differences, NaN values are ignored
+    :param n_resamples: number of bootstrap resamples
+    :param alpha: significance level
+    :param min_delta: minimal mean improvement to test against
+    :param seed: seed of the random generator, for reproducible decisions
+    :param n_bins: maximum number of histogram bins
+    :return: dict with the number of items, the mean difference, its lower confidence bound at level alpha,
+             the p-value of "mean difference <= min_delta" and whether the improvement is significant
+    """
+    differences = np.asarray(differences, dtype=float)
+    differences = differences[~np.isnan(differences)]
+    n_items = differences.size
+    if n_items == 0:
+        return {'n_items': 0, 'mean': float('nan'), 'lower_bound': float('nan'), 'p_value': 1.0,
+                'significant': False}
+
+    values, counts = np.unique(differences, return_counts=True)
+    if values.size > n_bins:
+        edges = np.linspace(values[0], values[-1], n_bins + 1)
+        bins = np.clip(np.searchsorted(edges, differences, side='right') - 1, 0, n_bins - 1)
+        counts = np.bincount(bins, minlength=n_bins)
+        sums = np.bincount(bins, weights=differences, minlength=n_bins)
+        non_empty = counts > 0
+        values, counts = sums[non_empty] / counts[non_empty], counts[non_empty]
+
+    rng = np.random.default_rng(seed)
+    draws = rng.poisson(counts.astype(float), size=(n_resamples, values.size))
+    totals = draws.sum(axis=1)
+    # a resample without any item (possible only for tiny sets) is dropped
+    valid = totals > 0
+    means = (draws[valid] @ values) / totals[valid]
+
+    lower_bound = float(np.quantile(means, alpha))
+    p_value = float((np.count_nonzero(means <= min_delta) + 1) / (means.size + 1))
+    return {'n_items': int(n_items),
+            'mean': float(differences.mean()),
+            'lower_bound': lower_bound,
+            'p_value': p_value,
+            'significant': bool(lower_bound > min_delta)}
@@ -0,0 +1,285 @@
+import os
+import json
+import time
+import logging
+import datetime
+import functools
+import threading
+import contextvars
+import collections
+import dtlpy as dl
+
+logger = logging.getLogger('Instrumentation')
+logger.setLevel(logging.INFO)
+
+MAX_RECORDS = 1000
+
+_enabled = os.environ.get('ACTIVE_LEARNING_INSTRUMENTATION', '').lower() in ('1', 'true', 'yes')
+_output_path = os.environ.get('ACTIVE_LEARNING_INSTRUMENTATION_FILE', None)
+_records = collections.deque(maxlen=MAX_RECORDS)
+_output_lock = threading.Lock()
+_hook_lock = threading.Lock()
+# the phases open in the current execution, outermost (the execution itself) first
+_open_phases = contextvars.ContextVar('active_learning_open_phases', default=())
+
+
+class _NullPhase:
+    """
+    Phase returned while the instrumentation is disabled, it does nothing
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def add(self, calls: int = 0, nbytes: int = 0):
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class ExecutionRecord:
+    """
+    Wall time, platform requests and payload bytes of one execution, in total and for each phase
+    """
+
+    def __init__(self, node: str, execution_id: str = None, node_id: str = None):
+        self.node = node
+        self.execution_id = execution_id
+        self.node_id = node_id
+        self.started_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        self.status = 'success'
+        self.wall_s = 0.0
+        self.calls = 0
+        self.bytes = 0
+        # phase name to [count, wall_s, calls, bytes], summed over the times the phase ran
+        self.phases = dict()
+        self._lock = threading.Lock()
+
+    def add_phase(self, name: str, wall_s: float, calls: int, nbytes: int):
+        with self._lock:
+            stats = self.phases.setdefault(name, [0, 0.0, 0, 0])
+            stats[0] += 1
+            stats[1] += wall_s
+            stats[2] += calls
+            stats[3] += nbytes
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            phases = {name: {'count': count, 'wall_s': wall_s, 'calls': calls, 'bytes': nbytes}
+                      for name, (count, wall_s, calls, nbytes) in self.phases.items()}
+        return {'node': self.node,
+                'execution_id': self.execution_id,
+                'node_id': self.node_id,
+                'started_at': self.started_at,
+                'status': self.status,
+                'wall_s': self.wall_s,
+                'calls': self.calls,
+                'bytes': self.bytes,
+                'phases': phases}
+
+
+class _Phase:
+    """
+    Time a phase of an execution and count the platform requests made while it is open
+    """
+
+    def __init__(self, record: ExecutionRecord, name: str = None):
+        self.record = record
+        self.name = name
+        self.calls = 0
+        self.bytes = 0
+        self._tic = None
+        self._token = None
+
+    def __enter__(self):
+        self._token = _open_phases.set(_open_phases.get() + (self,))
+        self._tic = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        wall_s = time.perf_counter() - self._tic
+        _open_phases.reset(self._token)
+        if self.name is None:
+            # the execution itself
+            self.record.wall_s, self.record.calls, self.record.bytes = wall_s, self.calls, self.bytes
+        else:
+            self.record.add_phase(name=self.name, wall_s=wall_s, calls=self.calls, nbytes=self.bytes)
+        return False
+
+    def add(self, calls: int = 0, nbytes: int = 0):
+        """
+        Count requests or payload bytes that do not go through the SDK request hook
+
+        :param calls: number of platform requests
+        :param nbytes: payload bytes
+        """
+        with self.record._lock:
+            self.calls += calls
+            self.bytes += nbytes
+
+
+def _response_bytes(response) -> int:
+    try:
+        length = response.headers.get('Content-Length')
+        if length is not None:
+            return int(length)
+        content = getattr(response, '_content', None)
+        return len(content) if isinstance(content, bytes) else 0
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def _record_request(response=None):
+    """
+    Count a platform request (and its response bytes) in every open phase of the current execution
+    """
+    phases = _open_phases.get()
+    if len(phases) == 0:
+        return
+    nbytes = _response_bytes(response) if response is not None else 0
+    with phases[0].record._lock:
+        for open_phase in phases:
+            open_phase.calls += 1
+            open_phase.bytes += nbytes
+
+
+def _install_request_hook():
+    """
+    Wrap the request method of the SDK client once, so every platform request is counted
+    """
+    client_api = getattr(dl, 'client_api', None)
+    if client_api is None:
+        return
+    with _hook_lock:
+        if getattr(client_api, '_active_learning_instrumented', False) is True:
+            return
+        gen_request = client_api.gen_request
+
+        @functools.wraps(gen_request)
+        def counted_gen_request(*args, **kwargs):
+            result = gen_request(*args, **kwargs)
+            if _enabled is True:
+                _record_request(response=result[1] if isinstance(result, tuple) and len(result) > 1 else None)
+            return result
+
+        client_api.gen_request = counted_gen_request
+        client_api._active_learning_instrumented = True
+
+
+def configure(enabled: bool = None, output_path: str = None):
+    """
+    Enable or disable the instrumentation of this worker.
+    The defaults come from the ACTIVE_LEARNING_INSTRUMENTATION and ACTIVE_LEARNING_INSTRUMENTATION_FILE
+    environment variables, it is disabled unless set.
+
+    :param enabled: record the executions
+    :param output_path: optional JSON lines file to append the execution records to
+    """
+    global _enabled, _output_path
+    if enabled is not None:
+        _enabled = enabled
+    if output_path is not None:
+        _output_path = output_path
+    if _enabled is True:
+        _install_request_hook()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def records() -> list:
+    """
+    Get the latest execution records of this worker (up to MAX_RECORDS)
+
+    :return: list of dict records, oldest first
+    """
+    return [record.to_dict() for record in list(_records)]
+
+
+def clear_records():
+    _records.clear()
+
+
+def _export(record: ExecutionRecord):
+    _records.append(record)
+    data = record.to_dict()
+    line = json.dumps(data)
+    logger.info(f'execution record: {line}')
+    if _output_path:
+        with _output_lock:
+            with open(_output_path, 'a') as f:
+                f.write(line + '\n')
+
+
+def phase(name: str):
+    """
+    Context manager for a phase of the current execution, e.g. "annotation listing".
+    Returns a no-op context while the instrumentation is disabled or outside of an instrumented execution.
+
+    :param name: name of the phase, the phases of an execution with the same name are summed
+    :return: context manager, its add() method counts requests the hook does not see
+    """
+    if _enabled is False:
+        return _NULL_PHASE
+    phases = _open_phases.get()
+    if len(phases) == 0:
+        return _NULL_PHASE
+    return _Phase(record=phases[0].record, name=name)
+
+
+def timed(name: str, func):
+    """
+    Wrap a callable (e.g. a functools.partial passed to run_concurrently) to run as a phase
+
+    :param name: name of the phase
+    :param func: callable without arguments
+    :return: the callable itself while the instrumentation is disabled
+    """
+    if _enabled is False:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with phase(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def instrumented(node: str):
+    """
+    Decorator for a service runner function: record each execution and export the record when it ends
+
+    :param node: name of the node in the records
+    :return: decorator
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _enabled is False:
+                return func(*args, **kwargs)
+            context = kwargs.get('context', None)
+            record = ExecutionRecord(node=node,
+                                     execution_id=getattr(context, 'execution_id', None),
+                                     node_id=getattr(context, 'node_id', None))
+            try:
+                with _Phase(record=record):
+                    return func(*args, **kwargs)
+            except Exception:
+                record.status = 'failed'
+                raise
+            finally:
+                _export(record)
+
+        return wrapper
+
+    return decorator
+
+
+configure()
@@ -0,0 +1,110 @@
+import os
+import time
+import random
+import logging
+import functools
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('IOExecutor')
+
+# one worker per execution of a data split service replica (runtime concurrency 32)
+DEFAULT_IO_WORKERS = 32
+# throttling and gateway errors, the request is sent again after a backoff
+RETRY_STATUS_CODES = ('429', '502', '503', '504')
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_S = 0.5
+MAX_BACKOFF_S = 30.0
+
+_executor = None
+_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def _mark_worker():
+    _worker_state.in_pool = True
+
+
+def configure_io_executor(max_workers: int = None) -> ThreadPoolExecutor:
+    """
+    (Re)create the shared I/O thread pool.
+    The worker count defaults to the ACTIVE_LEARNING_IO_WORKERS environment variable, or 32.
+
+    :param max_workers: maximum number of concurrent platform requests of this worker
+    :return: ThreadPoolExecutor
+    """
+    global _executor
+    if max_workers is None:
+        max_workers = int(os.environ.get('ACTIVE_LEARNING_IO_WORKERS', DEFAULT_IO_WORKERS))
+    if max_workers < 1:
+        raise ValueError(f"max_workers should be a positive integer, got {max_workers}")
+    with _executor_lock:
+        previous = _executor
+        _executor = ThreadPoolExecutor(max_workers=max_workers,
+                                       thread_name_prefix='active-learning-io',
+                                       initializer=_mark_worker)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    logger.debug(f'I/O executor configured with {max_workers} workers')
+    return _executor
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """
+    Get the I/O thread pool shared by all the service runners of this worker
+
+    :return: ThreadPoolExecutor
+    """
+    if _executor is None:
+        return configure_io_executor()
+    return _executor
+
+
+def run_concurrently(*calls) -> list:
+    """
+    Run independent blocking calls (e.g. platform requests) at the same time and wait for all of them.
+    The last call runs on the calling thread. Calls made from inside the pool run sequentially,
+    so nested use can never wait on its own bounded pool.
+
+    :param calls: callables without arguments (use functools.partial or lambda to bind arguments)
+    :return: list of the results, in the order of the calls
+    """
+    if len(calls) == 0:
+        return list()
+    if len(calls) == 1 or getattr(_worker_state, 'in_pool', False) is True:
+        return [call() for call in calls]
+    executor = get_io_executor()
+    # the calls see the context variables of the caller (e.g. the open instrumentation phases)
+    futures = [executor.submit(contextvars.copy_context().run, call) for call in calls[:-1]]
+    last_result = calls[-1]()
+    return [future.result() for future in futures] + [last_result]
+
+
+def with_retries(func, max_retries: int = DEFAULT_MAX_RETRIES, backoff_s: float = DEFAULT_BACKOFF_S):
+    """
+    Wrap a blocking platform request so throttled (429) and gateway (502, 503, 504) errors are retried with
+    exponential backoff and jitter. Only wrap idempotent requests, they may be sent more than once.
+
+    :param func: callable without arguments
+    :param max_retries: number of retries of a retryable error, 0 to call once
+    :param backoff_s: delay before the first retry, doubled on every retry (up to MAX_BACKOFF_S)
+    :return: callable without arguments, returning the result of func
+    """
+
+    @functools.wraps(func)
+    def _call():
+        for attempt in range(max_retries + 1):
+            try:
+                return func()
+            except Exception as error:
+                # the SDK exceptions carry the HTTP status code as a string
+                status_code = str(getattr(error, 'status_code', ''))
+                if attempt >= max_retries or status_code not in RETRY_STATUS_CODES:
+                    raise
+            delay = min(MAX_BACKOFF_S, backoff_s * 2 ** attempt) * random.uniform(0.5, 1.0)
+            logger.warning(f'Request failed with status {status_code}, retry {attempt + 1}/{max_retries} '
+                           f'in {delay:.2f}s')
+            time.sleep(delay)
+
+    return _call
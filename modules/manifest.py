@@ -0,0 +1,253 @@
+import os
+import logging
+import datetime
+import tempfile
+import functools
+import numpy as np
+import dtlpy as dl
+
+from modules.io_executor import run_concurrently
+from modules.paging import iterate_pages, page_annotations
+
+logger = logging.getLogger("[SubsetManifest]")
+
+SUBSETS = ('train', 'validation')
+MANIFEST_FILENAME = 'subsets_manifest.npy'
+# split manifest of a dataset, a hidden item written by DataSplitter.export_split_manifest
+SPLIT_MANIFEST_DIR = '/.active_learning'
+SPLIT_MANIFEST_FILENAME = 'split_manifest.npy'
+# per-label annotation counts of the split manifest rows, one column per label of the manifest label index
+SPLIT_LABELS_FILENAME = 'split_manifest_labels.npy'
+LABEL_COUNTS_DTYPE = np.dtype('<u4')
+# one row per item of a subset: the item id, the subset index (in SUBSETS, or in the subsets of a split manifest)
+# and the revision of its annotations: their count and the latest annotation updatedAt (editing an annotation does not
+# update its item, so the item updatedAt would not show the edits)
+MANIFEST_DTYPE = np.dtype([('item_id', 'S24'),
+                           ('subset', 'u1'),
+                           ('annotations_count', '<u4'),
+                           ('updated_at', '<i8')])
+
+
+def _timestamps(updated_at: list) -> np.ndarray:
+    """
+    Convert ISO "updatedAt" strings to int64 milliseconds since epoch
+
+    :param updated_at: list of ISO timestamps (None for missing)
+    :return: np.ndarray of int64, missing timestamps are the NaT value (int64 minimum)
+    """
+    values = [value.rstrip('Z') if value else 'NaT' for value in updated_at]
+    return np.array(values, dtype='datetime64[ms]').astype(np.int64)
+
+
+def manifest_rows(items: list, subset_indices, annotations: dict) -> np.ndarray:
+    """
+    Manifest rows of a page of items
+
+    :param items: list of dl.Item
+    :param subset_indices: subset index of all the items, or a sequence with the index of each item
+    :param annotations: dict of item id to the list of its annotations JSON (paging.page_annotations)
+    :return: structured np.ndarray of MANIFEST_DTYPE, in the order of the items
+    """
+    rows = np.empty(len(items), dtype=MANIFEST_DTYPE)
+    rows['item_id'] = [item.id for item in items]
+    rows['subset'] = subset_indices
+    rows['annotations_count'] = [item.annotations_count or 0 for item in items]
+    # ISO 8601 UTC times, ordered as strings
+    rows['updated_at'] = _timestamps([max((annotation.get('updatedAt') or '' for annotation in
+                                           annotations.get(item.id, list())), default=None)
+                                      for item in items])
+    return rows
+
+
+def resolve_subset(dataset: dl.Dataset, query: dict, subset: str, page_size: int = 1000) -> np.ndarray:
+    """
+    Resolve a subset DQL filter to its manifest rows
+
+    :param dataset: dl.Dataset of the subset
+    :param query: DQL filter JSON of the subset
+    :param subset: subset name, one of SUBSETS
+    :param page_size: number of items in each page
+    :return: structured np.ndarray of MANIFEST_DTYPE, sorted by item id
+    """
+    subset_index = SUBSETS.index(subset)
+    chunks = [manifest_rows(items=page,
+                            subset_indices=subset_index,
+                            annotations=page_annotations(dataset=dataset,
+                                                         item_ids=[item.id for item in page],
+                                                         page_size=page_size))
+              for page in iterate_pages(dataset=dataset, query=query, page_size=page_size)]
+    if len(chunks) == 0:
+        return np.empty(0, dtype=MANIFEST_DTYPE)
+    return np.concatenate(chunks)
+
+
+def build_manifest(dataset: dl.Dataset, subsets: dict, page_size: int = 1000) -> np.ndarray:
+    """
+    Resolve the train and validation filters once, both queries run concurrently
+
+    :param dataset: dl.Dataset of the subsets
+    :param subsets: dict of subset name (one of SUBSETS) to DQL filter JSON
+    :param page_size: number of items in each page
+    :return: structured np.ndarray of MANIFEST_DTYPE with the rows of all the subsets
+    """
+    calls = [functools.partial(resolve_subset, dataset=dataset, query=query, subset=subset, page_size=page_size)
+             for subset, query in subsets.items()]
+    if len(calls) == 0:
+        return np.empty(0, dtype=MANIFEST_DTYPE)
+    return np.concatenate(run_concurrently(*calls))
+
+
+def upload_manifest(model: dl.Model, manifest: np.ndarray, source: dict = None) -> dict:
+    """
+    Upload the manifest as a model artifact and record the subset counts in the model metadata
+
+    :param model: dl.Model the manifest belongs to
+    :param manifest: structured np.ndarray of MANIFEST_DTYPE
+    :param source: optional info of the split manifest the rows were taken from
+    :return: the manifest info saved under model.metadata['system']['subsetsManifest']
+    """
+    with tempfile.TemporaryDirectory() as local_dir:
+        local_path = os.path.join(local_dir, MANIFEST_FILENAME)
+        np.save(local_path, manifest, allow_pickle=False)
+        model.artifacts.upload(filepath=local_path, overwrite=True)
+    counts = np.bincount(manifest['subset'], minlength=len(SUBSETS))
+    info = {
+        'artifact': MANIFEST_FILENAME,
+        'createdAt': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'counts': {subset: int(count) for subset, count in zip(SUBSETS, counts)},
+    }
+    if source is not None:
+        info['source'] = source
+    model.metadata.setdefault('system', dict())['subsetsManifest'] = info
+    model.update(system_metadata=True)
+    logger.info(f"Uploaded subsets manifest to model {model.name}: {info['counts']}")
+    return info
+
+
+def load_manifest(model: dl.Model, local_dir: str = None) -> dict:
+    """
+    Download the subsets manifest of a model, for starting a training without re-running the subset queries
+
+    :param model: dl.Model with a subsets manifest artifact
+    :param local_dir: optional directory to download to, defaults to a temporary directory
+    :return: dict of subset name to structured np.ndarray of MANIFEST_DTYPE
+    """
+    if local_dir is None:
+        local_dir = tempfile.mkdtemp()
+    model.artifacts.download(artifact_name=MANIFEST_FILENAME, local_path=local_dir, overwrite=True)
+    manifest = np.load(os.path.join(local_dir, MANIFEST_FILENAME), allow_pickle=False)
+    return {subset: manifest[manifest['subset'] == i_subset] for i_subset, subset in enumerate(SUBSETS)}
+
+
+def label_counts_matrix(n_rows: int, rows: list, columns: list, n_labels: int) -> np.ndarray:
+    """
+    Per-label annotation counts of the manifest rows
+
+    :param n_rows: number of manifest rows
+    :param rows: manifest row of each annotation
+    :param columns: label index of each annotation
+    :param n_labels: number of labels of the label index
+    :return: np.ndarray of LABEL_COUNTS_DTYPE with shape (n_rows, n_labels)
+    """
+    counts = np.zeros((n_rows, n_labels), dtype=LABEL_COUNTS_DTYPE)
+    if len(rows) > 0:
+        np.add.at(counts, (np.asarray(rows, dtype=np.int64), np.asarray(columns, dtype=np.int64)), 1)
+    return counts
+
+
+def upload_split_manifest(dataset: dl.Dataset, manifest: np.ndarray, subsets: list, query: dict = None,
+                          label_counts: np.ndarray = None, labels: list = None) -> dl.Item:
+    """
+    Upload the split manifest of a dataset as a hidden item, replacing the previous one.
+    The per-label counts are uploaded next to it, as a second hidden item with the same rows
+
+    :param dataset: dl.Dataset of the items
+    :param manifest: structured np.ndarray of MANIFEST_DTYPE, the subset column indexes `subsets`
+    :param subsets: subset names
+    :param query: optional DQL filter JSON the manifest was exported from
+    :param label_counts: optional np.ndarray of LABEL_COUNTS_DTYPE, the annotation count of each label (column) of
+                         each manifest row
+    :param labels: label names of the label_counts columns
+    :return: the manifest dl.Item, its metadata.user.splitManifest holds the subsets, the labels and their counts
+    """
+    counts = np.bincount(manifest['subset'], minlength=len(subsets)) if len(manifest) > 0 else [0] * len(subsets)
+    info = {
+        'subsets': list(subsets),
+        'counts': {subset: int(count) for subset, count in zip(subsets, counts)},
+        'createdAt': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'query': query,
+    }
+    with tempfile.TemporaryDirectory() as local_dir:
+        if label_counts is not None:
+            info['labels'] = list(labels)
+            info['labelCounts'] = {
+                subset: {label: int(count)
+                         for label, count in zip(labels, label_counts[manifest['subset'] == i_subset].sum(axis=0))}
+                for i_subset, subset in enumerate(subsets)}
+            labels_path = os.path.join(local_dir, SPLIT_LABELS_FILENAME)
+            np.save(labels_path, label_counts, allow_pickle=False)
+            dataset.items.upload(local_path=labels_path,
+                                 remote_path=SPLIT_MANIFEST_DIR,
+                                 overwrite=True,
+                                 item_metadata={'user': {'splitManifestLabels': {'labels': list(labels)}}})
+        local_path = os.path.join(local_dir, SPLIT_MANIFEST_FILENAME)
+        np.save(local_path, manifest, allow_pickle=False)
+        item = dataset.items.upload(local_path=local_path,
+                                    remote_path=SPLIT_MANIFEST_DIR,
+                                    overwrite=True,
+                                    item_metadata={'user': {'splitManifest': info}})
+    logger.info(f"Uploaded split manifest of dataset {dataset.name} ({item.id}): {info['counts']}")
+    return item
+
+
+def load_split_manifest(dataset: dl.Dataset, local_dir: str = None, mmap_mode: str = 'r') -> tuple:
+    """
+    Download the split manifest of a dataset and map it in memory, so a data loader can build its shards
+    without running the subset queries
+
+    :param dataset: dl.Dataset with a split manifest
+    :param local_dir: optional directory to download to, defaults to a temporary directory
+    :param mmap_mode: np.load memory-map mode, None to read the whole file
+    :return: tuple of the structured np.ndarray of MANIFEST_DTYPE, the subset names and the manifest dl.Item
+    """
+    if local_dir is None:
+        local_dir = tempfile.mkdtemp()
+    item = dataset.items.get(filepath=f'{SPLIT_MANIFEST_DIR}/{SPLIT_MANIFEST_FILENAME}')
+    local_path = item.download(local_path=local_dir, to_items_folder=False, overwrite=True)
+    manifest = np.load(local_path, mmap_mode=mmap_mode, allow_pickle=False)
+    return manifest, item.metadata['user']['splitManifest']['subsets'], item
+
+
+def load_split_label_counts(dataset: dl.Dataset, local_dir: str = None, mmap_mode: str = 'r') -> tuple:
+    """
+    Download the per-label counts of the split manifest of a dataset and map them in memory. Row i holds the
+    annotation count of each label of the item of row i of the split manifest
+
+    :param dataset: dl.Dataset with a split manifest
+    :param local_dir: optional directory to download to, defaults to a temporary directory
+    :param mmap_mode: np.load memory-map mode, None to read the whole file
+    :return: tuple of the np.ndarray of LABEL_COUNTS_DTYPE with shape (rows, labels) and the label names
+    """
+    if local_dir is None:
+        local_dir = tempfile.mkdtemp()
+    item = dataset.items.get(filepath=f'{SPLIT_MANIFEST_DIR}/{SPLIT_LABELS_FILENAME}')
+    local_path = item.download(local_path=local_dir, to_items_folder=False, overwrite=True)
+    label_counts = np.load(local_path, mmap_mode=mmap_mode, allow_pickle=False)
+    return label_counts, item.metadata['user']['splitManifestLabels']['labels']
+
+
+def subsets_from_split_manifest(split_manifest: np.ndarray, split_subsets: list) -> np.ndarray:
+    """
+    Take the train and validation rows of a split manifest, as the rows of a model subsets manifest
+
+    :param split_manifest: structured np.ndarray of MANIFEST_DTYPE, the subset column indexes `split_subsets`
+    :param split_subsets: subset names of the split manifest
+    :return: structured np.ndarray of MANIFEST_DTYPE, the subset column indexes SUBSETS
+    """
+    # split subset index to SUBSETS index, -1 for the subsets that are not trained on (e.g. test)
+    remap = np.array([SUBSETS.index(subset) if subset in SUBSETS else -1 for subset in split_subsets] + [-1],
+                     dtype=np.int16)
+    subset_indices = remap[np.minimum(split_manifest['subset'], len(split_subsets))]
+    rows = np.array(split_manifest[subset_indices >= 0])
+    rows['subset'] = subset_indices[subset_indices >= 0]
+    return rows
@@ -1,16 +1,85 @@
 import os
+import copy
 import json
 import logging
+import tempfile
+import functools
+import threading
 import dtlpy as dl
 import numpy as np
 import pandas as pd
 
-from dtlpymetrics.scoring import calc_precision_recall
-from sklearn.metrics import auc
+from modules import instrumentation
+from modules.caching import DiskCache
+from modules.delta_evaluation import update_item_matches
+from modules.evaluation import auc_pr, paired_bootstrap, parse_iou_thresholds, precision_recall_sweep
+from modules.io_executor import run_concurrently
 
 logger = logging.getLogger('ModelCompare')
 logger.setLevel(logging.INFO)
 
+DEFAULT_CACHE_MAX_MB = 512
+# bump when the cached evaluation format changes
+EVAL_CACHE_VERSION = 2
+
+_eval_cache = None
+_eval_cache_lock = threading.Lock()
+
+
+DEFAULT_COMPARE_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                           'pipeline_configs', 'compare_configurations.json')
+
+
+def _load_compare_config(path: str) -> dict:
+    """
+    Parse a compare configuration file, an empty configuration if it is missing.
+    """
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.warning(f"Default compare configuration {path} not found.")
+        return dict()
+
+
+# parsed once when the service starts, callers must copy it before changing it
+DEFAULT_COMPARE_CONFIG = _load_compare_config(DEFAULT_COMPARE_CONFIG_PATH)
+
+
+def get_model_scores_df(dataset: dl.Dataset, model: dl.Model) -> pd.DataFrame:
+    # dtlpymetrics loads scipy, seaborn and matplotlib, import it on the first evaluation and not on startup
+    from dtlpymetrics.evaluating import get_model_scores_df as _get_model_scores_df
+    with instrumentation.phase('scores download'):
+        return _get_model_scores_df(dataset=dataset, model=model)
+
+
+def calc_precision_recall(dataset_id: str, model_id: str, iou_threshold: float, method_type: str) -> pd.DataFrame:
+    from dtlpymetrics.scoring import calc_precision_recall as _calc_precision_recall
+    return _calc_precision_recall(dataset_id=dataset_id,
+                                  model_id=model_id,
+                                  iou_threshold=iou_threshold,
+                                  method_type=method_type)
+
+
+def _get_eval_cache():
+    """
+    Get the on-disk evaluation cache of this worker.
+    The directory and size limit come from the ACTIVE_LEARNING_CACHE_DIR and ACTIVE_LEARNING_CACHE_MAX_MB
+    environment variables, a size limit of 0 disables the cache.
+
+    :return: DiskCache, or None when the cache is disabled
+    """
+    global _eval_cache
+    max_mb = float(os.environ.get('ACTIVE_LEARNING_CACHE_MAX_MB', DEFAULT_CACHE_MAX_MB))
+    if max_mb <= 0:
+        return None
+    with _eval_cache_lock:
+        if _eval_cache is None:
+            directory = os.environ.get('ACTIVE_LEARNING_CACHE_DIR',
+                                       os.path.join(tempfile.gettempdir(), 'active-learning-cache'))
+            _eval_cache = DiskCache(directory=directory, max_bytes=int(max_mb * 1024 ** 2))
+    return _eval_cache
+
 
 class ModelComparer(dl.BaseServiceRunner):
     """
@@ -18,28 +87,240 @@ class ModelComparer(dl.BaseServiceRunner):
     """
 
     @staticmethod
-    def metrics_to_df(model: dl.Model) -> pd.DataFrame:
+    def metrics_to_df(model: dl.Model, figures: list = None, legends: list = None, page_size: int = 1000) -> pd.DataFrame:
         """
-        Converts the metrics of a model to a pandas DataFrame with x and y columns.
+        Converts the metrics of a model to a pandas DataFrame with figure, legend, x and y columns.
+
+        The figure and legend filters are part of the query, so only the needed samples are downloaded. The raw
+        result pages are written straight into preallocated columns, without building a sample entity per row.
 
         Args:
             model (dl.Model): Model entity from which to download metrics
+            figures (list, optional): Only download the samples of these figures
+            legends (list, optional): Only download the samples of these legends
+            page_size (int, optional): Number of samples in each page
 
         Returns:
             pd.DataFrame: DataFrame containing the model's metric scores with x and y columns
         """
-        samples = model.metrics.list().to_df()
-
-        try:
-            data = samples['data'].values
-            x = [d['x'] for d in data]
-            y = [d['y'] for d in data]
-            samples['x'] = x
-            samples['y'] = y
-        except KeyError:
+        filters = dl.Filters(resource=dl.FiltersResource.METRICS, field='modelId', values=model.id)
+        if figures:
+            filters.add(field='figure', values=sorted(set(figures)), operator=dl.FiltersOperations.IN)
+        if legends:
+            filters.add(field='legend', values=sorted(set(legends)), operator=dl.FiltersOperations.IN)
+        filters.page_size = page_size
+
+        figure_col = np.empty(0, dtype=object)
+        legend_col = np.empty(0, dtype=object)
+        x_col = np.empty(0, dtype=float)
+        y_col = np.empty(0, dtype=float)
+        n_samples = 0
+        missing_data = False
+        page = 0
+        while True:
+            filters.page = page
+            with instrumentation.phase('metrics listing'):
+                response = model.metrics._list(filters=filters)
+            samples = response.get('items', list()) if response else list()
+            n_page = len(samples)
+            if n_samples + n_page > len(x_col):
+                # allocate the total count of the query on the first page, grow if more samples arrive meanwhile
+                size = max(int(response.get('totalItemsCount', 0)), n_samples + n_page)
+                figure_col, legend_col = np.resize(figure_col, size), np.resize(legend_col, size)
+                x_col, y_col = np.resize(x_col, size), np.resize(y_col, size)
+            end = n_samples + n_page
+            figure_col[n_samples:end] = [sample.get('figure', '') for sample in samples]
+            legend_col[n_samples:end] = [sample.get('legend', '') for sample in samples]
+            data = [sample.get('data') or dict() for sample in samples]
+            missing_data |= any('x' not in d or 'y' not in d for d in data)
+            x_page = [d.get('x') for d in data]
+            y_page = [d.get('y') for d in data]
+            try:
+                # None (no value) becomes NaN
+                x_col[n_samples:end] = np.array(x_page, dtype=float)
+                y_col[n_samples:end] = np.array(y_page, dtype=float)
+            except (TypeError, ValueError):
+                # non-numeric values, keep them as they are
+                x_col, y_col = x_col.astype(object), y_col.astype(object)
+                x_col[n_samples:end] = x_page
+                y_col[n_samples:end] = y_page
+            n_samples = end
+            if n_page == 0 or not response.get('hasNextPage', False):
+                break
+            page += 1
+
+        if missing_data is True:
             logger.warning(f"Metrics for model {model.name} do not contain data. Please check model.")
+        return pd.DataFrame({'figure': figure_col[:n_samples],
+                             'legend': legend_col[:n_samples],
+                             'x': x_col[:n_samples],
+                             'y': y_col[:n_samples]})
 
-        return samples
+    @staticmethod
+    def _scores_fingerprint(dataset: dl.Dataset, model_id: str):
+        """
+        Fingerprint of the evaluation of a model on a dataset.
+        The matched annotations file ("{model_id}.csv") is uploaded again on every evaluation, so its
+        id and update time change whenever the test subset annotations or the model predictions are scored again.
+
+        Args:
+            dataset (dl.Dataset): Dataset the model was evaluated on
+            model_id (str): ID of the evaluated model
+
+        Returns:
+            str: fingerprint, or None if the model was not evaluated on the dataset
+        """
+        filters = dl.Filters(field='hidden', values=True)
+        filters.add(field='name', values=f'{model_id}.csv')
+        items = list(dataset.items.list(filters=filters).items)
+        if len(items) != 1:
+            return None
+        label_names = sorted(label.tag for label in dataset.labels)
+        return f"{items[0].id}:{items[0].updated_at}:{','.join(label_names)}"
+
+    @staticmethod
+    def _calc_precision_recall(dataset: dl.Dataset, model: dl.Model, iou_thresholds: np.ndarray,
+                               method_type: str) -> pd.DataFrame:
+        """
+        Calculate the precision-recall points of a model for one or more IoU thresholds.
+        Several thresholds are swept over one download of the matched annotations, instead of one
+        calc_precision_recall call (download and matching) per threshold.
+
+        Args:
+            dataset (dl.Dataset): Dataset the model was evaluated on
+            model (dl.Model): The evaluated model
+            iou_thresholds (np.ndarray): IoU thresholds of a true positive
+            method_type (str): dtlpymetrics precision-recall method
+
+        Returns:
+            pd.DataFrame: precision-recall points of the dataset and of each label, for each threshold
+        """
+        with instrumentation.phase('precision recall'):
+            if len(iou_thresholds) == 1 or method_type != 'every_point':
+                return pd.concat([calc_precision_recall(dataset_id=dataset.id,
+                                                        model_id=model.id,
+                                                        iou_threshold=float(iou_threshold),
+                                                        method_type=method_type)
+                                  for iou_threshold in iou_thresholds], ignore_index=True)
+            return precision_recall_sweep(scores=get_model_scores_df(dataset=dataset, model=model),
+                                          iou_thresholds=iou_thresholds,
+                                          label_names=[label.tag for label in dataset.labels],
+                                          dataset_name=dataset.name)
+
+    @staticmethod
+    def _precision_recall(dataset: dl.Dataset, model: dl.Model, iou_thresholds: np.ndarray,
+                          method_type: str) -> pd.DataFrame:
+        """
+        Calculate the precision-recall points of a model, from the on-disk cache when the evaluation did not change.
+
+        Args:
+            dataset (dl.Dataset): Dataset the model was evaluated on
+            model (dl.Model): The evaluated model
+            iou_thresholds (np.ndarray): IoU thresholds of a true positive
+            method_type (str): dtlpymetrics precision-recall method
+
+        Returns:
+            pd.DataFrame: precision-recall points of the dataset and of each label, for each threshold
+        """
+        cache = _get_eval_cache()
+        with instrumentation.phase('evaluation cache'):
+            fingerprint = ModelComparer._scores_fingerprint(dataset=dataset, model_id=model.id) if cache else None
+        if fingerprint is None:
+            return ModelComparer._calc_precision_recall(dataset=dataset,
+                                                        model=model,
+                                                        iou_thresholds=iou_thresholds,
+                                                        method_type=method_type)
+        key = (EVAL_CACHE_VERSION, dataset.id, model.id, tuple(iou_thresholds.tolist()), method_type, fingerprint)
+        with instrumentation.phase('evaluation cache'):
+            pr_df = cache.get(key)
+        if pr_df is not None:
+            logger.info(f"Loaded precision-recall of model {model.id} from the evaluation cache.")
+            return pr_df
+        pr_df = ModelComparer._calc_precision_recall(dataset=dataset,
+                                                     model=model,
+                                                     iou_thresholds=iou_thresholds,
+                                                     method_type=method_type)
+        cache.put(key, pr_df)
+        return pr_df
+
+    @staticmethod
+    def _delta_model_scores(dataset: dl.Dataset, model: dl.Model, test_subset: dict) -> pd.DataFrame:
+        """
+        Get the matched annotations of a model on a test subset, matching again only the items that changed
+        since the previous evaluation (the per-item matches are kept in the evaluation cache).
+
+        Args:
+            dataset (dl.Dataset): Dataset containing the test subset
+            model (dl.Model): The evaluated model
+            test_subset (dict): DQL filter JSON of the test subset items
+
+        Returns:
+            pd.DataFrame: matched annotations of the model (dtlpymetrics scores csv columns)
+        """
+        cache = _get_eval_cache()
+        key = (EVAL_CACHE_VERSION, 'item matches', dataset.id, model.id, model.name,
+               json.dumps(test_subset, sort_keys=True, default=str))
+        with instrumentation.phase('evaluation cache'):
+            previous = cache.get(key) if cache else None
+        matches = update_item_matches(dataset=dataset, model=model, query=test_subset, previous=previous)
+        if cache and (previous is None or matches['n_matched'] > 0 or
+                      len(matches['revisions']) != len(previous['revisions']) or
+                      matches['latestUpdate'] != previous.get('latestUpdate')):
+            with instrumentation.phase('evaluation cache'):
+                cache.put(key, matches)
+        return matches['scores']
+
+    @staticmethod
+    def _evaluate(model: dl.Model, dataset: dl.Dataset, compare_config: dict) -> dict:
+        """
+        Get the evaluation of one model for each metric specified in the compare_config.
+        A metric with a "test_subset" DQL filter is evaluated from the per-item matches of the subset, updated
+        for the changed items only, instead of the model scores file.
+
+        Args:
+            model (dl.Model): The evaluated model
+            dataset (dl.Dataset): Dataset containing the test subset for model evaluation
+            compare_config (dict): Configuration specifying which metrics to compare
+
+        Returns:
+            dict: metric name to the evaluation DataFrame of the model
+        """
+        evaluation = dict()
+        # test subset query to the matched annotations, shared by the metrics of the same subset
+        delta_scores = dict()
+        for metric_name, metric_config in compare_config.items():
+            # the other entries (e.g. "wins": "any") are not evaluated metrics, get_eval_df warns about them
+            if metric_name not in ('precision_recall', 'annotation_scores') or not isinstance(metric_config, dict):
+                continue
+            scores = None
+            test_subset = metric_config.get('test_subset', None)
+            if test_subset is not None:
+                subset_key = json.dumps(test_subset, sort_keys=True, default=str)
+                if subset_key not in delta_scores:
+                    delta_scores[subset_key] = ModelComparer._delta_model_scores(dataset=dataset,
+                                                                                 model=model,
+                                                                                 test_subset=test_subset)
+                scores = delta_scores[subset_key]
+            if metric_name == 'precision_recall':
+                iou_thresholds = parse_iou_thresholds(metric_config.get('iou_threshold', 0.5))
+                if scores is not None:
+                    with instrumentation.phase('precision recall'):
+                        evaluation[metric_name] = precision_recall_sweep(
+                            scores=scores,
+                            iou_thresholds=iou_thresholds,
+                            label_names=[label.tag for label in dataset.labels],
+                            dataset_name=dataset.name)
+                else:
+                    evaluation[metric_name] = ModelComparer._precision_recall(
+                        dataset=dataset,
+                        model=model,
+                        iou_thresholds=iou_thresholds,
+                        method_type='every_point',
+                    )
+            elif metric_name == 'annotation_scores':
+                evaluation[metric_name] = scores if scores is not None else \
+                    get_model_scores_df(dataset=dataset, model=model)
+        return evaluation
 
     @staticmethod
     def get_eval_df(previous_model: dl.Model, new_model: dl.Model, dataset: dl.Dataset, compare_config: dict):
@@ -54,30 +335,85 @@ class ModelComparer(dl.BaseServiceRunner):
                                   If empty, defaults to comparing annotation scores
 
         Note:
-            Currently supports precision-recall metrics. Other metrics will trigger
+            Currently supports precision-recall and annotation scores metrics. Other metrics will trigger
             a NotImplementedError warning.
         """
-
-        for metric_name, metric_config in compare_config.items():
-            if metric_name == 'precision_recall':
-                iou_threshold = metric_config.get('iou_threshold', 0.5)
-                current_pr_df = calc_precision_recall(
-                    dataset_id=dataset.id,
-                    model_id=previous_model.id,
-                    iou_threshold=iou_threshold,
-                    method_type='every_point',
-                )
-
-                new_pr_df = calc_precision_recall(
-                    dataset_id=dataset.id, model_id=new_model.id, iou_threshold=iou_threshold, method_type='every_point'
-                )
-                metric_config['current_model_metrics'] = current_pr_df
-                metric_config['new_model_metrics'] = new_pr_df
-            else:
+        for metric_name in compare_config:
+            if metric_name not in ('precision_recall', 'annotation_scores'):
                 logger.warning(
-                    NotImplementedError(f"Metric {metric_name} is not implemented, use precision_recall instead.")
+                    NotImplementedError(f"Metric {metric_name} is not implemented, use precision_recall or "
+                                        f"annotation_scores instead.")
                 )
-                continue
+
+        # the two evaluations are independent, run them at the same time
+        current_evaluation, new_evaluation = run_concurrently(
+            functools.partial(ModelComparer._evaluate, model=previous_model, dataset=dataset,
+                              compare_config=compare_config),
+            functools.partial(ModelComparer._evaluate, model=new_model, dataset=dataset,
+                              compare_config=compare_config),
+        )
+        for metric_name in current_evaluation:
+            compare_config[metric_name]['current_model_metrics'] = current_evaluation[metric_name]
+            compare_config[metric_name]['new_model_metrics'] = new_evaluation[metric_name]
+
+    @staticmethod
+    def _index_metrics(model_metrics: pd.DataFrame) -> dict:
+        """
+        Index the metrics of a model by figure and legend, in one pass over the rows.
+
+        Args:
+            model_metrics (pd.DataFrame): Metrics of a model with figure, legend, x and y columns
+
+        Returns:
+            dict: (figure, legend) to a tuple of arrays (x, y, order), x and y in the logged order and
+                  order sorting x (stable), for binary search of x values
+        """
+        if len(model_metrics) == 0 or not {'figure', 'legend', 'x', 'y'}.issubset(model_metrics.columns):
+            return dict()
+        x = model_metrics['x'].to_numpy()
+        y = model_metrics['y'].to_numpy()
+        index = dict()
+        for key, rows in model_metrics.groupby(['figure', 'legend'], sort=False).indices.items():
+            key_x = x[rows]
+            index[key] = (key_x, y[rows], np.argsort(key_x, kind='stable'))
+        return index
+
+    @staticmethod
+    def _metric_value(metrics_index: dict, figure: str, legend: str, x_index: int = None, x_value=None,
+                      model_name: str = ''):
+        """
+        Look up a metric value in an index built by _index_metrics.
+
+        Args:
+            metrics_index (dict): Metrics index of a model
+            figure (str): Figure of the metric
+            legend (str): Legend of the metric
+            x_index (int): Position of the sample in the logged order, negative values count from the end
+            x_value: x of the sample (e.g. the epoch), found by binary search. If it was not logged,
+                     the last sample before it is used. Takes precedence over x_index
+            model_name (str): Name of the model for the error messages
+
+        Returns:
+            The y value of the first sample logged at the x value
+        """
+        try:
+            x, y, order = metrics_index[(figure, legend)]
+        except KeyError:
+            raise ValueError(f"Could not find figure {figure} and legend {legend} in {model_name} model metrics")
+        if len(x) == 0:
+            raise ValueError(f"Could not find figure {figure} and legend {legend} in {model_name} model metrics")
+        if x_value is None:
+            x_value = x[x_index]
+        sorted_x = x[order]
+        position = np.searchsorted(sorted_x, x_value, side='left')
+        if position == len(sorted_x) or sorted_x[position] != x_value:
+            # x value not logged, use the last one before it
+            position = np.searchsorted(sorted_x, x_value, side='right') - 1
+            if position < 0:
+                raise ValueError(f"No x value up to {x_value} for figure {figure} and legend {legend} "
+                                 f"in {model_name} model metrics")
+            position = np.searchsorted(sorted_x, sorted_x[position], side='left')
+        return y[order[position]]
 
     @staticmethod
     def compare_model_training(
@@ -103,17 +439,43 @@ class ModelComparer(dl.BaseServiceRunner):
             - maximize: Whether higher values are better
             - figure: Which metric figure to compare
             - legend: Which legend entry to compare
-            - x_index: Which x value to compare at
+            - x_index: Which x value to compare at, by position in the logged order (default: -1, the last one)
+            - x_value: Which x value to compare at, by value (e.g. the epoch)
         """
         wins = configuration.get('wins', None)
         if wins is None:
             logger.warning("No wins specified in configuration. Using 'any' as default.")
             wins = 'any'
+        # labels_filter = configuration.get('labels_filter', None) # TODO support filtering by specific labels
+
+        # index the metrics once, every check is then a dict lookup
+        new_model_wins = ModelComparer._training_wins(
+            current_index=ModelComparer._index_metrics(current_model_metrics),
+            new_index=ModelComparer._index_metrics(new_model_metrics),
+            configuration=configuration,
+        )
+
+        # TODO check all config return types
+        logger.info(f"Finished model comparison, wins list: {new_model_wins}")
+
+        return ModelComparer.check_if_winning(wins, new_model_wins)
+
+    @staticmethod
+    def _training_wins(current_index: dict, new_index: dict, configuration: dict) -> list:
+        """
+        Run the checks of the configuration on the indexed training metrics of two models.
+
+        Args:
+            current_index (dict): Metrics index of the current/previous model, built by _index_metrics
+            new_index (dict): Metrics index of the new model, built by _index_metrics
+            configuration (dict): Configuration with the checks and verbose settings
+
+        Returns:
+            list: True for each check won by the new model
+        """
         checks = configuration.get('checks', [])
         verbose = configuration.get('verbose', False)
-        # labels_filter = configuration.get('labels_filter', None) # TODO support filtering by specific labels
         new_model_wins = list()
-
         for check in checks:
             min_delta = check.get('min_delta', 0)
             maximize = check.get('maximize', True)
@@ -121,46 +483,107 @@ class ModelComparer(dl.BaseServiceRunner):
             legend = check.get('legend', None)
             x_index = check.get('x_index', None)
             x_value = check.get('x_value', None)
-            # TODO do some sanity check here (if none, give default value and warn)
-
-            # now we filter the current model Dataframe by column values
-            current_values = current_model_metrics.loc[
-                (current_model_metrics['figure'] == figure) & (current_model_metrics['legend'] == legend)
-            ]
-            current_x = current_values['x'].values
-            current_y = current_values['y'].values
-
-            if len(current_x) == 0 or len(current_y) == 0:
-                raise ValueError(f"Could not find figure {figure} and legend {legend} in current model metrics")
-            # TODO check the number of returned values and warn if there is more than one
-            current_value = current_y[current_x == current_x[x_index]][0]
-            # now we filter the new model Dataframe by column values
-            new_values = new_model_metrics.loc[
-                (new_model_metrics['figure'] == figure) & (new_model_metrics['legend'] == legend)
-            ]
-            new_x = new_values['x'].values
-            new_y = new_values['y'].values
-            if len(new_x) == 0 or len(new_y) == 0:
-                raise ValueError(f"Could not find figure {figure} and legend {legend} in current model metrics")
-            # TODO check the number of returned values and warn if there is more than one
-            new_value = new_y[new_x == new_x[x_index]][0]
+            if x_index is None and x_value is None:
+                logger.warning(f"No x_index or x_value for figure {figure} and legend {legend}, using the last value.")
+                x_index = -1
+
+            current_value = ModelComparer._metric_value(
+                current_index, figure=figure, legend=legend, x_index=x_index, x_value=x_value, model_name='current'
+            )
+            new_value = ModelComparer._metric_value(
+                new_index, figure=figure, legend=legend, x_index=x_index, x_value=x_value, model_name='new'
+            )
             if maximize is True:
                 win_check = new_value > (current_value + min_delta)
             else:
                 win_check = new_value < (current_value - min_delta)
-            new_model_wins.append(win_check)
+            new_model_wins.append(bool(win_check))
 
             if verbose is True:
                 logger.info(
                     f'Compare: figure: {figure}, legend: {legend}. Configs: maximize: {maximize}, min_delta: {min_delta}, current_value: {current_value}, new_value: {new_value}. New model won? {win_check}'
                 )
+        return new_model_wins
 
-        # TODO check all config return types
-        logger.info(f"Finished model comparison, wins list: {new_model_wins}")
+    @staticmethod
+    def _prepare_compare_config(compare_config: dict = None) -> dict:
+        """
+        Fill the compare configuration with the defaults of pipeline_configs/compare_configurations.json: the
+        default precision_recall entry is added only when neither precision_recall nor annotation_scores is set.
 
-        return ModelComparer.check_if_winning(wins, new_model_wins)
+        Args:
+            compare_config (dict, optional): Configuration for comparison metrics
+
+        Returns:
+            dict: the configuration to compare with
+        """
+        default_compare_config = copy.deepcopy(DEFAULT_COMPARE_CONFIG)
+
+        if compare_config is None:
+            logger.warning("No metrics were specified in the compare_config. Using precision-recall by default.")
+            compare_config = default_compare_config
+
+        if 'precision_recall' not in compare_config and 'annotation_scores' not in compare_config:
+            logger.warning("No supported metric specified in compare_config. Using precision-recall with default "
+                           "values.")
+            compare_config['precision_recall'] = default_compare_config.get('precision_recall', dict())
+        return compare_config
 
     @staticmethod
+    def _training_metrics(model: dl.Model, compare_config: dict) -> pd.DataFrame:
+        """
+        Download the training metrics of a model, only the ones used by the checks when all of them name
+        their figure and legend.
+
+        Args:
+            model (dl.Model): Model entity from which to download metrics
+            compare_config (dict): Configuration with the checks
+
+        Returns:
+            pd.DataFrame: DataFrame containing the model's metric scores with x and y columns
+        """
+        checks = compare_config.get('checks', list())
+        figures = [check.get('figure') for check in checks]
+        legends = [check.get('legend') for check in checks]
+        if len(checks) == 0 or None in figures or None in legends:
+            figures, legends = None, None
+        return ModelComparer.metrics_to_df(model=model, figures=figures, legends=legends)
+
+    @staticmethod
+    def _report_winner(winning_model: dl.Model, is_improved: bool, progress: dl.Progress,
+                       context: dl.Context) -> dl.Model:
+        """
+        Set the output action of the node and tag the winning model if configured to do so.
+
+        Args:
+            winning_model (dl.Model): The winning model
+            is_improved (bool): True if the winning model replaces the previous model
+            progress (dl.Progress): Progress tracker for updating action status
+            context (dl.Context): Context of the function execution
+
+        Returns:
+            dl.Model: The winning model
+        """
+        actions = ['update model', 'discard']
+        if is_improved is True:
+            logger.info(f"Action {actions[0]}")
+            progress.update(action=actions[0])
+        else:
+            logger.info(f"Action to update {actions[1]}")
+            progress.update(action=actions[1])
+
+        add_item_metadata = context.node.metadata.get('customNodeConfig', {}).get('itemMetadata', False)
+        if add_item_metadata:
+            if 'system' not in winning_model.metadata:
+                winning_model.metadata['system'] = {}
+            if 'tags' not in winning_model.metadata['system']:
+                winning_model.metadata['system']['tags'] = {}
+            winning_model.metadata['system']['tags'][actions[0]] = True
+            winning_model = winning_model.update(True)
+        return winning_model
+
+    @staticmethod
+    @instrumentation.instrumented('compare_models')
     def compare_models(
         previous_model: dl.Model,
         new_model: dl.Model,
@@ -189,25 +612,17 @@ class ModelComparer(dl.BaseServiceRunner):
             with comparison results if configured to do so.
         """
         logger.info(f"Compare configuration: {compare_config}")
-
-        # loading default compare_config
-        default_compare_config_path = os.path.join('pipeline_configs', 'compare_configurations.json')
-        with open(default_compare_config_path, 'r') as f:
-            default_compare_config = json.load(f)
-
-        if compare_config is None:
-            logger.warning("No metrics were specified in the compare_config. Using precision-recall by default.")
-            compare_config = default_compare_config
-
-        if 'precision_recall' not in compare_config:
-            logger.warning("Precision recall not specified in compare_config. Using default values.")
-            compare_config['precision_recall'] = default_compare_config.get('precision_recall', dict())
+        compare_config = ModelComparer._prepare_compare_config(compare_config)
 
         if dataset is None:
             # compare by model training
+            current_model_metrics, new_model_metrics = run_concurrently(
+                functools.partial(ModelComparer._training_metrics, model=previous_model, compare_config=compare_config),
+                functools.partial(ModelComparer._training_metrics, model=new_model, compare_config=compare_config),
+            )
             is_improved = ModelComparer.compare_model_training(
-                current_model_metrics=ModelComparer.metrics_to_df(previous_model),
-                new_model_metrics=ModelComparer.metrics_to_df(new_model),
+                current_model_metrics=current_model_metrics,
+                new_model_metrics=new_model_metrics,
                 configuration=compare_config,
             )
         else:
@@ -217,25 +632,150 @@ class ModelComparer(dl.BaseServiceRunner):
             is_improved = ModelComparer.compare_model_evaluation(configuration=compare_config)
         winning_model = new_model if is_improved else previous_model
 
-        actions = ['update model', 'discard']
         logger.info(f"Is new model better? {is_improved}")
-        if is_improved is True:
-            logger.info(f"Action {actions[0]}")
-            progress.update(action=actions[0])
-        else:
-            logger.info(f"Action to update {actions[1]}")
-            progress.update(action=actions[1])
+        return ModelComparer._report_winner(winning_model=winning_model,
+                                            is_improved=is_improved,
+                                            progress=progress,
+                                            context=context)
 
-        add_item_metadata = context.node.metadata.get('customNodeConfig', {}).get('itemMetadata', False)
-        if add_item_metadata:
-            if 'system' not in winning_model.metadata:
-                winning_model.metadata['system'] = {}
-            if 'tags' not in winning_model.metadata['system']:
-                winning_model.metadata['system']['tags'] = {}
-            winning_model.metadata['system']['tags'][actions[0]] = True
-            winning_model = winning_model.update(True)
+    @staticmethod
+    def _evaluation_score(evaluation: dict, compare_config: dict) -> float:
+        """
+        Summarize the evaluation of a model in one score for ranking: the AUC-PR of the dataset curve (the mean
+        of the label curves when specific labels are compared), else the mean item annotation score.
 
-        return winning_model
+        Args:
+            evaluation (dict): metric name to the evaluation DataFrame of the model, built by _evaluate
+            compare_config (dict): Configuration of the comparison
+
+        Returns:
+            float: the score of the model, higher is better (NaN if nothing was evaluated)
+        """
+        pr_df = evaluation.get('precision_recall')
+        if pr_df is not None and len(pr_df) > 0:
+            labels = compare_config.get('precision_recall', dict()).get('specific_label', None)
+            if labels is not None:
+                pr_df = pr_df.loc[pr_df['label_name'].isin(labels)]
+            if len(pr_df) > 0:
+                with instrumentation.phase('auc'):
+                    auc_pr_df = auc_pr(pr_df).groupby(['data', 'label_name'])['auc_pr'].mean()
+                data = auc_pr_df.index.get_level_values('data')
+                if (data == 'dataset').any():
+                    return float(auc_pr_df[data == 'dataset'].mean())
+                return float(auc_pr_df.mean())
+        scores_df = evaluation.get('annotation_scores')
+        if scores_df is not None and len(scores_df) > 0:
+            return float(scores_df.groupby('item_id')['annotation_score'].mean().mean())
+        return float('nan')
+
+    @staticmethod
+    @instrumentation.instrumented('compare_models_tournament')
+    def compare_models_tournament(
+        previous_model: dl.Model,
+        candidate_models: list,
+        progress: dl.Progress,
+        context: dl.Context,
+        compare_config: dict = None,
+        dataset: dl.Dataset = None,
+    ):
+        """
+        Compare several candidate models with the previous model and rank them.
+
+        The previous model is evaluated once and all the models are evaluated at the same time, so comparing
+        N candidates costs N+1 evaluations instead of the 2N of chained compare_models nodes.
+
+        Args:
+            previous_model (dl.Model): The original/previous model
+            candidate_models (list): The new models to compare against it
+            progress (dl.Progress): Progress tracker for updating action status
+            context (dl.Context): Context of the function execution
+            compare_config (dict, optional): Configuration for comparison metrics, as in compare_models
+            dataset (dl.Dataset, optional): Dataset for evaluation-based comparison
+
+        Returns:
+            tuple: The winning model (the best candidate that beat the previous model, else the previous model)
+                   and the ranking, a dict with the previous model score and the candidates ordered from best
+                   to worst, each with its score and whether it beat the previous model
+
+        Note:
+            Candidates are ranked first by whether they beat the previous model under compare_config, then by
+            score: the AUC-PR (or mean annotation score) in evaluation mode, the ratio of checks won in training mode.
+        """
+        logger.info(f"Compare configuration: {compare_config}")
+        compare_config = ModelComparer._prepare_compare_config(compare_config)
+
+        # the same model can be connected twice, evaluate it once
+        candidates = list({model.id: model for model in candidate_models or list()
+                           if model.id != previous_model.id}.values())
+        if len(candidates) == 0:
+            raise ValueError("No candidate models to compare with the previous model.")
+
+        models = [previous_model] + candidates
+        if dataset is None:
+            # compare by model training
+            wins = compare_config.get('wins', None)
+            if wins is None:
+                logger.warning("No wins specified in configuration. Using 'any' as default.")
+                wins = 'any'
+            models_metrics = run_concurrently(
+                *[functools.partial(ModelComparer._training_metrics, model=model, compare_config=compare_config)
+                  for model in models]
+            )
+            indexes = [ModelComparer._index_metrics(model_metrics) for model_metrics in models_metrics]
+            current_index = indexes[0]
+            results = list()
+            for candidate, candidate_index in zip(candidates, indexes[1:]):
+                new_model_wins = ModelComparer._training_wins(current_index=current_index,
+                                                              new_index=candidate_index,
+                                                              configuration=compare_config)
+                score = sum(new_model_wins) / len(new_model_wins) if len(new_model_wins) > 0 else float('nan')
+                results.append((ModelComparer.check_if_winning(wins, new_model_wins), score))
+            previous_score = None
+        else:
+            evaluations = run_concurrently(
+                *[functools.partial(ModelComparer._evaluate, model=model, dataset=dataset,
+                                    compare_config=compare_config)
+                  for model in models]
+            )
+            current_evaluation = evaluations[0]
+            results = list()
+            for candidate, evaluation in zip(candidates, evaluations[1:]):
+                configuration = dict()
+                for metric_name, metric_config in compare_config.items():
+                    if isinstance(metric_config, dict) and metric_name in evaluation:
+                        metric_config = dict(metric_config,
+                                             current_model_metrics=current_evaluation[metric_name],
+                                             new_model_metrics=evaluation[metric_name])
+                    configuration[metric_name] = metric_config
+                logger.info(f"Comparing candidate {candidate.name} with {previous_model.name}")
+                results.append((ModelComparer.compare_model_evaluation(configuration=configuration),
+                                ModelComparer._evaluation_score(evaluation, compare_config)))
+            previous_score = ModelComparer._evaluation_score(current_evaluation, compare_config)
+
+        ranking = [{'model_id': candidate.id,
+                    'model_name': candidate.name,
+                    'score': None if np.isnan(score) else score,
+                    'won': bool(won)}
+                   for candidate, (won, score) in zip(candidates, results)]
+        # winners first, then by score, candidates without a score last
+        order = sorted(range(len(ranking)),
+                       key=lambda i: (ranking[i]['won'],
+                                      ranking[i]['score'] is not None,
+                                      ranking[i]['score'] or 0),
+                       reverse=True)
+        ranking = [ranking[i] for i in order]
+        is_improved = ranking[0]['won']
+        winning_model = candidates[order[0]] if is_improved else previous_model
+        logger.info(f"Candidates ranking: {ranking}")
+
+        winning_model = ModelComparer._report_winner(winning_model=winning_model,
+                                                     is_improved=is_improved,
+                                                     progress=progress,
+                                                     context=context)
+        return winning_model, {'previous_model_id': previous_model.id,
+                               'previous_model_score': previous_score,
+                               'ranking': ranking,
+                               'winner_id': winning_model.id}
 
     @staticmethod
     def check_if_winning(wins, new_model_wins):
@@ -263,38 +803,64 @@ class ModelComparer(dl.BaseServiceRunner):
         return is_winning
 
     @staticmethod
-    def _compare_annotation_scores(_current: pd.DataFrame, _new: pd.DataFrame, **kwargs):
+    def _compare_annotation_scores(_current: pd.DataFrame, _new: pd.DataFrame, **kwargs) -> bool:
         """
-        Compare annotation scores between two models.
+        Compare the per-item annotation scores of two models with a paired bootstrap test.
 
         Args:
             _current (pd.DataFrame): Current model's annotation scores
             _new (pd.DataFrame): New model's annotation scores
             **kwargs: Additional parameters including:
-                - annotation_scores (dict): Configuration for score comparison
-                - win_ratio (float): Required ratio of wins for new model to be considered better
+                - alpha (float): Significance level of the improvement (default: 0.05)
+                - n_resamples (int): Number of bootstrap resamples (default: 10000)
+                - seed (int): Seed of the resampling, the same inputs always give the same decision (default: 0)
+                - min_delta (float): Minimal mean improvement of the item scores (default: 0)
+                - win_ratio (float): Optional, the new model must also score higher on more than this ratio
+                  of the items (0: any item, 1: all the items)
+
+        Returns:
+            bool: True if the new model improvement of the mean item score is significant
 
         Note:
-            Updates kwargs with 'new_model_won' boolean indicating comparison result.
-            Raises ValueError if win_ratio is not a float.
+            Raises ValueError if win_ratio is not a number.
         """
-        wins = kwargs.get('annotation_scores', dict()).get('win_ratio', 0)
-        if isinstance(wins, float) is False:
-            raise ValueError(f"wins should be a float, got {wins} of type {type(wins)}")
-
-        item_scores_old = _current.groupby(['item_id'])['annotation_score'].mean()
-        item_scores_new = _new.groupby(['item_id'])['annotation_score'].mean()
-        new_model_wins = np.array(item_scores_new > item_scores_old)
-
-        if wins == 1:
-            is_winning = True if all(new_model_wins) else False
-        elif wins == 0:
-            is_winning = True if any(new_model_wins) else False
-        else:
-            sum_model_wins = sum(new_model_wins)
-            all_model_wins = len(new_model_wins) if not len(new_model_wins) == 0 else 1
-            is_winning = True if (sum_model_wins / all_model_wins) > wins else False
-        kwargs['new_model_won'] = is_winning
+        win_ratio = kwargs.get('win_ratio', None)
+        if win_ratio is not None and (isinstance(win_ratio, (int, float)) is False or isinstance(win_ratio, bool)):
+            raise ValueError(f"win_ratio should be a float, got {win_ratio} of type {type(win_ratio)}")
+
+        # items scored by both models, paired
+        item_scores = pd.concat({'current': _current.groupby('item_id')['annotation_score'].mean(),
+                                 'new': _new.groupby('item_id')['annotation_score'].mean()},
+                                axis=1,
+                                join='inner')
+        n_unpaired = _current['item_id'].nunique() + _new['item_id'].nunique() - 2 * len(item_scores)
+        if n_unpaired > 0:
+            logger.warning(f"{n_unpaired} items were scored by only one of the models and are not compared.")
+        differences = (item_scores['new'] - item_scores['current']).to_numpy()
+
+        with instrumentation.phase('bootstrap'):
+            test = paired_bootstrap(differences=differences,
+                                    n_resamples=kwargs.get('n_resamples', 10000),
+                                    alpha=kwargs.get('alpha', 0.05),
+                                    min_delta=kwargs.get('min_delta', 0),
+                                    seed=kwargs.get('seed', 0))
+        logger.info(f"Annotation scores over {test['n_items']} items: mean improvement {test['mean']}, "
+                    f"lower bound {test['lower_bound']} (alpha {kwargs.get('alpha', 0.05)}), "
+                    f"p-value {test['p_value']}")
+        is_winning = test['significant']
+
+        if win_ratio is not None:
+            new_model_wins = differences > 0
+            if win_ratio == 1:
+                ratio_won = bool(new_model_wins.all()) and len(new_model_wins) > 0
+            elif win_ratio == 0:
+                ratio_won = bool(new_model_wins.any())
+            else:
+                ratio_won = new_model_wins.mean() > win_ratio if len(new_model_wins) > 0 else False
+            logger.info(f"New model scored higher on {int(new_model_wins.sum())}/{len(new_model_wins)} items "
+                        f"(required ratio: {win_ratio}).")
+            is_winning = is_winning and ratio_won
+        return bool(is_winning)
 
     @staticmethod
     def compare_model_evaluation(configuration: dict) -> bool:
@@ -330,58 +896,91 @@ class ModelComparer(dl.BaseServiceRunner):
         ******* SPECIFIC METRIC *******
         * *precision-recall* (``dict``) --
           compare models by Precision-Recall metrics using AUC-PR
+        * *annotation_scores* (``dict``) --
+          compare models by a paired bootstrap test of their per-item annotation scores
+          (see _compare_annotation_scores for its settings)
 
         ******* SETTINGS *******
-        * *iou_threshold* (``float``) --
-          perform comparison based on specific (single/boundaries) IoU value [default: 0.5]
+        * *iou_threshold* (``float``, ``list`` or ``dict``) --
+          perform comparison based on a specific IoU value, a list of values or a range
+          {"start": 0.5, "stop": 0.95, "step": 0.05}; the AUC-PR is averaged over the thresholds [default: 0.5]
         * *specific_label* (``list``) --
           perform comparison based on specific label [default: everything]
         * *min_delta* (``float``) --
           require minimum difference between the metrics before considering it as improvement [default: 0]
-
-        :return: True if the comparison detected any improvement OR equalization, else - False.
+        * *label_wins* (``str`` or ``float``) --
+          compare label by label instead of on the whole dataset: the new model must win on 'all' labels, 'any'
+          label, or more than this ratio of the labels [default: None, compare on the whole dataset]
+        * *no_regression_labels* (``list`` or ``str``) --
+          labels ('all' for every label) on which the new model AUC-PR must not be lower than the current one
+          by more than *max_regression* [default: None]
+        * *max_regression* (``float``) --
+          allowed AUC-PR decrease on the *no_regression_labels* [default: 0]
+        * *test_subset* (``dict``) --
+          DQL filter of the test items, the evaluation is updated from the per-item matches of the changed
+          items only [default: None, use the model scores file]
+
+        :return: True if the new model won on every configured metric, else - False.
         """
 
         def _compare_auc_pr(_current: pd.DataFrame, _new: pd.DataFrame, **kwargs):
             """
-            Compare two models by Precision-Recall metrics using AUC-PR.
+            Compare two models by Precision-Recall metrics using AUC-PR, on the whole dataset or label by label.
             :param _current: current model metrics dataframe
             :param _new: new model metrics dataframe
-            :return:
+            :return: True if the new model won
             """
-            new_model_won = False
             min_delta = kwargs.get("min_delta", 0)
-
-            # Sort the precision and recall values together.
-            current_precision_np = np.asarray(_current['precision'])
-            current_recall_np = np.asarray(_current['recall'])
-            current_sorted_precision_recall = np.array([current_precision_np, current_recall_np]).T
-            sorted_indices = current_sorted_precision_recall[:, 1].argsort()[::-1]
-            current_sorted_precision_recall = current_sorted_precision_recall[sorted_indices]
-
-            # Calculate the AUC-PR.
-            current_auc_pr = auc(current_sorted_precision_recall[:, 1], current_sorted_precision_recall[:, 0])
-            logger.info(f"current model auc pr: {current_auc_pr}")
-            print(f"current model auc pr: {current_auc_pr}")
-
-            # Sort the precision and recall values together.
-            new_precision_np = np.asarray(_new['precision'])
-            new_recall_np = np.asarray(_new['recall'])
-            new_sorted_precision_recall = np.array([new_precision_np, new_recall_np]).T
-            sorted_indices = new_sorted_precision_recall[:, 1].argsort()[::-1]
-            new_sorted_precision_recall = new_sorted_precision_recall[sorted_indices]
-
-            # Calculate the AUC-PR.
-            new_auc_pr = auc(new_sorted_precision_recall[:, 1], new_sorted_precision_recall[:, 0])
-            logger.info(f"new model auc pr: {new_auc_pr}")
-            print(f"new model auc pr: {new_auc_pr}")
-
-            difference_auc_pr = new_auc_pr - current_auc_pr
-            if difference_auc_pr > min_delta:
-                new_model_won = True
-
-            kwargs['new_model_won'] = new_model_won
-            return new_model_won
+            label_wins = kwargs.get("label_wins", None)
+            no_regression_labels = kwargs.get("no_regression_labels", None)
+            max_regression = kwargs.get("max_regression", 0)
+            verbose = kwargs.get("verbose", False)
+
+            # AUC-PR of every curve at once, averaged over the IoU thresholds (as in mAP@[.5:.95])
+            with instrumentation.phase('auc'):
+                current_auc_pr = auc_pr(_current).groupby(['data', 'label_name'])['auc_pr'].mean()
+                new_auc_pr = auc_pr(_new).groupby(['data', 'label_name'])['auc_pr'].mean()
+
+            def _overall(_auc_pr: pd.Series) -> float:
+                # the dataset curve, or the mean of the label curves when the labels were filtered
+                data = _auc_pr.index.get_level_values('data')
+                return float(_auc_pr[data == 'dataset'].mean() if (data == 'dataset').any() else _auc_pr.mean())
+
+            def _by_label(_auc_pr: pd.Series) -> pd.Series:
+                labels_auc_pr = _auc_pr[_auc_pr.index.get_level_values('data') == 'label']
+                return labels_auc_pr.droplevel('data')
+
+            current_overall, new_overall = _overall(current_auc_pr), _overall(new_auc_pr)
+            logger.info(f"current model auc pr: {current_overall}, new model auc pr: {new_overall}")
+            # a label without curve in one of the models has no area under it
+            labels_auc_pr = pd.concat({'current': _by_label(current_auc_pr), 'new': _by_label(new_auc_pr)},
+                                      axis=1).fillna(0)
+            if verbose is True:
+                logger.info(f"AUC-PR by label:\n{labels_auc_pr}")
+
+            if label_wins is not None and len(labels_auc_pr) > 0:
+                if isinstance(label_wins, (int, float)) and not isinstance(label_wins, bool):
+                    label_wins = float(label_wins)
+                label_won = (labels_auc_pr['new'] - labels_auc_pr['current']) > min_delta
+                new_model_won = ModelComparer.check_if_winning(label_wins, label_won.tolist())
+                logger.info(f"New model won on {int(label_won.sum())}/{len(label_won)} labels "
+                            f"(required: {label_wins}).")
+            else:
+                if label_wins is not None:
+                    logger.warning("No label curves to compare, comparing the dataset AUC-PR instead.")
+                new_model_won = (new_overall - current_overall) > min_delta
+
+            if no_regression_labels is not None:
+                if no_regression_labels == 'all':
+                    guarded = labels_auc_pr
+                else:
+                    guarded = labels_auc_pr.loc[labels_auc_pr.index.isin(list(no_regression_labels))]
+                regressed = guarded.index[(guarded['new'] < guarded['current'] - max_regression).to_numpy()]
+                if len(regressed) > 0:
+                    logger.info(f"New model regressed on labels: {list(regressed)}")
+                    new_model_won = False
+
+            return bool(new_model_won)
 
         def _filter(_current_metric: pd.DataFrame, _new_metric: pd.DataFrame, **kwargs):
             """
@@ -398,11 +997,10 @@ class ModelComparer(dl.BaseServiceRunner):
             # settings
             labels = kwargs.get("specific_label", None)
 
-            # TODO rename to be able to filter by dataset labels
             # filters by a list of labels
             if labels is not None:
-                _current_metric = _range_query(_current_metric, "label", labels)
-                _new_metric = _range_query(_new_metric, "label", labels)
+                _current_metric = _range_query(_current_metric, "label_name", labels)
+                _new_metric = _range_query(_new_metric, "label_name", labels)
 
             return _current_metric, _new_metric
 
@@ -410,14 +1008,21 @@ class ModelComparer(dl.BaseServiceRunner):
             'precision_recall': _compare_auc_pr,
             'annotation_scores': ModelComparer._compare_annotation_scores,
         }
-        result = False
+        # the new model has to win on every configured metric
+        results = list()
         for metric_name, metric_config in configuration.items():
-            if not metric_name == 'precision_recall':
-                continue
             compare_func = compare_funcs.get(metric_name, None)
-            current_sheet = metric_config.get('current_model_metrics')
-            new_sheet = metric_config.get('new_model_metrics')
-            current_metric, new_metric = _filter(current_sheet, new_sheet, **metric_config)
+            if compare_func is None or not isinstance(metric_config, dict):
+                continue
+            current_metric = metric_config.get('current_model_metrics')
+            new_metric = metric_config.get('new_model_metrics')
+            if current_metric is None or new_metric is None:
+                logger.warning(f"No evaluation found for metric {metric_name}, skipping it.")
+                continue
+            if metric_name == 'precision_recall':
+                current_metric, new_metric = _filter(current_metric, new_metric, **metric_config)
 
-            result = compare_func(current_metric, new_metric, **metric_config)
-        return result
+            metric_won = compare_func(current_metric, new_metric, **metric_config)
+            logger.info(f"Metric {metric_name}: new model won? {metric_won}")
+            results.append(metric_won)
+        return len(results) > 0 and all(results)
@@ -0,0 +1,73 @@
+import dtlpy as dl
+
+from modules import instrumentation
+
+
+def iterate_pages(dataset: dl.Dataset, query: dict, page_size: int = 1000):
+    """
+    Iterate over the items of a DQL query page by page.
+    Pages are fetched by item id (keyset) so updating items while iterating does not shift the pages.
+
+    :param dataset: dl.Dataset to query
+    :param query: DQL filter JSON (with or without the "filter" key)
+    :param page_size: number of items in each page
+    :return: generator of lists of dl.Item
+    """
+    query_filter = query.get('filter', query) if query else dict()
+    last_id = None
+    while True:
+        and_filters = [query_filter] if query_filter else list()
+        if last_id is not None:
+            and_filters.append({'id': {'$gt': last_id}})
+        custom_filter = {
+            'filter': {'$and': and_filters} if and_filters else dict(),
+            'sort': {'id': 'ascending'},
+            'page': 0,
+            'pageSize': page_size,
+            'resource': dl.FiltersResource.ITEM,
+        }
+        page = list(dataset.items.list(filters=dl.Filters(custom_filter=custom_filter)).items)
+        if len(page) == 0:
+            break
+        yield page
+        if len(page) < page_size:
+            break
+        last_id = page[-1].id
+
+
+def iterate_annotations(dataset: dl.Dataset, filters: dl.Filters):
+    """
+    Iterate the annotations JSON of a query, from the raw annotation pages
+
+    :param dataset: dl.Dataset of the annotations
+    :param filters: dl.Filters of the annotations
+    :return: generator of annotation JSON
+    """
+    page = 0
+    while True:
+        filters.page = page
+        with instrumentation.phase('annotation listing'):
+            response = dataset.annotations._list(filters=filters)
+        annotations = response.get('items', list()) if response else list()
+        yield from annotations
+        if len(annotations) == 0 or not response.get('hasNextPage', False):
+            break
+        page += 1
+
+
+def page_annotations(dataset: dl.Dataset, item_ids: list, page_size: int = 1000) -> dict:
+    """
+    Get the annotations JSON of a page of items from the raw annotation pages
+
+    :param dataset: dl.Dataset of the items
+    :param item_ids: ids of the items of the page
+    :param page_size: number of annotations in each page
+    :return: dict of item id to the list of its annotations JSON
+    """
+    filters = dl.Filters(resource=dl.FiltersResource.ANNOTATION, field='itemId', values=item_ids,
+                         operator=dl.FiltersOperations.IN)
+    filters.page_size = page_size
+    annotations = {item_id: list() for item_id in item_ids}
+    for annotation in iterate_annotations(dataset=dataset, filters=filters):
+        annotations.setdefault(annotation['itemId'], list()).append(annotation)
+    return annotations
@@ -0,0 +1,375 @@
+import heapq
+import logging
+import datetime
+import tempfile
+import functools
+import numpy as np
+import dtlpy as dl
+
+from modules import instrumentation
+from modules.coreset import k_center_greedy, load_embeddings
+from modules.io_executor import run_concurrently
+from modules.paging import iterate_pages
+
+logger = logging.getLogger("[SampleSelector]")
+
+STRATEGIES = ('uncertainty', 'coreset')
+MEASURES = ('entropy', 'margin', 'least_confidence')
+AGGREGATIONS = ('max', 'mean')
+# number of item ids in each bulk update of the selection tag
+UPDATE_BATCH_SIZE = 1000
+
+
+def uncertainty(confidence: np.ndarray, n_labels: int, measure: str = 'entropy') -> np.ndarray:
+    """
+    Uncertainty of predictions from their top-1 confidence, in [0, 1] (1 is the most uncertain).
+    The predictions only carry the confidence of the predicted label, the rest of the probability is spread
+    evenly over the other labels.
+
+    :param confidence: np.ndarray of the prediction confidences
+    :param n_labels: number of labels the model predicts
+    :param measure: 'entropy', 'margin' (1 - the gap between the two highest probabilities)
+                    or 'least_confidence' (1 - the highest probability)
+    :return: np.ndarray of float uncertainties
+    """
+    n_labels = max(int(n_labels), 2)
+    p = np.clip(np.asarray(confidence, dtype=np.float64), 0.0, 1.0)
+    rest = (1.0 - p) / (n_labels - 1)
+    if measure == 'least_confidence':
+        return (1.0 - p) * n_labels / (n_labels - 1)
+    if measure == 'margin':
+        return 1.0 - np.abs(p - rest)
+    if measure == 'entropy':
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropy = -(np.where(p > 0, p * np.log(p), 0.0) + (1.0 - p) * np.where(rest > 0, np.log(rest), 0.0))
+        return entropy / np.log(n_labels)
+    raise ValueError(f"Unknown uncertainty measure {measure}, use one of {MEASURES}")
+
+
+class TopK:
+    """
+    The k highest scoring items of a stream, in O(k) memory
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        # min-heap of (score, item_id), the weakest selected item is on top
+        self._heap = list()
+
+    def push_batch(self, scores: np.ndarray, item_ids: list):
+        """
+        Offer a batch of scored items, only the batch's own top k can enter the selection
+
+        :param scores: np.ndarray of the item scores
+        :param item_ids: ids of the items, aligned with the scores
+        """
+        if self.k <= 0 or len(scores) == 0:
+            return
+        candidates = np.arange(len(scores))
+        if len(scores) > self.k:
+            candidates = np.argpartition(-scores, self.k - 1)[:self.k]
+        if len(self._heap) == self.k:
+            candidates = candidates[scores[candidates] > self._heap[0][0]]
+        for index in candidates:
+            entry = (float(scores[index]), item_ids[index])
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+            else:
+                heapq.heappushpop(self._heap, entry)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def results(self) -> list:
+        """
+        :return: list of (score, item_id), the highest score first
+        """
+        return sorted(self._heap, reverse=True)
+
+
+class SampleSelector(dl.BaseServiceRunner):
+    """
+    Select the most informative items of an unlabeled pool, by the uncertainty of the model predictions
+    or by the diversity of the item embeddings (core-set)
+    """
+
+    def __init__(self): ...
+
+    @staticmethod
+    def _selection_config(context: dl.Context) -> dict:
+        """
+        Read the selection settings from the node config
+
+        :param context: entity IDs of related entities, the node config holds the selection settings
+        :return: dict of the selection settings (strategy, measure, aggregation, sample size, ...)
+        """
+        try:
+            node_config = context.node.metadata.get('customNodeConfig', dict()) or dict()
+        except AttributeError:
+            node_config = dict()
+        config = {
+            'strategy': node_config.get('strategy', 'uncertainty'),
+            'measure': node_config.get('measure', 'entropy'),
+            'aggregation': node_config.get('aggregation', 'max'),
+            'sampleSize': node_config.get('sampleSize', None),
+            'sampleRatio': node_config.get('sampleRatio', None),
+            'featureSetName': node_config.get('featureSetName', None),
+            'seed': node_config.get('seed', 0),
+        }
+        if config['strategy'] not in STRATEGIES:
+            raise ValueError(f"Unknown selection strategy {config['strategy']}, use one of {STRATEGIES}")
+        if config['measure'] not in MEASURES:
+            raise ValueError(f"Unknown uncertainty measure {config['measure']}, use one of {MEASURES}")
+        if config['aggregation'] not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation {config['aggregation']}, use one of {AGGREGATIONS}")
+        if config['sampleSize'] is None and config['sampleRatio'] is None:
+            raise ValueError("Either sampleSize or sampleRatio is required in the node config.")
+        return config
+
+    @staticmethod
+    def _pool_size(dataset: dl.Dataset, query: dict) -> int:
+        """
+        Count the items of the pool with a single one-item page
+
+        :param dataset: dl.Dataset of the pool
+        :param query: DQL filter JSON of the pool
+        :return: number of items matching the query
+        """
+        query_filter = query.get('filter', query) if query else dict()
+        filters = dl.Filters(custom_filter={'filter': query_filter,
+                                            'page': 0,
+                                            'pageSize': 1,
+                                            'resource': dl.FiltersResource.ITEM})
+        return dataset.items.list(filters=filters).items_count
+
+    @staticmethod
+    def _page_predictions(dataset: dl.Dataset, model: dl.Model, item_ids: list, page_size: int = 1000):
+        """
+        Get the confidences of the model predictions on a page of items, from the raw annotation pages
+
+        :param dataset: dl.Dataset of the items
+        :param model: dl.Model that made the predictions
+        :param item_ids: ids of the items of the page
+        :param page_size: number of annotations in each page
+        :return: tuple of the prediction item ids and a np.ndarray of their confidences
+        """
+        filters = dl.Filters(resource=dl.FiltersResource.ANNOTATION,
+                             field='itemId',
+                             values=item_ids,
+                             operator=dl.FiltersOperations.IN)
+        filters.add(field='metadata.user.model.model_id', values=model.id)
+        filters.page_size = page_size
+        prediction_item_ids = list()
+        confidences = list()
+        page = 0
+        while True:
+            filters.page = page
+            with instrumentation.phase('annotation listing'):
+                response = dataset.annotations._list(filters=filters)
+            annotations = response.get('items', list()) if response else list()
+            for annotation in annotations:
+                model_info = (annotation.get('metadata') or dict()).get('user', dict()).get('model', dict())
+                confidence = model_info.get('confidence')
+                if confidence is None:
+                    continue
+                prediction_item_ids.append(annotation['itemId'])
+                confidences.append(confidence)
+            if len(annotations) == 0 or not response.get('hasNextPage', False):
+                break
+            page += 1
+        return prediction_item_ids, np.asarray(confidences, dtype=np.float64)
+
+    @staticmethod
+    def _item_scores(item_ids: list, prediction_item_ids: list, prediction_scores: np.ndarray,
+                     aggregation: str) -> np.ndarray:
+        """
+        Aggregate the prediction scores of each item
+
+        :param item_ids: ids of the items
+        :param prediction_item_ids: item id of each prediction
+        :param prediction_scores: np.ndarray of the prediction scores
+        :param aggregation: 'max' (the most uncertain prediction) or 'mean'
+        :return: np.ndarray of the item scores, NaN for items without predictions
+        """
+        positions = {item_id: position for position, item_id in enumerate(item_ids)}
+        codes = np.fromiter((positions[item_id] for item_id in prediction_item_ids),
+                            dtype=np.int64, count=len(prediction_item_ids))
+        counts = np.bincount(codes, minlength=len(item_ids))
+        if aggregation == 'mean':
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = np.bincount(codes, weights=prediction_scores, minlength=len(item_ids)) / counts
+        else:
+            scores = np.full(len(item_ids), -np.inf)
+            np.maximum.at(scores, codes, prediction_scores)
+        scores[counts == 0] = np.nan
+        return scores
+
+    @staticmethod
+    def _tag_items(dataset: dl.Dataset, item_ids: list, selection: dict):
+        """
+        Tag the selected items with bulk updates of their user metadata
+
+        :param dataset: dl.Dataset of the items
+        :param item_ids: ids of the selected items
+        :param selection: value of metadata.user.activeLearning
+        """
+        calls = list()
+        for start in range(0, len(item_ids), UPDATE_BATCH_SIZE):
+            filters = dl.Filters(field='id',
+                                 values=item_ids[start:start + UPDATE_BATCH_SIZE],
+                                 operator=dl.FiltersOperations.IN,
+                                 use_defaults=False)
+            calls.append(instrumentation.timed('item updates', functools.partial(
+                dataset.items.update,
+                filters=filters,
+                update_values={'activeLearning': selection},
+            )))
+        run_concurrently(*calls)
+
+    @staticmethod
+    def _sample_size(config: dict, pool_size) -> int:
+        """
+        :param config: selection settings
+        :param pool_size: number of items in the pool, or a callable counting them (only called for a ratio)
+        :return: number of items to select
+        """
+        if config['sampleSize'] is not None:
+            return int(config['sampleSize'])
+        if callable(pool_size):
+            pool_size = pool_size()
+        return int(np.ceil(float(config['sampleRatio']) * pool_size))
+
+    @staticmethod
+    def _select_uncertain(dataset: dl.Dataset, model: dl.Model, query: dict, config: dict,
+                          page_size: int = 1000) -> list:
+        """
+        Stream the pool and the model predictions a page at a time and keep the most uncertain items
+
+        :param dataset: dataset of the pool
+        :param model: model whose predictions on the pool are scored
+        :param query: DQL filter JSON of the pool
+        :param config: selection settings
+        :param page_size: number of items in each page
+        :return: ids of the selected items, the most uncertain first
+        """
+        k = SampleSelector._sample_size(config=config,
+                                        pool_size=functools.partial(SampleSelector._pool_size,
+                                                                    dataset=dataset,
+                                                                    query=query))
+        n_labels = len(dataset.labels)
+
+        top_k = TopK(k=k)
+        n_items = 0
+        n_scored = 0
+        for page in iterate_pages(dataset=dataset, query=query, page_size=page_size):
+            item_ids = [item.id for item in page]
+            prediction_item_ids, confidences = SampleSelector._page_predictions(dataset=dataset,
+                                                                                model=model,
+                                                                                item_ids=item_ids,
+                                                                                page_size=page_size)
+            scores = SampleSelector._item_scores(item_ids=item_ids,
+                                                 prediction_item_ids=prediction_item_ids,
+                                                 prediction_scores=uncertainty(confidence=confidences,
+                                                                               n_labels=n_labels,
+                                                                               measure=config['measure']),
+                                                 aggregation=config['aggregation'])
+            scored = ~np.isnan(scores)
+            n_items += len(item_ids)
+            n_scored += int(scored.sum())
+            top_k.push_batch(scores=scores[scored], item_ids=[item_ids[i] for i in np.flatnonzero(scored)])
+
+        selected = top_k.results()
+        logger.info(f"Selected {len(selected)} of {n_items} items ({n_scored} with predictions) by "
+                    f"{config['measure']}, scores from {selected[-1][0] if selected else None} "
+                    f"to {selected[0][0] if selected else None}")
+        return [item_id for _, item_id in selected]
+
+    @staticmethod
+    def _feature_set(dataset: dl.Dataset, model: dl.Model, config: dict):
+        """
+        Get the feature set of the embeddings: the one named in the node config, else the one of the model
+
+        :param dataset: dataset of the pool
+        :param model: model of the embeddings, used when no feature set is named
+        :param config: selection settings
+        :return: dl.FeatureSet
+        """
+        project = dataset.project
+        if config['featureSetName'] is not None:
+            return project.feature_sets.get(feature_set_name=config['featureSetName'])
+        if model is None:
+            raise ValueError("A model or the featureSetName node config is required for core-set selection.")
+        filters = dl.Filters(resource=dl.FiltersResource.FEATURE_SET, field='modelId', values=model.id)
+        feature_sets = list(project.feature_sets.list(filters=filters).all())
+        if len(feature_sets) == 0:
+            raise ValueError(f"No feature set of model {model.name}, set featureSetName in the node config.")
+        return feature_sets[0]
+
+    @staticmethod
+    def _select_diverse(dataset: dl.Dataset, model: dl.Model, query: dict, config: dict,
+                        page_size: int = 1000) -> list:
+        """
+        Select the items that cover the embeddings of the pool best (k-center greedy), so near-duplicates
+        (e.g. consecutive video frames) are not selected together.
+        The embeddings are written to a temporary float32 file a page at a time and read back in chunks.
+
+        :param dataset: dataset of the pool
+        :param model: model of the embeddings, used when no feature set is named
+        :param query: DQL filter JSON of the pool
+        :param config: selection settings
+        :param page_size: number of items in each page
+        :return: ids of the selected items, in selection order
+        """
+        feature_set = SampleSelector._feature_set(dataset=dataset, model=model, config=config)
+        with tempfile.TemporaryDirectory() as local_dir:
+            item_ids, embeddings = load_embeddings(dataset=dataset,
+                                                   feature_set=feature_set,
+                                                   query=query,
+                                                   directory=local_dir,
+                                                   page_size=page_size)
+            k = SampleSelector._sample_size(config=config, pool_size=len(item_ids))
+            with instrumentation.phase('k-center'):
+                selected = k_center_greedy(embeddings=embeddings, k=k, seed=config['seed'])
+            del embeddings
+        logger.info(f"Selected {len(selected)} of {len(item_ids)} items with embeddings in feature set "
+                    f"{feature_set.name} by k-center greedy")
+        return [item_id.decode() for item_id in item_ids[selected]]
+
+    @staticmethod
+    @instrumentation.instrumented('select_samples')
+    def select_samples(dataset: dl.Dataset, model: dl.Model, query: dict, context: dl.Context,
+                       page_size: int = 1000) -> dict:
+        """
+        Select the most informative items of a pool: the items on which the model predictions are the most
+        uncertain, or (with the coreset strategy) the items that cover the pool embeddings best.
+        The pool is streamed a page at a time, so the memory grows with the sample size and not with the pool.
+
+        :param dataset: dataset of the pool
+        :param model: model whose predictions on the pool are scored, or whose feature set holds the embeddings
+        :param query: JSON for the DQL filter of the pool items (e.g. the items without a subset tag)
+        :param context: entity IDs of related entities, the node config holds the selection settings
+        :param page_size: number of items in each page
+        :return: JSON for the DQL filter of the selected items, e.g. the query of DataSplitter.split_filter
+        """
+        if dataset is None:
+            raise ValueError("Dataset is required.")
+        config = SampleSelector._selection_config(context)
+        if config['strategy'] == 'coreset':
+            selected_ids = SampleSelector._select_diverse(dataset=dataset, model=model, query=query, config=config,
+                                                          page_size=page_size)
+        else:
+            if model is None:
+                raise ValueError("Model is required for uncertainty selection.")
+            selected_ids = SampleSelector._select_uncertain(dataset=dataset, model=model, query=query,
+                                                            config=config, page_size=page_size)
+
+        selection_id = getattr(context, 'execution_id', None) or \
+            f"{dataset.id}-{datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%S%f')}"
+        selection = {'selection': selection_id, 'strategy': config['strategy']}
+        if model is not None:
+            selection['modelId'] = model.id
+        if config['strategy'] == 'uncertainty':
+            selection['measure'] = config['measure']
+        SampleSelector._tag_items(dataset=dataset, item_ids=selected_ids, selection=selection)
+        return {'filter': {'$and': [{'hidden': False},
+                                    {'metadata.user.activeLearning.selection': selection_id}]}}
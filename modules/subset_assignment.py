@@ -0,0 +1,250 @@
+import itertools
+import threading
+import numpy as np
+
+# 64-bit FNV-1a constants
+FNV_OFFSET = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+
+
+def _fnv1a(data: bytes, state: int = FNV_OFFSET) -> int:
+    """
+    Scalar FNV-1a over a byte string, used to seed the vectorized hash with the salt
+
+    :param data: bytes to hash
+    :param state: initial hash state
+    :return: 64-bit hash state
+    """
+    for byte in data:
+        state = ((state ^ byte) * FNV_PRIME) & 0xFFFFFFFFFFFFFFFF
+    return state
+
+
+def hash_ids(item_ids, salt: str = '') -> np.ndarray:
+    """
+    Hash item ids to uint64 values in one vectorized pass (FNV-1a of salt + id, with a murmur3 finalizer).
+
+    :param item_ids: list or array of item ids
+    :param salt: string prepended to every id, changing the salt reshuffles the assignment
+    :return: np.ndarray of uint64 hashes, one per id
+    """
+    ids = np.asarray(item_ids, dtype=np.bytes_)
+    if ids.ndim == 0:
+        ids = ids.reshape(1)
+    n_ids = ids.shape[0]
+    width = ids.dtype.itemsize
+    hashes = np.full(n_ids, _fnv1a(salt.encode('utf-8')), dtype=np.uint64)
+    if n_ids == 0 or width == 0:
+        return hashes
+
+    columns = ids.view(np.uint8).reshape(n_ids, width)
+    lengths = np.char.str_len(ids)
+    prime = np.uint64(FNV_PRIME)
+    for i_col in range(width):
+        updated = (hashes ^ columns[:, i_col].astype(np.uint64)) * prime
+        # shorter ids are null padded, the padding must not change their hash
+        hashes = np.where(lengths > i_col, updated, hashes)
+
+    # finalizer, spreads the low bits of the FNV state to the high bits used for the assignment
+    hashes ^= hashes >> np.uint64(33)
+    hashes *= np.uint64(0xff51afd7ed558ccd)
+    hashes ^= hashes >> np.uint64(33)
+    hashes *= np.uint64(0xc4ceb9fe1a85ec53)
+    hashes ^= hashes >> np.uint64(33)
+    return hashes
+
+
+def cumulative_weights(distribution) -> np.ndarray:
+    """
+    Normalize the subset weights to a cumulative distribution ending at 1
+
+    :param distribution: list of the subset weights (e.g. [80, 10, 10])
+    :return: np.ndarray of cumulative weights
+    """
+    weights = np.asarray(distribution, dtype=np.float64)
+    if weights.ndim != 1 or len(weights) == 0:
+        raise ValueError(f"distribution should be a non empty list of weights, got {distribution}")
+    if np.any(weights < 0) or weights.sum() <= 0:
+        raise ValueError(f"distribution weights should be non negative with a positive sum, got {distribution}")
+    return np.cumsum(weights) / weights.sum()
+
+
+def assign_by_hash(item_ids, distribution, salt: str = '', cumulative: np.ndarray = None) -> np.ndarray:
+    """
+    Deterministically assign items to subsets by hashing their ids onto the cumulative subset weights.
+    The same id (and salt) always gets the same subset, so nothing has to be stored to keep the split stable.
+
+    :param item_ids: list or array of item ids
+    :param distribution: list of the subset weights, in the order of the subset groups
+    :param salt: string mixed into the hash
+    :param cumulative: optional precomputed cumulative_weights(distribution)
+    :return: np.ndarray with the index of the assigned subset for every id
+    """
+    if cumulative is None:
+        cumulative = cumulative_weights(distribution)
+    # top 53 bits give a uniform float in [0, 1)
+    unit = (hash_ids(item_ids, salt=salt) >> np.uint64(11)).astype(np.float64) * (2.0 ** -53)
+    indices = np.searchsorted(cumulative, unit, side='right')
+    return np.minimum(indices, len(cumulative) - 1)
+
+
+class SplitPlan:
+    """
+    Precompiled subset assignment settings of a data split node, built once per node config revision
+    """
+
+    def __init__(self,
+                 population: list,
+                 distribution: list,
+                 item_metadata: bool = False,
+                 assignment: str = 'random',
+                 salt: str = '',
+                 stratify: bool = False,
+                 sync_every: int = 50):
+        self.population = tuple(population)
+        self.distribution = tuple(distribution)
+        self.cum_weights = tuple(itertools.accumulate(self.distribution))
+        self.cumulative = cumulative_weights(self.distribution)
+        self.item_metadata = item_metadata
+        self.assignment = assignment
+        self.salt = salt
+        self.stratify = stratify
+        self.sync_every = sync_every
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """
+        Compile the plan from the node's customNodeConfig
+
+        :param config: the node's customNodeConfig
+        :return: SplitPlan
+        """
+        groups = config['groups']
+        return cls(population=[group['name'] for group in groups],
+                   distribution=[int(group['distribution']) for group in groups],
+                   item_metadata=config.get('itemMetadata', False),
+                   assignment=config.get('assignment', 'random'),
+                   salt=config.get('hashSalt', ''),
+                   stratify=config.get('stratifyLabels', False) is True,
+                   sync_every=config.get('quotaSyncEvery', 50))
+
+
+def merge_counters(first: dict, second: dict) -> dict:
+    """
+    Add two JSON counter snapshots of the quota split
+
+    :param first: dict with "groups" ({subset: count}) and "labels" ({label: {subset: count}})
+    :param second: dict in the same format
+    :return: new dict with the summed counters
+    """
+    merged = {'groups': dict(), 'labels': dict()}
+    for counters in [first or dict(), second or dict()]:
+        for group, count in counters.get('groups', dict()).items():
+            merged['groups'][group] = merged['groups'].get(group, 0) + int(count)
+        for label, label_counters in counters.get('labels', dict()).items():
+            merged_label = merged['labels'].setdefault(label, dict())
+            for group, count in label_counters.items():
+                merged_label[group] = merged_label.get(group, 0) + int(count)
+    return merged
+
+
+class QuotaState:
+    """
+    Running per-subset (and optionally per-label) counters for exact-quota assignment.
+    Every new item goes to the subset furthest below its quota, so the split follows the distribution
+    exactly instead of on average. Memory is O(subsets x labels), regardless of the number of items.
+    """
+
+    def __init__(self, population: list, distribution: list, stratify: bool = False):
+        self.population = list(population)
+        self.shares = np.diff(cumulative_weights(distribution), prepend=0.0)
+        self.stratify = stratify
+        self.counts = np.zeros(len(self.population), dtype=np.int64)
+        self.label_counts = dict()
+        # everything assigned by this replica, the shared counters hold one such snapshot per replica
+        self.own = {'groups': dict(), 'labels': dict()}
+        # counts of this replica in the shared counters, as last read or written
+        self.shared = None
+        self.n_pending = 0
+        self._lock = threading.Lock()
+
+    def _choose(self, labels: list = None) -> int:
+        deficit = self.shares * (self.counts.sum() + 1) - self.counts
+        if self.stratify is False or not labels:
+            return int(np.argmax(deficit))
+        # stratify by the rarest label of the item, ties are broken by the overall deficit
+        empty = np.zeros(len(self.population), dtype=np.int64)
+        rarest = min(set(labels), key=lambda label: self.label_counts.get(label, empty).sum())
+        label_counts = self.label_counts.get(rarest, empty)
+        label_deficit = self.shares * (label_counts.sum() + 1) - label_counts
+        return int(np.lexsort((deficit, label_deficit))[-1])
+
+    def assign(self, labels: list = None) -> str:
+        """
+        Assign an item to the subset furthest below its quota and count it
+
+        :param labels: labels of the item annotations, used when stratifying
+        :return: name of the assigned subset
+        """
+        with self._lock:
+            index = self._choose(labels=labels)
+            group = self.population[index]
+            self.counts[index] += 1
+            self.own['groups'][group] = self.own['groups'].get(group, 0) + 1
+            if self.stratify is True and labels:
+                for label in set(labels):
+                    if label not in self.label_counts:
+                        self.label_counts[label] = np.zeros(len(self.population), dtype=np.int64)
+                    self.label_counts[label][index] += 1
+                    own_label = self.own['labels'].setdefault(label, dict())
+                    own_label[group] = own_label.get(group, 0) + 1
+            self.n_pending += 1
+        return group
+
+    def snapshot(self) -> tuple:
+        """
+        Take a copy of the counts assigned by this replica, to write to the shared counters
+
+        :return: tuple of the counters snapshot and the number of assignments not synced yet
+        """
+        with self._lock:
+            return merge_counters(self.own, None), self.n_pending
+
+    def synced(self, n_synced: int):
+        """
+        Mark assignments as written to the shared counters, after a successful update
+
+        :param n_synced: number of pending assignments of the written snapshot
+        """
+        with self._lock:
+            self.n_pending = max(0, self.n_pending - n_synced)
+
+    def rebase(self, folded: dict):
+        """
+        Take the counts that another replica folded into the shared base counters out of the counts of this replica,
+        so they are not counted twice
+
+        :param folded: counters snapshot of this replica that was folded
+        """
+        with self._lock:
+            for group, count in folded.get('groups', dict()).items():
+                self.own['groups'][group] = max(0, self.own['groups'].get(group, 0) - int(count))
+            for label, label_counters in folded.get('labels', dict()).items():
+                own_label = self.own['labels'].setdefault(label, dict())
+                for group, count in label_counters.items():
+                    own_label[group] = max(0, own_label.get(group, 0) - int(count))
+            self.shared = None
+
+    def load(self, others: dict):
+        """
+        Reset the counters from the counters of the other replicas and the current counts of this one
+
+        :param others: merged counters snapshot of the other replicas
+        """
+        with self._lock:
+            merged = merge_counters(others, self.own)
+            self.counts = np.array([merged['groups'].get(group, 0) for group in self.population], dtype=np.int64)
+            self.label_counts = {
+                label: np.array([label_counters.get(group, 0) for group in self.population], dtype=np.int64)
+                for label, label_counters in merged['labels'].items()
+            }
@@ -24,7 +24,7 @@ __p += '`),jr&&(Dt+=`' +
 function print() { __p += __j.call(arguments, '') }
 `:`;
 `)+Dt+`return __p
-}`;var gr=oU(function(){return ni(ge,yn+"return "+Dt).apply(n,$e)});if(gr.source=Dt,qR(gr))throw gr;return gr}function QSe(g){return ai(g).toLowerCase()}function XSe(g){return ai(g).toUpperCase()}function JSe(g,y,R){if(g=ai(g),g&&(R||y===n))return hF(g);if(!g||!(y=al(y)))return g;var G=Sc(g),ee=Sc(y),ge=mF(G,ee),$e=gF(G,ee)+1;return hf(G,ge,$e).join("")}function ZSe(g,y,R){if(g=ai(g),g&&(R||y===n))return g.slice(0,vF(g)+1);if(!g||!(y=al(y)))return g;var G=Sc(g),ee=gF(G,Sc(y))+1;return hf(G,0,ee).join("")}function eEe(g,y,R){if(g=ai(g),g&&(R||y===n))return g.replace(Pe,"");if(!g||!(y=al(y)))return g;var G=Sc(g),ee=mF(G,Sc(y));return hf(G,ee).join("")}function tEe(g,y){var R=I,G=O;if(ho(y)){var ee="separator"in y?y.separator:ee;R="length"in y?pr(y.length):R,G="omission"in y?al(y.omission):G}g=ai(g);var ge=g.length;if(gm(g)){var $e=Sc(g);ge=$e.length}if(R>=ge)return g;var Ye=R-_m(G);if(Ye<1)return G;var at=$e?hf($e,0,Ye).join(""):g.slice(0,Ye);if(ee===n)return at+G;if($e&&(Ye+=at.length-Ye),YR(ee)){if(g.slice(Ye).search(ee)){var It,Nt=at;for(ee.global||(ee=cR(ee.source,ai(Xt.exec(ee))+"g")),ee.lastIndex=0;It=ee.exec(Nt);)var Dt=It.index;at=at.slice(0,Dt===n?Ye:Dt)}}else if(g.indexOf(al(ee),Ye)!=Ye){var sn=at.lastIndexOf(ee);sn>-1&&(at=at.slice(0,sn))}return at+G}function nEe(g){return g=ai(g),g&&dn.test(g)?g.replace(Et,Nge):g}var rEe=Cm(function(g,y,R){return g+(R?" ":"")+y.toUpperCase()}),QR=a3("toUpperCase");function iU(g,y,R){return g=ai(g),y=R?n:y,y===n?Oge(g)?Mge(g):_ge(g):g.match(y)||[]}var oU=br(function(g,y){try{return il(g,n,y)}catch(R){return qR(R)?R:new ar(R)}}),iEe=ad(function(g,y){return Ll(y,function(R){R=pu(R),id(g,R,GR(g[R],g))}),g});function oEe(g){var y=g==null?0:g.length,R=Fn();return g=y?ro(g,function(G){if(typeof G[1]!="function")throw new $l(a);return[R(G[0]),G[1]]}):[],br(function(G){for(var ee=-1;++ee<y;){var ge=g[ee];if(il(ge[0],this,G))return il(ge[1],this,G)}})}function aEe(g){return N_e(jl(g,d))}function XR(g){return function(){return g}}function sEe(g,y){return g==null||g!==g?y:g}var lEe=l3(),cEe=l3(!0);function js(g){return g}function JR(g){return BF(typeof g=="function"?g:jl(g,d))}function uEe(g){return FF(jl(g,d))}function dEe(g,y){return UF(g,jl(y,d))}var fEe=br(function(g,y){return function(R){return W_(R,g,y)}}),pEe=br(function(g,y){return function(R){return W_(g,R,y)}});function ZR(g,y,R){var G=ia(y),ee=YS(y,G);R==null&&!(ho(y)&&(ee.length||!G.length))&&(R=y,y=g,g=this,ee=YS(y,ia(y)));var ge=!(ho(R)&&"chain"in R)||!!R.chain,$e=ld(g);return Ll(ee,function(Ye){var at=y[Ye];g[Ye]=at,$e&&(g.prototype[Ye]=function(){var It=this.__chain__;if(ge||It){var Nt=g(this.__wrapped__),Dt=Nt.__actions__=Ls(this.__actions__);return Dt.push({func:at,args:arguments,thisArg:g}),Nt.__chain__=It,Nt}return at.apply(g,lf([this.value()],arguments))})}),g}function hEe(){return da._===this&&(da._=Fge),this}function eA(){}function mEe(g){return g=pr(g),br(function(y){return zF(y,g)})}var gEe=NR(ro),_Ee=NR(cF),vEe=NR(nR);function aU(g){return BR(g)?rR(pu(g)):W_e(g)}function bEe(g){return function(y){return g==null?n:Vp(g,y)}}var yEe=u3(),SEe=u3(!0);function tA(){return[]}function nA(){return!1}function EEe(){return{}}function TEe(){return""}function CEe(){return!0}function wEe(g,y){if(g=pr(g),g<1||g>H)return[];var R=q,G=Da(g,q);y=Fn(y),g-=q;for(var ee=aR(G,y);++R<g;)y(R);return ee}function OEe(g){return cr(g)?ro(g,pu):sl(g)?[g]:Ls(O3(ai(g)))}function REe(g){var y=++Bge;return ai(g)+y}var AEe=ZS(function(g,y){return g+y},0),kEe=xR("ceil"),IEe=ZS(function(g,y){return g/y},1),NEe=xR("floor");function xEe(g){return g&&g.length?qS(g,js,_R):n}function DEe(g,y){return g&&g.length?qS(g,Fn(y,2),_R):n}function MEe(g){return fF(g,js)}function PEe(g,y){return fF(g,Fn(y,2))}function LEe(g){return g&&g.length?qS(g,js,SR):n}function $Ee(g,y){return g&&g.length?qS(g,Fn(y,2),SR):n}var BEe=ZS(function(g,y){return g*y},1),jEe=xR("round"),FEe=ZS(function(g,y){return g-y},0);function UEe(g){return g&&g.length?oR(g,js):0}function zEe(g,y){return g&&g.length?oR(g,Fn(y,2)):0}return de.after=uye,de.ary=$3,de.assign=Xye,de.assignIn=X3,de.assignInWith=fE,de.assignWith=Jye,de.at=Zye,de.before=B3,de.bind=GR,de.bindAll=iEe,de.bindKey=j3,de.castArray=Eye,de.chain=M3,de.chunk=Nve,de.compact=xve,de.concat=Dve,de.cond=oEe,de.conforms=aEe,de.constant=XR,de.countBy=Ube,de.create=eSe,de.curry=F3,de.curryRight=U3,de.debounce=z3,de.defaults=tSe,de.defaultsDeep=nSe,de.defer=dye,de.delay=fye,de.difference=Mve,de.differenceBy=Pve,de.differenceWith=Lve,de.drop=$ve,de.dropRight=Bve,de.dropRightWhile=jve,de.dropWhile=Fve,de.fill=Uve,de.filter=Vbe,de.flatMap=qbe,de.flatMapDeep=Ybe,de.flatMapDepth=Wbe,de.flatten=I3,de.flattenDeep=zve,de.flattenDepth=Vve,de.flip=pye,de.flow=lEe,de.flowRight=cEe,de.fromPairs=Gve,de.functions=cSe,de.functionsIn=uSe,de.groupBy=Kbe,de.initial=qve,de.intersection=Yve,de.intersectionBy=Wve,de.intersectionWith=Kve,de.invert=fSe,de.invertBy=pSe,de.invokeMap=Xbe,de.iteratee=JR,de.keyBy=Jbe,de.keys=ia,de.keysIn=Bs,de.map=aE,de.mapKeys=mSe,de.mapValues=gSe,de.matches=uEe,de.matchesProperty=dEe,de.memoize=lE,de.merge=_Se,de.mergeWith=J3,de.method=fEe,de.methodOf=pEe,de.mixin=ZR,de.negate=cE,de.nthArg=mEe,de.omit=vSe,de.omitBy=bSe,de.once=hye,de.orderBy=Zbe,de.over=gEe,de.overArgs=mye,de.overEvery=_Ee,de.overSome=vEe,de.partial=HR,de.partialRight=V3,de.partition=eye,de.pick=ySe,de.pickBy=Z3,de.property=aU,de.propertyOf=bEe,de.pull=Zve,de.pullAll=x3,de.pullAllBy=ebe,de.pullAllWith=tbe,de.pullAt=nbe,de.range=yEe,de.rangeRight=SEe,de.rearg=gye,de.reject=rye,de.remove=rbe,de.rest=_ye,de.reverse=zR,de.sampleSize=oye,de.set=ESe,de.setWith=TSe,de.shuffle=aye,de.slice=ibe,de.sortBy=cye,de.sortedUniq=dbe,de.sortedUniqBy=fbe,de.split=qSe,de.spread=vye,de.tail=pbe,de.take=hbe,de.takeRight=mbe,de.takeRightWhile=gbe,de.takeWhile=_be,de.tap=xbe,de.throttle=bye,de.thru=oE,de.toArray=W3,de.toPairs=eU,de.toPairsIn=tU,de.toPath=OEe,de.toPlainObject=Q3,de.transform=CSe,de.unary=yye,de.union=vbe,de.unionBy=bbe,de.unionWith=ybe,de.uniq=Sbe,de.uniqBy=Ebe,de.uniqWith=Tbe,de.unset=wSe,de.unzip=VR,de.unzipWith=D3,de.update=OSe,de.updateWith=RSe,de.values=Rm,de.valuesIn=ASe,de.without=Cbe,de.words=iU,de.wrap=Sye,de.xor=wbe,de.xorBy=Obe,de.xorWith=Rbe,de.zip=Abe,de.zipObject=kbe,de.zipObjectDeep=Ibe,de.zipWith=Nbe,de.entries=eU,de.entriesIn=tU,de.extend=X3,de.extendWith=fE,ZR(de,de),de.add=AEe,de.attempt=oU,de.camelCase=xSe,de.capitalize=nU,de.ceil=kEe,de.clamp=kSe,de.clone=Tye,de.cloneDeep=wye,de.cloneDeepWith=Oye,de.cloneWith=Cye,de.conformsTo=Rye,de.deburr=rU,de.defaultTo=sEe,de.divide=IEe,de.endsWith=DSe,de.eq=Tc,de.escape=MSe,de.escapeRegExp=PSe,de.every=zbe,de.find=Gbe,de.findIndex=A3,de.findKey=rSe,de.findLast=Hbe,de.findLastIndex=k3,de.findLastKey=iSe,de.floor=NEe,de.forEach=P3,de.forEachRight=L3,de.forIn=oSe,de.forInRight=aSe,de.forOwn=sSe,de.forOwnRight=lSe,de.get=WR,de.gt=Aye,de.gte=kye,de.has=dSe,de.hasIn=KR,de.head=N3,de.identity=js,de.includes=Qbe,de.indexOf=Hve,de.inRange=ISe,de.invoke=hSe,de.isArguments=qp,de.isArray=cr,de.isArrayBuffer=Iye,de.isArrayLike=$s,de.isArrayLikeObject=Do,de.isBoolean=Nye,de.isBuffer=mf,de.isDate=xye,de.isElement=Dye,de.isEmpty=Mye,de.isEqual=Pye,de.isEqualWith=Lye,de.isError=qR,de.isFinite=$ye,de.isFunction=ld,de.isInteger=G3,de.isLength=uE,de.isMap=H3,de.isMatch=Bye,de.isMatchWith=jye,de.isNaN=Fye,de.isNative=Uye,de.isNil=Vye,de.isNull=zye,de.isNumber=q3,de.isObject=ho,de.isObjectLike=Eo,de.isPlainObject=ev,de.isRegExp=YR,de.isSafeInteger=Gye,de.isSet=Y3,de.isString=dE,de.isSymbol=sl,de.isTypedArray=Om,de.isUndefined=Hye,de.isWeakMap=qye,de.isWeakSet=Yye,de.join=Qve,de.kebabCase=LSe,de.last=Ul,de.lastIndexOf=Xve,de.lowerCase=$Se,de.lowerFirst=BSe,de.lt=Wye,de.lte=Kye,de.max=xEe,de.maxBy=DEe,de.mean=MEe,de.meanBy=PEe,de.min=LEe,de.minBy=$Ee,de.stubArray=tA,de.stubFalse=nA,de.stubObject=EEe,de.stubString=TEe,de.stubTrue=CEe,de.multiply=BEe,de.nth=Jve,de.noConflict=hEe,de.noop=eA,de.now=sE,de.pad=jSe,de.padEnd=FSe,de.padStart=USe,de.parseInt=zSe,de.random=NSe,de.reduce=tye,de.reduceRight=nye,de.repeat=VSe,de.replace=GSe,de.result=SSe,de.round=jEe,de.runInContext=nt,de.sample=iye,de.size=sye,de.snakeCase=HSe,de.some=lye,de.sortedIndex=obe,de.sortedIndexBy=abe,de.sortedIndexOf=sbe,de.sortedLastIndex=lbe,de.sortedLastIndexBy=cbe,de.sortedLastIndexOf=ube,de.startCase=YSe,de.startsWith=WSe,de.subtract=FEe,de.sum=UEe,de.sumBy=zEe,de.template=KSe,de.times=wEe,de.toFinite=cd,de.toInteger=pr,de.toLength=K3,de.toLower=QSe,de.toNumber=zl,de.toSafeInteger=Qye,de.toString=ai,de.toUpper=XSe,de.trim=JSe,de.trimEnd=ZSe,de.trimStart=eEe,de.truncate=tEe,de.unescape=nEe,de.uniqueId=REe,de.upperCase=rEe,de.upperFirst=QR,de.each=P3,de.eachRight=L3,de.first=N3,ZR(de,function(){var g={};return du(de,function(y,R){oi.call(de.prototype,R)||(g[R]=y)}),g}(),{chain:!1}),de.VERSION=r,Ll(["bind","bindKey","curry","curryRight","partial","partialRight"],function(g){de[g].placeholder=de}),Ll(["drop","take"],function(g,y){Nr.prototype[g]=function(R){R=R===n?1:Xo(pr(R),0);var G=this.__filtered__&&!y?new Nr(this):this.clone();return G.__filtered__?G.__takeCount__=Da(R,G.__takeCount__):G.__views__.push({size:Da(R,q),type:g+(G.__dir__<0?"Right":"")}),G},Nr.prototype[g+"Right"]=function(R){return this.reverse()[g](R).reverse()}}),Ll(["filter","map","takeWhile"],function(g,y){var R=y+1,G=R==x||R==P;Nr.prototype[g]=function(ee){var ge=this.clone();return ge.__iteratees__.push({iteratee:Fn(ee,3),type:R}),ge.__filtered__=ge.__filtered__||G,ge}}),Ll(["head","last"],function(g,y){var R="take"+(y?"Right":"");Nr.prototype[g]=function(){return this[R](1).value()[0]}}),Ll(["initial","tail"],function(g,y){var R="drop"+(y?"":"Right");Nr.prototype[g]=function(){return this.__filtered__?new Nr(this):this[R](1)}}),Nr.prototype.compact=function(){return this.filter(js)},Nr.prototype.find=function(g){return this.filter(g).head()},Nr.prototype.findLast=function(g){return this.reverse().find(g)},Nr.prototype.invokeMap=br(function(g,y){return typeof g=="function"?new Nr(this):this.map(function(R){return W_(R,g,y)})}),Nr.prototype.reject=function(g){return this.filter(cE(Fn(g)))},Nr.prototype.slice=function(g,y){g=pr(g);var R=this;return R.__filtered__&&(g>0||y<0)?new Nr(R):(g<0?R=R.takeRight(-g):g&&(R=R.drop(g)),y!==n&&(y=pr(y),R=y<0?R.dropRight(-y):R.take(y-g)),R)},Nr.prototype.takeRightWhile=function(g){return this.reverse().takeWhile(g).reverse()},Nr.prototype.toArray=function(){return this.take(q)},du(Nr.prototype,function(g,y){var R=/^(?:filter|find|map|reject)|While$/.test(y),G=/^(?:head|last)$/.test(y),ee=de[G?"take"+(y=="last"?"Right":""):y],ge=G||/^find/.test(y);!ee||(de.prototype[y]=function(){var $e=this.__wrapped__,Ye=G?[1]:arguments,at=$e instanceof Nr,It=Ye[0],Nt=at||cr($e),Dt=function(Rr){var jr=ee.apply(de,lf([Rr],Ye));return G&&sn?jr[0]:jr};Nt&&R&&typeof It=="function"&&It.length!=1&&(at=Nt=!1);var sn=this.__chain__,yn=!!this.__actions__.length,Gn=ge&&!sn,gr=at&&!yn;if(!ge&&Nt){$e=gr?$e:new Nr(this);var Hn=g.apply($e,Ye);return Hn.__actions__.push({func:oE,args:[Dt],thisArg:n}),new Bl(Hn,sn)}return Gn&&gr?g.apply(this,Ye):(Hn=this.thru(Dt),Gn?G?Hn.value()[0]:Hn.value():Hn)})}),Ll(["pop","push","shift","sort","splice","unshift"],function(g){var y=NS[g],R=/^(?:push|sort|unshift)$/.test(g)?"tap":"thru",G=/^(?:pop|shift)$/.test(g);de.prototype[g]=function(){var ee=arguments;if(G&&!this.__chain__){var ge=this.value();return y.apply(cr(ge)?ge:[],ee)}return this[R](function($e){return y.apply(cr($e)?$e:[],ee)})}}),du(Nr.prototype,function(g,y){var R=de[y];if(R){var G=R.name+"";oi.call(Sm,G)||(Sm[G]=[]),Sm[G].push({name:y,func:R})}}),Sm[JS(n,v).name]=[{name:"wrapper",func:n}],Nr.prototype.clone=n_e,Nr.prototype.reverse=r_e,Nr.prototype.value=i_e,de.prototype.at=Dbe,de.prototype.chain=Mbe,de.prototype.commit=Pbe,de.prototype.next=Lbe,de.prototype.plant=Bbe,de.prototype.reverse=jbe,de.prototype.toJSON=de.prototype.valueOf=de.prototype.value=Fbe,de.prototype.first=de.prototype.head,U_&&(de.prototype[U_]=$be),de},vm=Pge();Bp?((Bp.exports=vm)._=vm,JO._=vm):da._=vm}).call(Zt)})(ut,ut.exports);const hte=()=>({name:"Model Data Split",groups:[{id:fg(),name:"train",distribution:80},{id:fg(),name:"validation",distribution:10},{id:fg(),name:"test",distribution:10}],distributeEqually:!1,itemMetadata:!0,validation:{valid:!0,errors:[]}}),bf={name:"Data Split",id:"",inputs:[],outputs:[],type:"",projectId:"",appId:"",metadata:{customNodeConfig:hte()},namespace:{projectName:"",serviceName:"",functionName:"",moduleName:"",packageName:""}};class YU{constructor(t){Un(this,"namespace");Un(this,"inputs");Un(this,"outputs");Un(this,"type");Un(this,"projectId");Un(this,"name");Un(this,"appId");Un(this,"metadata");Un(this,"id");var n,r,i,o,a,s,l,c,u,d,f;this.id=(n=t==null?void 0:t.id)!=null?n:bf.id,this.name=(r=t==null?void 0:t.name)!=null?r:bf.name,this.inputs=(i=t==null?void 0:t.inputs)!=null?i:bf.inputs,this.metadata=(o=t==null?void 0:t.metadata)!=null?o:bf.metadata,this.outputs=[{portId:(s=(a=t==null?void 0:t.outputs[0])==null?void 0:a.portId)!=null?s:fg(),actions:(l=this.metadata.customNodeConfig.groups.filter(p=>p.name.trim()!=="").map(p=>p.name))!=null?l:[],name:"item",nodeId:this.id,type:"Item"}],this.type=(c=t==null?void 0:t.type)!=null?c:bf.type,this.projectId=(u=t==null?void 0:t.projectId)!=null?u:bf.projectId,this.appId=(d=t==null?void 0:t.appId)!=null?d:bf.appId,this.namespace=(f=t==null?void 0:t.namespace)!=null?f:bf.namespace}static fromJSON(t){return{id:t.id,name:t.name,inputs:t.inputs,outputs:t.outputs,type:t.type,projectId:t.projectId,appId:t.appId,metadata:t.metadata,namespace:t.namespace}}}class Mc{constructor(t){Un(this,"name");Un(this,"distributeEqually");Un(this,"groups");Un(this,"itemMetadata");Un(this,"validation");var n,r,i,o,a;this.name=(n=t==null?void 0:t.name)!=null?n:Mc.DefaultValues.name,this.distributeEqually=(r=t==null?void 0:t.distributeEqually)!=null?r:Mc.DefaultValues.distributeEqually,this.groups=(i=t==null?void 0:t.groups)!=null?i:Mc.DefaultValues.groups,this.itemMetadata=(o=t==null?void 0:t.itemMetadata)!=null?o:Mc.DefaultValues.itemMetadata,this.validation=(a=t==null?void 0:t.validation)!=null?a:Mc.DefaultValues.validation}static get DefaultValues(){return hte()}get ports(){return this.groups.map(t=>({action:t.name,name:"item",type:"Item",portPercentage:t.distribution}))}static fromJSON(t){return{name:t==null?void 0:t.name,distributeEqually:t==null?void 0:t.distributeEqually,groups:t==null?void 0:t.groups,itemMetadata:t==null?void 0:t.itemMetadata,validation:t==null?void 0:t.validation}}toJSON(){var t;return{name:this.name,distributeEqually:this.distributeEqually,groups:this.groups,itemMetadata:(t=this.itemMetadata)!=null?t:!1,validation:this.validation,ports:this.ports}}}const gA=e=>parseFloat(Number(e).toFixed(2));var Km={},mte={},So={},B1={},Qa={};Object.defineProperty(Qa,"__esModule",{value:!0});Qa.channel=Qa.Logger=void 0;class pg{constructor(){this._enabled=!1,this._prefix=""}static getInstance(){return pg._instance||(pg._instance=new this),pg._instance}get state(){return this._enabled?"on":"off"}on(){this._enabled=!0}off(){this._enabled=!1}get prefix(){return this._prefix}set prefix(t){this._prefix=t}log(...t){if(!this._enabled)return;const n=`${window.location.hostname}(${this._prefix}) :: `;typeof console<"u"&&console.log(n,...t)}}Qa.Logger=pg;Qa.channel=pg.getInstance();var j1={},F1={};const Dy=MCe(DCe);var wp={exports:{}},hg=typeof Reflect=="object"?Reflect:null,WU=hg&&typeof hg.apply=="function"?hg.apply:function(t,n,r){return Function.prototype.apply.call(t,n,r)},H0;hg&&typeof hg.ownKeys=="function"?H0=hg.ownKeys:Object.getOwnPropertySymbols?H0=function(t){return Object.getOwnPropertyNames(t).concat(Object.getOwnPropertySymbols(t))}:H0=function(t){return Object.getOwnPropertyNames(t)};function PCe(e){console&&console.warn&&console.warn(e)}var gte=Number.isNaN||function(t){return t!==t};function Si(){Si.init.call(this)}wp.exports=Si;wp.exports.once=jCe;Si.EventEmitter=Si;Si.prototype._events=void 0;Si.prototype._eventsCount=0;Si.prototype._maxListeners=void 0;var KU=10;function U1(e){if(typeof e!="function")throw new TypeError('The "listener" argument must be of type Function. Received type '+typeof e)}Object.defineProperty(Si,"defaultMaxListeners",{enumerable:!0,get:function(){return KU},set:function(e){if(typeof e!="number"||e<0||gte(e))throw new RangeError('The value of "defaultMaxListeners" is out of range. It must be a non-negative number. Received '+e+".");KU=e}});Si.init=function(){(this._events===void 0||this._events===Object.getPrototypeOf(this)._events)&&(this._events=Object.create(null),this._eventsCount=0),this._maxListeners=this._maxListeners||void 0};Si.prototype.setMaxListeners=function(t){if(typeof t!="number"||t<0||gte(t))throw new RangeError('The value of "n" is out of range. It must be a non-negative number. Received '+t+".");return this._maxListeners=t,this};function _te(e){return e._maxListeners===void 0?Si.defaultMaxListeners:e._maxListeners}Si.prototype.getMaxListeners=function(){return _te(this)};Si.prototype.emit=function(t){for(var n=[],r=1;r<arguments.length;r++)n.push(arguments[r]);var i=t==="error",o=this._events;if(o!==void 0)i=i&&o.error===void 0;else if(!i)return!1;if(i){var a;if(n.length>0&&(a=n[0]),a instanceof Error)throw a;var s=new Error("Unhandled error."+(a?" ("+a.message+")":""));throw s.context=a,s}var l=o[t];if(l===void 0)return!1;if(typeof l=="function")WU(l,this,n);else for(var c=l.length,u=Ete(l,c),r=0;r<c;++r)WU(u[r],this,n);return!0};function vte(e,t,n,r){var i,o,a;if(U1(n),o=e._events,o===void 0?(o=e._events=Object.create(null),e._eventsCount=0):(o.newListener!==void 0&&(e.emit("newListener",t,n.listener?n.listener:n),o=e._events),a=o[t]),a===void 0)a=o[t]=n,++e._eventsCount;else if(typeof a=="function"?a=o[t]=r?[n,a]:[a,n]:r?a.unshift(n):a.push(n),i=_te(e),i>0&&a.length>i&&!a.warned){a.warned=!0;var s=new Error("Possible EventEmitter memory leak detected. "+a.length+" "+String(t)+" listeners added. Use emitter.setMaxListeners() to increase limit");s.name="MaxListenersExceededWarning",s.emitter=e,s.type=t,s.count=a.length,PCe(s)}return e}Si.prototype.addListener=function(t,n){return vte(this,t,n,!1)};Si.prototype.on=Si.prototype.addListener;Si.prototype.prependListener=function(t,n){return vte(this,t,n,!0)};function LCe(){if(!this.fired)return this.target.removeListener(this.type,this.wrapFn),this.fired=!0,arguments.length===0?this.listener.call(this.target):this.listener.apply(this.target,arguments)}function bte(e,t,n){var r={fired:!1,wrapFn:void 0,target:e,type:t,listener:n},i=LCe.bind(r);return i.listener=n,r.wrapFn=i,i}Si.prototype.once=function(t,n){return U1(n),this.on(t,bte(this,t,n)),this};Si.prototype.prependOnceListener=function(t,n){return U1(n),this.prependListener(t,bte(this,t,n)),this};Si.prototype.removeListener=function(t,n){var r,i,o,a,s;if(U1(n),i=this._events,i===void 0)return this;if(r=i[t],r===void 0)return this;if(r===n||r.listener===n)--this._eventsCount===0?this._events=Object.create(null):(delete i[t],i.removeListener&&this.emit("removeListener",t,r.listener||n));else if(typeof r!="function"){for(o=-1,a=r.length-1;a>=0;a--)if(r[a]===n||r[a].listener===n){s=r[a].listener,o=a;break}if(o<0)return this;o===0?r.shift():$Ce(r,o),r.length===1&&(i[t]=r[0]),i.removeListener!==void 0&&this.emit("removeListener",t,s||n)}return this};Si.prototype.off=Si.prototype.removeListener;Si.prototype.removeAllListeners=function(t){var n,r,i;if(r=this._events,r===void 0)return this;if(r.removeListener===void 0)return arguments.length===0?(this._events=Object.create(null),this._eventsCount=0):r[t]!==void 0&&(--this._eventsCount===0?this._events=Object.create(null):delete r[t]),this;if(arguments.length===0){var o=Object.keys(r),a;for(i=0;i<o.length;++i)a=o[i],a!=="removeListener"&&this.removeAllListeners(a);return this.removeAllListeners("removeListener"),this._events=Object.create(null),this._eventsCount=0,this}if(n=r[t],typeof n=="function")this.removeListener(t,n);else if(n!==void 0)for(i=n.length-1;i>=0;i--)this.removeListener(t,n[i]);return this};function yte(e,t,n){var r=e._events;if(r===void 0)return[];var i=r[t];return i===void 0?[]:typeof i=="function"?n?[i.listener||i]:[i]:n?BCe(i):Ete(i,i.length)}Si.prototype.listeners=function(t){return yte(this,t,!0)};Si.prototype.rawListeners=function(t){return yte(this,t,!1)};Si.listenerCount=function(e,t){return typeof e.listenerCount=="function"?e.listenerCount(t):Ste.call(e,t)};Si.prototype.listenerCount=Ste;function Ste(e){var t=this._events;if(t!==void 0){var n=t[e];if(typeof n=="function")return 1;if(n!==void 0)return n.length}return 0}Si.prototype.eventNames=function(){return this._eventsCount>0?H0(this._events):[]};function Ete(e,t){for(var n=new Array(t),r=0;r<t;++r)n[r]=e[r];return n}function $Ce(e,t){for(;t+1<e.length;t++)e[t]=e[t+1];e.pop()}function BCe(e){for(var t=new Array(e.length),n=0;n<t.length;++n)t[n]=e[n].listener||e[n];return t}function jCe(e,t){return new Promise(function(n,r){function i(a){e.removeListener(t,o),r(a)}function o(){typeof e.removeListener=="function"&&e.removeListener("error",i),n([].slice.call(arguments))}Tte(e,t,o,{once:!0}),t!=="error"&&FCe(e,i,{once:!0})})}function FCe(e,t,n){typeof e.on=="function"&&Tte(e,"error",t,n)}function Tte(e,t,n,r){if(typeof e.on=="function")r.once?e.once(t,n):e.on(t,n);else if(typeof e.addEventListener=="function")e.addEventListener(t,function i(o){r.once&&e.removeEventListener(t,i),n(o)});else throw new TypeError('The "emitter" argument must be of type EventEmitter. Received type '+typeof e)}var z1={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.AgentMessage=e.AgentMessageType=void 0,function(n){n.UNKNOWN="unknown",n.INIT="init",n.READY="ready",n.APP="app",n.CODE="code",n.RPC="rpc",n.EVENT="event",n.NAVIGATION="navigation"}(e.AgentMessageType||(e.AgentMessageType={}));class t{constructor(r){this.type=r.type,this.data=r.data,r.source&&(this.source=r.source),r.timeout&&(this.timeout=r.timeout)}}e.AgentMessage=t})(z1);var d2={},f2={};(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(s,l,c,u){u===void 0&&(u=c);var d=Object.getOwnPropertyDescriptor(l,c);(!d||("get"in d?!l.__esModule:d.writable||d.configurable))&&(d={enumerable:!0,get:function(){return l[c]}}),Object.defineProperty(s,u,d)}:function(s,l,c,u){u===void 0&&(u=c),s[u]=l[c]}),n=Zt&&Zt.__setModuleDefault||(Object.create?function(s,l){Object.defineProperty(s,"default",{enumerable:!0,value:l})}:function(s,l){s.default=l}),r=Zt&&Zt.__importStar||function(s){if(s&&s.__esModule)return s;var l={};if(s!=null)for(var c in s)c!=="default"&&Object.prototype.hasOwnProperty.call(s,c)&&t(l,s,c);return n(l,s),l};Object.defineProperty(e,"__esModule",{value:!0}),e.XFrameMessage=e.XFrameMessageType=void 0;const i=r(Dy);var o;(function(s){s.UNKNOWN="unknown",s.JOIN="join",s.REQUEST="request",s.RESPONSE="response"})(o=e.XFrameMessageType||(e.XFrameMessageType={}));class a{constructor(l){var c;this.xFrame=!0,this.sentTime=null,this.timeout=1800,this.id=i.v4(),this.type=o.UNKNOWN,this.data={},this.sync=!1,this.error=null,this.message=null,this.responseId=null,this.channelId=null,l&&Object.assign(this,l),!((c=this.data)===null||c===void 0)&&c.timeout&&(this.timeout=this.data.timeout,delete this.data.timeout)}static fromJson(l){}}e.XFrameMessage=a})(f2);var My={},UCe=Zt&&Zt.__createBinding||(Object.create?function(e,t,n,r){r===void 0&&(r=n);var i=Object.getOwnPropertyDescriptor(t,n);(!i||("get"in i?!t.__esModule:i.writable||i.configurable))&&(i={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,i)}:function(e,t,n,r){r===void 0&&(r=n),e[r]=t[n]}),zCe=Zt&&Zt.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),VCe=Zt&&Zt.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(e!=null)for(var n in e)n!=="default"&&Object.prototype.hasOwnProperty.call(e,n)&&UCe(t,e,n);return zCe(t,e),t};Object.defineProperty(My,"__esModule",{value:!0});My.XFrameMessageError=void 0;const GCe=VCe(Dy);class HCe{constructor(t){this.id=GCe.v4(),this.error=null,this.message=null,Object.assign(this,t)}}My.XFrameMessageError=HCe;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(d,f,p,h){h===void 0&&(h=p);var m=Object.getOwnPropertyDescriptor(f,p);(!m||("get"in m?!f.__esModule:m.writable||m.configurable))&&(m={enumerable:!0,get:function(){return f[p]}}),Object.defineProperty(d,h,m)}:function(d,f,p,h){h===void 0&&(h=p),d[h]=f[p]}),n=Zt&&Zt.__setModuleDefault||(Object.create?function(d,f){Object.defineProperty(d,"default",{enumerable:!0,value:f})}:function(d,f){d.default=f}),r=Zt&&Zt.__importStar||function(d){if(d&&d.__esModule)return d;var f={};if(d!=null)for(var p in d)p!=="default"&&Object.prototype.hasOwnProperty.call(d,p)&&t(f,d,p);return n(f,d),f};Object.defineProperty(e,"__esModule",{value:!0}),e.Channel=e.isOnPrem=void 0;const i=r(Dy),o=wp.exports,a=f2,s=My,l=Qa,c=()=>{let d;try{d={}.ON_PREM}catch{}return d===void 0||d==="true"};e.isOnPrem=c;class u extends o.EventEmitter{constructor(f,p=null,h=null){super(),this.localWin=null,this.remoteWin=null,this.queue=[],this._handleIncomingMessage=this.handleIncomingMessage.bind(this),l.channel.prefix=f.location.href,this.id="no-id-"+Date.now(),this.localWin=f,this.remoteWin=p,this._addMessageListener(),this.onDataCallback=h}_addMessageListener(){this.localWin.addEventListener("message",this._handleIncomingMessage)}isApprovedHost(f){return(0,e.isOnPrem)()?!0:/.*\.dataloop.ai$/.test(f)}destroy(){this.localWin.removeEventListener("message",this._handleIncomingMessage)}removeMessageFromQ(f){this.queue=this.queue.filter(p=>p.id!=f)}getMessageFromQ(f){return this.queue.find(p=>p.id==f)}handleResponse(f){if(!f.responseId){l.channel.log("Missing sent message response id");return}const p=this.getMessageFromQ(f.responseId);if(!p){l.channel.log("Unknown response");return}if(!p.resolve){l.channel.log("Missing resolve on response");return}this.removeMessageFromQ(f.responseId),f.error?p.reject(new s.XFrameMessageError({error:f.error,message:f.message})):p.resolve(f.data)}async handleIncomingMessage(f){const p=new URL(f.origin).hostname;let h=f.source;if(!this.isApprovedHost(p)){l.channel.log(`Host not allowed ${p}`);return}if(typeof f.data=="string"&&f.data.length==0){l.channel.log("Empty message");return}const m=new a.XFrameMessage(f.data);if(!m.xFrame){l.channel.log("Unknown message:"+m.type);return}if(m.type===a.XFrameMessageType.JOIN&&(this.remoteWin=h,this.id=m.channelId,this.emit("join")),m.channelId===this.id&&(l.channel.log(`Received: ${f.origin} =====> ${window.location.host}`),l.channel.log(`Message received (${window.location.href}): ${m.type}.${m.id}`),l.channel.log(`data: ${JSON.stringify(m)}`),m.type===a.XFrameMessageType.RESPONSE&&this.handleResponse(m),m.sync&&await this.sendAck(m),m.data)){if(this.isDataEmpty(m.data))return;this.emit("onData",m.data)}}isDataEmpty(f){return typeof f!="string"&&!Object.keys(f).length}async checkTimeout(){this.queue.filter(p=>p.sentTime&&Date.now()-p.sentTime>p.timeout).forEach(p=>{p.reject(new s.XFrameMessageError({error:"timeout",message:"Plugin message timeout",frame:p})),this.removeMessageFromQ(p.id)})}async sendAck(f,p){const h=new a.XFrameMessage({type:a.XFrameMessageType.RESPONSE});h.responseId=f.id;let m=p;if(!p)try{this.onDataCallback&&(m=await this.onDataCallback(f.data)),l.channel.log(`Ack message by resolver to: ${f.id}`)}catch(_){l.channel.log(`Ack message error: ${f.id}`),h.error=_.error,h.message=_.message,this.sendFrame(h);return}h.data=m,this.sendFrame(h)}async sendFrameSync(f){return f.sentTime=Date.now(),new Promise((h,m)=>{f.sync=!0,f.reject=m,f.resolve=h,setTimeout(this.checkTimeout.bind(this),f.timeout+5),this.queue.push(f),this.sendFrame(f)})}sendFrame(f){if(!this.remoteWin)throw new Error("Can't send with no remote win");f.sentTime=Date.now(),f.channelId=this.id;const p=JSON.parse(JSON.stringify(f));l.channel.log(`Sending channel message (${this.id}):${window.location.host} ------> ...`),l.channel.log(`Data: ${JSON.stringify(p)}`),this.remoteWin.postMessage(p,"*"),l.channel.log(`Message sent: ${f.type}.${f.id}`)}send(f){f.source.channelId=this.id;let p=new a.XFrameMessage({data:f,type:a.XFrameMessageType.REQUEST});return this.sendFrame(p)}async sendSync(f){let p=new a.XFrameMessage({data:f,type:a.XFrameMessageType.REQUEST});return await this.sendFrameSync(p)}async connect(){this.id=i.v4();let f=new a.XFrameMessage({type:a.XFrameMessageType.JOIN});return await this.sendFrameSync(f)}}e.Channel=u})(d2);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(f,p,h,m){m===void 0&&(m=h);var _=Object.getOwnPropertyDescriptor(p,h);(!_||("get"in _?!p.__esModule:_.writable||_.configurable))&&(_={enumerable:!0,get:function(){return p[h]}}),Object.defineProperty(f,m,_)}:function(f,p,h,m){m===void 0&&(m=h),f[m]=p[h]}),n=Zt&&Zt.__setModuleDefault||(Object.create?function(f,p){Object.defineProperty(f,"default",{enumerable:!0,value:p})}:function(f,p){f.default=p}),r=Zt&&Zt.__importStar||function(f){if(f&&f.__esModule)return f;var p={};if(f!=null)for(var h in f)h!=="default"&&Object.prototype.hasOwnProperty.call(f,h)&&t(p,f,h);return n(p,f),p};Object.defineProperty(e,"__esModule",{value:!0}),e.PeerAgent=e.FrameAgent=e.AgentState=void 0;const i=r(Dy),o=wp.exports,a=z1,s=d2,l=Qa;var c;(function(f){f.INIT="init",f.LIVE="live"})(c=e.AgentState||(e.AgentState={}));class u extends o.EventEmitter{constructor(p){super(),this.peers=[],this.supportedTypes=[],this.win=null,this.remote=!1,this._onPeerData=this.onPeerData.bind(this),this._onPeerEvent=this.onPeerEvent.bind(this),this._onPeerNavigation=this.onPeerNavigation.bind(this),this.handlePeerStateChange=h=>{const{guest:m,state:_}=h;this.emit("agentState",m,_)},this._handlePeerStateChange=this.handlePeerStateChange.bind(this),this.id=i.v4(),this.win=p!=null?p:window,this.supportedTypes.push(a.AgentMessageType.INIT,a.AgentMessageType.READY,a.AgentMessageType.APP,a.AgentMessageType.CODE,a.AgentMessageType.RPC)}getPeer(p){if(!p){if(this.peers.length==0)throw Error("Peer was not found and no default peer");return this.peers[0]}return this.peers.find(h=>h.id==p)}async onPeerData(p){this.emit("data",p)}async onPeerEvent(p){this.emit("event",p.data,p.source)}async onPeerNavigation(p){this.emit("navigation",p.data,p.source)}send(p,h=null){const m=this.getPeer(h);if(!m)throw Error("Send failed, No peer");return m.send(p)}async sendSync(p,h={}){const m=this.getPeer(h==null?void 0:h.peerId);if(!m)throw Error("Send failed, No peer");return m.sendSync(p)}async createPeer(p){const h=new d(this.win,p);return h.on("data",this._onPeerData),h.on("event",this._onPeerEvent),h.on("navigation",this._onPeerNavigation),h.on("peerState",this._handlePeerStateChange),this.peers.push(h),h}async loadPeer(p,h){const m=this.getPeer(p);if(!m)throw Error("Trying load unknown peer");return await m.connect(h),m}removePeer(p){this.destroy(p),this.peers=this.peers.filter(h=>h.id!==p)}destroy(p){const h=this.getPeer(p);if(!h)throw Error("No peer to destroy");h.off("data",this._onPeerData),h.off("event",this._onPeerEvent),h.off("navigation",this._onPeerNavigation),h.off("peerState",this._handlePeerStateChange),h.destroy()}}e.FrameAgent=u;class d extends u{constructor(p,h){super(),this.onPeerMessage_=this.onPeerMessage.bind(this),h&&(this.onDataCallback=h),this.localWin=p,this.remote=!0}get state(){return this._state}set state(p){this._state!==p&&(this._state=p,this.emit("peerState",{state:this.state,guest:this}))}get isRegistered(){return this.state===c.LIVE}send(p){var h;const m={agentId:this.id},_=new a.AgentMessage({type:a.AgentMessageType.APP,data:p,source:m});return(h=this.channel)===null||h===void 0?void 0:h.send(_)}async sendSync(p,h={}){var m;const _=new a.AgentMessage({type:a.AgentMessageType.APP,data:p,timeout:h.timeout});return(m=this.channel)===null||m===void 0?void 0:m.sendSync(_)}async sendCode(p,h={}){var m;const _=new a.AgentMessage({type:a.AgentMessageType.CODE,data:p,timeout:h.timeout});return(m=this.channel)===null||m===void 0?void 0:m.sendSync(_)}async sendRPC(p,h={}){var m;const _=new a.AgentMessage({type:a.AgentMessageType.RPC,data:p,timeout:h.timeout});return(m=this.channel)===null||m===void 0?void 0:m.sendSync(_)}sendEvent(p){var h;const m={agentId:this.id},_=new a.AgentMessage({type:a.AgentMessageType.EVENT,data:p,source:m});(h=this.channel)===null||h===void 0||h.send(_)}navigate(p){var h;const m={agentId:this.id},_=new a.AgentMessage({type:a.AgentMessageType.NAVIGATION,data:p,source:m});(h=this.channel)===null||h===void 0||h.send(_)}async connect(p){this.channel=new s.Channel(this.localWin,p,this.onDataCallback),this.channel.on("onData",this.onPeerMessage_),this.state=c.INIT,await this.channel.connect(),this.state=c.LIVE}destroy(){var p,h;(p=this.channel)===null||p===void 0||p.off("onData",this.onPeerMessage_),(h=this.channel)===null||h===void 0||h.destroy()}async onPeerMessage(p){var h;if(this.id===((h=p.source)===null||h===void 0?void 0:h.agentId)){l.channel.log("Message from self - aborting");return}switch(p.type){case a.AgentMessageType.APP:this.emit("data",p.data);break;case a.AgentMessageType.EVENT:this.emit("event",p);break;case a.AgentMessageType.NAVIGATION:this.emit("navigation",p)}}}e.PeerAgent=d})(F1);Object.defineProperty(j1,"__esModule",{value:!0});j1.GuestAgent=void 0;const qCe=F1,YCe=d2,_A=Qa,OE=z1;class WCe extends qCe.PeerAgent{constructor(t,n){t||(t=window),super(t,n),n||(this.onDataCallback=this.messageHandler.bind(this)),this.channel=new YCe.Channel(t,null,this.onDataCallback),this.channel.on("join",()=>{this.emit("guestReady")}),this.channel.on("onData",this.onData.bind(this))}async messageHandler(t){const{type:n}=t;return n===OE.AgentMessageType.CODE?await this.handleCode(t):n===OE.AgentMessageType.RPC?await this.handleRPC(t):null}destroy(){_A.channel.log("destroying guest agent"),super.destroy(),this.channel.off("join",()=>{this.emit("guestReady")}),this.channel.off("onData",this.onData.bind(this)),this.channel=null}async onData(t){const r=typeof t=="string"?{data:t}:t;t.type===OE.AgentMessageType.EVENT&&this.emit("event",r),t.type===OE.AgentMessageType.NAVIGATION&&this.emit("navigation",r),this.emit("data",r)}async handleCode(t){_A.channel.log("Loading code...");let n={},r="success",i="";try{n=eval.call(window,decodeURIComponent(t.data))}catch(a){r="error",i="exception occurred in code",n=a}const o={};return o.message=i,o.result=r,o.output=n,o}async handleRPC(t){_A.channel.log("Handling RPC message");const n=t.data;let r={},i="NA",o="";const a=window[n.func];if(typeof a!="function")r={},i="error",o="Function does not exist";else try{let l={};typeof n.inputs=="object"&&(l=n.inputs),a.constructor.name=="AsyncFunction"?r=await a(...l):r=a(...l),i="success"}catch(l){i="error",o="exception",l&&l.message&&(r=l.message)}const s={};return s.message=o,s.result=i,s.output=r,s}}j1.GuestAgent=WCe;var KCe=Zt&&Zt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(B1,"__esModule",{value:!0});B1.GuestApp=void 0;const QU=Qa,QCe=j1,XCe=KCe(wp.exports);class JCe extends XCe.default{initGuest(){QU.channel.log("plugin agent init"),this.agent=new QCe.GuestAgent,this.agent.on("guestReady",()=>{this.emit("ready")}),this.agent.on("data",t=>{this.emit("data",t)}),this.agent.on("event",t=>{this.emit("event",t)}),this.agent.on("navigation",t=>{this.emit("navigation",t)})}async init(){const t=window.location.href;QU.channel.log(`Init on window ${t}`),this.initGuest()}}B1.GuestApp=JCe;var Cte={},wte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.CrudEvent=e.CrudType=e.AppMessageScope=void 0,function(t){t.GLOBAL="global",t.ANNOTATION="annotation",t.LABEL="label",t.ATTRIBUTE="attribute",t.STRUCTURE="structure",t.ITEM="item",t.PROJECT="project",t.RECIPE="recipe",t.ONTOLOGY="ontology",t.DATASET="dataset",t.TASK="task",t.CONTRIBUTOR="contributor",t.SETTINGS="settings",t.EXECUTION="execution",t.DRIVER="driver",t.INTEGRATION="integration",t.PIPELINE="pipeline",t.PIPELINE_EXECUTION="pipelineExecution",t.MODEL="model",t.SERVICE="service"}(e.AppMessageScope||(e.AppMessageScope={})),function(t){t.UNKNOWN="unknown",t.CREATE="create",t.CREATE_BULK="createBulk",t.READ="read",t.UPDATE="update",t.UPDATE_BULK="updateBulk",t.DELETE="delete",t.DELETE_BULK="deleteBulk",t.QUERY="query",t.STREAM="stream",t.CLONE="clone",t.FETCH="fetch",t.LOGS="logs",t.SET_STATUS="setStatus",t.DOES_LABEL_HAVE_ATTRIBUTES="doesLabelHaveAttributes",t.CALC_LABELS_HAVE_ATTRIBUTES="calcLabelsHaveAttributes",t.MISSING_REQUIRED_ATTRIBUTE="missingRequiredAttribute",t.GET_LABEL_ATTRIBUTES="getLabelAttributes",t.UPDATE_ASSIGNEES="updateAssignees",t.GET_BY_NAME="getByName",t.COUNT_BY_QUERY="countByQuery",t.PREDICT="predict"}(e.CrudType||(e.CrudType={})),function(t){t.CREATED="created",t.DELETED="deleted",t.UPDATED="updated"}(e.CrudEvent||(e.CrudEvent={}))})(wte);var Ote={},V1={};Object.defineProperty(V1,"__esModule",{value:!0});V1.CrudMessage=void 0;class ZCe{constructor(t){t&&Object.assign(this,t)}}V1.CrudMessage=ZCe;var Rte={};Object.defineProperty(Rte,"__esModule",{value:!0});var Ate={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.DlRoute=e.DlNavigationMessage=void 0;class t{constructor(r){this.route=r.route,this.params=r.params,this.options=r.options,this.query=r.query}}e.DlNavigationMessage=t,function(n){n.PROJECTS="projectsPage",n.PROJECT="projectOverview",n.DATASETS="datasets",n.DATASET_BROWSER="datasetBrowser",n.PROJECT_TEAM="projectTeam",n.TASKS="tasks",n.TASK_BROWSER="taskBrowser",n.ASSIGNMENTS="assignments",n.CLOUD_STORAGE="cloudStorage",n.APPLICATION_HUB="applicationHub",n.ORG_MEMBERS_AND_GROUPS="orgMembersAndGroups",n.AUDIT_LOGS="auditLogs",n.STUDIO="studio",n.PIPELINES="pipelines",n.RECIPES="recipes",n.RECIPE="recipe",n.STARTLINE="startline",n.CUSTOM="custom"}(e.DlRoute||(e.DlRoute={}))})(Ate);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(z1,e),n(F1,e),n(V1,e),n(Rte,e),n(Ate,e)})(Ote);var kte={};(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(f2,e),n(My,e)})(kte);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(wte,e),n(Ote,e),n(kte,e)})(Cte);var Ite={},G1={};Object.defineProperty(G1,"__esModule",{value:!0});G1.XFrameManager=void 0;const e1e=F1,t1e=wp.exports,RE=Qa;class n1e extends t1e.EventEmitter{constructor(t,n){super(),this._guestAgents=[],this.onDataCallback=n,t||(t=window),this._hostAgent=new e1e.FrameAgent(t),this._hostAgent.on("data",this.onHostData.bind(this)),this._hostAgent.on("agentState",this.onHostAgentState.bind(this)),this._hostAgent.on("event",this.onHostEvent.bind(this)),this._hostAgent.on("navigation",this.onHostNavigation.bind(this))}get logger(){return RE.channel}get hostAgent(){return this._hostAgent}get guestAgents(){return this._guestAgents}async onHostData(t){RE.channel.log("Data from peer: ",t)}async onHostEvent(t){RE.channel.log("Event from peer: ",t)}async onHostNavigation(t){RE.channel.log("Navigation from peer: ",t)}async onGuestData(t,n){this.emit("data",t,n)}async onHostAgentState(t,n){console.log(t,n)}async onGuestAgentState(t,n){this.emit("agentState",t,n)}async onGuestEvent(t){this.emit("event",t.data,t.source)}async onGuestNavigation(t){this.emit("navigation",t.data,t.source)}async createFrameByUrl(t){return new Promise(async(r,i)=>{const a=Date.now(),s=document.createElement("iframe");s.src=t,document.body.appendChild(s);let l=!1;s.onload=async()=>{if(Date.now()-a>5e3)return;l=!0;const u=await this.registerGuest(s.contentWindow);r(u)},setTimeout(()=>{l||i("Frame load timeout")},5e3)})}async createGuest(){const t=await this._hostAgent.createPeer(this.onDataCallback);return this._guestAgents.push(t),t.on("data",n=>this.onGuestData(n,t)),t.on("onData",n=>this.onGuestData(n,t)),t.on("event",this.onGuestEvent.bind(this)),t.on("navigation",this.onGuestNavigation.bind(this)),t.on("agentState",this.onGuestAgentState.bind(this)),t}async registerGuest(t,n){if(n)return await this._hostAgent.loadPeer(n,t);const r=await this.createGuest();return await this._hostAgent.loadPeer(r.id,t)}removeGuest(t){this._guestAgents=this._guestAgents.filter(n=>n.id!==t),this._hostAgent.removePeer(t)}}G1.XFrameManager=n1e;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(G1,e)})(Ite);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(B1,e),n(Cte,e),n(Ite,e)})(So);Object.defineProperty(mte,"__esModule",{value:!0});var p2={},xo={};Object.defineProperty(xo,"__esModule",{value:!0});xo.Repository=void 0;const XU=Qa;class r1e{constructor(t){this.agent=t}async crudReqSync(t,n={}){try{return XU.channel.log(`Sync request:${t.scope}:${t.crud}`),await this.agent.sendSync(t,n)}catch(r){throw r}}crudReq(t){try{return XU.channel.log(`CRUD request:${t.scope}:${t.crud}`),this.agent.send(t)}catch(n){throw n}}}xo.Repository=r1e;var Nte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.ThemeType=void 0,function(t){t.DARK="dark",t.LIGHT="light"}(e.ThemeType||(e.ThemeType={}))})(Nte);var xte={};Object.defineProperty(xte,"__esModule",{value:!0});(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(a,s,l,c){c===void 0&&(c=l);var u=Object.getOwnPropertyDescriptor(s,l);(!u||("get"in u?!s.__esModule:u.writable||u.configurable))&&(u={enumerable:!0,get:function(){return s[l]}}),Object.defineProperty(a,c,u)}:function(a,s,l,c){c===void 0&&(c=l),a[c]=s[l]}),n=Zt&&Zt.__exportStar||function(a,s){for(var l in a)l!=="default"&&!Object.prototype.hasOwnProperty.call(s,l)&&t(s,a,l)};Object.defineProperty(e,"__esModule",{value:!0}),e.AppSettings=void 0;const r=xo,i=So;n(Nte,e),n(xte,e);class o extends r.Repository{async get(s){var l,c;const u=new i.CrudMessage({scope:i.AppMessageScope.SETTINGS,crud:i.CrudType.READ,data:{channelId:(c=(l=this.agent)===null||l===void 0?void 0:l.channel)===null||c===void 0?void 0:c.id,setting:s}});return await this.crudReqSync(u)}}e.AppSettings=o})(p2);var Lb={},H1={},Py={};Object.defineProperty(Py,"__esModule",{value:!0});Py.SDKProject=void 0;class i1e{constructor(t){t&&Object.assign(this,t)}get accountId(){var t;return(t=this.account)===null||t===void 0?void 0:t.id}get orgId(){var t;return(t=this.org)===null||t===void 0?void 0:t.id}}Py.SDKProject=i1e;Object.defineProperty(H1,"__esModule",{value:!0});H1.Projects=void 0;const o1e=xo,ds=So,a1e=Qa,s1e=Py;class l1e extends o1e.Repository{async create(t){const{name:n}=t;a1e.channel.log(`Creating project ${n}`);const r=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.CREATE,data:{name:n}});return await this.crudReqSync(r)}async update(t){const{id:n,name:r}=t,i=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.UPDATE,data:{id:n,name:r}});return await this.crudReqSync(i)}async delete(t){const n=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.DELETE,data:t});await this.crudReqSync(n)}async get(t){const n=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.READ,data:t});return await this.crudReqSync(n)}async query(){var t;const n=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.QUERY}),r=await this.crudReqSync(n);return r.items=(t=r.items)===null||t===void 0?void 0:t.map(i=>new s1e.SDKProject(i)),r}}H1.Projects=l1e;var q1={},h2={},m2={},$g={};Object.defineProperty($g,"__esModule",{value:!0});$g.SnapshotService=$g.SDKAnnotationSnapshot=void 0;const JU=ut.exports;class xv{constructor(t){var n;this.fixed=t.fixed,this.frame=t.frame,this.objectVisible=(n=t.objectVisible)!==null&&n!==void 0?n:!0,this.data=t.data,this.label=t.label,this.namedAttributes=t.namedAttributes,this.description=t.description}setAttributeByName(t,n){n!==void 0?(this.namedAttributes||(this.namedAttributes={}),this.namedAttributes[t]=n):this.namedAttributes&&(this.namedAttributes[t]=null)}}$g.SDKAnnotationSnapshot=xv;class c1e{_generateInclusiveList(){return this.initSnapshot?(this._inclusiveList=this._list.slice(),this._inclusiveList[this.initSnapshot.frame]=this.initSnapshot,this._inclusiveList):[]}get _annotationId(){var t;return(t=this._annotation)===null||t===void 0?void 0:t.id}_syncSnapshots(){this._annotation.metadata.system.snapshots_=this._list,this._generateInclusiveList()}get list(){return this._inclusiveList}constructor(t){this._snapShotIndex=[],this.findSelfFrames=(n,r)=>n===r,this._annotation=t,this._generateSnapshotState()}get _startFrame(){var t,n,r;return(r=(n=(t=this._annotation)===null||t===void 0?void 0:t.metadata)===null||n===void 0?void 0:n.system)===null||r===void 0?void 0:r.frame}set _startFrame(t){this._annotation.metadata.system.frame=t}get _endFrame(){var t,n,r;return(r=(n=(t=this._annotation)===null||t===void 0?void 0:t.metadata)===null||n===void 0?void 0:n.system)===null||r===void 0?void 0:r.endFrame}set _endFrame(t){this._annotation.metadata.system.endFrame=t}_generateSnapshotState(){var t;if(!(!((t=this._annotation.metadata)===null||t===void 0)&&t.system))return;this._annotation.metadata.system.snapshots_||(this._annotation.metadata.system.snapshots_=[]),this._list=this._annotation.metadata.system.snapshots_;const n=[];for(const i of this._list)if(i!=null&&i.data){const o=new xv({data:i.data,label:i.label,namedAttributes:i.namedAttributes,description:i.description,fixed:i.fixed,frame:i.frame,objectVisible:i.objectVisible});o.annotationId=this._annotationId,n[i.frame]=o}const r=[...this._list];this.initSnapshot&&r.unshift(this.initSnapshot);for(let i=0;i<r.length;i++){if(!r[i])continue;this._snapShotIndex[r[i].frame]=r[i].frame;let o=-1;r[i+1]&&(o=r[i+1].frame,this._snapShotIndex[r[i+1].frame]=r[i+1].frame),this._snapShotIndex.fill(r[i].frame,r[i].frame,o)}this._list=n,this._syncSnapshots()}get initSnapshot(){var t;if(!this._annotation)return;const n=this._annotation.label,r=this._annotation.description,i=Object.assign({},this._annotation.metadata.system.attributes),o=(t=this._annotation.data)!==null&&t!==void 0?t:this._annotation._def,a=new xv({data:o,label:n,namedAttributes:i,description:r,fixed:!0,frame:this._annotation.metadata.system.frame});return a.annotationId=this._annotationId,a}_addSnapshot(t){var n;if(t.annotationId=this._annotationId,t.frame>this._startFrame&&(this._list[t.frame]=t),t.label===""){const i=this.list.indexOf(t);t.label=this.list[i].label}let r=this.getNextSnapFrame(t.frame);if(this._startFrame>t.frame&&(r===((n=this.initSnapshot)===null||n===void 0?void 0:n.frame)&&(r=this.getNextSnapFrame(r)),delete this._snapShotIndex[this._startFrame],this._startFrame=t.frame),this._endFrame<t.frame&&(this._endFrame=t.frame),this._snapShotIndex[t.frame]===t.frame){this._syncSnapshots();return}if(this._snapShotIndex[t.frame]=t.frame,r===-1){const i=this._getPrevSnapFrame(t.frame);i!==-1&&this._snapShotIndex.fill(i,i,t.frame),this._syncSnapshots();return}this._snapShotIndex[r-1]=t.frame,this._snapShotIndex.fill(t.frame,t.frame,r),this._syncSnapshots()}delete(t){if(!t)return;const n=t.frame;delete this._list[n];const r=this._getPrevSnapFrame(n),i=this.getNextSnapFrame(t.frame)||this._snapShotIndex.length;this._snapShotIndex[t.frame]=r,this._snapShotIndex.fill(r,t.frame,i),this._syncSnapshots()}getNextSnapFrame(t){return(0,JU.findIndex)(this._snapShotIndex,this.findSelfFrames,t+1)}_getPrevSnapFrame(t){let n=(0,JU.findLastIndex)(this._snapShotIndex.slice(0,t),this.findSelfFrames);return n<0&&(n=this.initSnapshot.frame),n}_getPrevFixedFrame(t){for(let n=t-1;n>=0;--n)if(this.list[n]&&this.list[n].fixed)return this.list[n]}_getNextFixedFrame(t){for(let n=t+1;n<this.list.length;++n)if(this.list[n]&&this.list[n].fixed)return this.list[n]}_get(t){let n;return this._snapShotIndex[t]===void 0?this.list.length===0?n=this.initSnapshot:n=this.list[this._snapShotIndex.length-1]:n=this.list[this._snapShotIndex[t]],n}get(t){return new xv(this._get(t))}_generateTransformationSection(t,n,r){var i,o;if(!(n.frame-t.frame<=0)){for(let s=t.frame+1;s<n.frame;++s)delete this._list[s];for(let s=t.frame+1;s<n.frame;++s){const l=(s-t.frame)/(n.frame-t.frame),c=r(t,n,l);this.create({frame:s,label:(i=c.label)!==null&&i!==void 0?i:t.label,namedAttributes:(o=c.namedAttributes)!==null&&o!==void 0?o:t.namedAttributes,data:c.data,fixed:!1})}}}generateTransformation(t,n){const r=this._get(t);if(!r||r.frame!==t||!r.fixed)return;const i=this._getPrevFixedFrame(t),o=this._getNextFixedFrame(t);i&&this._generateTransformationSection(i,r,n),o&&this._generateTransformationSection(r,o,n),this._syncSnapshots()}create(t){const{frame:n,label:r,namedAttributes:i,data:o,fixed:a,description:s,objectVisible:l}=t;let c=this.list[n];return n===this._startFrame&&o?(this._annotation.data=o,this._generateInclusiveList()):c&&c.frame!==this._startFrame?(c.fixed=a,c.data=o,c.label=r,l!==void 0&&(c.objectVisible=l),c.description=s||c.description,i&&(c.namedAttributes=Object.assign({},i))):(c=new xv({data:o,label:r,namedAttributes:i,description:s,fixed:a,frame:n,objectVisible:l}),this._addSnapshot(c)),c}async update(t){const{label:n,namedAttributes:r,data:i,objectVisible:o}=t,a=t.untilSpecificFrame;let s=t.frame;if(s===this._startFrame&&i)this._annotation.data=i;else if(a){const l=this._get(a);if(l)l.fixed||(l.fixed=!0),a===this._endFrame&&this._updateByParams({frame:a,label:n,objectVisible:o,namedAttributes:r,data:i});else if(!l&&a!==this._endFrame){const c=this._get(a);this.create({frame:a,label:c.label,namedAttributes:c.namedAttributes,data:c.data,objectVisible:c.objectVisible,fixed:!0})}for(;s<a;){this._updateByParams({frame:s,label:n,namedAttributes:r,objectVisible:o,data:i});const c=this._getNextFixedFrame(s);s=c?c.frame:this._endFrame}}else this._updateByParams({frame:s,label:n,namedAttributes:r,data:i,objectVisible:o});this._syncSnapshots()}_updateByParams(t){const{label:n,namedAttributes:r,frame:i,data:o,objectVisible:a}=t;n&&this._setLabel({label:n,frame:i}),r&&this._setAttributes(r,i),o&&this._setData({data:o,frame:i}),a!==void 0&&this._setObjectVisible({objectVisible:a,frame:i})}_setObjectVisible(t){const{objectVisible:n}=t;let{frame:r}=t;r===void 0&&(r=0);const i=this._get(r);return i.objectVisible=n,this._updateSnapshot({objectVisible:n,frame:r})}_setData(t){const{data:n}=t;let{frame:r}=t;r===void 0&&(r=0);const i=this._get(r);return n&&(i.data=n),this._updateSnapshot({data:n,frame:r})}_setAttributes(t,n){var r;n<=this._startFrame&&(t.value!==void 0?this._annotation.metadata.system.attributes[t.key]=t.value:this._annotation.metadata.system.attributes[t.key]=null);const i=this._get(n);if(i)i.setAttributeByName(t.key,t.value),this._updateSnapshot({namedAttributes:i.namedAttributes,frame:n});else{const o=this._get(n),a=Object.assign({},(r=o==null?void 0:o.namedAttributes)!==null&&r!==void 0?r:{},{[t.key]:t.value});this._updateSnapshot({namedAttributes:a,frame:n})}}_setLabel(t){const{label:n,namedAttributes:r}=t;let{frame:i}=t;i===void 0&&(i=0);const o=this._get(i);return n&&(o.label=n),r&&(i<=this._startFrame&&(this._annotation.metadata.system.attributes=Object.assign({},r)),o.namedAttributes=Object.assign({},r)),this._updateSnapshot({label:n,namedAttributes:r,frame:i})}_updateSnapshot(t){var n;const{frame:r}=t;let{label:i,namedAttributes:o,data:a,objectVisible:s}=t;const l=this._get(r);if(l)i=i!=null?i:l.label,o=Object.assign({},o!=null?o:l.namedAttributes),a=a!=null?a:l.data,l.label=i,l.namedAttributes=o,l.fixed=!0,l.data=a,s!==void 0&&(l.objectVisible=s);else{const u=this._get(r);i||(i=u.label),o||(o=Object.assign({},(n=u.namedAttributes)!==null&&n!==void 0?n:{})),a||(a=u.data),this.create({frame:r,label:i,namedAttributes:o,data:a,objectVisible:s,fixed:!0,description:u.description})}const c=[{name:"label",value:i},{name:"namedAttributes",value:o}];a&&c.push({name:"data",value:a}),s!==void 0&&c.push({name:"objectVisible",value:s}),this._updateNotFixed({toUpdate:c,startFrame:r})}_updateNotFixed(t){var n;const{toUpdate:r,startFrame:i}=t;let o=!0,a=i;for(;o;){a=a+1;const s=(n=this.list[a])!==null&&n!==void 0?n:this._getNextSnapshot(a);if(!s)return;if(a=s.frame,o=!s.fixed,o)for(const l of r)s[l.name]=l.value}}_getNextSnapshot(t){const n=this.list;for(let r=t+1;r<n.length;++r)if(n[r])return n[r]}}$g.SnapshotService=c1e;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n($g,e)})(m2);(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKAnnotationEvent=e.SDKAnnotation=e.AnnotationType=void 0;const t=m2;(function(i){i.CLASS="class",i.POINT="point",i.LINE="line",i.BOX="box",i.CUBE="cube",i.SEGMENT="segment",i.ELLIPSE="ellipse",i.BINARY="binary",i.NOTE="note",i.POLYLINE="polyline",i.COMPARISON="comparison",i.RECORDING="recording",i.SUBTITLE="subtitle",i.ITEM_DESCRIPTION="item_description",i.TEXT_MARK="text_mark",i.POSE="pose",i.CUBE_3D="cube_3d",i.SEMANTIC_3D="semantic_3d",i.POLYLINE_3D="polyline_3d",i.PDF_TEXT="pdf_text",i.TEXT="text",i.REF_IMAGE="ref_image",i.REF_SEMANTIC_3D="ref_semantic_3d",i.GIS="gis"})(e.AnnotationType||(e.AnnotationType={}));class n{constructor(o){o&&Object.assign(this,o),this.snapshots=new t.SnapshotService(this),this.data===void 0&&(this.data=o._def),this.description===void 0&&(this.description=o._description)}toJSON(){return{clientId:this.clientId,coordinates:this.coordinates,createdAt:this.createdAt,creator:this.creator,datasetId:this.datasetId,id:this.id,itemId:this.itemId,label:this.label,labelSuggestions:this.labelSuggestions,metadata:this.metadata,type:this.type,updatedAt:this.updatedAt,updatedBy:this.updatedBy,attributes:this.attributes,description:this.description,labelColor:this.labelColor,data:this.data}}}e.SDKAnnotation=n;class r{constructor(o){this.id=o.id,this.annotationId=o.annotationId,this.user=o.user,this.timestamp=o.timestamp,o.changes&&(this.changes=o.changes),o.deleted&&(this.deleted=o.deleted)}}e.SDKAnnotationEvent=r})(h2);Object.defineProperty(q1,"__esModule",{value:!0});q1.Annotations=void 0;const u1e=xo,si=So,Am=h2;class d1e extends u1e.Repository{async get(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.READ,data:t}),r=await this.crudReqSync(n);return new Am.SDKAnnotation(r)}async delete(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.DELETE,data:t});await this.crudReqSync(n)}async deleteBulk(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.DELETE_BULK,data:t});await this.crudReqSync(n)}async query(t,n={}){const r=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.QUERY,data:t}),i=await this.crudReqSync(r,n);return i.items=i.items.map(o=>new Am.SDKAnnotation(o)),i}async create(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.CREATE,data:t}),r=await this.crudReqSync(n);return new Am.SDKAnnotation(r)}async createBulk(t,n={}){const r=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.CREATE_BULK,data:t});return(await this.crudReqSync(r,n)).map(o=>new Am.SDKAnnotation(o))}async update(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.UPDATE,data:t}),r=await this.crudReqSync(n);return new Am.SDKAnnotation(r)}async updateBulk(t,n={}){const r=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.UPDATE_BULK,data:t});return(await this.crudReqSync(r,n)).map(o=>new Am.SDKAnnotation(o))}async logs(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.LOGS,data:t});return await this.crudReqSync(n)}async setStatus(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.SET_STATUS,data:t});await this.crudReqSync(n)}}q1.Annotations=d1e;var Y1={},g2={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.TaskEvent=e.AppProcessingStates=e.AppsProcessingEvents=e.DlRecipeEvent=e.DlItemFrameEvent=e.DlItemEvent=e.DlAnnotationEvent=e.DlAnnotationFrameEvent=e.DlFrameEvent=e.DlEvent=void 0,function(t){t.READY="ready",t.THEME="theme",t.VALIDATION_RESULT="validationResult",t.NODE_CONFIG="nodeConfig",t.INVOKE_PAYLOAD="invokePayload",t.EXECUTION_STATUS="executionStatus",t.VIEWER_SETTINGS="viewerSettings",t.TOOL_CONTROLS="toolControls",t.ACTIVE_QUERY="activeQuery",t.TRIGGER_ACTIVE_QUERY="triggerActiveQuery",t.NAVIGATION="navigation",t.USER_FIRST_VISIT="userFirstVisit",t.REFRESH="refresh"}(e.DlEvent||(e.DlEvent={})),function(t){t.UPDATE_NODE_CONFIG="updateNodeConfig",t.TOGGLE_ACTION_LOCK="toggleActionLock",t.CLOSE_DIALOG="app:closeDialog",t.REDO="redo",t.UNDO="undo",t.TOAST_MESSAGE="app:toastMessage",t.INVOKE_PANEL="invokePanel",t.SET_HEIGHT="app:setHeight",t.UPDATE_TIME_SERVICE_SETTINGS="app:updateTimeServiceSettings",t.UPDATE_VIEWER_SETTINGS="app:updateViewerSettings",t.CLIPBOARD_WRITE="app:clipboardWrite",t.REFRESH_DATA="app:refreshData"}(e.DlFrameEvent||(e.DlFrameEvent={})),function(t){t.SELECT_ONE="selectOneAnnotation",t.DESELECT_ONE="deselectOneAnnotation",t.SELECT_MULTIPLE="selectMultipleAnnotations",t.DESELECT_MULTIPLE="deselectMultipleAnnotations",t.DESELECT_ALL="clearSelectedAnnotations"}(e.DlAnnotationFrameEvent||(e.DlAnnotationFrameEvent={})),function(t){t.DELETED="dl:annotation:deleted",t.UPDATED="dl:annotation:updated",t.CREATED="dl:annotation:created",t.BULK_DELETED="dl:annotations:deleted",t.SELECT="dl:annotations:select",t.DESELECT="dl:annotations:deselect",t.SET_SELECTION="dl:annotations:setSelection"}(e.DlAnnotationEvent||(e.DlAnnotationEvent={})),function(t){t.SELECTION_UPDATED="items:selection:updated",t.DESELECT_ONE="items:deselect:one",t.DELETED="items:deleted"}(e.DlItemEvent||(e.DlItemEvent={})),function(t){t.SET_SELECTION="dl:items:update:selection",t.SET_ITEM_STATUS="dl:items:set:status"}(e.DlItemFrameEvent||(e.DlItemFrameEvent={})),function(t){t.RECIPE_HAS_CHANGES="recipe:has:changes",t.RECIPE_ON_SAVE_CLICK="recipe:on:save:click",t.RECIPE_LAYOUT_SAVE_DONE="recipe:layout:save:done"}(e.DlRecipeEvent||(e.DlRecipeEvent={})),function(t){t.APP_PROCESSING="appProcessing",t.APP_PROCESSING_STATUS="appProcessingStatus",t.APPS_IS_PROCESSING="apps:isProcessing",t.APPS_IS_PROCESSING_STATUS="apps:isProcessingStatus"}(e.AppsProcessingEvents||(e.AppsProcessingEvents={})),function(t){t.IDLE="idle",t.PROCESSING="processing"}(e.AppProcessingStates||(e.AppProcessingStates={})),function(t){t.TASK_STATUS_CHANGE_RESULT="task:statusChangeResult",t.TASK_REQUEST_STATUS_CHANGE="task:requestStatusChange",t.TASK_STATUS_CHANGE_REQUESTED="task:statusChangeRequested"}(e.TaskEvent||(e.TaskEvent={}))})(g2);Object.defineProperty(Y1,"__esModule",{value:!0});Y1.Items=void 0;const f1e=Qa,p1e=xo,Ri=So,h1e=g2;class m1e extends p1e.Repository{async create(t,n={}){const{file:r,path:i,metadata:o,binaries:a,datasetId:s,overwrite:l}=t;f1e.channel.log(`creating ${r.name}`);const u=await(h=>new Promise((m,_)=>{const v=new FileReader;v.readAsDataURL(h),v.onload=()=>m(v.result),v.onerror=b=>_(b)}))(r);let d={};d.dataUri=u,d.name=r.name,d.type=r.type,d.datasetId=s,d.binaries=a,d.metadata=o,d.path=i,d.overwrite=l;const f=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.CREATE});return f.data=d,await this.crudReqSync(f,n)}async get(t,n={}){const r=n.timeout;delete n.timeout;const i=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.READ,data:{id:t,options:n}});return await this.crudReqSync(i,{timeout:r})}async getByName(t,n={}){const r=n.timeout;delete n.timeout;const i=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.GET_BY_NAME,data:{name:t,options:n}});return await this.crudReqSync(i,{timeout:r})}async countByQuery(t,n={}){const r=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.COUNT_BY_QUERY,data:t});return await this.crudReqSync(r,n)}async fetch(t,n={}){var r;const i=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.FETCH,data:t,options:{allowCode:(r=n.allowCode)!==null&&r!==void 0?r:!1}});return await this.crudReqSync(i,n)}async stream(t,n={}){var r,i;const o=n.timeout;delete n.timeout;const a=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.STREAM,data:{url:t,channelId:(i=(r=this.agent)===null||r===void 0?void 0:r.channel)===null||i===void 0?void 0:i.id,options:n}});return await this.crudReqSync(a,{timeout:o})}async update(t,n={}){const r=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.UPDATE,data:t});return await this.crudReqSync(r,n)}async delete(t){const n=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.DELETE,data:t});await this.crudReqSync(n)}async query(t,n={}){const r=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.QUERY,data:t});return await this.crudReqSync(r,n)}setItemStatus(t){this.agent.sendEvent({name:h1e.DlItemFrameEvent.SET_ITEM_STATUS,payload:t})}}Y1.Items=m1e;var W1={};Object.defineProperty(W1,"__esModule",{value:!0});W1.Recipes=void 0;const g1e=xo,li=So;class _1e extends g1e.Repository{async query(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.QUERY,data:{projectIds:t==null?void 0:t.projectIds}});return await this.crudReqSync(n)}async delete(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.DELETE,data:t});await this.crudReqSync(n)}async create(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async clone(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.CLONE,data:t});return await this.crudReqSync(n)}async get(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.READ,data:t});return await this.crudReqSync(n)}async update(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async doesLabelHaveAttributes(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.DOES_LABEL_HAVE_ATTRIBUTES,data:t});return await this.crudReqSync(n)}async calcLabelsHaveAttributes(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.CALC_LABELS_HAVE_ATTRIBUTES,data:t});await this.crudReqSync(n)}async missingRequiredAttribute(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.MISSING_REQUIRED_ATTRIBUTE,data:t});return await this.crudReqSync(n)}async getLabelAttributes(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.GET_LABEL_ATTRIBUTES,data:t});return await this.crudReqSync(n)}}W1.Recipes=_1e;var K1={},Ly={};Object.defineProperty(Ly,"__esModule",{value:!0});Ly.APIOntologyV2=void 0;class v1e{constructor(t){Object.assign(this,t),this.v2=!0}toJSON(){return{id:this.id,creator:this.creator,title:this.title,roots:this.roots,structureIds:this.structureIds,metadata:this.metadata,attributes:this.attributes,createdAt:this.createdAt,updatedAt:this.updatedAt,updatedBy:this.updatedBy,v2:this.v2}}}Ly.APIOntologyV2=v1e;Object.defineProperty(K1,"__esModule",{value:!0});K1.Ontologies=void 0;const b1e=xo,fs=So,ZU=Ly;class y1e extends b1e.Repository{async get(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.READ,data:t}),r=await this.crudReqSync(n);let i;try{i=new ZU.APIOntologyV2(r)}catch{}return i}async create(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.DELETE,data:t});await this.crudReqSync(n)}async update(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async query(t,n){var r;const i=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.QUERY,data:{payload:t,options:n}}),o=await this.crudReqSync(i);return o.items=(r=o.items)===null||r===void 0?void 0:r.map(a=>new ZU.APIOntologyV2(a)),o}}K1.Ontologies=y1e;var Q1={};Object.defineProperty(Q1,"__esModule",{value:!0});Q1.Labels=void 0;const S1e=xo,Gl=So;class E1e extends S1e.Repository{async query(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.QUERY,data:t});return await this.crudReqSync(n)}async get(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.READ,data:t});return await this.crudReqSync(n)}async create(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.DELETE,data:t});await this.crudReqSync(n)}}Q1.Labels=E1e;var X1={},el={},Dte={};Object.defineProperty(Dte,"__esModule",{value:!0});var Mte={},Pte={};Object.defineProperty(Pte,"__esModule",{value:!0});var $b={};Object.defineProperty($b,"__esModule",{value:!0});$b.APIRecipeV2=void 0;class T1e{constructor(t){t&&Object.assign(this,t),this.v2=!0}get ontologyId(){return this.ontology.ontologyId}get attributes(){return this.ontology.attributes}}$b.APIRecipeV2=T1e;var ku={};Object.defineProperty(ku,"__esModule",{value:!0});ku.SDKLabelTreeNode=ku.SDKLabel=ku.APILabelTreeNodeV2=ku.APILabelV2=void 0;class C1e{constructor(t){this.tag=t.tag,this.displayLabel=t.displayLabel||this.tag,this.color=t.color,this.displayData=t.displayData}}ku.APILabelV2=C1e;class w1e{constructor(t){t&&Object.assign(this,t)}identifier(){return this.path}isRoot(){return!this.parent}}ku.APILabelTreeNodeV2=w1e;class O1e{constructor(t){this.tag=t.tag,this.displayLabel=t.displayLabel||this.tag,this.color=t.color,this.attributes=t.attributes||[],this.displayData=t.displayData||{}}}ku.SDKLabel=O1e;class R1e{constructor(t){t&&Object.assign(this,t)}}ku.SDKLabelTreeNode=R1e;var J1={};Object.defineProperty(J1,"__esModule",{value:!0});J1.SDKItem=void 0;class A1e{constructor(t){t&&Object.assign(this,t)}}J1.SDKItem=A1e;var Z1={};Object.defineProperty(Z1,"__esModule",{value:!0});Z1.APIStructureV2=void 0;class k1e{constructor(t){t&&Object.assign(this,t)}}Z1.APIStructureV2=k1e;var Bg={};Object.defineProperty(Bg,"__esModule",{value:!0});Bg.APIAttributeSectionV2=Bg.SDKAttributeInstruction=void 0;class I1e{constructor(t,n){this.title=t.title,this.key=n.key,this.type=n.type,this.values=n.values,this.scope=n.scope,this.range=n.range,this.multi=t.body.multi,this.optional=t.body.optional,"hierarchy"in n&&(this.hierarchy=n.hierarchy)}}Bg.SDKAttributeInstruction=I1e;class N1e{constructor(t){Object.assign(this,t)}}Bg.APIAttributeSectionV2=N1e;var ez;(function(e){e.OPTIONS="options",e.BOOLEAN="boolean",e.RANGE="range",e.FREE_TEXT="freeText",e.NUMBER="number"})(ez||(ez={}));var Lte={},$te={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.CustomNodeScope=e.InvokeType=void 0,function(t){t.PANEL="panel",t.FUNCTION="function",t.SCRIPT="script",t.EVENT="event"}(e.InvokeType||(e.InvokeType={})),function(t){t.GLOBAL="global",t.PROJECT="project",t.NODE="node"}(e.CustomNodeScope||(e.CustomNodeScope={}))})($te);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n($te,e)})(Lte);var jg={};Object.defineProperty(jg,"__esModule",{value:!0});jg.SDKFunctionExecution=jg.SDKExecution=void 0;class x1e{constructor(t){t&&Object.assign(this,t)}}jg.SDKExecution=x1e;class D1e{constructor(t){t&&Object.assign(this,t)}}jg.SDKFunctionExecution=D1e;var $y={};Object.defineProperty($y,"__esModule",{value:!0});$y.SDKDataset=void 0;class M1e{constructor(t){t&&Object.assign(this,t)}}$y.SDKDataset=M1e;var Bte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKContributor=e.SDKUser=e.Role=void 0,function(i){i.OWNER="owner",i.ANNOTATOR="annotator",i.DEVELOPER="engineer",i.ANNOTATION_MANAGER="annotationManager"}(e.Role||(e.Role={}));class t{constructor(o){o&&Object.assign(this,o)}}e.SDKUser=t;var n;(function(i){i.HUMAN="human",i.BOT="bot"})(n||(n={}));class r{constructor(o){o&&Object.assign(this,o)}}e.SDKContributor=r})(Bte);var ew={};Object.defineProperty(ew,"__esModule",{value:!0});ew.SDKGroup=void 0;class P1e{constructor(t){Object.assign(this,t)}}ew.SDKGroup=P1e;var tw={};Object.defineProperty(tw,"__esModule",{value:!0});tw.SDKAccount=void 0;class L1e{constructor(t){Object.assign(this,t)}}tw.SDKAccount=L1e;var nw={};Object.defineProperty(nw,"__esModule",{value:!0});nw.SDKOrg=void 0;var tz;(function(e){e.OWNER="owner",e.ADMIN="admin",e.MEMBER="member"})(tz||(tz={}));var nz;(function(e){e.SMALL="small",e.MEDIUM="medium",e.ENTERPRISE="enterprise"})(nz||(nz={}));var rz;(function(e){e.AUTOMOTIVE="automotive",e.MEDICAL="medical",e.RETAIL="retail",e.AGRICULTURE="agriculture",e.SPORTS="sports",e.AERIAL="aerialImagery",e.MEDIA="media",e.OTHER="other"})(rz||(rz={}));class $1e{constructor(t){Object.assign(this,t)}}nw.SDKOrg=$1e;var rw={};Object.defineProperty(rw,"__esModule",{value:!0});rw.SDKTask=void 0;class B1e{constructor(t){Object.assign(this,t)}}rw.SDKTask=B1e;var iw={};Object.defineProperty(iw,"__esModule",{value:!0});iw.SDKDriver=void 0;class j1e{constructor(t){t&&Object.assign(this,t)}}iw.SDKDriver=j1e;var ow={};Object.defineProperty(ow,"__esModule",{value:!0});ow.SDKIntegration=void 0;class F1e{constructor(t){t&&Object.assign(this,t)}}ow.SDKIntegration=F1e;var _2={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKPipeline=e.NodeType=e.ENodeStatus=e.EPipelineStatus=void 0,function(n){n.PENDING="pending",n.IN_PROGRESS="in-progress",n.FAILED="failed",n.SUCCESS="success",n.QUEUE="queue",n.TERMINATED="terminated",n.RERUN="rerun"}(e.EPipelineStatus||(e.EPipelineStatus={})),function(n){n.PENDING="pending",n.IN_PROGRESS="in-progress",n.FAILED="failed",n.SUCCESS="success",n.QUEUE="queue"}(e.ENodeStatus||(e.ENodeStatus={})),function(n){n.CODE="code",n.FUNCTION="function",n.TASK="task",n.MERGE="merge",n.SPLIT="split",n.ML="ml",n.STORAGE="storage",n.API="api",n.CUSTOM="custom",n.UPDATE_VARIABLE="updateVariable"}(e.NodeType||(e.NodeType={}));class t{constructor(r){Object.assign(this,r)}}e.SDKPipeline=t})(_2);var jte={};Object.defineProperty(jte,"__esModule",{value:!0});var aw={};Object.defineProperty(aw,"__esModule",{value:!0});aw.SDKPipelineExecution=void 0;class U1e{constructor(t){t&&Object.assign(this,t)}}aw.SDKPipelineExecution=U1e;var Fte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKModel=e.LocalArtifact=e.ItemArtifact=e.ModelArtifact=e.ArtifactType=e.ModelInputType=e.ModelStatus=e.EntityScopeLevel=void 0,function(o){o.PRIVATE="private",o.PROJECT="project",o.ORG="org",o.PUBLIC="public"}(e.EntityScopeLevel||(e.EntityScopeLevel={})),function(o){o.CREATED="created",o.PRE_TRAINED="pre-trained",o.PENDING="pending",o.TRAINING="training",o.TRAINED="trained",o.DEPLOYED="deployed",o.FAILED="failed",o.CLONING="cloning"}(e.ModelStatus||(e.ModelStatus={})),function(o){o.IMAGE="image",o.VIDEO="video",o.TEXT="text",o.AUDIO="audio"}(e.ModelInputType||(e.ModelInputType={})),function(o){o.ITEM="item",o.LOCAL="local",o.LINK="link"}(e.ArtifactType||(e.ArtifactType={}));class t{constructor(a){Object.assign(this,a)}}e.ModelArtifact=t;class n extends t{constructor(a){super(a),Object.assign(this,a)}}e.ItemArtifact=n;class r extends t{constructor(a){super(a),Object.assign(this,a)}}e.LocalArtifact=r;class i{constructor(a){a&&Object.assign(this,a)}}e.SDKModel=i})(Fte);var Ute={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKService=e.JsServiceVersions=e.Crashloop=e.CrashloopReason=e.CrashloopAction=e.OnResetAction=e.ServiceModeType=e.ServiceType=void 0,function(i){i.SYSTEM="system",i.REGULAR="regular"}(e.ServiceType||(e.ServiceType={})),function(i){i.DEBUG="debug",i.REGULAR="regular"}(e.ServiceModeType||(e.ServiceModeType={})),function(i){i.RERUN="rerun",i.FAILED="failed"}(e.OnResetAction||(e.OnResetAction={})),function(i){i.DEACTIVATE="deactivate"}(e.CrashloopAction||(e.CrashloopAction={})),function(i){i.DEPLETION="depletion"}(e.CrashloopReason||(e.CrashloopReason={}));class t{constructor(o){Object.assign(this,o)}}e.Crashloop=t;class n{constructor(o){this.dtlpy=o.dtlpy||"",this.runner=o.runner||"",this.proxy=o.proxy||"",this.verify=o.verify||!0}}e.JsServiceVersions=n;class r{constructor(o){o&&Object.assign(this,o)}}e.SDKService=r})(Ute);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(Pte,e),n(h2,e),n($b,e),n(ku,e),n(Ly,e),n(J1,e),n($b,e),n(Z1,e),n(Bg,e),n(Lte,e),n(jg,e),n($y,e),n(Py,e),n(Bte,e),n(ew,e),n(tw,e),n(nw,e),n(rw,e),n(iw,e),n(ow,e),n(_2,e),n(jte,e),n(aw,e),n(Fte,e),n(Ute,e)})(Mte);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(Dte,e),n(Mte,e),n(m2,e)})(el);Object.defineProperty(X1,"__esModule",{value:!0});X1.Attributes=void 0;const z1e=xo,V1e=el,ps=So;class G1e extends z1e.Repository{async query(t){var n;const r=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new V1e.APIAttributeSectionV2(o)),i}async get(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.READ,data:t});return await this.crudReqSync(n)}async create(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async update(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.DELETE,data:t});await this.crudReqSync(n)}}X1.Attributes=G1e;var sw={};Object.defineProperty(sw,"__esModule",{value:!0});sw.Structures=void 0;const H1e=xo,q1e=el,hs=So;class Y1e extends H1e.Repository{async query(t){var n;const r=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new q1e.APIStructureV2(o)),i}async get(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.READ,data:t});return await this.crudReqSync(n)}async update(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async create(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.DELETE,data:t});await this.crudReqSync(n)}}sw.Structures=Y1e;var lw={};Object.defineProperty(lw,"__esModule",{value:!0});lw.Tasks=void 0;const W1e=xo,km=So;class K1e extends W1e.Repository{async get(t){const n=new km.CrudMessage({scope:km.AppMessageScope.TASK,crud:km.CrudType.READ,data:t});return await this.crudReqSync(n)}async updateAssignees(t){const n=new km.CrudMessage({scope:km.AppMessageScope.TASK,crud:km.CrudType.UPDATE_ASSIGNEES,data:{payload:t}});return await this.crudReqSync(n)}}lw.Tasks=K1e;var cw={};Object.defineProperty(cw,"__esModule",{value:!0});cw.Contributors=void 0;const Q1e=xo,Hl=So,X1e=el;class J1e extends Q1e.Repository{async get(t){const n=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.READ,data:t});return await this.crudReqSync(n)}async create(t){const n=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.DELETE,data:t});await this.crudReqSync(n)}async query(t){var n;const r=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new X1e.SDKContributor(o)),i}}cw.Contributors=J1e;var uw={};Object.defineProperty(uw,"__esModule",{value:!0});uw.Datasets=void 0;const Z1e=xo,ms=So,ewe=$y;class twe extends Z1e.Repository{async create(t){const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async update(t){const{id:n}=t,r=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.UPDATE,data:{id:n,payload:t}});return await this.crudReqSync(r)}async delete(t){const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.DELETE,data:t});await this.crudReqSync(n)}async get(t){const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.READ,data:t});return await this.crudReqSync(n)}async query(){var t;const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.QUERY}),r=await this.crudReqSync(n);return r.items=(t=r.items)===null||t===void 0?void 0:t.map(i=>new ewe.SDKDataset(i)),r}}uw.Datasets=twe;var dw={};Object.defineProperty(dw,"__esModule",{value:!0});dw.Executions=void 0;const nwe=xo,dd=So,rwe=Qa,vA=el;class iwe extends nwe.Repository{async create(t){const{functionName:n}=t;rwe.channel.log(`Creating execution for function '${n}'`);const r=new dd.CrudMessage({scope:dd.AppMessageScope.EXECUTION,crud:dd.CrudType.CREATE,data:t});return new vA.SDKExecution(await this.crudReqSync(r))}async get(t){const n=new dd.CrudMessage({scope:dd.AppMessageScope.EXECUTION,crud:dd.CrudType.READ,data:t});return new vA.SDKExecution(await this.crudReqSync(n))}async query(t){var n;const r=new dd.CrudMessage({scope:dd.AppMessageScope.EXECUTION,crud:dd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new vA.SDKExecution(o)),i}}dw.Executions=iwe;var fw={};Object.defineProperty(fw,"__esModule",{value:!0});fw.Drivers=void 0;const owe=xo,bA=So;class awe extends owe.Repository{async query(){const t=new bA.CrudMessage({scope:bA.AppMessageScope.DRIVER,crud:bA.CrudType.QUERY});return await this.crudReqSync(t)}}fw.Drivers=awe;var pw={};Object.defineProperty(pw,"__esModule",{value:!0});pw.Integrations=void 0;const swe=xo,yA=So;class lwe extends swe.Repository{async query(){const t=new yA.CrudMessage({scope:yA.AppMessageScope.INTEGRATION,crud:yA.CrudType.QUERY});return await this.crudReqSync(t)}}pw.Integrations=lwe;var By={};Object.defineProperty(By,"__esModule",{value:!0});By.SDKNavigator=void 0;const cwe=Qa,Hr=So;class uwe{constructor(t){this.agent=t}_navigate(t){try{return cwe.channel.log(`Navigation request:${t.route}`),this.agent.navigate(t)}catch(n){throw n}}projects(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.PROJECTS,options:t});this._navigate(n)}projectOverview(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.PROJECT,options:t});this._navigate(n)}datasets(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.DATASETS,options:t});this._navigate(n)}datasetBrowser(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.DATASET_BROWSER,params:[t],options:n});this._navigate(r)}projectTeam(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.PROJECT_TEAM,options:t});this._navigate(n)}tasks(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.TASKS,options:t});this._navigate(n)}taskBrowser(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.TASK_BROWSER,params:[t],options:n});this._navigate(r)}assignments(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.ASSIGNMENTS,options:t});this._navigate(n)}cloudStorage(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.CLOUD_STORAGE,options:t});this._navigate(n)}applicationHub(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.APPLICATION_HUB,options:t});this._navigate(n)}orgMembersAndGroups(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.ORG_MEMBERS_AND_GROUPS,options:t});this._navigate(n)}auditLogs(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.AUDIT_LOGS,options:t});this._navigate(n)}studio(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.STUDIO,params:[t],options:n});this._navigate(r)}recipes(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.RECIPES,options:t});this._navigate(n)}recipe(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.RECIPE,params:[t],options:n});this._navigate(r)}custom(t,n={}){const{params:r,options:i}=n,o=new Hr.DlNavigationMessage({route:Hr.DlRoute.CUSTOM,params:[t,r],options:i});this._navigate(o)}startline(t){const{query:n,options:r}=t,i=new Hr.DlNavigationMessage({route:Hr.DlRoute.STARTLINE,options:r,query:n});this._navigate(i)}}By.SDKNavigator=uwe;var hw={};Object.defineProperty(hw,"__esModule",{value:!0});hw.Pipelines=void 0;const dwe=xo,fd=So,SA=_2;class fwe extends dwe.Repository{async get(t){const n=new fd.CrudMessage({scope:fd.AppMessageScope.PIPELINE,crud:fd.CrudType.READ,data:t});return new SA.SDKPipeline(await this.crudReqSync(n))}async query(t){var n;const r=new fd.CrudMessage({scope:fd.AppMessageScope.PIPELINE,crud:fd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new SA.SDKPipeline(o)),i}async update(t){const n=new fd.CrudMessage({scope:fd.AppMessageScope.PIPELINE,crud:fd.CrudType.UPDATE,data:t});return new SA.SDKPipeline(await this.crudReqSync(n))}}hw.Pipelines=fwe;var mw={};Object.defineProperty(mw,"__esModule",{value:!0});mw.PipelineExecutions=void 0;const pwe=xo,pd=So,EA=el;class hwe extends pwe.Repository{async create(t){const n=new pd.CrudMessage({scope:pd.AppMessageScope.PIPELINE_EXECUTION,crud:pd.CrudType.CREATE,data:t});return new EA.SDKPipelineExecution(await this.crudReqSync(n))}async get(t,n){const r=new pd.CrudMessage({scope:pd.AppMessageScope.PIPELINE_EXECUTION,crud:pd.CrudType.READ,data:{executionId:t,pipelineId:n}});return new EA.SDKPipelineExecution(await this.crudReqSync(r))}async query(t){var n;const r=new pd.CrudMessage({scope:pd.AppMessageScope.PIPELINE_EXECUTION,crud:pd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new EA.SDKPipelineExecution(o)),i}}mw.PipelineExecutions=hwe;var gw={};Object.defineProperty(gw,"__esModule",{value:!0});gw.Models=void 0;const mwe=xo,ql=So,AE=el;class gwe extends mwe.Repository{async get(t){const n=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.READ,data:t});return new AE.SDKModel(await this.crudReqSync(n))}async query(t){var n;const r=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new AE.SDKModel(o)),i}async update(t){const n=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.UPDATE,data:t});return new AE.SDKModel(await this.crudReqSync(n))}async predict(t){const n=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.PREDICT,data:t});return new AE.SDKExecution(await this.crudReqSync(n))}}gw.Models=gwe;var _w={};Object.defineProperty(_w,"__esModule",{value:!0});_w.Services=void 0;const _we=xo,hd=So,TA=el;class vwe extends _we.Repository{async get(t){const n=new hd.CrudMessage({scope:hd.AppMessageScope.SERVICE,crud:hd.CrudType.READ,data:t});return new TA.SDKService(await this.crudReqSync(n))}async update(t){const n=new hd.CrudMessage({scope:hd.AppMessageScope.SERVICE,crud:hd.CrudType.UPDATE,data:t});return new TA.SDKService(await this.crudReqSync(n))}async query(t){var n;const r=new hd.CrudMessage({scope:hd.AppMessageScope.SERVICE,crud:hd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new TA.SDKService(o)),i}}_w.Services=vwe;var bwe=Zt&&Zt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(Lb,"__esModule",{value:!0});Lb.xFrameDriver=void 0;const ywe=So,Swe=H1,Ewe=bwe(wp.exports),Twe=q1,Cwe=Y1,wwe=W1,Owe=K1,Rwe=Q1,Awe=p2,kwe=X1,Iwe=sw,Nwe=lw,xwe=cw,Dwe=uw,Mwe=dw,Pwe=fw,Lwe=Qa,$we=pw,Bwe=By,jwe=hw,Fwe=mw,Uwe=gw,zwe=_w;class Vwe extends Ewe.default{async init(){await this._initGuestApp(),this._initRepos(),this._initNavigator()}async _initGuestApp(){this._guestApp=new ywe.GuestApp,await this._guestApp.init(),this.agent=this._guestApp.agent,this._guestApp.on("ready",()=>{this.emit("ready")}),this._guestApp.on("data",t=>{this.emit("data",t)}),this._guestApp.on("event",t=>{this.emit(t.data.name,t.data.payload,t.source)}),this._guestApp.on("navigation",t=>{this.emit("navigation",t.data,t.source)})}sendEvent(t){this.agent.sendEvent(t)}_initRepos(){this.projects=new Swe.Projects(this.agent),this.annotations=new Twe.Annotations(this.agent),this.items=new Cwe.Items(this.agent),this.settings=new Awe.AppSettings(this.agent),this.recipes=new wwe.Recipes(this.agent),this.ontologies=new Owe.Ontologies(this.agent),this.labels=new Rwe.Labels(this.agent),this.attributes=new kwe.Attributes(this.agent),this.structures=new Iwe.Structures(this.agent),this.tasks=new Nwe.Tasks(this.agent),this.contributors=new xwe.Contributors(this.agent),this.datasets=new Dwe.Datasets(this.agent),this.executions=new Mwe.Executions(this.agent),this.drivers=new Pwe.Drivers(this.agent),this.integrations=new $we.Integrations(this.agent),this.pipelines=new jwe.Pipelines(this.agent),this.pipelineExecutions=new Fwe.PipelineExecutions(this.agent),this.models=new Uwe.Models(this.agent),this.services=new zwe.Services(this.agent)}_initNavigator(){this.navigator=new Bwe.SDKNavigator(this.agent)}get logger(){return Lwe.channel}}Lb.xFrameDriver=Vwe;var vw={},bw={},Qd={};Object.defineProperty(Qd,"__esModule",{value:!0});Qd.BaseData=void 0;class Gwe{constructor(t){this._data=null,this._data=t}}Qd.BaseData=Gwe;Object.defineProperty(bw,"__esModule",{value:!0});bw.Items=void 0;const iz=el,Hwe=Qd;class qwe extends Hwe.BaseData{async get(t){var n,r,i;if(!t)return new iz.SDKItem((n=this._data)===null||n===void 0?void 0:n.item);const o=(i=(r=this._data)===null||r===void 0?void 0:r.datasetItems)===null||i===void 0?void 0:i.find(a=>a.id===t);return o?new iz.SDKItem(o):void 0}async delete(t){this._data.datasetItems=this._data.datasetItems.filter(n=>n.id!==t)}async update(t){const n=this._data.datasetItems.findIndex(r=>r.id===t.id);return this._data.datasetItems[n]=Object.assign({},this._data.datasetItems[n],t),this._data.datasetItems[n]}}bw.Items=qwe;var yw={};Object.defineProperty(yw,"__esModule",{value:!0});yw.Annotations=void 0;const Ywe=el,Wwe=Qd;class Kwe extends Wwe.BaseData{async query(){return Object.assign(Object.assign({},this._data.annotations),{items:this._data.annotations.items.map(t=>new Ywe.SDKAnnotation(t))})}async logs(){return this._data.annotationLogs}}yw.Annotations=Kwe;var Sw={};Object.defineProperty(Sw,"__esModule",{value:!0});Sw.Tasks=void 0;const Qwe=el,Xwe=Qd;class Jwe extends Xwe.BaseData{async get(t){var n;return new Qwe.SDKTask((n=this._data)===null||n===void 0?void 0:n.task)}}Sw.Tasks=Jwe;var Ew={};Object.defineProperty(Ew,"__esModule",{value:!0});Ew.AppSettings=void 0;const Zwe=Qd;class eOe extends Zwe.BaseData{async get(){return this._data.settings}}Ew.AppSettings=eOe;var Tw={};Object.defineProperty(Tw,"__esModule",{value:!0});Tw.Datasets=void 0;const tOe=Qd,kE=el,nOe=Dy;class rOe extends tOe.BaseData{async get(t){var n,r,i,o;if(!t)return new kE.SDKDataset((n=this._data)===null||n===void 0?void 0:n.dataset);const a=(o=(i=(r=this._data)===null||r===void 0?void 0:r.datasets)===null||i===void 0?void 0:i.items)===null||o===void 0?void 0:o.find(s=>s.id===t);return a?new kE.SDKDataset(a):void 0}async create(t){const n=new kE.SDKDataset({id:(0,nOe.v4)(),name:t.name});return this._data.datasets.items.push(n),this._data.datasets.totalItemsCount+=1,n}async delete(t){this._data.datasets.items=this._data.datasets.items.filter(n=>n.id!==t),this._data.datasets.totalItemsCount-=1}async query(){return Object.assign(Object.assign({},this._data.datasets),{items:this._data.datasets.items.map(t=>new kE.SDKDataset(t))})}}Tw.Datasets=rOe;var Cw={};Object.defineProperty(Cw,"__esModule",{value:!0});Cw.Contributors=void 0;const iOe=Qd,oz=el;class oOe extends iOe.BaseData{async get(t){var n,r;return((r=(n=this._data)===null||n===void 0?void 0:n.contributors)===null||r===void 0?void 0:r.items).find(o=>o.id===t)}async create(t){const n=new oz.SDKContributor({id:t.email,email:t.email,role:t.role});return this._data.contributors.items.push(n),this._data.contributors.totalItemsCount+=1,n}async delete(t){this._data.contributors.items=this._data.contributors.items.filter(n=>n.id!==t),this._data.contributors.totalItemsCount-=1}async query(){return Object.assign(Object.assign({},this._data.contributors),{items:this._data.contributors.items.map(t=>new oz.SDKContributor(t))})}}Cw.Contributors=oOe;var aOe=Zt&&Zt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(vw,"__esModule",{value:!0});vw.DlMockDriver=void 0;const sOe=aOe(wp.exports),lOe=bw,cOe=yw,uOe=Sw,dOe=Ew,fOe=Tw,pOe=Cw;class hOe extends sOe.default{constructor(t){super(),this.items=new lOe.Items(t),this.annotations=new cOe.Annotations(t),this.tasks=new uOe.Tasks(t),this.settings=new dOe.AppSettings(t),this.datasets=new fOe.Datasets(t),this.contributors=new pOe.Contributors(t)}}vw.DlMockDriver=hOe;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(o,a,s,l){l===void 0&&(l=s);var c=Object.getOwnPropertyDescriptor(a,s);(!c||("get"in c?!a.__esModule:c.writable||c.configurable))&&(c={enumerable:!0,get:function(){return a[s]}}),Object.defineProperty(o,l,c)}:function(o,a,s,l){l===void 0&&(l=s),o[l]=a[s]}),n=Zt&&Zt.__exportStar||function(o,a){for(var s in o)s!=="default"&&!Object.prototype.hasOwnProperty.call(a,s)&&t(a,o,s)};Object.defineProperty(e,"__esModule",{value:!0}),e.initializeFrameDriver=void 0,n(mte,e),n(So,e),n(p2,e),n(Lb,e),n(el,e),n(vw,e),n(g2,e),n(By,e);const r=Lb,i=async()=>{try{const o=new r.xFrameDriver;await o.init(),window&&(window.dl=o)}catch(o){throw console.error("Error initializing xFrameDriver",o),o}};e.initializeFrameDriver=i})(Km);const mOe={id:"panel"},gOe={style:{width:"100% font-size: 10px"}},_Oe=ue("div",{style:{width:"20px"}},null,-1),vOe={id:"item-metadata-section"},bOe=dt({__name:"Panel",props:{component:null,readonly:{type:Boolean},addItemMetadata:{type:Boolean}},emits:["addItemMetadata"],setup(e,{emit:t}){const n=e,r=Fd(n,"component"),i=Fd(n,"readonly"),o=5,a=2,s=100,l=we(Mc.DefaultValues.name),c=we(Mc.DefaultValues.distributeEqually);we(!1);const u=we(Mc.DefaultValues.groups),d=re({get:()=>n.addItemMetadata,set:A=>{t("addItemMetadata",A)}});re(()=>u.value.length<o),re(()=>u.value.length>a),Wh(()=>{window.dl.agent.sendEvent({name:"app:setHeight",payload:document.body.scrollHeight})});const f=re(()=>{const A=u.value.map(I=>({...I,distribution:Number(I.distribution)}));return gA(ut.exports.sumBy(A,"distribution"))}),p=re(()=>f.value>s),h=re(()=>f.value<s),m=re(()=>gA(s-f.value)),_=re(()=>Math.abs(m.value)),v=ut.exports.debounce(A=>{const I=ut.exports.cloneDeep(u.value);I[A].distribution=gA(Math.max(Math.min(Number(I[A].distribution),s),0)),Object.assign(u.value,I)},0),b=(A,I)=>{try{if(typeof A!="string")return;const O=ut.exports.cloneDeep(u.value);O[I].name=(A==null?void 0:A.replace(/[^\w_]/g,""))||"",Object.assign(u.value,O)}catch(O){console.log("Failed to validate group name",{error:O})}};re(()=>!h.value&&!p.value);const S=re(()=>u.value.every(A=>!!A.name.length)),E=re(()=>{if(!l.value.length)return"Node name is required";if(!l.value.match(/^[a-zA-Z0-9_\- ]+$/))return"Node name can only contain letters, numbers, underscores, hyphens and spaces"}),T=()=>{l.value=l.value.trim()},w=re(()=>{const A=[];return(p.value||h.value)&&A.push({message:"Distribution must equal 100%",suggestion:"Please adjust the distribution"}),E.value&&A.push({message:"Node name error",suggestion:"Please adjust the node name"}),S.value||A.push({message:"Group name is required",suggestion:"Please adjust the group name"}),A}),C=re(()=>({valid:w.value.length===0,errors:w.value})),k=ut.exports.debounce(async()=>{var I,O;const A=new Mc({name:l.value.trim(),groups:u.value,distributeEqually:c.value,validation:C.value,itemMetadata:d.value});try{r.value.metadata.customNodeConfig=A,r.value.outputs=[{portId:(I=r.value.outputs[0].portId)!=null?I:fg(),actions:(O=A.groups.filter(N=>N.name.trim()!=="").map(N=>N.name))!=null?O:[],name:"item",nodeId:r.value.id,type:"Item"}],await window.dl.agent.sendEvent({name:Km.DlFrameEvent.UPDATE_NODE_CONFIG,payload:r.value})}catch(N){console.error("Failed to send event",{error:N})}},200);return Bt([l,u,c,C,d],k,{deep:!0}),Bt(r,()=>{var I;const A=(I=r.value)==null?void 0:I.metadata.customNodeConfig;l.value=A.name,u.value=A.groups,c.value=A.distributeEqually}),(A,I)=>{const O=Te("dl-input"),N=Te("dl-typography"),M=Te("dl-checkbox"),x=Te("dl-item-section"),B=Te("dl-list-item"),P=Te("dl-icon"),L=Te("dl-list"),H=Te("dl-tooltip");return U(),J("div",mOe,[ve(O,{dense:"",style:{width:"100%","padding-bottom":"20px"},placeholder:"Insert node name",error:!!wo(E),"error-message":wo(E),modelValue:wo(l),"onUpdate:modelValue":I[0]||(I[0]=j=>Ki(l)?l.value=j:null),title:"Node Name","red-asterisk":"",required:"",onBlur:T,disabled:wo(i)},null,8,["error","error-message","modelValue","disabled"]),ue("div",null,[ve(N,{size:"12px",color:"dl-color-darker"},{default:Re(()=>[yt("Subsets Distribution")]),_:1}),ve(N,{color:"dl-color-medium",style:{"margin-top":"6px"},size:"10px"},{default:Re(()=>[yt(" Refine the model data distribution into training, validation, and test subsets ")]),_:1}),ve(M,{style:{"margin-top":"18px"},modelValue:wo(c),"onUpdate:modelValue":I[1]||(I[1]=j=>Ki(c)?c.value=j:null),label:"Distribute equally",disabled:wo(i)},null,8,["modelValue","disabled"]),ve(L,{padding:"0"},{default:Re(()=>[ve(B,{padding:"0",class:"container"},{default:Re(()=>[ve(x,{color:"dl-color-medium",class:"item"},{default:Re(()=>[yt("Subset Name")]),_:1}),ve(x,{color:"dl-color-medium",class:"item-2"},{default:Re(()=>[yt("Distribution")]),_:1})]),_:1}),(U(!0),J(pn,null,_n(wo(u),(j,z)=>(U(),Ge(B,{padding:"0",key:j.id,height:"fit-content",class:"container",id:"groups-distribution",style:{"margin-bottom":"10px","align-items":"start"}},{default:Re(()=>[ve(x,{class:"item"},{default:Re(()=>[ve(O,Pn({"disable-clear-btn":"",modelValue:j.name,"onUpdate:modelValue":q=>j.name=q,placeholder:"Insert group name",error:j.name.length===0,"error-message":"Group name is required",dense:"",disabled:wo(i)},{disabled:!0},{onInput:q=>b(q,z),onChange:q=>b(q,z)}),null,16,["modelValue","onUpdate:modelValue","error","disabled","onInput","onChange"])]),_:2},1024),ve(x,{class:"item-2",style:{display:"flex","align-items":"center",gap:"10px"}},{default:Re(()=>[ve(O,{style:{width:"100%"},"disable-clear-btn":"",type:"number",error:wo(p),warning:wo(h),disabled:wo(c),modelValue:j.distribution,"onUpdate:modelValue":q=>j.distribution=q,modelModifiers:{number:!0},onBlur:q=>wo(v)(z),dense:""},{append:Re(()=>[yt(" % ")]),_:2},1032,["error","warning","disabled","modelValue","onUpdate:modelValue","onBlur"])]),_:2},1024)]),_:2},1024))),128)),ve(B,{padding:"0"},{default:Re(()=>[ve(x,{style:{gap:"5px","text-align":"right"}},{default:Re(()=>[ue("div",gOe,[ve(N,{color:"dl-color-darker"},{default:Re(()=>[yt(ot(wo(f))+"% ",1)]),_:1}),wo(h)?(U(),Ge(N,{key:0,color:"dl-color-warning"},{default:Re(()=>[ve(P,{icon:"icon-dl-alert-filled"}),yt(" "+ot(wo(m))+"% Remaining ",1)]),_:1})):wo(p)?(U(),Ge(N,{key:1,color:"dl-color-negative"},{default:Re(()=>[ve(P,{icon:"icon-dl-error-filled"}),yt(" "+ot(wo(_))+" Exceeding ",1)]),_:1})):(U(),Ge(N,{key:2,color:"dl-color-lighter"},{default:Re(()=>[yt(" Total distribution ")]),_:1}))]),_Oe]),_:1})]),_:1})]),_:1})]),ve(B,{bordered:"",style:{"margin-top":"20px"},height:"20px"}),ue("div",vOe,[ve(N,{size:"12px",color:"dl-color-darker"},{default:Re(()=>[yt(" Item Tags "),ve(P,{icon:"icon-dl-info",size:"13px",color:"dell-blue-500"}),ve(H,null,{default:Re(()=>[yt(" Add a tag to each item according to its assigned subset group. The tag will be added to a dictionary under item.metadata.system.tags in the following format: tags = {\u201Csubset name\u201D: true} ")]),_:1})]),_:1}),ve(M,Pn({style:{"margin-top":"10px"},modelValue:wo(d),"onUpdate:modelValue":I[2]||(I[2]=j=>Ki(d)?d.value=j:null),label:"Tag items based on their assigned subset name",disabled:wo(i)},{disabled:!0}),null,16,["modelValue","disabled"])])])}}}),yOe={class:"full-screen"},SOe=dt({__name:"App",setup(e){const t=we(null),n=we("light"),r=we(!1),i=we(!0);return pi(()=>{try{window.dl.init();const o=window.dl;o.on(Km.DlEvent.READY,async()=>{try{const a=await o.settings.get();n.value=a.theme,r.value=a.readonly==="view"}catch(a){throw new Error("Error getting settings",a)}o.on(Km.DlEvent.THEME,a=>{n.value=a}),o.on("pipelineReadonly",({mode:a})=>{r.value=a==="view"}),o.on(Km.DlEvent.NODE_CONFIG,async a=>{var s,l,c,u;try{a.metadata.customNodeConfig||(a.metadata.customNodeConfig=Mc.DefaultValues),t.value=new YU(YU.fromJSON(a)),i.value=(u=(c=(l=(s=t.value)==null?void 0:s.metadata)==null?void 0:l.customNodeConfig)==null?void 0:c.itemMetadata)!=null?u:!1,console.info("Node Config Event",a),await window.dl.agent.sendEvent({name:Km.DlFrameEvent.UPDATE_NODE_CONFIG,payload:t.value})}catch(d){throw new Error("Error creating NodeConfig from nodeConfig event",d)}})})}catch(o){console.error("Error initializing xFrameDriver",o)}}),(o,a)=>{const s=Te("dl-theme-provider");return U(),Ge(s,{"is-dark":n.value==="dark"},{default:Re(()=>[ue("div",yOe,[ve(bOe,{component:t.value,readonly:r.value,addItemMetadata:i.value,onAddItemMetadata:a[0]||(a[0]=l=>i.value=l)},null,8,["component","readonly","addItemMetadata"])])]),_:1},8,["is-dark"])}}});var IE,EOe=new Uint8Array(16);function TOe(){if(!IE&&(IE=typeof crypto<"u"&&crypto.getRandomValues&&crypto.getRandomValues.bind(crypto)||typeof msCrypto<"u"&&typeof msCrypto.getRandomValues=="function"&&msCrypto.getRandomValues.bind(msCrypto),!IE))throw new Error("crypto.getRandomValues() not supported. See https://github.com/uuidjs/uuid#getrandomvalues-not-supported");return IE(EOe)}const COe=/^(?:[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}|00000000-0000-0000-0000-000000000000)$/i;function wOe(e){return typeof e=="string"&&COe.test(e)}var ha=[];for(var CA=0;CA<256;++CA)ha.push((CA+256).toString(16).substr(1));function OOe(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,n=(ha[e[t+0]]+ha[e[t+1]]+ha[e[t+2]]+ha[e[t+3]]+"-"+ha[e[t+4]]+ha[e[t+5]]+"-"+ha[e[t+6]]+ha[e[t+7]]+"-"+ha[e[t+8]]+ha[e[t+9]]+"-"+ha[e[t+10]]+ha[e[t+11]]+ha[e[t+12]]+ha[e[t+13]]+ha[e[t+14]]+ha[e[t+15]]).toLowerCase();if(!wOe(n))throw TypeError("Stringified UUID is invalid");return n}function an(e,t,n){e=e||{};var r=e.random||(e.rng||TOe)();if(r[6]=r[6]&15|64,r[8]=r[8]&63|128,t){n=n||0;for(var i=0;i<16;++i)t[n+i]=r[i];return t}return OOe(r)}var v2=!1,ROe=!0,AOe=void 0;function kOe(){}function IOe(e,t,n){return Array.isArray(e)?(e.length=Math.max(e.length,t),e.splice(t,1,n),n):(e[t]=n,n)}function NOe(e,t){if(Array.isArray(e)){e.splice(t,1);return}delete e[t]}const zte=Object.freeze(Object.defineProperty({__proto__:null,set:IOe,del:NOe,Vue:dCe,Vue2:AOe,isVue2:v2,isVue3:ROe,install:kOe,EffectScope:f1,ReactiveEffect:d_,customRef:zZ,effect:RZ,effectScope:EZ,getCurrentScope:NL,isProxy:v1,isReactive:Yf,isReadonly:op,isRef:Ki,isShallow:Mg,markRaw:b1,onScopeDispose:CZ,proxyRefs:S1,reactive:Ka,readonly:g1,ref:we,shallowReactive:ML,shallowReadonly:jZ,shallowRef:Dd,stop:AZ,toRaw:Vn,toRef:Fd,toRefs:zr,triggerRef:UZ,unref:wo,camelize:ws,capitalize:u_,normalizeClass:et,normalizeProps:cn,normalizeStyle:qe,toDisplayString:ot,toHandlerKey:lg,BaseTransition:A1,Comment:Ta,Fragment:pn,KeepAlive:iee,Static:Wf,Suspense:JZ,Teleport:gee,Text:sp,assertNumber:HZ,callWithAsyncErrorHandling:Ks,callWithErrorHandling:$u,cloneVNode:Kc,compatUtils:Vee,computed:re,createBlock:Ge,createCommentVNode:he,createElementBlock:J,createElementVNode:ue,createHydrationRenderer:ZL,createPropsRestProxy:$ee,createRenderer:JL,createSlots:ra,createStaticVNode:N1,createTextVNode:yt,createVNode:ve,defineAsyncComponent:ree,defineComponent:dt,defineEmits:Iee,defineExpose:Nee,defineProps:kee,get devtools(){return lh},getCurrentInstance:$i,getTransitionRawChildren:Ay,guardReactiveProps:nr,h:g_,handleError:Cp,initCustomFormatter:jee,inject:Ch,isMemoSame:i2,isRuntimeOnly:Oee,isVNode:Ud,mergeDefaults:Lee,mergeProps:Pn,nextTick:Ar,onActivated:Iy,onBeforeMount:h_,onBeforeUnmount:bo,onBeforeUpdate:VL,onDeactivated:Ny,onErrorCaptured:YL,onMounted:pi,onRenderTracked:qL,onRenderTriggered:HL,onServerPrefetch:GL,onUnmounted:Ku,onUpdated:Wh,openBlock:U,popScopeId:Aa,provide:O1,pushScopeId:Ra,queuePostFlushCb:T1,registerRuntimeCompiler:wee,renderList:_n,renderSlot:Qe,resolveComponent:Te,resolveDirective:m_,resolveDynamicComponent:Gu,resolveFilter:zee,resolveTransitionHooks:Dh,setBlockTracking:NT,setDevtoolsHook:BL,setTransitionHooks:ap,ssrContextKey:n2,ssrUtils:Uee,toHandlers:Md,transformVNodeArgs:yee,useAttrs:Mee,useSSRContext:r2,useSlots:Dee,useTransitionState:R1,version:o2,warn:GZ,watch:Bt,watchEffect:UL,watchPostEffect:zL,watchSyncEffect:eee,withAsyncContext:Bee,withCtx:Re,withDefaults:xee,withDirectives:Oo,withMemo:Fee,withScopeId:QZ,Transition:Kd,TransitionGroup:ete,VueElement:xy,createApp:u2,createSSRApp:ate,defineCustomElement:a2,defineSSRCustomElement:Gee,hydrate:c2,initDirectivesForSSR:lte,render:DT,useCssModule:Hee,useCssVars:qee,vModelCheckbox:D1,vModelDynamic:l2,vModelRadio:M1,vModelSelect:s2,vModelText:Ph,vShow:_a,withKeys:up,withModifiers:mc,compile:cte},Symbol.toStringTag,{value:"Module"}));class xOe{constructor(t){this._name=t}}const eF=class extends xOe{_shouldLogLevel(t){const n=["non","error","warn","info","debug"];return n.indexOf(t)<=n.indexOf(eF.LOG_LEVEL)}constructor(t){super(t)}_timestamp(){return new Date().toISOString()}_logMessage(t,n,r){n=`[${this._timestamp()}] [${this._name}] - ${n}`,r?console[t](n,r):console[t](n)}debug(t,n){this._shouldLogLevel("debug")&&this._logMessage("debug",t,n)}info(t,n){this._shouldLogLevel("info")&&this._logMessage("log",t,n)}warn(t,n){this._shouldLogLevel("warn")&&this._logMessage("warn",t,n)}error(t,n){this._shouldLogLevel("error")&&this._logMessage("error",t,n)}};let q0=eF;Un(q0,"LOG_LEVEL","debug");const b2=e=>new q0(e),sM=e=>Math.round(e*(25/12)),DOe=e=>e*.5,y2=e=>Math.round(e/12),lM=e=>e-y2(e)*2,MOe=e=>sM(e)-y2(e)-lM(e),POe=e=>(e==null?void 0:e.offsetHeight)<(e==null?void 0:e.scrollHeight)||(e==null?void 0:e.offsetWidth)<(e==null?void 0:e.scrollWidth)||!1,og=class{constructor(){Un(this,"_state",null);Un(this,"logger",null);this._state=Ka({theme:"light",locale:"en",disableDebounce:!1}),this.logger=b2("DlComponents")}static get instance(){return og._instance===null&&(og._instance=new og),og._instance}get state(){return this._state}get theme(){return this._state.theme}set theme(t){this._state.theme=t}get disableDebounce(){return this._state.disableDebounce}set disableDebounce(t){this._state.disableDebounce=t}get isDarkTheme(){return this._state.theme==="dark"}get isLightTheme(){return this._state.theme==="light"}};let mg=og;Un(mg,"_instance",null);const Yi=mg.instance;window.DlComponents=mg.instance;const dp={hasPassive:!1,passiveCapture:!0,notPassiveCapture:!0};try{const e=Object.defineProperty({},"passive",{get(){Object.assign(dp,{hasPassive:!0,passive:{passive:!0},notPassive:{passive:!1},passiveCapture:{passive:!0,capture:!0},notPassiveCapture:{passive:!1,capture:!0}})}})}catch(e){Yi.logger.warn("Unknown Error Occured",e)}function uc(e){e.cancelable&&e.preventDefault(),e.stopPropagation()}function LOe(){}function $Oe(e){return e.button===0}function Fg(e){return e.touches&&e.touches[0]?e=e.touches[0]:e.changedTouches&&e.changedTouches[0]?e=e.changedTouches[0]:e.targetTouches&&e.targetTouches[0]&&(e=e.targetTouches[0]),{top:e.clientY,left:e.clientX}}function Y0(e){e.stopPropagation()}function MT(e){e.cancelable!==!1&&e.preventDefault()}function Lf(e,t,n){const r=`__dl_${t}_evt`;e[r]=e[r]?e[r].concat(n):n,n.forEach(i=>{i[0].addEventListener(i[1],e[i[2]],dp[i[3]])})}function Ug(e,t){const n=`__dl_${t}_evt`;e[n]&&(e[n].forEach(r=>{r[0].removeEventListener(r[1],e[r[2]],dp[r[3]])}),e[n]=null)}const Vte={aliceblue:"#f0f8ff",antiquewhite:"#faebd7",aqua:"#00ffff",aquamarine:"#7fffd4",azure:"#f0ffff",beige:"#f5f5dc",bisque:"#ffe4c4",black:"#000000",blanchedalmond:"#ffebcd",blue:"#0000ff",blueviolet:"#8a2be2",brown:"#a52a2a",burlywood:"#deb887",cadetblue:"#5f9ea0",chartreuse:"#7fff00",chocolate:"#d2691e",coral:"#ff7f50",cornflowerblue:"#6495ed",cornsilk:"#fff8dc",crimson:"#dc143c",cyan:"#00ffff",darkblue:"#00008b",darkcyan:"#008b8b",darkgoldenrod:"#b8860b",darkgray:"#a9a9a9",darkgreen:"#006400",darkgrey:"#a9a9a9",darkkhaki:"#bdb76b",darkmagenta:"#8b008b",darkolivegreen:"#556b2f",darkorange:"#ff8c00",darkorchid:"#9932cc",darkred:"#8b0000",darksalmon:"#e9967a",darkseagreen:"#8fbc8f",darkslateblue:"#483d8b",darkslategray:"#2f4f4f",darkslategrey:"#2f4f4f",darkturquoise:"#00ced1",darkviolet:"#9400d3",deeppink:"#ff1493",deepskyblue:"#00bfff",dimgray:"#696969",dimgrey:"#696969",dodgerblue:"#1e90ff",firebrick:"#b22222",floralwhite:"#fffaf0",forestgreen:"#228b22",fuchsia:"#ff00ff",gainsboro:"#dcdcdc",ghostwhite:"#f8f8ff",goldenrod:"#daa520",gold:"#ffd700",gray:"#808080",green:"#008000",greenyellow:"#adff2f",grey:"#808080",honeydew:"#f0fff0",hotpink:"#ff69b4",indianred:"#cd5c5c",indigo:"#4b0082",ivory:"#fffff0",khaki:"#f0e68c",lavenderblush:"#fff0f5",lavender:"#e6e6fa",lawngreen:"#7cfc00",lemonchiffon:"#fffacd",lightblue:"#add8e6",lightcoral:"#f08080",lightcyan:"#e0ffff",lightgoldenrodyellow:"#fafad2",lightgray:"#d3d3d3",lightgreen:"#90ee90",lightgrey:"#d3d3d3",lightpink:"#ffb6c1",lightsalmon:"#ffa07a",lightseagreen:"#20b2aa",lightskyblue:"#87cefa",lightslategray:"#778899",lightslategrey:"#778899",lightsteelblue:"#b0c4de",lightyellow:"#ffffe0",lime:"#00ff00",limegreen:"#32cd32",linen:"#faf0e6",magenta:"#ff00ff",maroon:"#800000",mediumaquamarine:"#66cdaa",mediumblue:"#0000cd",mediumorchid:"#ba55d3",mediumpurple:"#9370db",mediumseagreen:"#3cb371",mediumslateblue:"#7b68ee",mediumspringgreen:"#00fa9a",mediumturquoise:"#48d1cc",mediumvioletred:"#c71585",midnightblue:"#191970",mintcream:"#f5fffa",mistyrose:"#ffe4e1",moccasin:"#ffe4b5",navajowhite:"#ffdead",navy:"#000080",oldlace:"#fdf5e6",olive:"#808000",olivedrab:"#6b8e23",orange:"#ffa500",orangered:"#ff4500",orchid:"#da70d6",palegoldenrod:"#eee8aa",palegreen:"#98fb98",paleturquoise:"#afeeee",palevioletred:"#db7093",papayawhip:"#ffefd5",peachpuff:"#ffdab9",peru:"#cd853f",pink:"#ffc0cb",plum:"#dda0dd",powderblue:"#b0e0e6",purple:"#800080",rebeccapurple:"#663399",red:"#ff0000",rosybrown:"#bc8f8f",royalblue:"#4169e1",saddlebrown:"#8b4513",salmon:"#fa8072",sandybrown:"#f4a460",seagreen:"#2e8b57",seashell:"#fff5ee",sienna:"#a0522d",silver:"#c0c0c0",skyblue:"#87ceeb",slateblue:"#6a5acd",slategray:"#708090",slategrey:"#708090",snow:"#fffafa",springgreen:"#00ff7f",steelblue:"#4682b4",tan:"#d2b48c",teal:"#008080",thistle:"#d8bfd8",tomato:"#ff6347",turquoise:"#40e0d0",violet:"#ee82ee",wheat:"#f5deb3",white:"#ffffff",whitesmoke:"#f5f5f5",yellow:"#ffff00",yellowgreen:"#9acd32"},BOe=[...Object.keys(Vte)],jOe=/(?:#|0x)(?:[A-Fa-f0-9]{3}|[A-Fa-f0-9]{6})\b|(?:rgb|hsl)a?\([^\)]*\)/,tn=(e,t)=>jOe.test(e)||BOe.includes(e==null?void 0:e.toLowerCase())?e:e?e.includes("var(--")?e:`var(--${e}, var(--${t||"dell-gray-800"}))`:`var(--${t||"dell-gray-800"})`;function Iu(e,t){return e.includes(t)}const nc={PGDOWN:34,LEFT:37,DOWN:40,PGUP:33,RIGHT:39,UP:38},cM=Object.values(nc),Gte={directive:"wave",color:"currentColor",initialOpacity:.2,finalOpacity:.1,duration:.4,dissolveDuration:.15,easing:"ease-out",cancellationPeriod:75,trigger:"auto",tagName:"div"},FOe=e=>"config"in e&&"globalProperties"in e.config,UOe=e=>{let t;return e==="vue2"?t=!1:e==="vue3"?t=!0:t=FOe(e),t?{mounted:"mounted",updated:"updated"}:{mounted:"inserted",updated:"componentUpdated"}},Hte=e=>typeof e=="string"&&e!=="auto",az=(e,t)=>{e.dataset.vWaveBoundary=Hte(t)?t:"true"},zOe=({borderTopLeftRadius:e,borderTopRightRadius:t,borderBottomLeftRadius:n,borderBottomRightRadius:r},i)=>{const o=document.createElement(i);return o.style.top="0",o.style.left="0",o.style.width="100%",o.style.height="100%",o.style.display="block",o.style.position="absolute",o.style.borderRadius=`${e} ${t} ${r} ${n}`,o.style.overflow="hidden",o.style.pointerEvents="none",o.style.webkitMaskImage="-webkit-radial-gradient(white, black)",o},VOe=(e,t,n,r)=>{const i=document.createElement("div");return i.style.position="absolute",i.style.width=`${n}px`,i.style.height=`${n}px`,i.style.top=`${t}px`,i.style.left=`${e}px`,i.style.background=r.color,i.style.borderRadius="50%",i.style.opacity=`${r.initialOpacity}`,i.style.transform="translate(-50%,-50%) scale(0)",i.style.transition=`transform ${r.duration}s ${r.easing}, opacity ${r.duration}s ${r.easing}`,i};function NE(e,t,n,r){const i=e-n,o=t-r;return Math.sqrt(i*i+o*o)}function GOe(e,t,{width:n,height:r}){const i=NE(e,t,0,0),o=NE(e,t,n,0),a=NE(e,t,0,r),s=NE(e,t,n,r);return Math.max(i,o,a,s)}const HOe=({x:e,y:t},{top:n,left:r})=>({x:e-r,y:t-n}),S2="vWaveCountInternal";function qOe(e){const t=E2(e);qte(e,t+1)}function YOe(e){const t=E2(e);qte(e,t-1)}function qte(e,t){e.dataset[S2]=t.toString()}function E2(e){var t;return parseInt((t=e.dataset[S2])!==null&&t!==void 0?t:"0",10)}function WOe(e){delete e.dataset[S2]}const wA=(e,t,n)=>{const r=t.getBoundingClientRect(),i=window.getComputedStyle(t),{x:o,y:a}=HOe(e,r),s=2.05*GOe(o,a,r),l=zOe(i,n.tagName),c=VOe(o,a,s,n);qOe(t);let u="";i.position==="static"&&(t.style.position&&(u=t.style.position),t.style.position="relative"),l.appendChild(c),t.appendChild(l);let d=!1;const f=_=>{typeof _<"u"&&(document.removeEventListener("pointerup",f),document.removeEventListener("pointercancel",f)),d?p():d=!0},p=()=>{c.style.transition=`opacity ${n.dissolveDuration}s linear`,c.style.opacity="0",setTimeout(()=>{l.remove(),YOe(t),E2(t)===0&&(WOe(t),t.style.position=u)},n.dissolveDuration*1e3)};document.addEventListener("pointerup",f),document.addEventListener("pointercancel",f);const h=setTimeout(()=>{document.removeEventListener("pointercancel",m),requestAnimationFrame(()=>{c.style.transform="translate(-50%,-50%) scale(1)",c.style.opacity=`${n.finalOpacity}`,setTimeout(()=>f(),n.duration*1e3)})},n.cancellationPeriod),m=()=>{clearTimeout(h),l.remove(),document.removeEventListener("pointerup",f),document.removeEventListener("pointercancel",f),document.removeEventListener("pointercancel",m)};document.addEventListener("pointercancel",m)},rv=new WeakMap,sz=(e={},t="vue3")=>{const n=Object.assign(Object.assign({},Gte),e),r=UOe(t),i=s=>{const l=s.currentTarget.dataset.vWaveTrigger;document.querySelectorAll(`[data-v-wave-boundary="${l}"]`).forEach(u=>wA(s,u,Object.assign(Object.assign({},n),rv.get(u))))},o={[r.mounted](s,{value:l={}}){var c;rv.set(s,l),az(s,(c=l&&l.trigger)!==null&&c!==void 0?c:n.trigger),s.addEventListener("pointerdown",u=>{if(rv.get(s)===!1)return;const d=Object.assign(Object.assign({},n),rv.get(s));if(d.trigger===!1)return wA(u,s,d);if(Hte(d.trigger))return;const f=s.querySelector('[data-v-wave-trigger="true"]');!f&&d.trigger===!0||f&&!u.composedPath().includes(f)||wA(u,s,d)})},[r.updated](s,{value:l={}}){var c;rv.set(s,l),az(s,(c=l&&l.trigger)!==null&&c!==void 0?c:n.trigger)}},a={[r.mounted](s,{arg:l="true"}){s.dataset.vWaveTrigger=l,l!=="true"&&s.addEventListener("pointerdown",i)},[r.updated](s,{arg:l="true"}){s.dataset.vWaveTrigger=l,l==="true"?s.removeEventListener("pointerdown",i):s.addEventListener("pointerdown",i)}};return{wave:o,vWave:o,waveTrigger:a,vWaveTrigger:a}},KOe={install(e,t={}){if(this.installed)return;this.installed=!0;const n=Object.assign(Object.assign({},Gte),t),{vWave:r,vWaveTrigger:i}=sz(n,e);e.directive(n.directive,r),e.directive(`${n.directive}-trigger`,i)},installed:!1,createLocalWaveDirective:sz},{wave:QOe,waveTrigger:XOe}=KOe.createLocalWaveDirective({},"vue3");function uM(){if(window.getSelection){const e=window.getSelection();if(!e)return;e.empty?e.empty():e.removeAllRanges&&(e.removeAllRanges(),Op()&&e.addRange(document.createRange()))}}function fp(e,t,n,r){if(n(t))return!0;for(let i=0,o=t.childNodes.length;i<o;i++)if(fp(t,t.childNodes[i],n,!0))return!0;if(!r){let i=t;for(;i&&i!==e;){let o=i.nextSibling;for(;o;){if(fp(e,o,n,!0))return!0;o=o.nextSibling}i=i.parentNode}}return!1}function JOe(e,t,n){let r;fp(e,e,a=>{if(a.nodeType===Node.TEXT_NODE){const s=a.data.length;return t<=s?(r=a,!0):(t-=s,n-=s,!1)}});let i;r&&fp(e,r,a=>{if(a.nodeType===Node.TEXT_NODE){const s=a.data.length;return n<=s?(i=a,!0):(n-=s,!1)}});const o=document.createRange();return r?t<r.data.length?o.setStart(r,t):o.setStartAfter(r):t===0?o.setStart(e,0):o.setStartAfter(e),i?n<i.data.length?o.setEnd(i,n):o.setEndAfter(i):n===0?o.setEnd(e,0):o.setEndAfter(e),o}function dM(e,t,n){const r=JOe(e,t,n),i=window.getSelection();i.removeAllRanges(),i.addRange(r)}function lz(e,t){if(e.nodeType===Node.TEXT_NODE)return t;let n=0;for(let r=0,i=Math.min(e.childNodes.length,t);r<i;r++){const o=e.childNodes[r];fp(o,o,a=>(a.nodeType===Node.TEXT_NODE&&(n+=a.data.length),!1))}return n}function Yte(e){let t=0,n=0;const r=window.getSelection();for(let i=0,o=r.rangeCount;i<o;i++){const a=r.getRangeAt(i);if(a.intersectsNode(e)){const s=a.startContainer;fp(e,e,c=>{if(s===c)return t+=lz(c,a.startOffset),!0;const u=c.nodeType===Node.TEXT_NODE?c.data.length:0;return t+=u,n+=u,!1});const l=a.endContainer;fp(e,s,c=>{if(l===c)return n+=lz(c,a.endOffset),!0;const u=c.nodeType===Node.TEXT_NODE?c.data.length:0;return n+=u,!1});break}}return[t,n]}function ZOe(e){const t=[];return fp(e,e,n=>(n.nodeType===Node.TEXT_NODE&&t.push(n.data),!1)),t.join("")}function Qm(e){const t=document.createRange(),n=window.getSelection();t.selectNodeContents(e),t.collapse(!1),n.removeAllRanges(),n.addRange(t),e.focus()}const cz=e=>e?"dark-mode":"";function sa(e,t,n){return n<=t?t:Math.min(n,Math.max(t,e))}function eRe(e,t){return e?t.concat(e()):t}const tRe=(e,t="default")=>{var n;return(n=e[t])==null?void 0:n.call(e)},$o=(e,t=1)=>{try{const n=parseInt(e.slice(1,3),16),r=parseInt(e.slice(3,5),16),i=parseInt(e.slice(5,7),16);return t||t===0?"rgba("+n+", "+r+", "+i+", "+t+")":"rgb("+n+", "+r+", "+i+")"}catch{return e}},xE=e=>e.replace(/[^,]+(?=\))/,"1"),DE=e=>{let t;const n=e.replace(/\s/g,"").match(/^rgba?\((\d+),(\d+),(\d+),?([^,\s)]+)?/i),r=(n&&n[4]||"").trim();let i;if(n)i=(n[1]|1<<8).toString(16).slice(1)+(n[2]|1<<8).toString(16).slice(1)+(n[3]|1<<8).toString(16).slice(1);else return e;return r!==""?t=r:t=1,t=(t*255|1<<8).toString(16).slice(1),i=i+t,`#${i}`};var nRe={name:"teleport",props:{to:{type:String,required:!0},where:{type:String,default:"after"},disabled:Boolean},data:function(){return{nodes:[],waiting:!1,observer:null,parent:null}},watch:{to:"maybeMove",where:"maybeMove",disabled:function(t){t?(this.disable(),this.teardownObserver()):(this.bootObserver(),this.move())}},mounted:function(){this.nodes=Array.from(this.$el.childNodes),this.disabled||this.bootObserver(),this.maybeMove()},beforeDestroy:function(){this.disable(),this.teardownObserver()},computed:{classes:function(){return this.disabled?["teleporter"]:["teleporter","hidden"]}},methods:{maybeMove:function(){this.disabled||this.move()},move:function(){if(this.waiting=!1,this.parent=document.querySelector(this.to),!this.parent){this.disable(),this.waiting=!0;return}this.where==="before"?this.parent.prepend(this.getFragment()):this.parent.appendChild(this.getFragment())},disable:function(){this.$el.appendChild(this.getFragment()),this.parent=null},getFragment:function(){var t=document.createDocumentFragment();return this.nodes.forEach(function(n){return t.appendChild(n)}),t},onMutations:function(t){for(var n=this,r=!1,i=0;i<t.length;i++){var o=t[i],a=Array.from(o.addedNodes).filter(function(s){return!n.nodes.includes(s)});Array.from(o.removedNodes).includes(this.parent)?(this.disable(),this.waiting=!this.disabled):this.waiting&&a.length>0&&(r=!0)}r&&this.move()},bootObserver:function(){var t=this;this.observer||(this.observer=new MutationObserver(function(n){return t.onMutations(n)}),this.observer.observe(document.body,{childList:!0,subtree:!0,attributes:!1,characterData:!1}))},teardownObserver:function(){this.observer&&(this.observer.disconnect(),this.observer=null)}}};function rRe(e,t,n,r,i,o,a,s,l,c){typeof a!="boolean"&&(l=s,s=a,a=!1);var u=typeof n=="function"?n.options:n;e&&e.render&&(u.render=e.render,u.staticRenderFns=e.staticRenderFns,u._compiled=!0,i&&(u.functional=!0)),r&&(u._scopeId=r);var d;if(o?(d=function(h){h=h||this.$vnode&&this.$vnode.ssrContext||this.parent&&this.parent.$vnode&&this.parent.$vnode.ssrContext,!h&&typeof __VUE_SSR_CONTEXT__<"u"&&(h=__VUE_SSR_CONTEXT__),t&&t.call(this,l(h)),h&&h._registeredComponents&&h._registeredComponents.add(o)},u._ssrRegister=d):t&&(d=a?function(h){t.call(this,c(h,this.$root.$options.shadowRoot))}:function(h){t.call(this,s(h))}),d)if(u.functional){var f=u.render;u.render=function(m,_){return d.call(_),f(m,_)}}else{var p=u.beforeCreate;u.beforeCreate=p?[].concat(p,d):[d]}return n}var iRe=typeof navigator<"u"&&/msie [6-9]\\b/.test(navigator.userAgent.toLowerCase());function oRe(e){return function(t,n){return aRe(t,n)}}var OA,uz={};function aRe(e,t){var n=iRe?t.media||"default":e,r=uz[n]||(uz[n]={ids:new Set,styles:[]});if(!r.ids.has(e)){r.ids.add(e);var i=t.source;if(t.map&&(i+=`
+}`;var gr=oU(function(){return ni(ge,yn+"return "+Dt).apply(n,$e)});if(gr.source=Dt,qR(gr))throw gr;return gr}function QSe(g){return ai(g).toLowerCase()}function XSe(g){return ai(g).toUpperCase()}function JSe(g,y,R){if(g=ai(g),g&&(R||y===n))return hF(g);if(!g||!(y=al(y)))return g;var G=Sc(g),ee=Sc(y),ge=mF(G,ee),$e=gF(G,ee)+1;return hf(G,ge,$e).join("")}function ZSe(g,y,R){if(g=ai(g),g&&(R||y===n))return g.slice(0,vF(g)+1);if(!g||!(y=al(y)))return g;var G=Sc(g),ee=gF(G,Sc(y))+1;return hf(G,0,ee).join("")}function eEe(g,y,R){if(g=ai(g),g&&(R||y===n))return g.replace(Pe,"");if(!g||!(y=al(y)))return g;var G=Sc(g),ee=mF(G,Sc(y));return hf(G,ee).join("")}function tEe(g,y){var R=I,G=O;if(ho(y)){var ee="separator"in y?y.separator:ee;R="length"in y?pr(y.length):R,G="omission"in y?al(y.omission):G}g=ai(g);var ge=g.length;if(gm(g)){var $e=Sc(g);ge=$e.length}if(R>=ge)return g;var Ye=R-_m(G);if(Ye<1)return G;var at=$e?hf($e,0,Ye).join(""):g.slice(0,Ye);if(ee===n)return at+G;if($e&&(Ye+=at.length-Ye),YR(ee)){if(g.slice(Ye).search(ee)){var It,Nt=at;for(ee.global||(ee=cR(ee.source,ai(Xt.exec(ee))+"g")),ee.lastIndex=0;It=ee.exec(Nt);)var Dt=It.index;at=at.slice(0,Dt===n?Ye:Dt)}}else if(g.indexOf(al(ee),Ye)!=Ye){var sn=at.lastIndexOf(ee);sn>-1&&(at=at.slice(0,sn))}return at+G}function nEe(g){return g=ai(g),g&&dn.test(g)?g.replace(Et,Nge):g}var rEe=Cm(function(g,y,R){return g+(R?" ":"")+y.toUpperCase()}),QR=a3("toUpperCase");function iU(g,y,R){return g=ai(g),y=R?n:y,y===n?Oge(g)?Mge(g):_ge(g):g.match(y)||[]}var oU=br(function(g,y){try{return il(g,n,y)}catch(R){return qR(R)?R:new ar(R)}}),iEe=ad(function(g,y){return Ll(y,function(R){R=pu(R),id(g,R,GR(g[R],g))}),g});function oEe(g){var y=g==null?0:g.length,R=Fn();return g=y?ro(g,function(G){if(typeof G[1]!="function")throw new $l(a);return[R(G[0]),G[1]]}):[],br(function(G){for(var ee=-1;++ee<y;){var ge=g[ee];if(il(ge[0],this,G))return il(ge[1],this,G)}})}function aEe(g){return N_e(jl(g,d))}function XR(g){return function(){return g}}function sEe(g,y){return g==null||g!==g?y:g}var lEe=l3(),cEe=l3(!0);function js(g){return g}function JR(g){return BF(typeof g=="function"?g:jl(g,d))}function uEe(g){return FF(jl(g,d))}function dEe(g,y){return UF(g,jl(y,d))}var fEe=br(function(g,y){return function(R){return W_(R,g,y)}}),pEe=br(function(g,y){return function(R){return W_(g,R,y)}});function ZR(g,y,R){var G=ia(y),ee=YS(y,G);R==null&&!(ho(y)&&(ee.length||!G.length))&&(R=y,y=g,g=this,ee=YS(y,ia(y)));var ge=!(ho(R)&&"chain"in R)||!!R.chain,$e=ld(g);return Ll(ee,function(Ye){var at=y[Ye];g[Ye]=at,$e&&(g.prototype[Ye]=function(){var It=this.__chain__;if(ge||It){var Nt=g(this.__wrapped__),Dt=Nt.__actions__=Ls(this.__actions__);return Dt.push({func:at,args:arguments,thisArg:g}),Nt.__chain__=It,Nt}return at.apply(g,lf([this.value()],arguments))})}),g}function hEe(){return da._===this&&(da._=Fge),this}function eA(){}function mEe(g){return g=pr(g),br(function(y){return zF(y,g)})}var gEe=NR(ro),_Ee=NR(cF),vEe=NR(nR);function aU(g){return BR(g)?rR(pu(g)):W_e(g)}function bEe(g){return function(y){return g==null?n:Vp(g,y)}}var yEe=u3(),SEe=u3(!0);function tA(){return[]}function nA(){return!1}function EEe(){return{}}function TEe(){return""}function CEe(){return!0}function wEe(g,y){if(g=pr(g),g<1||g>H)return[];var R=q,G=Da(g,q);y=Fn(y),g-=q;for(var ee=aR(G,y);++R<g;)y(R);return ee}function OEe(g){return cr(g)?ro(g,pu):sl(g)?[g]:Ls(O3(ai(g)))}function REe(g){var y=++Bge;return ai(g)+y}var AEe=ZS(function(g,y){return g+y},0),kEe=xR("ceil"),IEe=ZS(function(g,y){return g/y},1),NEe=xR("floor");function xEe(g){return g&&g.length?qS(g,js,_R):n}function DEe(g,y){return g&&g.length?qS(g,Fn(y,2),_R):n}function MEe(g){return fF(g,js)}function PEe(g,y){return fF(g,Fn(y,2))}function LEe(g){return g&&g.length?qS(g,js,SR):n}function $Ee(g,y){return g&&g.length?qS(g,Fn(y,2),SR):n}var BEe=ZS(function(g,y){return g*y},1),jEe=xR("round"),FEe=ZS(function(g,y){return g-y},0);function UEe(g){return g&&g.length?oR(g,js):0}function zEe(g,y){return g&&g.length?oR(g,Fn(y,2)):0}return de.after=uye,de.ary=$3,de.assign=Xye,de.assignIn=X3,de.assignInWith=fE,de.assignWith=Jye,de.at=Zye,de.before=B3,de.bind=GR,de.bindAll=iEe,de.bindKey=j3,de.castArray=Eye,de.chain=M3,de.chunk=Nve,de.compact=xve,de.concat=Dve,de.cond=oEe,de.conforms=aEe,de.constant=XR,de.countBy=Ube,de.create=eSe,de.curry=F3,de.curryRight=U3,de.debounce=z3,de.defaults=tSe,de.defaultsDeep=nSe,de.defer=dye,de.delay=fye,de.difference=Mve,de.differenceBy=Pve,de.differenceWith=Lve,de.drop=$ve,de.dropRight=Bve,de.dropRightWhile=jve,de.dropWhile=Fve,de.fill=Uve,de.filter=Vbe,de.flatMap=qbe,de.flatMapDeep=Ybe,de.flatMapDepth=Wbe,de.flatten=I3,de.flattenDeep=zve,de.flattenDepth=Vve,de.flip=pye,de.flow=lEe,de.flowRight=cEe,de.fromPairs=Gve,de.functions=cSe,de.functionsIn=uSe,de.groupBy=Kbe,de.initial=qve,de.intersection=Yve,de.intersectionBy=Wve,de.intersectionWith=Kve,de.invert=fSe,de.invertBy=pSe,de.invokeMap=Xbe,de.iteratee=JR,de.keyBy=Jbe,de.keys=ia,de.keysIn=Bs,de.map=aE,de.mapKeys=mSe,de.mapValues=gSe,de.matches=uEe,de.matchesProperty=dEe,de.memoize=lE,de.merge=_Se,de.mergeWith=J3,de.method=fEe,de.methodOf=pEe,de.mixin=ZR,de.negate=cE,de.nthArg=mEe,de.omit=vSe,de.omitBy=bSe,de.once=hye,de.orderBy=Zbe,de.over=gEe,de.overArgs=mye,de.overEvery=_Ee,de.overSome=vEe,de.partial=HR,de.partialRight=V3,de.partition=eye,de.pick=ySe,de.pickBy=Z3,de.property=aU,de.propertyOf=bEe,de.pull=Zve,de.pullAll=x3,de.pullAllBy=ebe,de.pullAllWith=tbe,de.pullAt=nbe,de.range=yEe,de.rangeRight=SEe,de.rearg=gye,de.reject=rye,de.remove=rbe,de.rest=_ye,de.reverse=zR,de.sampleSize=oye,de.set=ESe,de.setWith=TSe,de.shuffle=aye,de.slice=ibe,de.sortBy=cye,de.sortedUniq=dbe,de.sortedUniqBy=fbe,de.split=qSe,de.spread=vye,de.tail=pbe,de.take=hbe,de.takeRight=mbe,de.takeRightWhile=gbe,de.takeWhile=_be,de.tap=xbe,de.throttle=bye,de.thru=oE,de.toArray=W3,de.toPairs=eU,de.toPairsIn=tU,de.toPath=OEe,de.toPlainObject=Q3,de.transform=CSe,de.unary=yye,de.union=vbe,de.unionBy=bbe,de.unionWith=ybe,de.uniq=Sbe,de.uniqBy=Ebe,de.uniqWith=Tbe,de.unset=wSe,de.unzip=VR,de.unzipWith=D3,de.update=OSe,de.updateWith=RSe,de.values=Rm,de.valuesIn=ASe,de.without=Cbe,de.words=iU,de.wrap=Sye,de.xor=wbe,de.xorBy=Obe,de.xorWith=Rbe,de.zip=Abe,de.zipObject=kbe,de.zipObjectDeep=Ibe,de.zipWith=Nbe,de.entries=eU,de.entriesIn=tU,de.extend=X3,de.extendWith=fE,ZR(de,de),de.add=AEe,de.attempt=oU,de.camelCase=xSe,de.capitalize=nU,de.ceil=kEe,de.clamp=kSe,de.clone=Tye,de.cloneDeep=wye,de.cloneDeepWith=Oye,de.cloneWith=Cye,de.conformsTo=Rye,de.deburr=rU,de.defaultTo=sEe,de.divide=IEe,de.endsWith=DSe,de.eq=Tc,de.escape=MSe,de.escapeRegExp=PSe,de.every=zbe,de.find=Gbe,de.findIndex=A3,de.findKey=rSe,de.findLast=Hbe,de.findLastIndex=k3,de.findLastKey=iSe,de.floor=NEe,de.forEach=P3,de.forEachRight=L3,de.forIn=oSe,de.forInRight=aSe,de.forOwn=sSe,de.forOwnRight=lSe,de.get=WR,de.gt=Aye,de.gte=kye,de.has=dSe,de.hasIn=KR,de.head=N3,de.identity=js,de.includes=Qbe,de.indexOf=Hve,de.inRange=ISe,de.invoke=hSe,de.isArguments=qp,de.isArray=cr,de.isArrayBuffer=Iye,de.isArrayLike=$s,de.isArrayLikeObject=Do,de.isBoolean=Nye,de.isBuffer=mf,de.isDate=xye,de.isElement=Dye,de.isEmpty=Mye,de.isEqual=Pye,de.isEqualWith=Lye,de.isError=qR,de.isFinite=$ye,de.isFunction=ld,de.isInteger=G3,de.isLength=uE,de.isMap=H3,de.isMatch=Bye,de.isMatchWith=jye,de.isNaN=Fye,de.isNative=Uye,de.isNil=Vye,de.isNull=zye,de.isNumber=q3,de.isObject=ho,de.isObjectLike=Eo,de.isPlainObject=ev,de.isRegExp=YR,de.isSafeInteger=Gye,de.isSet=Y3,de.isString=dE,de.isSymbol=sl,de.isTypedArray=Om,de.isUndefined=Hye,de.isWeakMap=qye,de.isWeakSet=Yye,de.join=Qve,de.kebabCase=LSe,de.last=Ul,de.lastIndexOf=Xve,de.lowerCase=$Se,de.lowerFirst=BSe,de.lt=Wye,de.lte=Kye,de.max=xEe,de.maxBy=DEe,de.mean=MEe,de.meanBy=PEe,de.min=LEe,de.minBy=$Ee,de.stubArray=tA,de.stubFalse=nA,de.stubObject=EEe,de.stubString=TEe,de.stubTrue=CEe,de.multiply=BEe,de.nth=Jve,de.noConflict=hEe,de.noop=eA,de.now=sE,de.pad=jSe,de.padEnd=FSe,de.padStart=USe,de.parseInt=zSe,de.random=NSe,de.reduce=tye,de.reduceRight=nye,de.repeat=VSe,de.replace=GSe,de.result=SSe,de.round=jEe,de.runInContext=nt,de.sample=iye,de.size=sye,de.snakeCase=HSe,de.some=lye,de.sortedIndex=obe,de.sortedIndexBy=abe,de.sortedIndexOf=sbe,de.sortedLastIndex=lbe,de.sortedLastIndexBy=cbe,de.sortedLastIndexOf=ube,de.startCase=YSe,de.startsWith=WSe,de.subtract=FEe,de.sum=UEe,de.sumBy=zEe,de.template=KSe,de.times=wEe,de.toFinite=cd,de.toInteger=pr,de.toLength=K3,de.toLower=QSe,de.toNumber=zl,de.toSafeInteger=Qye,de.toString=ai,de.toUpper=XSe,de.trim=JSe,de.trimEnd=ZSe,de.trimStart=eEe,de.truncate=tEe,de.unescape=nEe,de.uniqueId=REe,de.upperCase=rEe,de.upperFirst=QR,de.each=P3,de.eachRight=L3,de.first=N3,ZR(de,function(){var g={};return du(de,function(y,R){oi.call(de.prototype,R)||(g[R]=y)}),g}(),{chain:!1}),de.VERSION=r,Ll(["bind","bindKey","curry","curryRight","partial","partialRight"],function(g){de[g].placeholder=de}),Ll(["drop","take"],function(g,y){Nr.prototype[g]=function(R){R=R===n?1:Xo(pr(R),0);var G=this.__filtered__&&!y?new Nr(this):this.clone();return G.__filtered__?G.__takeCount__=Da(R,G.__takeCount__):G.__views__.push({size:Da(R,q),type:g+(G.__dir__<0?"Right":"")}),G},Nr.prototype[g+"Right"]=function(R){return this.reverse()[g](R).reverse()}}),Ll(["filter","map","takeWhile"],function(g,y){var R=y+1,G=R==x||R==P;Nr.prototype[g]=function(ee){var ge=this.clone();return ge.__iteratees__.push({iteratee:Fn(ee,3),type:R}),ge.__filtered__=ge.__filtered__||G,ge}}),Ll(["head","last"],function(g,y){var R="take"+(y?"Right":"");Nr.prototype[g]=function(){return this[R](1).value()[0]}}),Ll(["initial","tail"],function(g,y){var R="drop"+(y?"":"Right");Nr.prototype[g]=function(){return this.__filtered__?new Nr(this):this[R](1)}}),Nr.prototype.compact=function(){return this.filter(js)},Nr.prototype.find=function(g){return this.filter(g).head()},Nr.prototype.findLast=function(g){return this.reverse().find(g)},Nr.prototype.invokeMap=br(function(g,y){return typeof g=="function"?new Nr(this):this.map(function(R){return W_(R,g,y)})}),Nr.prototype.reject=function(g){return this.filter(cE(Fn(g)))},Nr.prototype.slice=function(g,y){g=pr(g);var R=this;return R.__filtered__&&(g>0||y<0)?new Nr(R):(g<0?R=R.takeRight(-g):g&&(R=R.drop(g)),y!==n&&(y=pr(y),R=y<0?R.dropRight(-y):R.take(y-g)),R)},Nr.prototype.takeRightWhile=function(g){return this.reverse().takeWhile(g).reverse()},Nr.prototype.toArray=function(){return this.take(q)},du(Nr.prototype,function(g,y){var R=/^(?:filter|find|map|reject)|While$/.test(y),G=/^(?:head|last)$/.test(y),ee=de[G?"take"+(y=="last"?"Right":""):y],ge=G||/^find/.test(y);!ee||(de.prototype[y]=function(){var $e=this.__wrapped__,Ye=G?[1]:arguments,at=$e instanceof Nr,It=Ye[0],Nt=at||cr($e),Dt=function(Rr){var jr=ee.apply(de,lf([Rr],Ye));return G&&sn?jr[0]:jr};Nt&&R&&typeof It=="function"&&It.length!=1&&(at=Nt=!1);var sn=this.__chain__,yn=!!this.__actions__.length,Gn=ge&&!sn,gr=at&&!yn;if(!ge&&Nt){$e=gr?$e:new Nr(this);var Hn=g.apply($e,Ye);return Hn.__actions__.push({func:oE,args:[Dt],thisArg:n}),new Bl(Hn,sn)}return Gn&&gr?g.apply(this,Ye):(Hn=this.thru(Dt),Gn?G?Hn.value()[0]:Hn.value():Hn)})}),Ll(["pop","push","shift","sort","splice","unshift"],function(g){var y=NS[g],R=/^(?:push|sort|unshift)$/.test(g)?"tap":"thru",G=/^(?:pop|shift)$/.test(g);de.prototype[g]=function(){var ee=arguments;if(G&&!this.__chain__){var ge=this.value();return y.apply(cr(ge)?ge:[],ee)}return this[R](function($e){return y.apply(cr($e)?$e:[],ee)})}}),du(Nr.prototype,function(g,y){var R=de[y];if(R){var G=R.name+"";oi.call(Sm,G)||(Sm[G]=[]),Sm[G].push({name:y,func:R})}}),Sm[JS(n,v).name]=[{name:"wrapper",func:n}],Nr.prototype.clone=n_e,Nr.prototype.reverse=r_e,Nr.prototype.value=i_e,de.prototype.at=Dbe,de.prototype.chain=Mbe,de.prototype.commit=Pbe,de.prototype.next=Lbe,de.prototype.plant=Bbe,de.prototype.reverse=jbe,de.prototype.toJSON=de.prototype.valueOf=de.prototype.value=Fbe,de.prototype.first=de.prototype.head,U_&&(de.prototype[U_]=$be),de},vm=Pge();Bp?((Bp.exports=vm)._=vm,JO._=vm):da._=vm}).call(Zt)})(ut,ut.exports);const hte=()=>({name:"Model Data Split",groups:[{id:fg(),name:"train",distribution:80},{id:fg(),name:"validation",distribution:10},{id:fg(),name:"test",distribution:10}],distributeEqually:!1,itemMetadata:!0,assignment:"random",hashSalt:"",stratifyLabels:!1,quotaSyncEvery:50,validation:{valid:!0,errors:[]}}),bf={name:"Data Split",id:"",inputs:[],outputs:[],type:"",projectId:"",appId:"",metadata:{customNodeConfig:hte()},namespace:{projectName:"",serviceName:"",functionName:"",moduleName:"",packageName:""}};class YU{constructor(t){Un(this,"namespace");Un(this,"inputs");Un(this,"outputs");Un(this,"type");Un(this,"projectId");Un(this,"name");Un(this,"appId");Un(this,"metadata");Un(this,"id");var n,r,i,o,a,s,l,c,u,d,f;this.id=(n=t==null?void 0:t.id)!=null?n:bf.id,this.name=(r=t==null?void 0:t.name)!=null?r:bf.name,this.inputs=(i=t==null?void 0:t.inputs)!=null?i:bf.inputs,this.metadata=(o=t==null?void 0:t.metadata)!=null?o:bf.metadata,this.outputs=[{portId:(s=(a=t==null?void 0:t.outputs[0])==null?void 0:a.portId)!=null?s:fg(),actions:(l=this.metadata.customNodeConfig.groups.filter(p=>p.name.trim()!=="").map(p=>p.name))!=null?l:[],name:"item",nodeId:this.id,type:"Item"}],this.type=(c=t==null?void 0:t.type)!=null?c:bf.type,this.projectId=(u=t==null?void 0:t.projectId)!=null?u:bf.projectId,this.appId=(d=t==null?void 0:t.appId)!=null?d:bf.appId,this.namespace=(f=t==null?void 0:t.namespace)!=null?f:bf.namespace}static fromJSON(t){return{id:t.id,name:t.name,inputs:t.inputs,outputs:t.outputs,type:t.type,projectId:t.projectId,appId:t.appId,metadata:t.metadata,namespace:t.namespace}}}class Mc{constructor(t){Un(this,"name");Un(this,"distributeEqually");Un(this,"groups");Un(this,"itemMetadata");Un(this,"assignment");Un(this,"hashSalt");Un(this,"stratifyLabels");Un(this,"quotaSyncEvery");Un(this,"validation");var n,r,i,o,a,s,l,c,u;this.name=(n=t==null?void 0:t.name)!=null?n:Mc.DefaultValues.name,this.distributeEqually=(r=t==null?void 0:t.distributeEqually)!=null?r:Mc.DefaultValues.distributeEqually,this.groups=(i=t==null?void 0:t.groups)!=null?i:Mc.DefaultValues.groups,this.itemMetadata=(o=t==null?void 0:t.itemMetadata)!=null?o:Mc.DefaultValues.itemMetadata,this.assignment=(s=t==null?void 0:t.assignment)!=null?s:Mc.DefaultValues.assignment,this.hashSalt=(l=t==null?void 0:t.hashSalt)!=null?l:Mc.DefaultValues.hashSalt,this.stratifyLabels=(c=t==null?void 0:t.stratifyLabels)!=null?c:Mc.DefaultValues.stratifyLabels,this.quotaSyncEvery=(u=t==null?void 0:t.quotaSyncEvery)!=null?u:Mc.DefaultValues.quotaSyncEvery,this.validation=(a=t==null?void 0:t.validation)!=null?a:Mc.DefaultValues.validation}static get DefaultValues(){return hte()}get ports(){return this.groups.map(t=>({action:t.name,name:"item",type:"Item",portPercentage:t.distribution}))}static fromJSON(t){return{name:t==null?void 0:t.name,distributeEqually:t==null?void 0:t.distributeEqually,groups:t==null?void 0:t.groups,itemMetadata:t==null?void 0:t.itemMetadata,assignment:t==null?void 0:t.assignment,hashSalt:t==null?void 0:t.hashSalt,stratifyLabels:t==null?void 0:t.stratifyLabels,quotaSyncEvery:t==null?void 0:t.quotaSyncEvery,validation:t==null?void 0:t.validation}}toJSON(){var t;return{name:this.name,distributeEqually:this.distributeEqually,groups:this.groups,itemMetadata:(t=this.itemMetadata)!=null?t:!1,assignment:this.assignment,hashSalt:this.hashSalt,stratifyLabels:this.stratifyLabels,quotaSyncEvery:this.quotaSyncEvery,validation:this.validation,ports:this.ports}}}const gA=e=>parseFloat(Number(e).toFixed(2));var Km={},mte={},So={},B1={},Qa={};Object.defineProperty(Qa,"__esModule",{value:!0});Qa.channel=Qa.Logger=void 0;class pg{constructor(){this._enabled=!1,this._prefix=""}static getInstance(){return pg._instance||(pg._instance=new this),pg._instance}get state(){return this._enabled?"on":"off"}on(){this._enabled=!0}off(){this._enabled=!1}get prefix(){return this._prefix}set prefix(t){this._prefix=t}log(...t){if(!this._enabled)return;const n=`${window.location.hostname}(${this._prefix}) :: `;typeof console<"u"&&console.log(n,...t)}}Qa.Logger=pg;Qa.channel=pg.getInstance();var j1={},F1={};const Dy=MCe(DCe);var wp={exports:{}},hg=typeof Reflect=="object"?Reflect:null,WU=hg&&typeof hg.apply=="function"?hg.apply:function(t,n,r){return Function.prototype.apply.call(t,n,r)},H0;hg&&typeof hg.ownKeys=="function"?H0=hg.ownKeys:Object.getOwnPropertySymbols?H0=function(t){return Object.getOwnPropertyNames(t).concat(Object.getOwnPropertySymbols(t))}:H0=function(t){return Object.getOwnPropertyNames(t)};function PCe(e){console&&console.warn&&console.warn(e)}var gte=Number.isNaN||function(t){return t!==t};function Si(){Si.init.call(this)}wp.exports=Si;wp.exports.once=jCe;Si.EventEmitter=Si;Si.prototype._events=void 0;Si.prototype._eventsCount=0;Si.prototype._maxListeners=void 0;var KU=10;function U1(e){if(typeof e!="function")throw new TypeError('The "listener" argument must be of type Function. Received type '+typeof e)}Object.defineProperty(Si,"defaultMaxListeners",{enumerable:!0,get:function(){return KU},set:function(e){if(typeof e!="number"||e<0||gte(e))throw new RangeError('The value of "defaultMaxListeners" is out of range. It must be a non-negative number. Received '+e+".");KU=e}});Si.init=function(){(this._events===void 0||this._events===Object.getPrototypeOf(this)._events)&&(this._events=Object.create(null),this._eventsCount=0),this._maxListeners=this._maxListeners||void 0};Si.prototype.setMaxListeners=function(t){if(typeof t!="number"||t<0||gte(t))throw new RangeError('The value of "n" is out of range. It must be a non-negative number. Received '+t+".");return this._maxListeners=t,this};function _te(e){return e._maxListeners===void 0?Si.defaultMaxListeners:e._maxListeners}Si.prototype.getMaxListeners=function(){return _te(this)};Si.prototype.emit=function(t){for(var n=[],r=1;r<arguments.length;r++)n.push(arguments[r]);var i=t==="error",o=this._events;if(o!==void 0)i=i&&o.error===void 0;else if(!i)return!1;if(i){var a;if(n.length>0&&(a=n[0]),a instanceof Error)throw a;var s=new Error("Unhandled error."+(a?" ("+a.message+")":""));throw s.context=a,s}var l=o[t];if(l===void 0)return!1;if(typeof l=="function")WU(l,this,n);else for(var c=l.length,u=Ete(l,c),r=0;r<c;++r)WU(u[r],this,n);return!0};function vte(e,t,n,r){var i,o,a;if(U1(n),o=e._events,o===void 0?(o=e._events=Object.create(null),e._eventsCount=0):(o.newListener!==void 0&&(e.emit("newListener",t,n.listener?n.listener:n),o=e._events),a=o[t]),a===void 0)a=o[t]=n,++e._eventsCount;else if(typeof a=="function"?a=o[t]=r?[n,a]:[a,n]:r?a.unshift(n):a.push(n),i=_te(e),i>0&&a.length>i&&!a.warned){a.warned=!0;var s=new Error("Possible EventEmitter memory leak detected. "+a.length+" "+String(t)+" listeners added. Use emitter.setMaxListeners() to increase limit");s.name="MaxListenersExceededWarning",s.emitter=e,s.type=t,s.count=a.length,PCe(s)}return e}Si.prototype.addListener=function(t,n){return vte(this,t,n,!1)};Si.prototype.on=Si.prototype.addListener;Si.prototype.prependListener=function(t,n){return vte(this,t,n,!0)};function LCe(){if(!this.fired)return this.target.removeListener(this.type,this.wrapFn),this.fired=!0,arguments.length===0?this.listener.call(this.target):this.listener.apply(this.target,arguments)}function bte(e,t,n){var r={fired:!1,wrapFn:void 0,target:e,type:t,listener:n},i=LCe.bind(r);return i.listener=n,r.wrapFn=i,i}Si.prototype.once=function(t,n){return U1(n),this.on(t,bte(this,t,n)),this};Si.prototype.prependOnceListener=function(t,n){return U1(n),this.prependListener(t,bte(this,t,n)),this};Si.prototype.removeListener=function(t,n){var r,i,o,a,s;if(U1(n),i=this._events,i===void 0)return this;if(r=i[t],r===void 0)return this;if(r===n||r.listener===n)--this._eventsCount===0?this._events=Object.create(null):(delete i[t],i.removeListener&&this.emit("removeListener",t,r.listener||n));else if(typeof r!="function"){for(o=-1,a=r.length-1;a>=0;a--)if(r[a]===n||r[a].listener===n){s=r[a].listener,o=a;break}if(o<0)return this;o===0?r.shift():$Ce(r,o),r.length===1&&(i[t]=r[0]),i.removeListener!==void 0&&this.emit("removeListener",t,s||n)}return this};Si.prototype.off=Si.prototype.removeListener;Si.prototype.removeAllListeners=function(t){var n,r,i;if(r=this._events,r===void 0)return this;if(r.removeListener===void 0)return arguments.length===0?(this._events=Object.create(null),this._eventsCount=0):r[t]!==void 0&&(--this._eventsCount===0?this._events=Object.create(null):delete r[t]),this;if(arguments.length===0){var o=Object.keys(r),a;for(i=0;i<o.length;++i)a=o[i],a!=="removeListener"&&this.removeAllListeners(a);return this.removeAllListeners("removeListener"),this._events=Object.create(null),this._eventsCount=0,this}if(n=r[t],typeof n=="function")this.removeListener(t,n);else if(n!==void 0)for(i=n.length-1;i>=0;i--)this.removeListener(t,n[i]);return this};function yte(e,t,n){var r=e._events;if(r===void 0)return[];var i=r[t];return i===void 0?[]:typeof i=="function"?n?[i.listener||i]:[i]:n?BCe(i):Ete(i,i.length)}Si.prototype.listeners=function(t){return yte(this,t,!0)};Si.prototype.rawListeners=function(t){return yte(this,t,!1)};Si.listenerCount=function(e,t){return typeof e.listenerCount=="function"?e.listenerCount(t):Ste.call(e,t)};Si.prototype.listenerCount=Ste;function Ste(e){var t=this._events;if(t!==void 0){var n=t[e];if(typeof n=="function")return 1;if(n!==void 0)return n.length}return 0}Si.prototype.eventNames=function(){return this._eventsCount>0?H0(this._events):[]};function Ete(e,t){for(var n=new Array(t),r=0;r<t;++r)n[r]=e[r];return n}function $Ce(e,t){for(;t+1<e.length;t++)e[t]=e[t+1];e.pop()}function BCe(e){for(var t=new Array(e.length),n=0;n<t.length;++n)t[n]=e[n].listener||e[n];return t}function jCe(e,t){return new Promise(function(n,r){function i(a){e.removeListener(t,o),r(a)}function o(){typeof e.removeListener=="function"&&e.removeListener("error",i),n([].slice.call(arguments))}Tte(e,t,o,{once:!0}),t!=="error"&&FCe(e,i,{once:!0})})}function FCe(e,t,n){typeof e.on=="function"&&Tte(e,"error",t,n)}function Tte(e,t,n,r){if(typeof e.on=="function")r.once?e.once(t,n):e.on(t,n);else if(typeof e.addEventListener=="function")e.addEventListener(t,function i(o){r.once&&e.removeEventListener(t,i),n(o)});else throw new TypeError('The "emitter" argument must be of type EventEmitter. Received type '+typeof e)}var z1={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.AgentMessage=e.AgentMessageType=void 0,function(n){n.UNKNOWN="unknown",n.INIT="init",n.READY="ready",n.APP="app",n.CODE="code",n.RPC="rpc",n.EVENT="event",n.NAVIGATION="navigation"}(e.AgentMessageType||(e.AgentMessageType={}));class t{constructor(r){this.type=r.type,this.data=r.data,r.source&&(this.source=r.source),r.timeout&&(this.timeout=r.timeout)}}e.AgentMessage=t})(z1);var d2={},f2={};(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(s,l,c,u){u===void 0&&(u=c);var d=Object.getOwnPropertyDescriptor(l,c);(!d||("get"in d?!l.__esModule:d.writable||d.configurable))&&(d={enumerable:!0,get:function(){return l[c]}}),Object.defineProperty(s,u,d)}:function(s,l,c,u){u===void 0&&(u=c),s[u]=l[c]}),n=Zt&&Zt.__setModuleDefault||(Object.create?function(s,l){Object.defineProperty(s,"default",{enumerable:!0,value:l})}:function(s,l){s.default=l}),r=Zt&&Zt.__importStar||function(s){if(s&&s.__esModule)return s;var l={};if(s!=null)for(var c in s)c!=="default"&&Object.prototype.hasOwnProperty.call(s,c)&&t(l,s,c);return n(l,s),l};Object.defineProperty(e,"__esModule",{value:!0}),e.XFrameMessage=e.XFrameMessageType=void 0;const i=r(Dy);var o;(function(s){s.UNKNOWN="unknown",s.JOIN="join",s.REQUEST="request",s.RESPONSE="response"})(o=e.XFrameMessageType||(e.XFrameMessageType={}));class a{constructor(l){var c;this.xFrame=!0,this.sentTime=null,this.timeout=1800,this.id=i.v4(),this.type=o.UNKNOWN,this.data={},this.sync=!1,this.error=null,this.message=null,this.responseId=null,this.channelId=null,l&&Object.assign(this,l),!((c=this.data)===null||c===void 0)&&c.timeout&&(this.timeout=this.data.timeout,delete this.data.timeout)}static fromJson(l){}}e.XFrameMessage=a})(f2);var My={},UCe=Zt&&Zt.__createBinding||(Object.create?function(e,t,n,r){r===void 0&&(r=n);var i=Object.getOwnPropertyDescriptor(t,n);(!i||("get"in i?!t.__esModule:i.writable||i.configurable))&&(i={enumerable:!0,get:function(){return t[n]}}),Object.defineProperty(e,r,i)}:function(e,t,n,r){r===void 0&&(r=n),e[r]=t[n]}),zCe=Zt&&Zt.__setModuleDefault||(Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t}),VCe=Zt&&Zt.__importStar||function(e){if(e&&e.__esModule)return e;var t={};if(e!=null)for(var n in e)n!=="default"&&Object.prototype.hasOwnProperty.call(e,n)&&UCe(t,e,n);return zCe(t,e),t};Object.defineProperty(My,"__esModule",{value:!0});My.XFrameMessageError=void 0;const GCe=VCe(Dy);class HCe{constructor(t){this.id=GCe.v4(),this.error=null,this.message=null,Object.assign(this,t)}}My.XFrameMessageError=HCe;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(d,f,p,h){h===void 0&&(h=p);var m=Object.getOwnPropertyDescriptor(f,p);(!m||("get"in m?!f.__esModule:m.writable||m.configurable))&&(m={enumerable:!0,get:function(){return f[p]}}),Object.defineProperty(d,h,m)}:function(d,f,p,h){h===void 0&&(h=p),d[h]=f[p]}),n=Zt&&Zt.__setModuleDefault||(Object.create?function(d,f){Object.defineProperty(d,"default",{enumerable:!0,value:f})}:function(d,f){d.default=f}),r=Zt&&Zt.__importStar||function(d){if(d&&d.__esModule)return d;var f={};if(d!=null)for(var p in d)p!=="default"&&Object.prototype.hasOwnProperty.call(d,p)&&t(f,d,p);return n(f,d),f};Object.defineProperty(e,"__esModule",{value:!0}),e.Channel=e.isOnPrem=void 0;const i=r(Dy),o=wp.exports,a=f2,s=My,l=Qa,c=()=>{let d;try{d={}.ON_PREM}catch{}return d===void 0||d==="true"};e.isOnPrem=c;class u extends o.EventEmitter{constructor(f,p=null,h=null){super(),this.localWin=null,this.remoteWin=null,this.queue=[],this._handleIncomingMessage=this.handleIncomingMessage.bind(this),l.channel.prefix=f.location.href,this.id="no-id-"+Date.now(),this.localWin=f,this.remoteWin=p,this._addMessageListener(),this.onDataCallback=h}_addMessageListener(){this.localWin.addEventListener("message",this._handleIncomingMessage)}isApprovedHost(f){return(0,e.isOnPrem)()?!0:/.*\.dataloop.ai$/.test(f)}destroy(){this.localWin.removeEventListener("message",this._handleIncomingMessage)}removeMessageFromQ(f){this.queue=this.queue.filter(p=>p.id!=f)}getMessageFromQ(f){return this.queue.find(p=>p.id==f)}handleResponse(f){if(!f.responseId){l.channel.log("Missing sent message response id");return}const p=this.getMessageFromQ(f.responseId);if(!p){l.channel.log("Unknown response");return}if(!p.resolve){l.channel.log("Missing resolve on response");return}this.removeMessageFromQ(f.responseId),f.error?p.reject(new s.XFrameMessageError({error:f.error,message:f.message})):p.resolve(f.data)}async handleIncomingMessage(f){const p=new URL(f.origin).hostname;let h=f.source;if(!this.isApprovedHost(p)){l.channel.log(`Host not allowed ${p}`);return}if(typeof f.data=="string"&&f.data.length==0){l.channel.log("Empty message");return}const m=new a.XFrameMessage(f.data);if(!m.xFrame){l.channel.log("Unknown message:"+m.type);return}if(m.type===a.XFrameMessageType.JOIN&&(this.remoteWin=h,this.id=m.channelId,this.emit("join")),m.channelId===this.id&&(l.channel.log(`Received: ${f.origin} =====> ${window.location.host}`),l.channel.log(`Message received (${window.location.href}): ${m.type}.${m.id}`),l.channel.log(`data: ${JSON.stringify(m)}`),m.type===a.XFrameMessageType.RESPONSE&&this.handleResponse(m),m.sync&&await this.sendAck(m),m.data)){if(this.isDataEmpty(m.data))return;this.emit("onData",m.data)}}isDataEmpty(f){return typeof f!="string"&&!Object.keys(f).length}async checkTimeout(){this.queue.filter(p=>p.sentTime&&Date.now()-p.sentTime>p.timeout).forEach(p=>{p.reject(new s.XFrameMessageError({error:"timeout",message:"Plugin message timeout",frame:p})),this.removeMessageFromQ(p.id)})}async sendAck(f,p){const h=new a.XFrameMessage({type:a.XFrameMessageType.RESPONSE});h.responseId=f.id;let m=p;if(!p)try{this.onDataCallback&&(m=await this.onDataCallback(f.data)),l.channel.log(`Ack message by resolver to: ${f.id}`)}catch(_){l.channel.log(`Ack message error: ${f.id}`),h.error=_.error,h.message=_.message,this.sendFrame(h);return}h.data=m,this.sendFrame(h)}async sendFrameSync(f){return f.sentTime=Date.now(),new Promise((h,m)=>{f.sync=!0,f.reject=m,f.resolve=h,setTimeout(this.checkTimeout.bind(this),f.timeout+5),this.queue.push(f),this.sendFrame(f)})}sendFrame(f){if(!this.remoteWin)throw new Error("Can't send with no remote win");f.sentTime=Date.now(),f.channelId=this.id;const p=JSON.parse(JSON.stringify(f));l.channel.log(`Sending channel message (${this.id}):${window.location.host} ------> ...`),l.channel.log(`Data: ${JSON.stringify(p)}`),this.remoteWin.postMessage(p,"*"),l.channel.log(`Message sent: ${f.type}.${f.id}`)}send(f){f.source.channelId=this.id;let p=new a.XFrameMessage({data:f,type:a.XFrameMessageType.REQUEST});return this.sendFrame(p)}async sendSync(f){let p=new a.XFrameMessage({data:f,type:a.XFrameMessageType.REQUEST});return await this.sendFrameSync(p)}async connect(){this.id=i.v4();let f=new a.XFrameMessage({type:a.XFrameMessageType.JOIN});return await this.sendFrameSync(f)}}e.Channel=u})(d2);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(f,p,h,m){m===void 0&&(m=h);var _=Object.getOwnPropertyDescriptor(p,h);(!_||("get"in _?!p.__esModule:_.writable||_.configurable))&&(_={enumerable:!0,get:function(){return p[h]}}),Object.defineProperty(f,m,_)}:function(f,p,h,m){m===void 0&&(m=h),f[m]=p[h]}),n=Zt&&Zt.__setModuleDefault||(Object.create?function(f,p){Object.defineProperty(f,"default",{enumerable:!0,value:p})}:function(f,p){f.default=p}),r=Zt&&Zt.__importStar||function(f){if(f&&f.__esModule)return f;var p={};if(f!=null)for(var h in f)h!=="default"&&Object.prototype.hasOwnProperty.call(f,h)&&t(p,f,h);return n(p,f),p};Object.defineProperty(e,"__esModule",{value:!0}),e.PeerAgent=e.FrameAgent=e.AgentState=void 0;const i=r(Dy),o=wp.exports,a=z1,s=d2,l=Qa;var c;(function(f){f.INIT="init",f.LIVE="live"})(c=e.AgentState||(e.AgentState={}));class u extends o.EventEmitter{constructor(p){super(),this.peers=[],this.supportedTypes=[],this.win=null,this.remote=!1,this._onPeerData=this.onPeerData.bind(this),this._onPeerEvent=this.onPeerEvent.bind(this),this._onPeerNavigation=this.onPeerNavigation.bind(this),this.handlePeerStateChange=h=>{const{guest:m,state:_}=h;this.emit("agentState",m,_)},this._handlePeerStateChange=this.handlePeerStateChange.bind(this),this.id=i.v4(),this.win=p!=null?p:window,this.supportedTypes.push(a.AgentMessageType.INIT,a.AgentMessageType.READY,a.AgentMessageType.APP,a.AgentMessageType.CODE,a.AgentMessageType.RPC)}getPeer(p){if(!p){if(this.peers.length==0)throw Error("Peer was not found and no default peer");return this.peers[0]}return this.peers.find(h=>h.id==p)}async onPeerData(p){this.emit("data",p)}async onPeerEvent(p){this.emit("event",p.data,p.source)}async onPeerNavigation(p){this.emit("navigation",p.data,p.source)}send(p,h=null){const m=this.getPeer(h);if(!m)throw Error("Send failed, No peer");return m.send(p)}async sendSync(p,h={}){const m=this.getPeer(h==null?void 0:h.peerId);if(!m)throw Error("Send failed, No peer");return m.sendSync(p)}async createPeer(p){const h=new d(this.win,p);return h.on("data",this._onPeerData),h.on("event",this._onPeerEvent),h.on("navigation",this._onPeerNavigation),h.on("peerState",this._handlePeerStateChange),this.peers.push(h),h}async loadPeer(p,h){const m=this.getPeer(p);if(!m)throw Error("Trying load unknown peer");return await m.connect(h),m}removePeer(p){this.destroy(p),this.peers=this.peers.filter(h=>h.id!==p)}destroy(p){const h=this.getPeer(p);if(!h)throw Error("No peer to destroy");h.off("data",this._onPeerData),h.off("event",this._onPeerEvent),h.off("navigation",this._onPeerNavigation),h.off("peerState",this._handlePeerStateChange),h.destroy()}}e.FrameAgent=u;class d extends u{constructor(p,h){super(),this.onPeerMessage_=this.onPeerMessage.bind(this),h&&(this.onDataCallback=h),this.localWin=p,this.remote=!0}get state(){return this._state}set state(p){this._state!==p&&(this._state=p,this.emit("peerState",{state:this.state,guest:this}))}get isRegistered(){return this.state===c.LIVE}send(p){var h;const m={agentId:this.id},_=new a.AgentMessage({type:a.AgentMessageType.APP,data:p,source:m});return(h=this.channel)===null||h===void 0?void 0:h.send(_)}async sendSync(p,h={}){var m;const _=new a.AgentMessage({type:a.AgentMessageType.APP,data:p,timeout:h.timeout});return(m=this.channel)===null||m===void 0?void 0:m.sendSync(_)}async sendCode(p,h={}){var m;const _=new a.AgentMessage({type:a.AgentMessageType.CODE,data:p,timeout:h.timeout});return(m=this.channel)===null||m===void 0?void 0:m.sendSync(_)}async sendRPC(p,h={}){var m;const _=new a.AgentMessage({type:a.AgentMessageType.RPC,data:p,timeout:h.timeout});return(m=this.channel)===null||m===void 0?void 0:m.sendSync(_)}sendEvent(p){var h;const m={agentId:this.id},_=new a.AgentMessage({type:a.AgentMessageType.EVENT,data:p,source:m});(h=this.channel)===null||h===void 0||h.send(_)}navigate(p){var h;const m={agentId:this.id},_=new a.AgentMessage({type:a.AgentMessageType.NAVIGATION,data:p,source:m});(h=this.channel)===null||h===void 0||h.send(_)}async connect(p){this.channel=new s.Channel(this.localWin,p,this.onDataCallback),this.channel.on("onData",this.onPeerMessage_),this.state=c.INIT,await this.channel.connect(),this.state=c.LIVE}destroy(){var p,h;(p=this.channel)===null||p===void 0||p.off("onData",this.onPeerMessage_),(h=this.channel)===null||h===void 0||h.destroy()}async onPeerMessage(p){var h;if(this.id===((h=p.source)===null||h===void 0?void 0:h.agentId)){l.channel.log("Message from self - aborting");return}switch(p.type){case a.AgentMessageType.APP:this.emit("data",p.data);break;case a.AgentMessageType.EVENT:this.emit("event",p);break;case a.AgentMessageType.NAVIGATION:this.emit("navigation",p)}}}e.PeerAgent=d})(F1);Object.defineProperty(j1,"__esModule",{value:!0});j1.GuestAgent=void 0;const qCe=F1,YCe=d2,_A=Qa,OE=z1;class WCe extends qCe.PeerAgent{constructor(t,n){t||(t=window),super(t,n),n||(this.onDataCallback=this.messageHandler.bind(this)),this.channel=new YCe.Channel(t,null,this.onDataCallback),this.channel.on("join",()=>{this.emit("guestReady")}),this.channel.on("onData",this.onData.bind(this))}async messageHandler(t){const{type:n}=t;return n===OE.AgentMessageType.CODE?await this.handleCode(t):n===OE.AgentMessageType.RPC?await this.handleRPC(t):null}destroy(){_A.channel.log("destroying guest agent"),super.destroy(),this.channel.off("join",()=>{this.emit("guestReady")}),this.channel.off("onData",this.onData.bind(this)),this.channel=null}async onData(t){const r=typeof t=="string"?{data:t}:t;t.type===OE.AgentMessageType.EVENT&&this.emit("event",r),t.type===OE.AgentMessageType.NAVIGATION&&this.emit("navigation",r),this.emit("data",r)}async handleCode(t){_A.channel.log("Loading code...");let n={},r="success",i="";try{n=eval.call(window,decodeURIComponent(t.data))}catch(a){r="error",i="exception occurred in code",n=a}const o={};return o.message=i,o.result=r,o.output=n,o}async handleRPC(t){_A.channel.log("Handling RPC message");const n=t.data;let r={},i="NA",o="";const a=window[n.func];if(typeof a!="function")r={},i="error",o="Function does not exist";else try{let l={};typeof n.inputs=="object"&&(l=n.inputs),a.constructor.name=="AsyncFunction"?r=await a(...l):r=a(...l),i="success"}catch(l){i="error",o="exception",l&&l.message&&(r=l.message)}const s={};return s.message=o,s.result=i,s.output=r,s}}j1.GuestAgent=WCe;var KCe=Zt&&Zt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(B1,"__esModule",{value:!0});B1.GuestApp=void 0;const QU=Qa,QCe=j1,XCe=KCe(wp.exports);class JCe extends XCe.default{initGuest(){QU.channel.log("plugin agent init"),this.agent=new QCe.GuestAgent,this.agent.on("guestReady",()=>{this.emit("ready")}),this.agent.on("data",t=>{this.emit("data",t)}),this.agent.on("event",t=>{this.emit("event",t)}),this.agent.on("navigation",t=>{this.emit("navigation",t)})}async init(){const t=window.location.href;QU.channel.log(`Init on window ${t}`),this.initGuest()}}B1.GuestApp=JCe;var Cte={},wte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.CrudEvent=e.CrudType=e.AppMessageScope=void 0,function(t){t.GLOBAL="global",t.ANNOTATION="annotation",t.LABEL="label",t.ATTRIBUTE="attribute",t.STRUCTURE="structure",t.ITEM="item",t.PROJECT="project",t.RECIPE="recipe",t.ONTOLOGY="ontology",t.DATASET="dataset",t.TASK="task",t.CONTRIBUTOR="contributor",t.SETTINGS="settings",t.EXECUTION="execution",t.DRIVER="driver",t.INTEGRATION="integration",t.PIPELINE="pipeline",t.PIPELINE_EXECUTION="pipelineExecution",t.MODEL="model",t.SERVICE="service"}(e.AppMessageScope||(e.AppMessageScope={})),function(t){t.UNKNOWN="unknown",t.CREATE="create",t.CREATE_BULK="createBulk",t.READ="read",t.UPDATE="update",t.UPDATE_BULK="updateBulk",t.DELETE="delete",t.DELETE_BULK="deleteBulk",t.QUERY="query",t.STREAM="stream",t.CLONE="clone",t.FETCH="fetch",t.LOGS="logs",t.SET_STATUS="setStatus",t.DOES_LABEL_HAVE_ATTRIBUTES="doesLabelHaveAttributes",t.CALC_LABELS_HAVE_ATTRIBUTES="calcLabelsHaveAttributes",t.MISSING_REQUIRED_ATTRIBUTE="missingRequiredAttribute",t.GET_LABEL_ATTRIBUTES="getLabelAttributes",t.UPDATE_ASSIGNEES="updateAssignees",t.GET_BY_NAME="getByName",t.COUNT_BY_QUERY="countByQuery",t.PREDICT="predict"}(e.CrudType||(e.CrudType={})),function(t){t.CREATED="created",t.DELETED="deleted",t.UPDATED="updated"}(e.CrudEvent||(e.CrudEvent={}))})(wte);var Ote={},V1={};Object.defineProperty(V1,"__esModule",{value:!0});V1.CrudMessage=void 0;class ZCe{constructor(t){t&&Object.assign(this,t)}}V1.CrudMessage=ZCe;var Rte={};Object.defineProperty(Rte,"__esModule",{value:!0});var Ate={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.DlRoute=e.DlNavigationMessage=void 0;class t{constructor(r){this.route=r.route,this.params=r.params,this.options=r.options,this.query=r.query}}e.DlNavigationMessage=t,function(n){n.PROJECTS="projectsPage",n.PROJECT="projectOverview",n.DATASETS="datasets",n.DATASET_BROWSER="datasetBrowser",n.PROJECT_TEAM="projectTeam",n.TASKS="tasks",n.TASK_BROWSER="taskBrowser",n.ASSIGNMENTS="assignments",n.CLOUD_STORAGE="cloudStorage",n.APPLICATION_HUB="applicationHub",n.ORG_MEMBERS_AND_GROUPS="orgMembersAndGroups",n.AUDIT_LOGS="auditLogs",n.STUDIO="studio",n.PIPELINES="pipelines",n.RECIPES="recipes",n.RECIPE="recipe",n.STARTLINE="startline",n.CUSTOM="custom"}(e.DlRoute||(e.DlRoute={}))})(Ate);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(z1,e),n(F1,e),n(V1,e),n(Rte,e),n(Ate,e)})(Ote);var kte={};(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(f2,e),n(My,e)})(kte);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(wte,e),n(Ote,e),n(kte,e)})(Cte);var Ite={},G1={};Object.defineProperty(G1,"__esModule",{value:!0});G1.XFrameManager=void 0;const e1e=F1,t1e=wp.exports,RE=Qa;class n1e extends t1e.EventEmitter{constructor(t,n){super(),this._guestAgents=[],this.onDataCallback=n,t||(t=window),this._hostAgent=new e1e.FrameAgent(t),this._hostAgent.on("data",this.onHostData.bind(this)),this._hostAgent.on("agentState",this.onHostAgentState.bind(this)),this._hostAgent.on("event",this.onHostEvent.bind(this)),this._hostAgent.on("navigation",this.onHostNavigation.bind(this))}get logger(){return RE.channel}get hostAgent(){return this._hostAgent}get guestAgents(){return this._guestAgents}async onHostData(t){RE.channel.log("Data from peer: ",t)}async onHostEvent(t){RE.channel.log("Event from peer: ",t)}async onHostNavigation(t){RE.channel.log("Navigation from peer: ",t)}async onGuestData(t,n){this.emit("data",t,n)}async onHostAgentState(t,n){console.log(t,n)}async onGuestAgentState(t,n){this.emit("agentState",t,n)}async onGuestEvent(t){this.emit("event",t.data,t.source)}async onGuestNavigation(t){this.emit("navigation",t.data,t.source)}async createFrameByUrl(t){return new Promise(async(r,i)=>{const a=Date.now(),s=document.createElement("iframe");s.src=t,document.body.appendChild(s);let l=!1;s.onload=async()=>{if(Date.now()-a>5e3)return;l=!0;const u=await this.registerGuest(s.contentWindow);r(u)},setTimeout(()=>{l||i("Frame load timeout")},5e3)})}async createGuest(){const t=await this._hostAgent.createPeer(this.onDataCallback);return this._guestAgents.push(t),t.on("data",n=>this.onGuestData(n,t)),t.on("onData",n=>this.onGuestData(n,t)),t.on("event",this.onGuestEvent.bind(this)),t.on("navigation",this.onGuestNavigation.bind(this)),t.on("agentState",this.onGuestAgentState.bind(this)),t}async registerGuest(t,n){if(n)return await this._hostAgent.loadPeer(n,t);const r=await this.createGuest();return await this._hostAgent.loadPeer(r.id,t)}removeGuest(t){this._guestAgents=this._guestAgents.filter(n=>n.id!==t),this._hostAgent.removePeer(t)}}G1.XFrameManager=n1e;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(G1,e)})(Ite);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(B1,e),n(Cte,e),n(Ite,e)})(So);Object.defineProperty(mte,"__esModule",{value:!0});var p2={},xo={};Object.defineProperty(xo,"__esModule",{value:!0});xo.Repository=void 0;const XU=Qa;class r1e{constructor(t){this.agent=t}async crudReqSync(t,n={}){try{return XU.channel.log(`Sync request:${t.scope}:${t.crud}`),await this.agent.sendSync(t,n)}catch(r){throw r}}crudReq(t){try{return XU.channel.log(`CRUD request:${t.scope}:${t.crud}`),this.agent.send(t)}catch(n){throw n}}}xo.Repository=r1e;var Nte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.ThemeType=void 0,function(t){t.DARK="dark",t.LIGHT="light"}(e.ThemeType||(e.ThemeType={}))})(Nte);var xte={};Object.defineProperty(xte,"__esModule",{value:!0});(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(a,s,l,c){c===void 0&&(c=l);var u=Object.getOwnPropertyDescriptor(s,l);(!u||("get"in u?!s.__esModule:u.writable||u.configurable))&&(u={enumerable:!0,get:function(){return s[l]}}),Object.defineProperty(a,c,u)}:function(a,s,l,c){c===void 0&&(c=l),a[c]=s[l]}),n=Zt&&Zt.__exportStar||function(a,s){for(var l in a)l!=="default"&&!Object.prototype.hasOwnProperty.call(s,l)&&t(s,a,l)};Object.defineProperty(e,"__esModule",{value:!0}),e.AppSettings=void 0;const r=xo,i=So;n(Nte,e),n(xte,e);class o extends r.Repository{async get(s){var l,c;const u=new i.CrudMessage({scope:i.AppMessageScope.SETTINGS,crud:i.CrudType.READ,data:{channelId:(c=(l=this.agent)===null||l===void 0?void 0:l.channel)===null||c===void 0?void 0:c.id,setting:s}});return await this.crudReqSync(u)}}e.AppSettings=o})(p2);var Lb={},H1={},Py={};Object.defineProperty(Py,"__esModule",{value:!0});Py.SDKProject=void 0;class i1e{constructor(t){t&&Object.assign(this,t)}get accountId(){var t;return(t=this.account)===null||t===void 0?void 0:t.id}get orgId(){var t;return(t=this.org)===null||t===void 0?void 0:t.id}}Py.SDKProject=i1e;Object.defineProperty(H1,"__esModule",{value:!0});H1.Projects=void 0;const o1e=xo,ds=So,a1e=Qa,s1e=Py;class l1e extends o1e.Repository{async create(t){const{name:n}=t;a1e.channel.log(`Creating project ${n}`);const r=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.CREATE,data:{name:n}});return await this.crudReqSync(r)}async update(t){const{id:n,name:r}=t,i=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.UPDATE,data:{id:n,name:r}});return await this.crudReqSync(i)}async delete(t){const n=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.DELETE,data:t});await this.crudReqSync(n)}async get(t){const n=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.READ,data:t});return await this.crudReqSync(n)}async query(){var t;const n=new ds.CrudMessage({scope:ds.AppMessageScope.PROJECT,crud:ds.CrudType.QUERY}),r=await this.crudReqSync(n);return r.items=(t=r.items)===null||t===void 0?void 0:t.map(i=>new s1e.SDKProject(i)),r}}H1.Projects=l1e;var q1={},h2={},m2={},$g={};Object.defineProperty($g,"__esModule",{value:!0});$g.SnapshotService=$g.SDKAnnotationSnapshot=void 0;const JU=ut.exports;class xv{constructor(t){var n;this.fixed=t.fixed,this.frame=t.frame,this.objectVisible=(n=t.objectVisible)!==null&&n!==void 0?n:!0,this.data=t.data,this.label=t.label,this.namedAttributes=t.namedAttributes,this.description=t.description}setAttributeByName(t,n){n!==void 0?(this.namedAttributes||(this.namedAttributes={}),this.namedAttributes[t]=n):this.namedAttributes&&(this.namedAttributes[t]=null)}}$g.SDKAnnotationSnapshot=xv;class c1e{_generateInclusiveList(){return this.initSnapshot?(this._inclusiveList=this._list.slice(),this._inclusiveList[this.initSnapshot.frame]=this.initSnapshot,this._inclusiveList):[]}get _annotationId(){var t;return(t=this._annotation)===null||t===void 0?void 0:t.id}_syncSnapshots(){this._annotation.metadata.system.snapshots_=this._list,this._generateInclusiveList()}get list(){return this._inclusiveList}constructor(t){this._snapShotIndex=[],this.findSelfFrames=(n,r)=>n===r,this._annotation=t,this._generateSnapshotState()}get _startFrame(){var t,n,r;return(r=(n=(t=this._annotation)===null||t===void 0?void 0:t.metadata)===null||n===void 0?void 0:n.system)===null||r===void 0?void 0:r.frame}set _startFrame(t){this._annotation.metadata.system.frame=t}get _endFrame(){var t,n,r;return(r=(n=(t=this._annotation)===null||t===void 0?void 0:t.metadata)===null||n===void 0?void 0:n.system)===null||r===void 0?void 0:r.endFrame}set _endFrame(t){this._annotation.metadata.system.endFrame=t}_generateSnapshotState(){var t;if(!(!((t=this._annotation.metadata)===null||t===void 0)&&t.system))return;this._annotation.metadata.system.snapshots_||(this._annotation.metadata.system.snapshots_=[]),this._list=this._annotation.metadata.system.snapshots_;const n=[];for(const i of this._list)if(i!=null&&i.data){const o=new xv({data:i.data,label:i.label,namedAttributes:i.namedAttributes,description:i.description,fixed:i.fixed,frame:i.frame,objectVisible:i.objectVisible});o.annotationId=this._annotationId,n[i.frame]=o}const r=[...this._list];this.initSnapshot&&r.unshift(this.initSnapshot);for(let i=0;i<r.length;i++){if(!r[i])continue;this._snapShotIndex[r[i].frame]=r[i].frame;let o=-1;r[i+1]&&(o=r[i+1].frame,this._snapShotIndex[r[i+1].frame]=r[i+1].frame),this._snapShotIndex.fill(r[i].frame,r[i].frame,o)}this._list=n,this._syncSnapshots()}get initSnapshot(){var t;if(!this._annotation)return;const n=this._annotation.label,r=this._annotation.description,i=Object.assign({},this._annotation.metadata.system.attributes),o=(t=this._annotation.data)!==null&&t!==void 0?t:this._annotation._def,a=new xv({data:o,label:n,namedAttributes:i,description:r,fixed:!0,frame:this._annotation.metadata.system.frame});return a.annotationId=this._annotationId,a}_addSnapshot(t){var n;if(t.annotationId=this._annotationId,t.frame>this._startFrame&&(this._list[t.frame]=t),t.label===""){const i=this.list.indexOf(t);t.label=this.list[i].label}let r=this.getNextSnapFrame(t.frame);if(this._startFrame>t.frame&&(r===((n=this.initSnapshot)===null||n===void 0?void 0:n.frame)&&(r=this.getNextSnapFrame(r)),delete this._snapShotIndex[this._startFrame],this._startFrame=t.frame),this._endFrame<t.frame&&(this._endFrame=t.frame),this._snapShotIndex[t.frame]===t.frame){this._syncSnapshots();return}if(this._snapShotIndex[t.frame]=t.frame,r===-1){const i=this._getPrevSnapFrame(t.frame);i!==-1&&this._snapShotIndex.fill(i,i,t.frame),this._syncSnapshots();return}this._snapShotIndex[r-1]=t.frame,this._snapShotIndex.fill(t.frame,t.frame,r),this._syncSnapshots()}delete(t){if(!t)return;const n=t.frame;delete this._list[n];const r=this._getPrevSnapFrame(n),i=this.getNextSnapFrame(t.frame)||this._snapShotIndex.length;this._snapShotIndex[t.frame]=r,this._snapShotIndex.fill(r,t.frame,i),this._syncSnapshots()}getNextSnapFrame(t){return(0,JU.findIndex)(this._snapShotIndex,this.findSelfFrames,t+1)}_getPrevSnapFrame(t){let n=(0,JU.findLastIndex)(this._snapShotIndex.slice(0,t),this.findSelfFrames);return n<0&&(n=this.initSnapshot.frame),n}_getPrevFixedFrame(t){for(let n=t-1;n>=0;--n)if(this.list[n]&&this.list[n].fixed)return this.list[n]}_getNextFixedFrame(t){for(let n=t+1;n<this.list.length;++n)if(this.list[n]&&this.list[n].fixed)return this.list[n]}_get(t){let n;return this._snapShotIndex[t]===void 0?this.list.length===0?n=this.initSnapshot:n=this.list[this._snapShotIndex.length-1]:n=this.list[this._snapShotIndex[t]],n}get(t){return new xv(this._get(t))}_generateTransformationSection(t,n,r){var i,o;if(!(n.frame-t.frame<=0)){for(let s=t.frame+1;s<n.frame;++s)delete this._list[s];for(let s=t.frame+1;s<n.frame;++s){const l=(s-t.frame)/(n.frame-t.frame),c=r(t,n,l);this.create({frame:s,label:(i=c.label)!==null&&i!==void 0?i:t.label,namedAttributes:(o=c.namedAttributes)!==null&&o!==void 0?o:t.namedAttributes,data:c.data,fixed:!1})}}}generateTransformation(t,n){const r=this._get(t);if(!r||r.frame!==t||!r.fixed)return;const i=this._getPrevFixedFrame(t),o=this._getNextFixedFrame(t);i&&this._generateTransformationSection(i,r,n),o&&this._generateTransformationSection(r,o,n),this._syncSnapshots()}create(t){const{frame:n,label:r,namedAttributes:i,data:o,fixed:a,description:s,objectVisible:l}=t;let c=this.list[n];return n===this._startFrame&&o?(this._annotation.data=o,this._generateInclusiveList()):c&&c.frame!==this._startFrame?(c.fixed=a,c.data=o,c.label=r,l!==void 0&&(c.objectVisible=l),c.description=s||c.description,i&&(c.namedAttributes=Object.assign({},i))):(c=new xv({data:o,label:r,namedAttributes:i,description:s,fixed:a,frame:n,objectVisible:l}),this._addSnapshot(c)),c}async update(t){const{label:n,namedAttributes:r,data:i,objectVisible:o}=t,a=t.untilSpecificFrame;let s=t.frame;if(s===this._startFrame&&i)this._annotation.data=i;else if(a){const l=this._get(a);if(l)l.fixed||(l.fixed=!0),a===this._endFrame&&this._updateByParams({frame:a,label:n,objectVisible:o,namedAttributes:r,data:i});else if(!l&&a!==this._endFrame){const c=this._get(a);this.create({frame:a,label:c.label,namedAttributes:c.namedAttributes,data:c.data,objectVisible:c.objectVisible,fixed:!0})}for(;s<a;){this._updateByParams({frame:s,label:n,namedAttributes:r,objectVisible:o,data:i});const c=this._getNextFixedFrame(s);s=c?c.frame:this._endFrame}}else this._updateByParams({frame:s,label:n,namedAttributes:r,data:i,objectVisible:o});this._syncSnapshots()}_updateByParams(t){const{label:n,namedAttributes:r,frame:i,data:o,objectVisible:a}=t;n&&this._setLabel({label:n,frame:i}),r&&this._setAttributes(r,i),o&&this._setData({data:o,frame:i}),a!==void 0&&this._setObjectVisible({objectVisible:a,frame:i})}_setObjectVisible(t){const{objectVisible:n}=t;let{frame:r}=t;r===void 0&&(r=0);const i=this._get(r);return i.objectVisible=n,this._updateSnapshot({objectVisible:n,frame:r})}_setData(t){const{data:n}=t;let{frame:r}=t;r===void 0&&(r=0);const i=this._get(r);return n&&(i.data=n),this._updateSnapshot({data:n,frame:r})}_setAttributes(t,n){var r;n<=this._startFrame&&(t.value!==void 0?this._annotation.metadata.system.attributes[t.key]=t.value:this._annotation.metadata.system.attributes[t.key]=null);const i=this._get(n);if(i)i.setAttributeByName(t.key,t.value),this._updateSnapshot({namedAttributes:i.namedAttributes,frame:n});else{const o=this._get(n),a=Object.assign({},(r=o==null?void 0:o.namedAttributes)!==null&&r!==void 0?r:{},{[t.key]:t.value});this._updateSnapshot({namedAttributes:a,frame:n})}}_setLabel(t){const{label:n,namedAttributes:r}=t;let{frame:i}=t;i===void 0&&(i=0);const o=this._get(i);return n&&(o.label=n),r&&(i<=this._startFrame&&(this._annotation.metadata.system.attributes=Object.assign({},r)),o.namedAttributes=Object.assign({},r)),this._updateSnapshot({label:n,namedAttributes:r,frame:i})}_updateSnapshot(t){var n;const{frame:r}=t;let{label:i,namedAttributes:o,data:a,objectVisible:s}=t;const l=this._get(r);if(l)i=i!=null?i:l.label,o=Object.assign({},o!=null?o:l.namedAttributes),a=a!=null?a:l.data,l.label=i,l.namedAttributes=o,l.fixed=!0,l.data=a,s!==void 0&&(l.objectVisible=s);else{const u=this._get(r);i||(i=u.label),o||(o=Object.assign({},(n=u.namedAttributes)!==null&&n!==void 0?n:{})),a||(a=u.data),this.create({frame:r,label:i,namedAttributes:o,data:a,objectVisible:s,fixed:!0,description:u.description})}const c=[{name:"label",value:i},{name:"namedAttributes",value:o}];a&&c.push({name:"data",value:a}),s!==void 0&&c.push({name:"objectVisible",value:s}),this._updateNotFixed({toUpdate:c,startFrame:r})}_updateNotFixed(t){var n;const{toUpdate:r,startFrame:i}=t;let o=!0,a=i;for(;o;){a=a+1;const s=(n=this.list[a])!==null&&n!==void 0?n:this._getNextSnapshot(a);if(!s)return;if(a=s.frame,o=!s.fixed,o)for(const l of r)s[l.name]=l.value}}_getNextSnapshot(t){const n=this.list;for(let r=t+1;r<n.length;++r)if(n[r])return n[r]}}$g.SnapshotService=c1e;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n($g,e)})(m2);(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKAnnotationEvent=e.SDKAnnotation=e.AnnotationType=void 0;const t=m2;(function(i){i.CLASS="class",i.POINT="point",i.LINE="line",i.BOX="box",i.CUBE="cube",i.SEGMENT="segment",i.ELLIPSE="ellipse",i.BINARY="binary",i.NOTE="note",i.POLYLINE="polyline",i.COMPARISON="comparison",i.RECORDING="recording",i.SUBTITLE="subtitle",i.ITEM_DESCRIPTION="item_description",i.TEXT_MARK="text_mark",i.POSE="pose",i.CUBE_3D="cube_3d",i.SEMANTIC_3D="semantic_3d",i.POLYLINE_3D="polyline_3d",i.PDF_TEXT="pdf_text",i.TEXT="text",i.REF_IMAGE="ref_image",i.REF_SEMANTIC_3D="ref_semantic_3d",i.GIS="gis"})(e.AnnotationType||(e.AnnotationType={}));class n{constructor(o){o&&Object.assign(this,o),this.snapshots=new t.SnapshotService(this),this.data===void 0&&(this.data=o._def),this.description===void 0&&(this.description=o._description)}toJSON(){return{clientId:this.clientId,coordinates:this.coordinates,createdAt:this.createdAt,creator:this.creator,datasetId:this.datasetId,id:this.id,itemId:this.itemId,label:this.label,labelSuggestions:this.labelSuggestions,metadata:this.metadata,type:this.type,updatedAt:this.updatedAt,updatedBy:this.updatedBy,attributes:this.attributes,description:this.description,labelColor:this.labelColor,data:this.data}}}e.SDKAnnotation=n;class r{constructor(o){this.id=o.id,this.annotationId=o.annotationId,this.user=o.user,this.timestamp=o.timestamp,o.changes&&(this.changes=o.changes),o.deleted&&(this.deleted=o.deleted)}}e.SDKAnnotationEvent=r})(h2);Object.defineProperty(q1,"__esModule",{value:!0});q1.Annotations=void 0;const u1e=xo,si=So,Am=h2;class d1e extends u1e.Repository{async get(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.READ,data:t}),r=await this.crudReqSync(n);return new Am.SDKAnnotation(r)}async delete(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.DELETE,data:t});await this.crudReqSync(n)}async deleteBulk(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.DELETE_BULK,data:t});await this.crudReqSync(n)}async query(t,n={}){const r=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.QUERY,data:t}),i=await this.crudReqSync(r,n);return i.items=i.items.map(o=>new Am.SDKAnnotation(o)),i}async create(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.CREATE,data:t}),r=await this.crudReqSync(n);return new Am.SDKAnnotation(r)}async createBulk(t,n={}){const r=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.CREATE_BULK,data:t});return(await this.crudReqSync(r,n)).map(o=>new Am.SDKAnnotation(o))}async update(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.UPDATE,data:t}),r=await this.crudReqSync(n);return new Am.SDKAnnotation(r)}async updateBulk(t,n={}){const r=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.UPDATE_BULK,data:t});return(await this.crudReqSync(r,n)).map(o=>new Am.SDKAnnotation(o))}async logs(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.LOGS,data:t});return await this.crudReqSync(n)}async setStatus(t){const n=new si.CrudMessage({scope:si.AppMessageScope.ANNOTATION,crud:si.CrudType.SET_STATUS,data:t});await this.crudReqSync(n)}}q1.Annotations=d1e;var Y1={},g2={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.TaskEvent=e.AppProcessingStates=e.AppsProcessingEvents=e.DlRecipeEvent=e.DlItemFrameEvent=e.DlItemEvent=e.DlAnnotationEvent=e.DlAnnotationFrameEvent=e.DlFrameEvent=e.DlEvent=void 0,function(t){t.READY="ready",t.THEME="theme",t.VALIDATION_RESULT="validationResult",t.NODE_CONFIG="nodeConfig",t.INVOKE_PAYLOAD="invokePayload",t.EXECUTION_STATUS="executionStatus",t.VIEWER_SETTINGS="viewerSettings",t.TOOL_CONTROLS="toolControls",t.ACTIVE_QUERY="activeQuery",t.TRIGGER_ACTIVE_QUERY="triggerActiveQuery",t.NAVIGATION="navigation",t.USER_FIRST_VISIT="userFirstVisit",t.REFRESH="refresh"}(e.DlEvent||(e.DlEvent={})),function(t){t.UPDATE_NODE_CONFIG="updateNodeConfig",t.TOGGLE_ACTION_LOCK="toggleActionLock",t.CLOSE_DIALOG="app:closeDialog",t.REDO="redo",t.UNDO="undo",t.TOAST_MESSAGE="app:toastMessage",t.INVOKE_PANEL="invokePanel",t.SET_HEIGHT="app:setHeight",t.UPDATE_TIME_SERVICE_SETTINGS="app:updateTimeServiceSettings",t.UPDATE_VIEWER_SETTINGS="app:updateViewerSettings",t.CLIPBOARD_WRITE="app:clipboardWrite",t.REFRESH_DATA="app:refreshData"}(e.DlFrameEvent||(e.DlFrameEvent={})),function(t){t.SELECT_ONE="selectOneAnnotation",t.DESELECT_ONE="deselectOneAnnotation",t.SELECT_MULTIPLE="selectMultipleAnnotations",t.DESELECT_MULTIPLE="deselectMultipleAnnotations",t.DESELECT_ALL="clearSelectedAnnotations"}(e.DlAnnotationFrameEvent||(e.DlAnnotationFrameEvent={})),function(t){t.DELETED="dl:annotation:deleted",t.UPDATED="dl:annotation:updated",t.CREATED="dl:annotation:created",t.BULK_DELETED="dl:annotations:deleted",t.SELECT="dl:annotations:select",t.DESELECT="dl:annotations:deselect",t.SET_SELECTION="dl:annotations:setSelection"}(e.DlAnnotationEvent||(e.DlAnnotationEvent={})),function(t){t.SELECTION_UPDATED="items:selection:updated",t.DESELECT_ONE="items:deselect:one",t.DELETED="items:deleted"}(e.DlItemEvent||(e.DlItemEvent={})),function(t){t.SET_SELECTION="dl:items:update:selection",t.SET_ITEM_STATUS="dl:items:set:status"}(e.DlItemFrameEvent||(e.DlItemFrameEvent={})),function(t){t.RECIPE_HAS_CHANGES="recipe:has:changes",t.RECIPE_ON_SAVE_CLICK="recipe:on:save:click",t.RECIPE_LAYOUT_SAVE_DONE="recipe:layout:save:done"}(e.DlRecipeEvent||(e.DlRecipeEvent={})),function(t){t.APP_PROCESSING="appProcessing",t.APP_PROCESSING_STATUS="appProcessingStatus",t.APPS_IS_PROCESSING="apps:isProcessing",t.APPS_IS_PROCESSING_STATUS="apps:isProcessingStatus"}(e.AppsProcessingEvents||(e.AppsProcessingEvents={})),function(t){t.IDLE="idle",t.PROCESSING="processing"}(e.AppProcessingStates||(e.AppProcessingStates={})),function(t){t.TASK_STATUS_CHANGE_RESULT="task:statusChangeResult",t.TASK_REQUEST_STATUS_CHANGE="task:requestStatusChange",t.TASK_STATUS_CHANGE_REQUESTED="task:statusChangeRequested"}(e.TaskEvent||(e.TaskEvent={}))})(g2);Object.defineProperty(Y1,"__esModule",{value:!0});Y1.Items=void 0;const f1e=Qa,p1e=xo,Ri=So,h1e=g2;class m1e extends p1e.Repository{async create(t,n={}){const{file:r,path:i,metadata:o,binaries:a,datasetId:s,overwrite:l}=t;f1e.channel.log(`creating ${r.name}`);const u=await(h=>new Promise((m,_)=>{const v=new FileReader;v.readAsDataURL(h),v.onload=()=>m(v.result),v.onerror=b=>_(b)}))(r);let d={};d.dataUri=u,d.name=r.name,d.type=r.type,d.datasetId=s,d.binaries=a,d.metadata=o,d.path=i,d.overwrite=l;const f=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.CREATE});return f.data=d,await this.crudReqSync(f,n)}async get(t,n={}){const r=n.timeout;delete n.timeout;const i=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.READ,data:{id:t,options:n}});return await this.crudReqSync(i,{timeout:r})}async getByName(t,n={}){const r=n.timeout;delete n.timeout;const i=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.GET_BY_NAME,data:{name:t,options:n}});return await this.crudReqSync(i,{timeout:r})}async countByQuery(t,n={}){const r=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.COUNT_BY_QUERY,data:t});return await this.crudReqSync(r,n)}async fetch(t,n={}){var r;const i=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.FETCH,data:t,options:{allowCode:(r=n.allowCode)!==null&&r!==void 0?r:!1}});return await this.crudReqSync(i,n)}async stream(t,n={}){var r,i;const o=n.timeout;delete n.timeout;const a=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.STREAM,data:{url:t,channelId:(i=(r=this.agent)===null||r===void 0?void 0:r.channel)===null||i===void 0?void 0:i.id,options:n}});return await this.crudReqSync(a,{timeout:o})}async update(t,n={}){const r=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.UPDATE,data:t});return await this.crudReqSync(r,n)}async delete(t){const n=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.DELETE,data:t});await this.crudReqSync(n)}async query(t,n={}){const r=new Ri.CrudMessage({scope:Ri.AppMessageScope.ITEM,crud:Ri.CrudType.QUERY,data:t});return await this.crudReqSync(r,n)}setItemStatus(t){this.agent.sendEvent({name:h1e.DlItemFrameEvent.SET_ITEM_STATUS,payload:t})}}Y1.Items=m1e;var W1={};Object.defineProperty(W1,"__esModule",{value:!0});W1.Recipes=void 0;const g1e=xo,li=So;class _1e extends g1e.Repository{async query(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.QUERY,data:{projectIds:t==null?void 0:t.projectIds}});return await this.crudReqSync(n)}async delete(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.DELETE,data:t});await this.crudReqSync(n)}async create(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async clone(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.CLONE,data:t});return await this.crudReqSync(n)}async get(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.READ,data:t});return await this.crudReqSync(n)}async update(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async doesLabelHaveAttributes(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.DOES_LABEL_HAVE_ATTRIBUTES,data:t});return await this.crudReqSync(n)}async calcLabelsHaveAttributes(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.CALC_LABELS_HAVE_ATTRIBUTES,data:t});await this.crudReqSync(n)}async missingRequiredAttribute(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.MISSING_REQUIRED_ATTRIBUTE,data:t});return await this.crudReqSync(n)}async getLabelAttributes(t){const n=new li.CrudMessage({scope:li.AppMessageScope.RECIPE,crud:li.CrudType.GET_LABEL_ATTRIBUTES,data:t});return await this.crudReqSync(n)}}W1.Recipes=_1e;var K1={},Ly={};Object.defineProperty(Ly,"__esModule",{value:!0});Ly.APIOntologyV2=void 0;class v1e{constructor(t){Object.assign(this,t),this.v2=!0}toJSON(){return{id:this.id,creator:this.creator,title:this.title,roots:this.roots,structureIds:this.structureIds,metadata:this.metadata,attributes:this.attributes,createdAt:this.createdAt,updatedAt:this.updatedAt,updatedBy:this.updatedBy,v2:this.v2}}}Ly.APIOntologyV2=v1e;Object.defineProperty(K1,"__esModule",{value:!0});K1.Ontologies=void 0;const b1e=xo,fs=So,ZU=Ly;class y1e extends b1e.Repository{async get(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.READ,data:t}),r=await this.crudReqSync(n);let i;try{i=new ZU.APIOntologyV2(r)}catch{}return i}async create(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.DELETE,data:t});await this.crudReqSync(n)}async update(t){const n=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async query(t,n){var r;const i=new fs.CrudMessage({scope:fs.AppMessageScope.ONTOLOGY,crud:fs.CrudType.QUERY,data:{payload:t,options:n}}),o=await this.crudReqSync(i);return o.items=(r=o.items)===null||r===void 0?void 0:r.map(a=>new ZU.APIOntologyV2(a)),o}}K1.Ontologies=y1e;var Q1={};Object.defineProperty(Q1,"__esModule",{value:!0});Q1.Labels=void 0;const S1e=xo,Gl=So;class E1e extends S1e.Repository{async query(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.QUERY,data:t});return await this.crudReqSync(n)}async get(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.READ,data:t});return await this.crudReqSync(n)}async create(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new Gl.CrudMessage({scope:Gl.AppMessageScope.LABEL,crud:Gl.CrudType.DELETE,data:t});await this.crudReqSync(n)}}Q1.Labels=E1e;var X1={},el={},Dte={};Object.defineProperty(Dte,"__esModule",{value:!0});var Mte={},Pte={};Object.defineProperty(Pte,"__esModule",{value:!0});var $b={};Object.defineProperty($b,"__esModule",{value:!0});$b.APIRecipeV2=void 0;class T1e{constructor(t){t&&Object.assign(this,t),this.v2=!0}get ontologyId(){return this.ontology.ontologyId}get attributes(){return this.ontology.attributes}}$b.APIRecipeV2=T1e;var ku={};Object.defineProperty(ku,"__esModule",{value:!0});ku.SDKLabelTreeNode=ku.SDKLabel=ku.APILabelTreeNodeV2=ku.APILabelV2=void 0;class C1e{constructor(t){this.tag=t.tag,this.displayLabel=t.displayLabel||this.tag,this.color=t.color,this.displayData=t.displayData}}ku.APILabelV2=C1e;class w1e{constructor(t){t&&Object.assign(this,t)}identifier(){return this.path}isRoot(){return!this.parent}}ku.APILabelTreeNodeV2=w1e;class O1e{constructor(t){this.tag=t.tag,this.displayLabel=t.displayLabel||this.tag,this.color=t.color,this.attributes=t.attributes||[],this.displayData=t.displayData||{}}}ku.SDKLabel=O1e;class R1e{constructor(t){t&&Object.assign(this,t)}}ku.SDKLabelTreeNode=R1e;var J1={};Object.defineProperty(J1,"__esModule",{value:!0});J1.SDKItem=void 0;class A1e{constructor(t){t&&Object.assign(this,t)}}J1.SDKItem=A1e;var Z1={};Object.defineProperty(Z1,"__esModule",{value:!0});Z1.APIStructureV2=void 0;class k1e{constructor(t){t&&Object.assign(this,t)}}Z1.APIStructureV2=k1e;var Bg={};Object.defineProperty(Bg,"__esModule",{value:!0});Bg.APIAttributeSectionV2=Bg.SDKAttributeInstruction=void 0;class I1e{constructor(t,n){this.title=t.title,this.key=n.key,this.type=n.type,this.values=n.values,this.scope=n.scope,this.range=n.range,this.multi=t.body.multi,this.optional=t.body.optional,"hierarchy"in n&&(this.hierarchy=n.hierarchy)}}Bg.SDKAttributeInstruction=I1e;class N1e{constructor(t){Object.assign(this,t)}}Bg.APIAttributeSectionV2=N1e;var ez;(function(e){e.OPTIONS="options",e.BOOLEAN="boolean",e.RANGE="range",e.FREE_TEXT="freeText",e.NUMBER="number"})(ez||(ez={}));var Lte={},$te={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.CustomNodeScope=e.InvokeType=void 0,function(t){t.PANEL="panel",t.FUNCTION="function",t.SCRIPT="script",t.EVENT="event"}(e.InvokeType||(e.InvokeType={})),function(t){t.GLOBAL="global",t.PROJECT="project",t.NODE="node"}(e.CustomNodeScope||(e.CustomNodeScope={}))})($te);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n($te,e)})(Lte);var jg={};Object.defineProperty(jg,"__esModule",{value:!0});jg.SDKFunctionExecution=jg.SDKExecution=void 0;class x1e{constructor(t){t&&Object.assign(this,t)}}jg.SDKExecution=x1e;class D1e{constructor(t){t&&Object.assign(this,t)}}jg.SDKFunctionExecution=D1e;var $y={};Object.defineProperty($y,"__esModule",{value:!0});$y.SDKDataset=void 0;class M1e{constructor(t){t&&Object.assign(this,t)}}$y.SDKDataset=M1e;var Bte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKContributor=e.SDKUser=e.Role=void 0,function(i){i.OWNER="owner",i.ANNOTATOR="annotator",i.DEVELOPER="engineer",i.ANNOTATION_MANAGER="annotationManager"}(e.Role||(e.Role={}));class t{constructor(o){o&&Object.assign(this,o)}}e.SDKUser=t;var n;(function(i){i.HUMAN="human",i.BOT="bot"})(n||(n={}));class r{constructor(o){o&&Object.assign(this,o)}}e.SDKContributor=r})(Bte);var ew={};Object.defineProperty(ew,"__esModule",{value:!0});ew.SDKGroup=void 0;class P1e{constructor(t){Object.assign(this,t)}}ew.SDKGroup=P1e;var tw={};Object.defineProperty(tw,"__esModule",{value:!0});tw.SDKAccount=void 0;class L1e{constructor(t){Object.assign(this,t)}}tw.SDKAccount=L1e;var nw={};Object.defineProperty(nw,"__esModule",{value:!0});nw.SDKOrg=void 0;var tz;(function(e){e.OWNER="owner",e.ADMIN="admin",e.MEMBER="member"})(tz||(tz={}));var nz;(function(e){e.SMALL="small",e.MEDIUM="medium",e.ENTERPRISE="enterprise"})(nz||(nz={}));var rz;(function(e){e.AUTOMOTIVE="automotive",e.MEDICAL="medical",e.RETAIL="retail",e.AGRICULTURE="agriculture",e.SPORTS="sports",e.AERIAL="aerialImagery",e.MEDIA="media",e.OTHER="other"})(rz||(rz={}));class $1e{constructor(t){Object.assign(this,t)}}nw.SDKOrg=$1e;var rw={};Object.defineProperty(rw,"__esModule",{value:!0});rw.SDKTask=void 0;class B1e{constructor(t){Object.assign(this,t)}}rw.SDKTask=B1e;var iw={};Object.defineProperty(iw,"__esModule",{value:!0});iw.SDKDriver=void 0;class j1e{constructor(t){t&&Object.assign(this,t)}}iw.SDKDriver=j1e;var ow={};Object.defineProperty(ow,"__esModule",{value:!0});ow.SDKIntegration=void 0;class F1e{constructor(t){t&&Object.assign(this,t)}}ow.SDKIntegration=F1e;var _2={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKPipeline=e.NodeType=e.ENodeStatus=e.EPipelineStatus=void 0,function(n){n.PENDING="pending",n.IN_PROGRESS="in-progress",n.FAILED="failed",n.SUCCESS="success",n.QUEUE="queue",n.TERMINATED="terminated",n.RERUN="rerun"}(e.EPipelineStatus||(e.EPipelineStatus={})),function(n){n.PENDING="pending",n.IN_PROGRESS="in-progress",n.FAILED="failed",n.SUCCESS="success",n.QUEUE="queue"}(e.ENodeStatus||(e.ENodeStatus={})),function(n){n.CODE="code",n.FUNCTION="function",n.TASK="task",n.MERGE="merge",n.SPLIT="split",n.ML="ml",n.STORAGE="storage",n.API="api",n.CUSTOM="custom",n.UPDATE_VARIABLE="updateVariable"}(e.NodeType||(e.NodeType={}));class t{constructor(r){Object.assign(this,r)}}e.SDKPipeline=t})(_2);var jte={};Object.defineProperty(jte,"__esModule",{value:!0});var aw={};Object.defineProperty(aw,"__esModule",{value:!0});aw.SDKPipelineExecution=void 0;class U1e{constructor(t){t&&Object.assign(this,t)}}aw.SDKPipelineExecution=U1e;var Fte={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKModel=e.LocalArtifact=e.ItemArtifact=e.ModelArtifact=e.ArtifactType=e.ModelInputType=e.ModelStatus=e.EntityScopeLevel=void 0,function(o){o.PRIVATE="private",o.PROJECT="project",o.ORG="org",o.PUBLIC="public"}(e.EntityScopeLevel||(e.EntityScopeLevel={})),function(o){o.CREATED="created",o.PRE_TRAINED="pre-trained",o.PENDING="pending",o.TRAINING="training",o.TRAINED="trained",o.DEPLOYED="deployed",o.FAILED="failed",o.CLONING="cloning"}(e.ModelStatus||(e.ModelStatus={})),function(o){o.IMAGE="image",o.VIDEO="video",o.TEXT="text",o.AUDIO="audio"}(e.ModelInputType||(e.ModelInputType={})),function(o){o.ITEM="item",o.LOCAL="local",o.LINK="link"}(e.ArtifactType||(e.ArtifactType={}));class t{constructor(a){Object.assign(this,a)}}e.ModelArtifact=t;class n extends t{constructor(a){super(a),Object.assign(this,a)}}e.ItemArtifact=n;class r extends t{constructor(a){super(a),Object.assign(this,a)}}e.LocalArtifact=r;class i{constructor(a){a&&Object.assign(this,a)}}e.SDKModel=i})(Fte);var Ute={};(function(e){Object.defineProperty(e,"__esModule",{value:!0}),e.SDKService=e.JsServiceVersions=e.Crashloop=e.CrashloopReason=e.CrashloopAction=e.OnResetAction=e.ServiceModeType=e.ServiceType=void 0,function(i){i.SYSTEM="system",i.REGULAR="regular"}(e.ServiceType||(e.ServiceType={})),function(i){i.DEBUG="debug",i.REGULAR="regular"}(e.ServiceModeType||(e.ServiceModeType={})),function(i){i.RERUN="rerun",i.FAILED="failed"}(e.OnResetAction||(e.OnResetAction={})),function(i){i.DEACTIVATE="deactivate"}(e.CrashloopAction||(e.CrashloopAction={})),function(i){i.DEPLETION="depletion"}(e.CrashloopReason||(e.CrashloopReason={}));class t{constructor(o){Object.assign(this,o)}}e.Crashloop=t;class n{constructor(o){this.dtlpy=o.dtlpy||"",this.runner=o.runner||"",this.proxy=o.proxy||"",this.verify=o.verify||!0}}e.JsServiceVersions=n;class r{constructor(o){o&&Object.assign(this,o)}}e.SDKService=r})(Ute);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(Pte,e),n(h2,e),n($b,e),n(ku,e),n(Ly,e),n(J1,e),n($b,e),n(Z1,e),n(Bg,e),n(Lte,e),n(jg,e),n($y,e),n(Py,e),n(Bte,e),n(ew,e),n(tw,e),n(nw,e),n(rw,e),n(iw,e),n(ow,e),n(_2,e),n(jte,e),n(aw,e),n(Fte,e),n(Ute,e)})(Mte);(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(r,i,o,a){a===void 0&&(a=o);var s=Object.getOwnPropertyDescriptor(i,o);(!s||("get"in s?!i.__esModule:s.writable||s.configurable))&&(s={enumerable:!0,get:function(){return i[o]}}),Object.defineProperty(r,a,s)}:function(r,i,o,a){a===void 0&&(a=o),r[a]=i[o]}),n=Zt&&Zt.__exportStar||function(r,i){for(var o in r)o!=="default"&&!Object.prototype.hasOwnProperty.call(i,o)&&t(i,r,o)};Object.defineProperty(e,"__esModule",{value:!0}),n(Dte,e),n(Mte,e),n(m2,e)})(el);Object.defineProperty(X1,"__esModule",{value:!0});X1.Attributes=void 0;const z1e=xo,V1e=el,ps=So;class G1e extends z1e.Repository{async query(t){var n;const r=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new V1e.APIAttributeSectionV2(o)),i}async get(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.READ,data:t});return await this.crudReqSync(n)}async create(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async update(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new ps.CrudMessage({scope:ps.AppMessageScope.ATTRIBUTE,crud:ps.CrudType.DELETE,data:t});await this.crudReqSync(n)}}X1.Attributes=G1e;var sw={};Object.defineProperty(sw,"__esModule",{value:!0});sw.Structures=void 0;const H1e=xo,q1e=el,hs=So;class Y1e extends H1e.Repository{async query(t){var n;const r=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new q1e.APIStructureV2(o)),i}async get(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.READ,data:t});return await this.crudReqSync(n)}async update(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.UPDATE,data:t});return await this.crudReqSync(n)}async create(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new hs.CrudMessage({scope:hs.AppMessageScope.STRUCTURE,crud:hs.CrudType.DELETE,data:t});await this.crudReqSync(n)}}sw.Structures=Y1e;var lw={};Object.defineProperty(lw,"__esModule",{value:!0});lw.Tasks=void 0;const W1e=xo,km=So;class K1e extends W1e.Repository{async get(t){const n=new km.CrudMessage({scope:km.AppMessageScope.TASK,crud:km.CrudType.READ,data:t});return await this.crudReqSync(n)}async updateAssignees(t){const n=new km.CrudMessage({scope:km.AppMessageScope.TASK,crud:km.CrudType.UPDATE_ASSIGNEES,data:{payload:t}});return await this.crudReqSync(n)}}lw.Tasks=K1e;var cw={};Object.defineProperty(cw,"__esModule",{value:!0});cw.Contributors=void 0;const Q1e=xo,Hl=So,X1e=el;class J1e extends Q1e.Repository{async get(t){const n=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.READ,data:t});return await this.crudReqSync(n)}async create(t){const n=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async delete(t){const n=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.DELETE,data:t});await this.crudReqSync(n)}async query(t){var n;const r=new Hl.CrudMessage({scope:Hl.AppMessageScope.CONTRIBUTOR,crud:Hl.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new X1e.SDKContributor(o)),i}}cw.Contributors=J1e;var uw={};Object.defineProperty(uw,"__esModule",{value:!0});uw.Datasets=void 0;const Z1e=xo,ms=So,ewe=$y;class twe extends Z1e.Repository{async create(t){const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.CREATE,data:t});return await this.crudReqSync(n)}async update(t){const{id:n}=t,r=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.UPDATE,data:{id:n,payload:t}});return await this.crudReqSync(r)}async delete(t){const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.DELETE,data:t});await this.crudReqSync(n)}async get(t){const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.READ,data:t});return await this.crudReqSync(n)}async query(){var t;const n=new ms.CrudMessage({scope:ms.AppMessageScope.DATASET,crud:ms.CrudType.QUERY}),r=await this.crudReqSync(n);return r.items=(t=r.items)===null||t===void 0?void 0:t.map(i=>new ewe.SDKDataset(i)),r}}uw.Datasets=twe;var dw={};Object.defineProperty(dw,"__esModule",{value:!0});dw.Executions=void 0;const nwe=xo,dd=So,rwe=Qa,vA=el;class iwe extends nwe.Repository{async create(t){const{functionName:n}=t;rwe.channel.log(`Creating execution for function '${n}'`);const r=new dd.CrudMessage({scope:dd.AppMessageScope.EXECUTION,crud:dd.CrudType.CREATE,data:t});return new vA.SDKExecution(await this.crudReqSync(r))}async get(t){const n=new dd.CrudMessage({scope:dd.AppMessageScope.EXECUTION,crud:dd.CrudType.READ,data:t});return new vA.SDKExecution(await this.crudReqSync(n))}async query(t){var n;const r=new dd.CrudMessage({scope:dd.AppMessageScope.EXECUTION,crud:dd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new vA.SDKExecution(o)),i}}dw.Executions=iwe;var fw={};Object.defineProperty(fw,"__esModule",{value:!0});fw.Drivers=void 0;const owe=xo,bA=So;class awe extends owe.Repository{async query(){const t=new bA.CrudMessage({scope:bA.AppMessageScope.DRIVER,crud:bA.CrudType.QUERY});return await this.crudReqSync(t)}}fw.Drivers=awe;var pw={};Object.defineProperty(pw,"__esModule",{value:!0});pw.Integrations=void 0;const swe=xo,yA=So;class lwe extends swe.Repository{async query(){const t=new yA.CrudMessage({scope:yA.AppMessageScope.INTEGRATION,crud:yA.CrudType.QUERY});return await this.crudReqSync(t)}}pw.Integrations=lwe;var By={};Object.defineProperty(By,"__esModule",{value:!0});By.SDKNavigator=void 0;const cwe=Qa,Hr=So;class uwe{constructor(t){this.agent=t}_navigate(t){try{return cwe.channel.log(`Navigation request:${t.route}`),this.agent.navigate(t)}catch(n){throw n}}projects(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.PROJECTS,options:t});this._navigate(n)}projectOverview(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.PROJECT,options:t});this._navigate(n)}datasets(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.DATASETS,options:t});this._navigate(n)}datasetBrowser(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.DATASET_BROWSER,params:[t],options:n});this._navigate(r)}projectTeam(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.PROJECT_TEAM,options:t});this._navigate(n)}tasks(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.TASKS,options:t});this._navigate(n)}taskBrowser(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.TASK_BROWSER,params:[t],options:n});this._navigate(r)}assignments(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.ASSIGNMENTS,options:t});this._navigate(n)}cloudStorage(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.CLOUD_STORAGE,options:t});this._navigate(n)}applicationHub(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.APPLICATION_HUB,options:t});this._navigate(n)}orgMembersAndGroups(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.ORG_MEMBERS_AND_GROUPS,options:t});this._navigate(n)}auditLogs(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.AUDIT_LOGS,options:t});this._navigate(n)}studio(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.STUDIO,params:[t],options:n});this._navigate(r)}recipes(t){const n=new Hr.DlNavigationMessage({route:Hr.DlRoute.RECIPES,options:t});this._navigate(n)}recipe(t,n){const r=new Hr.DlNavigationMessage({route:Hr.DlRoute.RECIPE,params:[t],options:n});this._navigate(r)}custom(t,n={}){const{params:r,options:i}=n,o=new Hr.DlNavigationMessage({route:Hr.DlRoute.CUSTOM,params:[t,r],options:i});this._navigate(o)}startline(t){const{query:n,options:r}=t,i=new Hr.DlNavigationMessage({route:Hr.DlRoute.STARTLINE,options:r,query:n});this._navigate(i)}}By.SDKNavigator=uwe;var hw={};Object.defineProperty(hw,"__esModule",{value:!0});hw.Pipelines=void 0;const dwe=xo,fd=So,SA=_2;class fwe extends dwe.Repository{async get(t){const n=new fd.CrudMessage({scope:fd.AppMessageScope.PIPELINE,crud:fd.CrudType.READ,data:t});return new SA.SDKPipeline(await this.crudReqSync(n))}async query(t){var n;const r=new fd.CrudMessage({scope:fd.AppMessageScope.PIPELINE,crud:fd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new SA.SDKPipeline(o)),i}async update(t){const n=new fd.CrudMessage({scope:fd.AppMessageScope.PIPELINE,crud:fd.CrudType.UPDATE,data:t});return new SA.SDKPipeline(await this.crudReqSync(n))}}hw.Pipelines=fwe;var mw={};Object.defineProperty(mw,"__esModule",{value:!0});mw.PipelineExecutions=void 0;const pwe=xo,pd=So,EA=el;class hwe extends pwe.Repository{async create(t){const n=new pd.CrudMessage({scope:pd.AppMessageScope.PIPELINE_EXECUTION,crud:pd.CrudType.CREATE,data:t});return new EA.SDKPipelineExecution(await this.crudReqSync(n))}async get(t,n){const r=new pd.CrudMessage({scope:pd.AppMessageScope.PIPELINE_EXECUTION,crud:pd.CrudType.READ,data:{executionId:t,pipelineId:n}});return new EA.SDKPipelineExecution(await this.crudReqSync(r))}async query(t){var n;const r=new pd.CrudMessage({scope:pd.AppMessageScope.PIPELINE_EXECUTION,crud:pd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new EA.SDKPipelineExecution(o)),i}}mw.PipelineExecutions=hwe;var gw={};Object.defineProperty(gw,"__esModule",{value:!0});gw.Models=void 0;const mwe=xo,ql=So,AE=el;class gwe extends mwe.Repository{async get(t){const n=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.READ,data:t});return new AE.SDKModel(await this.crudReqSync(n))}async query(t){var n;const r=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new AE.SDKModel(o)),i}async update(t){const n=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.UPDATE,data:t});return new AE.SDKModel(await this.crudReqSync(n))}async predict(t){const n=new ql.CrudMessage({scope:ql.AppMessageScope.MODEL,crud:ql.CrudType.PREDICT,data:t});return new AE.SDKExecution(await this.crudReqSync(n))}}gw.Models=gwe;var _w={};Object.defineProperty(_w,"__esModule",{value:!0});_w.Services=void 0;const _we=xo,hd=So,TA=el;class vwe extends _we.Repository{async get(t){const n=new hd.CrudMessage({scope:hd.AppMessageScope.SERVICE,crud:hd.CrudType.READ,data:t});return new TA.SDKService(await this.crudReqSync(n))}async update(t){const n=new hd.CrudMessage({scope:hd.AppMessageScope.SERVICE,crud:hd.CrudType.UPDATE,data:t});return new TA.SDKService(await this.crudReqSync(n))}async query(t){var n;const r=new hd.CrudMessage({scope:hd.AppMessageScope.SERVICE,crud:hd.CrudType.QUERY,data:t}),i=await this.crudReqSync(r);return i.items=(n=i.items)===null||n===void 0?void 0:n.map(o=>new TA.SDKService(o)),i}}_w.Services=vwe;var bwe=Zt&&Zt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(Lb,"__esModule",{value:!0});Lb.xFrameDriver=void 0;const ywe=So,Swe=H1,Ewe=bwe(wp.exports),Twe=q1,Cwe=Y1,wwe=W1,Owe=K1,Rwe=Q1,Awe=p2,kwe=X1,Iwe=sw,Nwe=lw,xwe=cw,Dwe=uw,Mwe=dw,Pwe=fw,Lwe=Qa,$we=pw,Bwe=By,jwe=hw,Fwe=mw,Uwe=gw,zwe=_w;class Vwe extends Ewe.default{async init(){await this._initGuestApp(),this._initRepos(),this._initNavigator()}async _initGuestApp(){this._guestApp=new ywe.GuestApp,await this._guestApp.init(),this.agent=this._guestApp.agent,this._guestApp.on("ready",()=>{this.emit("ready")}),this._guestApp.on("data",t=>{this.emit("data",t)}),this._guestApp.on("event",t=>{this.emit(t.data.name,t.data.payload,t.source)}),this._guestApp.on("navigation",t=>{this.emit("navigation",t.data,t.source)})}sendEvent(t){this.agent.sendEvent(t)}_initRepos(){this.projects=new Swe.Projects(this.agent),this.annotations=new Twe.Annotations(this.agent),this.items=new Cwe.Items(this.agent),this.settings=new Awe.AppSettings(this.agent),this.recipes=new wwe.Recipes(this.agent),this.ontologies=new Owe.Ontologies(this.agent),this.labels=new Rwe.Labels(this.agent),this.attributes=new kwe.Attributes(this.agent),this.structures=new Iwe.Structures(this.agent),this.tasks=new Nwe.Tasks(this.agent),this.contributors=new xwe.Contributors(this.agent),this.datasets=new Dwe.Datasets(this.agent),this.executions=new Mwe.Executions(this.agent),this.drivers=new Pwe.Drivers(this.agent),this.integrations=new $we.Integrations(this.agent),this.pipelines=new jwe.Pipelines(this.agent),this.pipelineExecutions=new Fwe.PipelineExecutions(this.agent),this.models=new Uwe.Models(this.agent),this.services=new zwe.Services(this.agent)}_initNavigator(){this.navigator=new Bwe.SDKNavigator(this.agent)}get logger(){return Lwe.channel}}Lb.xFrameDriver=Vwe;var vw={},bw={},Qd={};Object.defineProperty(Qd,"__esModule",{value:!0});Qd.BaseData=void 0;class Gwe{constructor(t){this._data=null,this._data=t}}Qd.BaseData=Gwe;Object.defineProperty(bw,"__esModule",{value:!0});bw.Items=void 0;const iz=el,Hwe=Qd;class qwe extends Hwe.BaseData{async get(t){var n,r,i;if(!t)return new iz.SDKItem((n=this._data)===null||n===void 0?void 0:n.item);const o=(i=(r=this._data)===null||r===void 0?void 0:r.datasetItems)===null||i===void 0?void 0:i.find(a=>a.id===t);return o?new iz.SDKItem(o):void 0}async delete(t){this._data.datasetItems=this._data.datasetItems.filter(n=>n.id!==t)}async update(t){const n=this._data.datasetItems.findIndex(r=>r.id===t.id);return this._data.datasetItems[n]=Object.assign({},this._data.datasetItems[n],t),this._data.datasetItems[n]}}bw.Items=qwe;var yw={};Object.defineProperty(yw,"__esModule",{value:!0});yw.Annotations=void 0;const Ywe=el,Wwe=Qd;class Kwe extends Wwe.BaseData{async query(){return Object.assign(Object.assign({},this._data.annotations),{items:this._data.annotations.items.map(t=>new Ywe.SDKAnnotation(t))})}async logs(){return this._data.annotationLogs}}yw.Annotations=Kwe;var Sw={};Object.defineProperty(Sw,"__esModule",{value:!0});Sw.Tasks=void 0;const Qwe=el,Xwe=Qd;class Jwe extends Xwe.BaseData{async get(t){var n;return new Qwe.SDKTask((n=this._data)===null||n===void 0?void 0:n.task)}}Sw.Tasks=Jwe;var Ew={};Object.defineProperty(Ew,"__esModule",{value:!0});Ew.AppSettings=void 0;const Zwe=Qd;class eOe extends Zwe.BaseData{async get(){return this._data.settings}}Ew.AppSettings=eOe;var Tw={};Object.defineProperty(Tw,"__esModule",{value:!0});Tw.Datasets=void 0;const tOe=Qd,kE=el,nOe=Dy;class rOe extends tOe.BaseData{async get(t){var n,r,i,o;if(!t)return new kE.SDKDataset((n=this._data)===null||n===void 0?void 0:n.dataset);const a=(o=(i=(r=this._data)===null||r===void 0?void 0:r.datasets)===null||i===void 0?void 0:i.items)===null||o===void 0?void 0:o.find(s=>s.id===t);return a?new kE.SDKDataset(a):void 0}async create(t){const n=new kE.SDKDataset({id:(0,nOe.v4)(),name:t.name});return this._data.datasets.items.push(n),this._data.datasets.totalItemsCount+=1,n}async delete(t){this._data.datasets.items=this._data.datasets.items.filter(n=>n.id!==t),this._data.datasets.totalItemsCount-=1}async query(){return Object.assign(Object.assign({},this._data.datasets),{items:this._data.datasets.items.map(t=>new kE.SDKDataset(t))})}}Tw.Datasets=rOe;var Cw={};Object.defineProperty(Cw,"__esModule",{value:!0});Cw.Contributors=void 0;const iOe=Qd,oz=el;class oOe extends iOe.BaseData{async get(t){var n,r;return((r=(n=this._data)===null||n===void 0?void 0:n.contributors)===null||r===void 0?void 0:r.items).find(o=>o.id===t)}async create(t){const n=new oz.SDKContributor({id:t.email,email:t.email,role:t.role});return this._data.contributors.items.push(n),this._data.contributors.totalItemsCount+=1,n}async delete(t){this._data.contributors.items=this._data.contributors.items.filter(n=>n.id!==t),this._data.contributors.totalItemsCount-=1}async query(){return Object.assign(Object.assign({},this._data.contributors),{items:this._data.contributors.items.map(t=>new oz.SDKContributor(t))})}}Cw.Contributors=oOe;var aOe=Zt&&Zt.__importDefault||function(e){return e&&e.__esModule?e:{default:e}};Object.defineProperty(vw,"__esModule",{value:!0});vw.DlMockDriver=void 0;const sOe=aOe(wp.exports),lOe=bw,cOe=yw,uOe=Sw,dOe=Ew,fOe=Tw,pOe=Cw;class hOe extends sOe.default{constructor(t){super(),this.items=new lOe.Items(t),this.annotations=new cOe.Annotations(t),this.tasks=new uOe.Tasks(t),this.settings=new dOe.AppSettings(t),this.datasets=new fOe.Datasets(t),this.contributors=new pOe.Contributors(t)}}vw.DlMockDriver=hOe;(function(e){var t=Zt&&Zt.__createBinding||(Object.create?function(o,a,s,l){l===void 0&&(l=s);var c=Object.getOwnPropertyDescriptor(a,s);(!c||("get"in c?!a.__esModule:c.writable||c.configurable))&&(c={enumerable:!0,get:function(){return a[s]}}),Object.defineProperty(o,l,c)}:function(o,a,s,l){l===void 0&&(l=s),o[l]=a[s]}),n=Zt&&Zt.__exportStar||function(o,a){for(var s in o)s!=="default"&&!Object.prototype.hasOwnProperty.call(a,s)&&t(a,o,s)};Object.defineProperty(e,"__esModule",{value:!0}),e.initializeFrameDriver=void 0,n(mte,e),n(So,e),n(p2,e),n(Lb,e),n(el,e),n(vw,e),n(g2,e),n(By,e);const r=Lb,i=async()=>{try{const o=new r.xFrameDriver;await o.init(),window&&(window.dl=o)}catch(o){throw console.error("Error initializing xFrameDriver",o),o}};e.initializeFrameDriver=i})(Km);const mOe={id:"panel"},gOe={style:{width:"100% font-size: 10px"}},_Oe=ue("div",{style:{width:"20px"}},null,-1),vOe={id:"item-metadata-section"},bOe=dt({__name:"Panel",props:{component:null,readonly:{type:Boolean},addItemMetadata:{type:Boolean}},emits:["addItemMetadata"],setup(e,{emit:t}){const n=e,r=Fd(n,"component"),i=Fd(n,"readonly"),o=5,a=2,s=100,Q=["random","hash","quota"],l=we(Mc.DefaultValues.name),c=we(Mc.DefaultValues.distributeEqually);we(!1);const u=we(Mc.DefaultValues.groups),y=we(Mc.DefaultValues.assignment),D=we(Mc.DefaultValues.hashSalt),R=we(Mc.DefaultValues.stratifyLabels),F=we(Mc.DefaultValues.quotaSyncEvery),d=re({get:()=>n.addItemMetadata,set:A=>{t("addItemMetadata",A)}});re(()=>u.value.length<o),re(()=>u.value.length>a),Wh(()=>{window.dl.agent.sendEvent({name:"app:setHeight",payload:document.body.scrollHeight})});const f=re(()=>{const A=u.value.map(I=>({...I,distribution:Number(I.distribution)}));return gA(ut.exports.sumBy(A,"distribution"))}),p=re(()=>f.value>s),h=re(()=>f.value<s),m=re(()=>gA(s-f.value)),_=re(()=>Math.abs(m.value)),v=ut.exports.debounce(A=>{const I=ut.exports.cloneDeep(u.value);I[A].distribution=gA(Math.max(Math.min(Number(I[A].distribution),s),0)),Object.assign(u.value,I)},0),b=(A,I)=>{try{if(typeof A!="string")return;const O=ut.exports.cloneDeep(u.value);O[I].name=(A==null?void 0:A.replace(/[^\w_]/g,""))||"",Object.assign(u.value,O)}catch(O){console.log("Failed to validate group name",{error:O})}},G=()=>{F.value=Math.max(Math.round(Number(F.value))||1,1)};re(()=>!h.value&&!p.value);const S=re(()=>u.value.every(A=>!!A.name.length)),E=re(()=>{if(!l.value.length)return"Node name is required";if(!l.value.match(/^[a-zA-Z0-9_\- ]+$/))return"Node name can only contain letters, numbers, underscores, hyphens and spaces"}),T=()=>{l.value=l.value.trim()},w=re(()=>{const A=[];return(p.value||h.value)&&A.push({message:"Distribution must equal 100%",suggestion:"Please adjust the distribution"}),E.value&&A.push({message:"Node name error",suggestion:"Please adjust the node name"}),S.value||A.push({message:"Group name is required",suggestion:"Please adjust the group name"}),A}),C=re(()=>({valid:w.value.length===0,errors:w.value})),k=ut.exports.debounce(async()=>{var I,O;const A=new Mc({name:l.value.trim(),groups:u.value,distributeEqually:c.value,validation:C.value,itemMetadata:d.value,assignment:y.value,hashSalt:D.value,stratifyLabels:R.value,quotaSyncEvery:F.value});try{r.value.metadata.customNodeConfig=A,r.value.outputs=[{portId:(I=r.value.outputs[0].portId)!=null?I:fg(),actions:(O=A.groups.filter(N=>N.name.trim()!=="").map(N=>N.name))!=null?O:[],name:"item",nodeId:r.value.id,type:"Item"}],await window.dl.agent.sendEvent({name:Km.DlFrameEvent.UPDATE_NODE_CONFIG,payload:r.value})}catch(N){console.error("Failed to send event",{error:N})}},200);return Bt([l,u,c,C,d,y,D,R,F],k,{deep:!0}),Bt(r,()=>{var I,O,N,M,x;const A=(I=r.value)==null?void 0:I.metadata.customNodeConfig;l.value=A.name,u.value=A.groups,c.value=A.distributeEqually,y.value=(O=A.assignment)!=null?O:Mc.DefaultValues.assignment,D.value=(N=A.hashSalt)!=null?N:Mc.DefaultValues.hashSalt,R.value=(M=A.stratifyLabels)!=null?M:Mc.DefaultValues.stratifyLabels,F.value=(x=A.quotaSyncEvery)!=null?x:Mc.DefaultValues.quotaSyncEvery}),(A,I)=>{const O=Te("dl-input"),N=Te("dl-typography"),M=Te("dl-checkbox"),x=Te("dl-item-section"),B=Te("dl-list-item"),P=Te("dl-icon"),L=Te("dl-list"),H=Te("dl-tooltip"),V=Te("dl-select");return U(),J("div",mOe,[ve(O,{dense:"",style:{width:"100%","padding-bottom":"20px"},placeholder:"Insert node name",error:!!wo(E),"error-message":wo(E),modelValue:wo(l),"onUpdate:modelValue":I[0]||(I[0]=j=>Ki(l)?l.value=j:null),title:"Node Name","red-asterisk":"",required:"",onBlur:T,disabled:wo(i)},null,8,["error","error-message","modelValue","disabled"]),ue("div",null,[ve(N,{size:"12px",color:"dl-color-darker"},{default:Re(()=>[yt("Subsets Distribution")]),_:1}),ve(N,{color:"dl-color-medium",style:{"margin-top":"6px"},size:"10px"},{default:Re(()=>[yt(" Refine the model data distribution into training, validation, and test subsets ")]),_:1}),ve(M,{style:{"margin-top":"18px"},modelValue:wo(c),"onUpdate:modelValue":I[1]||(I[1]=j=>Ki(c)?c.value=j:null),label:"Distribute equally",disabled:wo(i)},null,8,["modelValue","disabled"]),ve(L,{padding:"0"},{default:Re(()=>[ve(B,{padding:"0",class:"container"},{default:Re(()=>[ve(x,{color:"dl-color-medium",class:"item"},{default:Re(()=>[yt("Subset Name")]),_:1}),ve(x,{color:"dl-color-medium",class:"item-2"},{default:Re(()=>[yt("Distribution")]),_:1})]),_:1}),(U(!0),J(pn,null,_n(wo(u),(j,z)=>(U(),Ge(B,{padding:"0",key:j.id,height:"fit-content",class:"container",id:"groups-distribution",style:{"margin-bottom":"10px","align-items":"start"}},{default:Re(()=>[ve(x,{class:"item"},{default:Re(()=>[ve(O,Pn({"disable-clear-btn":"",modelValue:j.name,"onUpdate:modelValue":q=>j.name=q,placeholder:"Insert group name",error:j.name.length===0,"error-message":"Group name is required",dense:"",disabled:wo(i)},{disabled:!0},{onInput:q=>b(q,z),onChange:q=>b(q,z)}),null,16,["modelValue","onUpdate:modelValue","error","disabled","onInput","onChange"])]),_:2},1024),ve(x,{class:"item-2",style:{display:"flex","align-items":"center",gap:"10px"}},{default:Re(()=>[ve(O,{style:{width:"100%"},"disable-clear-btn":"",type:"number",error:wo(p),warning:wo(h),disabled:wo(c),modelValue:j.distribution,"onUpdate:modelValue":q=>j.distribution=q,modelModifiers:{number:!0},onBlur:q=>wo(v)(z),dense:""},{append:Re(()=>[yt(" % ")]),_:2},1032,["error","warning","disabled","modelValue","onUpdate:modelValue","onBlur"])]),_:2},1024)]),_:2},1024))),128)),ve(B,{padding:"0"},{default:Re(()=>[ve(x,{style:{gap:"5px","text-align":"right"}},{default:Re(()=>[ue("div",gOe,[ve(N,{color:"dl-color-darker"},{default:Re(()=>[yt(ot(wo(f))+"% ",1)]),_:1}),wo(h)?(U(),Ge(N,{key:0,color:"dl-color-warning"},{default:Re(()=>[ve(P,{icon:"icon-dl-alert-filled"}),yt(" "+ot(wo(m))+"% Remaining ",1)]),_:1})):wo(p)?(U(),Ge(N,{key:1,color:"dl-color-negative"},{default:Re(()=>[ve(P,{icon:"icon-dl-error-filled"}),yt(" "+ot(wo(_))+" Exceeding ",1)]),_:1})):(U(),Ge(N,{key:2,color:"dl-color-lighter"},{default:Re(()=>[yt(" Total distribution ")]),_:1}))]),_Oe]),_:1})]),_:1})]),_:1})]),ve(B,{bordered:"",style:{"margin-top":"20px"},height:"20px"}),ue("div",{id:"assignment-section"},[ve(N,{size:"12px",color:"dl-color-darker"},{default:Re(()=>[yt(" Subset Assignment "),ve(P,{icon:"icon-dl-info",size:"13px",color:"dell-blue-500"}),ve(H,null,{default:Re(()=>[yt(" random: draw a subset by the distribution. hash: the same item always gets the same subset. quota: keep counters of the assigned items so the subsets match the distribution exactly ")]),_:1})]),_:1}),ve(V,{style:{"margin-top":"10px"},modelValue:wo(y),"onUpdate:modelValue":I[3]||(I[3]=j=>Ki(y)?y.value=j:null),options:Q,disabled:wo(i)},null,8,["modelValue","disabled"]),wo(y)==="hash"?(U(),Ge(O,{key:0,dense:"",style:{width:"100%","margin-top":"10px"},title:"Hash Salt",placeholder:"Changing the salt reshuffles the split",modelValue:wo(D),"onUpdate:modelValue":I[4]||(I[4]=j=>Ki(D)?D.value=j:null),disabled:wo(i)},null,8,["modelValue","disabled"])):he("",!0),wo(y)==="quota"?(U(),J(pn,{key:1},[ve(M,{style:{"margin-top":"10px"},modelValue:wo(R),"onUpdate:modelValue":I[5]||(I[5]=j=>Ki(R)?R.value=j:null),label:"Balance the labels between the subsets",disabled:wo(i)},null,8,["modelValue","disabled"]),ve(O,{dense:"",style:{width:"100%","margin-top":"10px"},type:"number",title:"Assignments between counter syncs",modelValue:wo(F),"onUpdate:modelValue":I[6]||(I[6]=j=>Ki(F)?F.value=j:null),modelModifiers:{number:!0},onBlur:G,disabled:wo(i)},null,8,["modelValue","disabled"])],64)):he("",!0)]),ve(B,{bordered:"",style:{"margin-top":"20px"},height:"20px"}),ue("div",vOe,[ve(N,{size:"12px",color:"dl-color-darker"},{default:Re(()=>[yt(" Item Tags "),ve(P,{icon:"icon-dl-info",size:"13px",color:"dell-blue-500"}),ve(H,null,{default:Re(()=>[yt(" Add a tag to each item according to its assigned subset group. The tag will be added to a dictionary under item.metadata.system.tags in the following format: tags = {\u201Csubset name\u201D: true} ")]),_:1})]),_:1}),ve(M,Pn({style:{"margin-top":"10px"},modelValue:wo(d),"onUpdate:modelValue":I[2]||(I[2]=j=>Ki(d)?d.value=j:null),label:"Tag items based on their assigned subset name",disabled:wo(i)},{disabled:!0}),null,16,["modelValue","disabled"])])])}}}),yOe={class:"full-screen"},SOe=dt({__name:"App",setup(e){const t=we(null),n=we("light"),r=we(!1),i=we(!0);return pi(()=>{try{window.dl.init();const o=window.dl;o.on(Km.DlEvent.READY,async()=>{try{const a=await o.settings.get();n.value=a.theme,r.value=a.readonly==="view"}catch(a){throw new Error("Error getting settings",a)}o.on(Km.DlEvent.THEME,a=>{n.value=a}),o.on("pipelineReadonly",({mode:a})=>{r.value=a==="view"}),o.on(Km.DlEvent.NODE_CONFIG,async a=>{var s,l,c,u;try{a.metadata.customNodeConfig||(a.metadata.customNodeConfig=Mc.DefaultValues),t.value=new YU(YU.fromJSON(a)),i.value=(u=(c=(l=(s=t.value)==null?void 0:s.metadata)==null?void 0:l.customNodeConfig)==null?void 0:c.itemMetadata)!=null?u:!1,console.info("Node Config Event",a),await window.dl.agent.sendEvent({name:Km.DlFrameEvent.UPDATE_NODE_CONFIG,payload:t.value})}catch(d){throw new Error("Error creating NodeConfig from nodeConfig event",d)}})})}catch(o){console.error("Error initializing xFrameDriver",o)}}),(o,a)=>{const s=Te("dl-theme-provider");return U(),Ge(s,{"is-dark":n.value==="dark"},{default:Re(()=>[ue("div",yOe,[ve(bOe,{component:t.value,readonly:r.value,addItemMetadata:i.value,onAddItemMetadata:a[0]||(a[0]=l=>i.value=l)},null,8,["component","readonly","addItemMetadata"])])]),_:1},8,["is-dark"])}}});var IE,EOe=new Uint8Array(16);function TOe(){if(!IE&&(IE=typeof crypto<"u"&&crypto.getRandomValues&&crypto.getRandomValues.bind(crypto)||typeof msCrypto<"u"&&typeof msCrypto.getRandomValues=="function"&&msCrypto.getRandomValues.bind(msCrypto),!IE))throw new Error("crypto.getRandomValues() not supported. See https://github.com/uuidjs/uuid#getrandomvalues-not-supported");return IE(EOe)}const COe=/^(?:[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}|00000000-0000-0000-0000-000000000000)$/i;function wOe(e){return typeof e=="string"&&COe.test(e)}var ha=[];for(var CA=0;CA<256;++CA)ha.push((CA+256).toString(16).substr(1));function OOe(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,n=(ha[e[t+0]]+ha[e[t+1]]+ha[e[t+2]]+ha[e[t+3]]+"-"+ha[e[t+4]]+ha[e[t+5]]+"-"+ha[e[t+6]]+ha[e[t+7]]+"-"+ha[e[t+8]]+ha[e[t+9]]+"-"+ha[e[t+10]]+ha[e[t+11]]+ha[e[t+12]]+ha[e[t+13]]+ha[e[t+14]]+ha[e[t+15]]).toLowerCase();if(!wOe(n))throw TypeError("Stringified UUID is invalid");return n}function an(e,t,n){e=e||{};var r=e.random||(e.rng||TOe)();if(r[6]=r[6]&15|64,r[8]=r[8]&63|128,t){n=n||0;for(var i=0;i<16;++i)t[n+i]=r[i];return t}return OOe(r)}var v2=!1,ROe=!0,AOe=void 0;function kOe(){}function IOe(e,t,n){return Array.isArray(e)?(e.length=Math.max(e.length,t),e.splice(t,1,n),n):(e[t]=n,n)}function NOe(e,t){if(Array.isArray(e)){e.splice(t,1);return}delete e[t]}const zte=Object.freeze(Object.defineProperty({__proto__:null,set:IOe,del:NOe,Vue:dCe,Vue2:AOe,isVue2:v2,isVue3:ROe,install:kOe,EffectScope:f1,ReactiveEffect:d_,customRef:zZ,effect:RZ,effectScope:EZ,getCurrentScope:NL,isProxy:v1,isReactive:Yf,isReadonly:op,isRef:Ki,isShallow:Mg,markRaw:b1,onScopeDispose:CZ,proxyRefs:S1,reactive:Ka,readonly:g1,ref:we,shallowReactive:ML,shallowReadonly:jZ,shallowRef:Dd,stop:AZ,toRaw:Vn,toRef:Fd,toRefs:zr,triggerRef:UZ,unref:wo,camelize:ws,capitalize:u_,normalizeClass:et,normalizeProps:cn,normalizeStyle:qe,toDisplayString:ot,toHandlerKey:lg,BaseTransition:A1,Comment:Ta,Fragment:pn,KeepAlive:iee,Static:Wf,Suspense:JZ,Teleport:gee,Text:sp,assertNumber:HZ,callWithAsyncErrorHandling:Ks,callWithErrorHandling:$u,cloneVNode:Kc,compatUtils:Vee,computed:re,createBlock:Ge,createCommentVNode:he,createElementBlock:J,createElementVNode:ue,createHydrationRenderer:ZL,createPropsRestProxy:$ee,createRenderer:JL,createSlots:ra,createStaticVNode:N1,createTextVNode:yt,createVNode:ve,defineAsyncComponent:ree,defineComponent:dt,defineEmits:Iee,defineExpose:Nee,defineProps:kee,get devtools(){return lh},getCurrentInstance:$i,getTransitionRawChildren:Ay,guardReactiveProps:nr,h:g_,handleError:Cp,initCustomFormatter:jee,inject:Ch,isMemoSame:i2,isRuntimeOnly:Oee,isVNode:Ud,mergeDefaults:Lee,mergeProps:Pn,nextTick:Ar,onActivated:Iy,onBeforeMount:h_,onBeforeUnmount:bo,onBeforeUpdate:VL,onDeactivated:Ny,onErrorCaptured:YL,onMounted:pi,onRenderTracked:qL,onRenderTriggered:HL,onServerPrefetch:GL,onUnmounted:Ku,onUpdated:Wh,openBlock:U,popScopeId:Aa,provide:O1,pushScopeId:Ra,queuePostFlushCb:T1,registerRuntimeCompiler:wee,renderList:_n,renderSlot:Qe,resolveComponent:Te,resolveDirective:m_,resolveDynamicComponent:Gu,resolveFilter:zee,resolveTransitionHooks:Dh,setBlockTracking:NT,setDevtoolsHook:BL,setTransitionHooks:ap,ssrContextKey:n2,ssrUtils:Uee,toHandlers:Md,transformVNodeArgs:yee,useAttrs:Mee,useSSRContext:r2,useSlots:Dee,useTransitionState:R1,version:o2,warn:GZ,watch:Bt,watchEffect:UL,watchPostEffect:zL,watchSyncEffect:eee,withAsyncContext:Bee,withCtx:Re,withDefaults:xee,withDirectives:Oo,withMemo:Fee,withScopeId:QZ,Transition:Kd,TransitionGroup:ete,VueElement:xy,createApp:u2,createSSRApp:ate,defineCustomElement:a2,defineSSRCustomElement:Gee,hydrate:c2,initDirectivesForSSR:lte,render:DT,useCssModule:Hee,useCssVars:qee,vModelCheckbox:D1,vModelDynamic:l2,vModelRadio:M1,vModelSelect:s2,vModelText:Ph,vShow:_a,withKeys:up,withModifiers:mc,compile:cte},Symbol.toStringTag,{value:"Module"}));class xOe{constructor(t){this._name=t}}const eF=class extends xOe{_shouldLogLevel(t){const n=["non","error","warn","info","debug"];return n.indexOf(t)<=n.indexOf(eF.LOG_LEVEL)}constructor(t){super(t)}_timestamp(){return new Date().toISOString()}_logMessage(t,n,r){n=`[${this._timestamp()}] [${this._name}] - ${n}`,r?console[t](n,r):console[t](n)}debug(t,n){this._shouldLogLevel("debug")&&this._logMessage("debug",t,n)}info(t,n){this._shouldLogLevel("info")&&this._logMessage("log",t,n)}warn(t,n){this._shouldLogLevel("warn")&&this._logMessage("warn",t,n)}error(t,n){this._shouldLogLevel("error")&&this._logMessage("error",t,n)}};let q0=eF;Un(q0,"LOG_LEVEL","debug");const b2=e=>new q0(e),sM=e=>Math.round(e*(25/12)),DOe=e=>e*.5,y2=e=>Math.round(e/12),lM=e=>e-y2(e)*2,MOe=e=>sM(e)-y2(e)-lM(e),POe=e=>(e==null?void 0:e.offsetHeight)<(e==null?void 0:e.scrollHeight)||(e==null?void 0:e.offsetWidth)<(e==null?void 0:e.scrollWidth)||!1,og=class{constructor(){Un(this,"_state",null);Un(this,"logger",null);this._state=Ka({theme:"light",locale:"en",disableDebounce:!1}),this.logger=b2("DlComponents")}static get instance(){return og._instance===null&&(og._instance=new og),og._instance}get state(){return this._state}get theme(){return this._state.theme}set theme(t){this._state.theme=t}get disableDebounce(){return this._state.disableDebounce}set disableDebounce(t){this._state.disableDebounce=t}get isDarkTheme(){return this._state.theme==="dark"}get isLightTheme(){return this._state.theme==="light"}};let mg=og;Un(mg,"_instance",null);const Yi=mg.instance;window.DlComponents=mg.instance;const dp={hasPassive:!1,passiveCapture:!0,notPassiveCapture:!0};try{const e=Object.defineProperty({},"passive",{get(){Object.assign(dp,{hasPassive:!0,passive:{passive:!0},notPassive:{passive:!1},passiveCapture:{passive:!0,capture:!0},notPassiveCapture:{passive:!1,capture:!0}})}})}catch(e){Yi.logger.warn("Unknown Error Occured",e)}function uc(e){e.cancelable&&e.preventDefault(),e.stopPropagation()}function LOe(){}function $Oe(e){return e.button===0}function Fg(e){return e.touches&&e.touches[0]?e=e.touches[0]:e.changedTouches&&e.changedTouches[0]?e=e.changedTouches[0]:e.targetTouches&&e.targetTouches[0]&&(e=e.targetTouches[0]),{top:e.clientY,left:e.clientX}}function Y0(e){e.stopPropagation()}function MT(e){e.cancelable!==!1&&e.preventDefault()}function Lf(e,t,n){const r=`__dl_${t}_evt`;e[r]=e[r]?e[r].concat(n):n,n.forEach(i=>{i[0].addEventListener(i[1],e[i[2]],dp[i[3]])})}function Ug(e,t){const n=`__dl_${t}_evt`;e[n]&&(e[n].forEach(r=>{r[0].removeEventListener(r[1],e[r[2]],dp[r[3]])}),e[n]=null)}const Vte={aliceblue:"#f0f8ff",antiquewhite:"#faebd7",aqua:"#00ffff",aquamarine:"#7fffd4",azure:"#f0ffff",beige:"#f5f5dc",bisque:"#ffe4c4",black:"#000000",blanchedalmond:"#ffebcd",blue:"#0000ff",blueviolet:"#8a2be2",brown:"#a52a2a",burlywood:"#deb887",cadetblue:"#5f9ea0",chartreuse:"#7fff00",chocolate:"#d2691e",coral:"#ff7f50",cornflowerblue:"#6495ed",cornsilk:"#fff8dc",crimson:"#dc143c",cyan:"#00ffff",darkblue:"#00008b",darkcyan:"#008b8b",darkgoldenrod:"#b8860b",darkgray:"#a9a9a9",darkgreen:"#006400",darkgrey:"#a9a9a9",darkkhaki:"#bdb76b",darkmagenta:"#8b008b",darkolivegreen:"#556b2f",darkorange:"#ff8c00",darkorchid:"#9932cc",darkred:"#8b0000",darksalmon:"#e9967a",darkseagreen:"#8fbc8f",darkslateblue:"#483d8b",darkslategray:"#2f4f4f",darkslategrey:"#2f4f4f",darkturquoise:"#00ced1",darkviolet:"#9400d3",deeppink:"#ff1493",deepskyblue:"#00bfff",dimgray:"#696969",dimgrey:"#696969",dodgerblue:"#1e90ff",firebrick:"#b22222",floralwhite:"#fffaf0",forestgreen:"#228b22",fuchsia:"#ff00ff",gainsboro:"#dcdcdc",ghostwhite:"#f8f8ff",goldenrod:"#daa520",gold:"#ffd700",gray:"#808080",green:"#008000",greenyellow:"#adff2f",grey:"#808080",honeydew:"#f0fff0",hotpink:"#ff69b4",indianred:"#cd5c5c",indigo:"#4b0082",ivory:"#fffff0",khaki:"#f0e68c",lavenderblush:"#fff0f5",lavender:"#e6e6fa",lawngreen:"#7cfc00",lemonchiffon:"#fffacd",lightblue:"#add8e6",lightcoral:"#f08080",lightcyan:"#e0ffff",lightgoldenrodyellow:"#fafad2",lightgray:"#d3d3d3",lightgreen:"#90ee90",lightgrey:"#d3d3d3",lightpink:"#ffb6c1",lightsalmon:"#ffa07a",lightseagreen:"#20b2aa",lightskyblue:"#87cefa",lightslategray:"#778899",lightslategrey:"#778899",lightsteelblue:"#b0c4de",lightyellow:"#ffffe0",lime:"#00ff00",limegreen:"#32cd32",linen:"#faf0e6",magenta:"#ff00ff",maroon:"#800000",mediumaquamarine:"#66cdaa",mediumblue:"#0000cd",mediumorchid:"#ba55d3",mediumpurple:"#9370db",mediumseagreen:"#3cb371",mediumslateblue:"#7b68ee",mediumspringgreen:"#00fa9a",mediumturquoise:"#48d1cc",mediumvioletred:"#c71585",midnightblue:"#191970",mintcream:"#f5fffa",mistyrose:"#ffe4e1",moccasin:"#ffe4b5",navajowhite:"#ffdead",navy:"#000080",oldlace:"#fdf5e6",olive:"#808000",olivedrab:"#6b8e23",orange:"#ffa500",orangered:"#ff4500",orchid:"#da70d6",palegoldenrod:"#eee8aa",palegreen:"#98fb98",paleturquoise:"#afeeee",palevioletred:"#db7093",papayawhip:"#ffefd5",peachpuff:"#ffdab9",peru:"#cd853f",pink:"#ffc0cb",plum:"#dda0dd",powderblue:"#b0e0e6",purple:"#800080",rebeccapurple:"#663399",red:"#ff0000",rosybrown:"#bc8f8f",royalblue:"#4169e1",saddlebrown:"#8b4513",salmon:"#fa8072",sandybrown:"#f4a460",seagreen:"#2e8b57",seashell:"#fff5ee",sienna:"#a0522d",silver:"#c0c0c0",skyblue:"#87ceeb",slateblue:"#6a5acd",slategray:"#708090",slategrey:"#708090",snow:"#fffafa",springgreen:"#00ff7f",steelblue:"#4682b4",tan:"#d2b48c",teal:"#008080",thistle:"#d8bfd8",tomato:"#ff6347",turquoise:"#40e0d0",violet:"#ee82ee",wheat:"#f5deb3",white:"#ffffff",whitesmoke:"#f5f5f5",yellow:"#ffff00",yellowgreen:"#9acd32"},BOe=[...Object.keys(Vte)],jOe=/(?:#|0x)(?:[A-Fa-f0-9]{3}|[A-Fa-f0-9]{6})\b|(?:rgb|hsl)a?\([^\)]*\)/,tn=(e,t)=>jOe.test(e)||BOe.includes(e==null?void 0:e.toLowerCase())?e:e?e.includes("var(--")?e:`var(--${e}, var(--${t||"dell-gray-800"}))`:`var(--${t||"dell-gray-800"})`;function Iu(e,t){return e.includes(t)}const nc={PGDOWN:34,LEFT:37,DOWN:40,PGUP:33,RIGHT:39,UP:38},cM=Object.values(nc),Gte={directive:"wave",color:"currentColor",initialOpacity:.2,finalOpacity:.1,duration:.4,dissolveDuration:.15,easing:"ease-out",cancellationPeriod:75,trigger:"auto",tagName:"div"},FOe=e=>"config"in e&&"globalProperties"in e.config,UOe=e=>{let t;return e==="vue2"?t=!1:e==="vue3"?t=!0:t=FOe(e),t?{mounted:"mounted",updated:"updated"}:{mounted:"inserted",updated:"componentUpdated"}},Hte=e=>typeof e=="string"&&e!=="auto",az=(e,t)=>{e.dataset.vWaveBoundary=Hte(t)?t:"true"},zOe=({borderTopLeftRadius:e,borderTopRightRadius:t,borderBottomLeftRadius:n,borderBottomRightRadius:r},i)=>{const o=document.createElement(i);return o.style.top="0",o.style.left="0",o.style.width="100%",o.style.height="100%",o.style.display="block",o.style.position="absolute",o.style.borderRadius=`${e} ${t} ${r} ${n}`,o.style.overflow="hidden",o.style.pointerEvents="none",o.style.webkitMaskImage="-webkit-radial-gradient(white, black)",o},VOe=(e,t,n,r)=>{const i=document.createElement("div");return i.style.position="absolute",i.style.width=`${n}px`,i.style.height=`${n}px`,i.style.top=`${t}px`,i.style.left=`${e}px`,i.style.background=r.color,i.style.borderRadius="50%",i.style.opacity=`${r.initialOpacity}`,i.style.transform="translate(-50%,-50%) scale(0)",i.style.transition=`transform ${r.duration}s ${r.easing}, opacity ${r.duration}s ${r.easing}`,i};function NE(e,t,n,r){const i=e-n,o=t-r;return Math.sqrt(i*i+o*o)}function GOe(e,t,{width:n,height:r}){const i=NE(e,t,0,0),o=NE(e,t,n,0),a=NE(e,t,0,r),s=NE(e,t,n,r);return Math.max(i,o,a,s)}const HOe=({x:e,y:t},{top:n,left:r})=>({x:e-r,y:t-n}),S2="vWaveCountInternal";function qOe(e){const t=E2(e);qte(e,t+1)}function YOe(e){const t=E2(e);qte(e,t-1)}function qte(e,t){e.dataset[S2]=t.toString()}function E2(e){var t;return parseInt((t=e.dataset[S2])!==null&&t!==void 0?t:"0",10)}function WOe(e){delete e.dataset[S2]}const wA=(e,t,n)=>{const r=t.getBoundingClientRect(),i=window.getComputedStyle(t),{x:o,y:a}=HOe(e,r),s=2.05*GOe(o,a,r),l=zOe(i,n.tagName),c=VOe(o,a,s,n);qOe(t);let u="";i.position==="static"&&(t.style.position&&(u=t.style.position),t.style.position="relative"),l.appendChild(c),t.appendChild(l);let d=!1;const f=_=>{typeof _<"u"&&(document.removeEventListener("pointerup",f),document.removeEventListener("pointercancel",f)),d?p():d=!0},p=()=>{c.style.transition=`opacity ${n.dissolveDuration}s linear`,c.style.opacity="0",setTimeout(()=>{l.remove(),YOe(t),E2(t)===0&&(WOe(t),t.style.position=u)},n.dissolveDuration*1e3)};document.addEventListener("pointerup",f),document.addEventListener("pointercancel",f);const h=setTimeout(()=>{document.removeEventListener("pointercancel",m),requestAnimationFrame(()=>{c.style.transform="translate(-50%,-50%) scale(1)",c.style.opacity=`${n.finalOpacity}`,setTimeout(()=>f(),n.duration*1e3)})},n.cancellationPeriod),m=()=>{clearTimeout(h),l.remove(),document.removeEventListener("pointerup",f),document.removeEventListener("pointercancel",f),document.removeEventListener("pointercancel",m)};document.addEventListener("pointercancel",m)},rv=new WeakMap,sz=(e={},t="vue3")=>{const n=Object.assign(Object.assign({},Gte),e),r=UOe(t),i=s=>{const l=s.currentTarget.dataset.vWaveTrigger;document.querySelectorAll(`[data-v-wave-boundary="${l}"]`).forEach(u=>wA(s,u,Object.assign(Object.assign({},n),rv.get(u))))},o={[r.mounted](s,{value:l={}}){var c;rv.set(s,l),az(s,(c=l&&l.trigger)!==null&&c!==void 0?c:n.trigger),s.addEventListener("pointerdown",u=>{if(rv.get(s)===!1)return;const d=Object.assign(Object.assign({},n),rv.get(s));if(d.trigger===!1)return wA(u,s,d);if(Hte(d.trigger))return;const f=s.querySelector('[data-v-wave-trigger="true"]');!f&&d.trigger===!0||f&&!u.composedPath().includes(f)||wA(u,s,d)})},[r.updated](s,{value:l={}}){var c;rv.set(s,l),az(s,(c=l&&l.trigger)!==null&&c!==void 0?c:n.trigger)}},a={[r.mounted](s,{arg:l="true"}){s.dataset.vWaveTrigger=l,l!=="true"&&s.addEventListener("pointerdown",i)},[r.updated](s,{arg:l="true"}){s.dataset.vWaveTrigger=l,l==="true"?s.removeEventListener("pointerdown",i):s.addEventListener("pointerdown",i)}};return{wave:o,vWave:o,waveTrigger:a,vWaveTrigger:a}},KOe={install(e,t={}){if(this.installed)return;this.installed=!0;const n=Object.assign(Object.assign({},Gte),t),{vWave:r,vWaveTrigger:i}=sz(n,e);e.directive(n.directive,r),e.directive(`${n.directive}-trigger`,i)},installed:!1,createLocalWaveDirective:sz},{wave:QOe,waveTrigger:XOe}=KOe.createLocalWaveDirective({},"vue3");function uM(){if(window.getSelection){const e=window.getSelection();if(!e)return;e.empty?e.empty():e.removeAllRanges&&(e.removeAllRanges(),Op()&&e.addRange(document.createRange()))}}function fp(e,t,n,r){if(n(t))return!0;for(let i=0,o=t.childNodes.length;i<o;i++)if(fp(t,t.childNodes[i],n,!0))return!0;if(!r){let i=t;for(;i&&i!==e;){let o=i.nextSibling;for(;o;){if(fp(e,o,n,!0))return!0;o=o.nextSibling}i=i.parentNode}}return!1}function JOe(e,t,n){let r;fp(e,e,a=>{if(a.nodeType===Node.TEXT_NODE){const s=a.data.length;return t<=s?(r=a,!0):(t-=s,n-=s,!1)}});let i;r&&fp(e,r,a=>{if(a.nodeType===Node.TEXT_NODE){const s=a.data.length;return n<=s?(i=a,!0):(n-=s,!1)}});const o=document.createRange();return r?t<r.data.length?o.setStart(r,t):o.setStartAfter(r):t===0?o.setStart(e,0):o.setStartAfter(e),i?n<i.data.length?o.setEnd(i,n):o.setEndAfter(i):n===0?o.setEnd(e,0):o.setEndAfter(e),o}function dM(e,t,n){const r=JOe(e,t,n),i=window.getSelection();i.removeAllRanges(),i.addRange(r)}function lz(e,t){if(e.nodeType===Node.TEXT_NODE)return t;let n=0;for(let r=0,i=Math.min(e.childNodes.length,t);r<i;r++){const o=e.childNodes[r];fp(o,o,a=>(a.nodeType===Node.TEXT_NODE&&(n+=a.data.length),!1))}return n}function Yte(e){let t=0,n=0;const r=window.getSelection();for(let i=0,o=r.rangeCount;i<o;i++){const a=r.getRangeAt(i);if(a.intersectsNode(e)){const s=a.startContainer;fp(e,e,c=>{if(s===c)return t+=lz(c,a.startOffset),!0;const u=c.nodeType===Node.TEXT_NODE?c.data.length:0;return t+=u,n+=u,!1});const l=a.endContainer;fp(e,s,c=>{if(l===c)return n+=lz(c,a.endOffset),!0;const u=c.nodeType===Node.TEXT_NODE?c.data.length:0;return n+=u,!1});break}}return[t,n]}function ZOe(e){const t=[];return fp(e,e,n=>(n.nodeType===Node.TEXT_NODE&&t.push(n.data),!1)),t.join("")}function Qm(e){const t=document.createRange(),n=window.getSelection();t.selectNodeContents(e),t.collapse(!1),n.removeAllRanges(),n.addRange(t),e.focus()}const cz=e=>e?"dark-mode":"";function sa(e,t,n){return n<=t?t:Math.min(n,Math.max(t,e))}function eRe(e,t){return e?t.concat(e()):t}const tRe=(e,t="default")=>{var n;return(n=e[t])==null?void 0:n.call(e)},$o=(e,t=1)=>{try{const n=parseInt(e.slice(1,3),16),r=parseInt(e.slice(3,5),16),i=parseInt(e.slice(5,7),16);return t||t===0?"rgba("+n+", "+r+", "+i+", "+t+")":"rgb("+n+", "+r+", "+i+")"}catch{return e}},xE=e=>e.replace(/[^,]+(?=\))/,"1"),DE=e=>{let t;const n=e.replace(/\s/g,"").match(/^rgba?\((\d+),(\d+),(\d+),?([^,\s)]+)?/i),r=(n&&n[4]||"").trim();let i;if(n)i=(n[1]|1<<8).toString(16).slice(1)+(n[2]|1<<8).toString(16).slice(1)+(n[3]|1<<8).toString(16).slice(1);else return e;return r!==""?t=r:t=1,t=(t*255|1<<8).toString(16).slice(1),i=i+t,`#${i}`};var nRe={name:"teleport",props:{to:{type:String,required:!0},where:{type:String,default:"after"},disabled:Boolean},data:function(){return{nodes:[],waiting:!1,observer:null,parent:null}},watch:{to:"maybeMove",where:"maybeMove",disabled:function(t){t?(this.disable(),this.teardownObserver()):(this.bootObserver(),this.move())}},mounted:function(){this.nodes=Array.from(this.$el.childNodes),this.disabled||this.bootObserver(),this.maybeMove()},beforeDestroy:function(){this.disable(),this.teardownObserver()},computed:{classes:function(){return this.disabled?["teleporter"]:["teleporter","hidden"]}},methods:{maybeMove:function(){this.disabled||this.move()},move:function(){if(this.waiting=!1,this.parent=document.querySelector(this.to),!this.parent){this.disable(),this.waiting=!0;return}this.where==="before"?this.parent.prepend(this.getFragment()):this.parent.appendChild(this.getFragment())},disable:function(){this.$el.appendChild(this.getFragment()),this.parent=null},getFragment:function(){var t=document.createDocumentFragment();return this.nodes.forEach(function(n){return t.appendChild(n)}),t},onMutations:function(t){for(var n=this,r=!1,i=0;i<t.length;i++){var o=t[i],a=Array.from(o.addedNodes).filter(function(s){return!n.nodes.includes(s)});Array.from(o.removedNodes).includes(this.parent)?(this.disable(),this.waiting=!this.disabled):this.waiting&&a.length>0&&(r=!0)}r&&this.move()},bootObserver:function(){var t=this;this.observer||(this.observer=new MutationObserver(function(n){return t.onMutations(n)}),this.observer.observe(document.body,{childList:!0,subtree:!0,attributes:!1,characterData:!1}))},teardownObserver:function(){this.observer&&(this.observer.disconnect(),this.observer=null)}}};function rRe(e,t,n,r,i,o,a,s,l,c){typeof a!="boolean"&&(l=s,s=a,a=!1);var u=typeof n=="function"?n.options:n;e&&e.render&&(u.render=e.render,u.staticRenderFns=e.staticRenderFns,u._compiled=!0,i&&(u.functional=!0)),r&&(u._scopeId=r);var d;if(o?(d=function(h){h=h||this.$vnode&&this.$vnode.ssrContext||this.parent&&this.parent.$vnode&&this.parent.$vnode.ssrContext,!h&&typeof __VUE_SSR_CONTEXT__<"u"&&(h=__VUE_SSR_CONTEXT__),t&&t.call(this,l(h)),h&&h._registeredComponents&&h._registeredComponents.add(o)},u._ssrRegister=d):t&&(d=a?function(h){t.call(this,c(h,this.$root.$options.shadowRoot))}:function(h){t.call(this,s(h))}),d)if(u.functional){var f=u.render;u.render=function(m,_){return d.call(_),f(m,_)}}else{var p=u.beforeCreate;u.beforeCreate=p?[].concat(p,d):[d]}return n}var iRe=typeof navigator<"u"&&/msie [6-9]\\b/.test(navigator.userAgent.toLowerCase());function oRe(e){return function(t,n){return aRe(t,n)}}var OA,uz={};function aRe(e,t){var n=iRe?t.media||"default":e,r=uz[n]||(uz[n]={ids:new Set,styles:[]});if(!r.ids.has(e)){r.ids.add(e);var i=t.source;if(t.map&&(i+=`
 /*# sourceURL=`+t.map.sources[0]+" */",i+=`
 /*# sourceMappingURL=data:application/json;base64,`+btoa(unescape(encodeURIComponent(JSON.stringify(t.map))))+" */"),r.element||(r.element=document.createElement("style"),r.element.type="text/css",t.media&&r.element.setAttribute("media",t.media),OA===void 0&&(OA=document.head||document.getElementsByTagName("head")[0]),OA.appendChild(r.element)),"styleSheet"in r.element)r.styles.push(i),r.element.styleSheet.cssText=r.styles.filter(Boolean).join(`
 `);else{var o=r.ids.size-1,a=document.createTextNode(i),s=r.element.childNodes;s[o]&&r.element.removeChild(s[o]),s.length?r.element.insertBefore(a,s[o]):r.element.appendChild(a)}}}var sRe=nRe,Wte=function(){var e=this,t=e.$createElement,n=e._self._c||t;return n("div",{class:e.classes},[e._t("default")],2)},lRe=[];Wte._withStripped=!0;var cRe=function(e){!e||e("data-v-d4e6e290_0",{source:`.hidden[data-v-d4e6e290] {
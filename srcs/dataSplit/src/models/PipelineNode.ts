@@ -12,11 +12,17 @@ export interface ItemMetadata {
     type: string
 }
 
+export type Assignment = 'random' | 'hash' | 'quota'
+
 export interface INodeConfig {
     name: string
     distributeEqually: boolean
     groups: Group[]
     itemMetadata?: boolean
+    assignment?: Assignment
+    hashSalt?: string
+    stratifyLabels?: boolean
+    quotaSyncEvery?: number
     validation: ValidationDescriptor
     ports?: Port[]
 }
@@ -31,6 +37,10 @@ export interface INodeConfig {
  * @property {boolean} body.distributeEqually - Indicates whether the groups should be distributed equally.
  * @property {Group[]} body.groups - An array of groups associated with the node configuration.
  * @property {ItemMetadata} [body.itemMetadata] - The metadata associated with the node configuration.
+ * @property {Assignment} [body.assignment] - How the items are assigned to the groups: random, hash or quota.
+ * @property {string} [body.hashSalt] - The salt of the item ID hash of the hash assignment.
+ * @property {boolean} [body.stratifyLabels] - Whether the quota assignment also balances the labels.
+ * @property {number} [body.quotaSyncEvery] - The number of assignments between syncs of the quota counters.
  * @property {ValidationDescriptor} validation - The validation descriptor for the node configuration.
  * @property {Port[]} [ports] - An array of ports associated with the node configuration.
  */
@@ -40,6 +50,10 @@ export interface INodeConfigJSON {
         distributeEqually: boolean
         groups: Group[]
         itemMetadata?: boolean
+        assignment?: Assignment
+        hashSalt?: string
+        stratifyLabels?: boolean
+        quotaSyncEvery?: number
     }
     validation: ValidationDescriptor
     ports?: Port[]
@@ -61,6 +75,10 @@ const DEFAULT_VALUES = (): INodeConfig => ({
     ],
     distributeEqually: false,
     itemMetadata: true,
+    assignment: 'random',
+    hashSalt: '',
+    stratifyLabels: false,
+    quotaSyncEvery: 50,
     validation: {
         valid: true,
         errors: []
@@ -95,6 +113,10 @@ const NODE_DEFAULT_VALUES = {
  * @property {boolean} distributeEqually - Indicates whether the data should be distributed equally between the groups.
  * @property {Group[]} groups - An array of groups associated with the node configuration.
  * @property {ItemMetadata} [itemMetadata] - The item metadata associated with the node configuration.
+ * @property {Assignment} [assignment] - How the items are assigned to the groups: random, hash or quota.
+ * @property {string} [hashSalt] - The salt of the item ID hash of the hash assignment.
+ * @property {boolean} [stratifyLabels] - Whether the quota assignment also balances the labels.
+ * @property {number} [quotaSyncEvery] - The number of assignments between syncs of the quota counters.
  * @property {ValidationDescriptor} validation - The validation for the node.
  */
 
@@ -171,6 +193,10 @@ export class NodeConfig implements INodeConfig {
     public distributeEqually: boolean
     public groups: Group[]
     public itemMetadata?: boolean
+    public assignment?: Assignment
+    public hashSalt?: string
+    public stratifyLabels?: boolean
+    public quotaSyncEvery?: number
     public validation: ValidationDescriptor
 
     constructor(init?: INodeConfig) {
@@ -181,6 +207,13 @@ export class NodeConfig implements INodeConfig {
         this.groups = init?.groups ?? NodeConfig.DefaultValues.groups
         this.itemMetadata =
             init?.itemMetadata ?? NodeConfig.DefaultValues.itemMetadata
+        this.assignment =
+            init?.assignment ?? NodeConfig.DefaultValues.assignment
+        this.hashSalt = init?.hashSalt ?? NodeConfig.DefaultValues.hashSalt
+        this.stratifyLabels =
+            init?.stratifyLabels ?? NodeConfig.DefaultValues.stratifyLabels
+        this.quotaSyncEvery =
+            init?.quotaSyncEvery ?? NodeConfig.DefaultValues.quotaSyncEvery
         this.validation =
             init?.validation ?? NodeConfig.DefaultValues.validation
     }
@@ -206,6 +239,10 @@ export class NodeConfig implements INodeConfig {
             distributeEqually: json?.distributeEqually,
             groups: json?.groups,
             itemMetadata: json?.itemMetadata,
+            assignment: json?.assignment,
+            hashSalt: json?.hashSalt,
+            stratifyLabels: json?.stratifyLabels,
+            quotaSyncEvery: json?.quotaSyncEvery,
             validation: json?.validation
         }
     }
@@ -216,6 +253,10 @@ export class NodeConfig implements INodeConfig {
             distributeEqually: this.distributeEqually,
             groups: this.groups,
             itemMetadata: this.itemMetadata ?? false,
+            assignment: this.assignment,
+            hashSalt: this.hashSalt,
+            stratifyLabels: this.stratifyLabels,
+            quotaSyncEvery: this.quotaSyncEvery,
             validation: this.validation,
             ports: this.ports
         }
@@ -0,0 +1,31 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# packages served by the stand-in, and the runner modules importing them
+SWAPPED_PACKAGES = ('dtlpy', 'dtlpymetrics', 'modules')
+
+
+def _swapped_modules() -> list:
+    return [name for name in sys.modules if name.split('.')[0] in SWAPPED_PACKAGES]
+
+
+@pytest.fixture
+def fake_backend(monkeypatch, tmp_path):
+    """
+    Serve `dtlpy` and `dtlpymetrics` from the in-memory stand-in of the benchmarks for one test.
+    The runner modules are imported again against the stand-in, and the modules are restored afterwards.
+    """
+    monkeypatch.setenv('ACTIVE_LEARNING_CACHE_DIR', str(tmp_path / 'cache'))
+    saved = {name: sys.modules[name] for name in _swapped_modules()}
+    for name in saved:
+        if name.split('.')[0] == 'modules':
+            del sys.modules[name]
+    from benchmarks import fake_dtlpy
+    yield fake_dtlpy.install()
+    for name in _swapped_modules():
+        del sys.modules[name]
+    sys.modules.update(saved)
@@ -0,0 +1,47 @@
+import pytest
+
+SPLIT_CONFIG = {
+    'groups': [
+        {'name': 'train', 'distribution': 80},
+        {'name': 'validation', 'distribution': 10},
+        {'name': 'test', 'distribution': 10},
+    ],
+    'itemMetadata': True,
+    'assignment': 'quota',
+}
+BASE_SUBSETS = {
+    'train': {'filter': {'metadata.system.tags.train': True}},
+    'validation': {'filter': {'metadata.system.tags.validation': True}},
+}
+
+
+@pytest.fixture
+def base_model(fake_backend):
+    from modules.data_split import DataSplitter
+    dataset = fake_backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    fake_backend.populate_items(dataset=dataset, n_items=50, seed=0)
+    DataSplitter.split_filter(dataset=dataset, query={'filter': {'hidden': False}}, split_config=SPLIT_CONFIG)
+    return fake_backend.create_model(project=dataset.project, dataset=dataset, name='base',
+                                     metadata={'system': {'subsets': BASE_SUBSETS}})
+
+
+@pytest.mark.parametrize('subset', [None, dict()])
+def test_materialize_with_empty_subsets_uses_the_base_model_subsets(base_model, fake_backend, subset):
+    from benchmarks import fake_dtlpy
+    from modules.create_new_model import ModelCreator
+    from modules.manifest import load_manifest
+    pipeline = fake_backend.create_pipeline(node_id='create-node',
+                                            node_metadata={'customNodeConfig': {'modelName': 'new',
+                                                                                'materializeSubsets': True}})
+    context = fake_dtlpy.Context(pipeline=pipeline, node_id='create-node')
+    new_model, _ = ModelCreator.create_new_model(base_model=base_model,
+                                                 dataset=base_model.dataset,
+                                                 train_subset=subset,
+                                                 validation_subset=subset,
+                                                 model_configuration=dict(),
+                                                 context=context)
+    assert new_model.metadata['system']['subsets'] == BASE_SUBSETS
+    manifest = load_manifest(model=new_model)
+    assert len(manifest['train']) == 40
+    assert len(manifest['validation']) == 5
+    assert new_model.metadata['system']['subsetsManifest']['counts'] == {'train': 40, 'validation': 5}
@@ -0,0 +1,226 @@
+import json
+import pytest
+
+SPLIT_CONFIG = {
+    'groups': [
+        {'name': 'train', 'distribution': 80},
+        {'name': 'validation', 'distribution': 10},
+        {'name': 'test', 'distribution': 10},
+    ],
+    'itemMetadata': True,
+}
+QUERY = {'filter': {'hidden': False}}
+
+
+@pytest.fixture
+def dataset(fake_backend):
+    dataset = fake_backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    fake_backend.populate_items(dataset=dataset, n_items=50, seed=0)
+    return dataset
+
+
+def _tags(dataset) -> dict:
+    return {item.id: list(item.metadata.get('system', dict()).get('tags', dict()))
+            for item in dataset._items.values()}
+
+
+@pytest.mark.parametrize('assignment', ['random', 'hash', 'quota'])
+def test_split_filter_with_split_config_outside_of_a_pipeline(dataset, assignment):
+    from modules.data_split import DataSplitter
+    split_config = dict(SPLIT_CONFIG, assignment=assignment)
+    summary = DataSplitter.split_filter(dataset=dataset, query=QUERY, split_config=split_config, page_size=20)
+    assert sum(summary.values()) == 50
+    tags = _tags(dataset)
+    assert all(len(item_tags) == 1 for item_tags in tags.values())
+    if assignment == 'quota':
+        assert summary == {'train': 40, 'validation': 5, 'test': 5}
+
+
+def test_split_filter_as_a_function_node(dataset, fake_backend):
+    from benchmarks import fake_dtlpy
+    from modules.data_split import DataSplitter
+    # a function node has no panel, so no customNodeConfig
+    pipeline = fake_backend.create_pipeline(node_id='batch-node', node_metadata=dict())
+    context = fake_dtlpy.Context(pipeline=pipeline, node_id='batch-node')
+    summary = DataSplitter.split_filter(dataset=dataset, query=QUERY, context=context,
+                                        split_config=json.loads(json.dumps(SPLIT_CONFIG)))
+    assert sum(summary.values()) == 50
+
+
+def test_split_filter_node_config(dataset, fake_backend):
+    from benchmarks import fake_dtlpy
+    from modules.data_split import DataSplitter
+    pipeline = fake_backend.create_pipeline(node_id='split-node', node_metadata={'customNodeConfig': SPLIT_CONFIG})
+    context = fake_dtlpy.Context(pipeline=pipeline, node_id='split-node')
+    summary = DataSplitter.split_filter(dataset=dataset, query=QUERY, context=context)
+    assert sum(summary.values()) == 50
+
+
+@pytest.mark.parametrize('node_metadata', [None, dict()])
+def test_split_filter_without_groups(dataset, fake_backend, node_metadata):
+    from benchmarks import fake_dtlpy
+    from modules.data_split import DataSplitter
+    context = None
+    if node_metadata is not None:
+        pipeline = fake_backend.create_pipeline(node_id='batch-node', node_metadata=node_metadata)
+        context = fake_dtlpy.Context(pipeline=pipeline, node_id='batch-node')
+    with pytest.raises(ValueError, match='split_config'):
+        DataSplitter.split_filter(dataset=dataset, query=QUERY, context=context)
+
+
+def test_export_split_manifest_without_context(dataset):
+    from modules.data_split import DataSplitter
+    from modules.manifest import load_split_manifest
+    DataSplitter.split_filter(dataset=dataset, query=QUERY, split_config=SPLIT_CONFIG)
+    DataSplitter.export_split_manifest(dataset=dataset, query=QUERY)
+    manifest, subsets, _ = load_split_manifest(dataset=dataset)
+    assert len(manifest) == 50
+    assert sorted(subsets) == ['test', 'train', 'validation']
+
+
+def test_export_split_manifest_label_counts(dataset):
+    from modules.data_split import DataSplitter
+    from modules.manifest import load_split_label_counts, load_split_manifest
+    DataSplitter.split_filter(dataset=dataset, query=QUERY, split_config=SPLIT_CONFIG)
+    DataSplitter.export_split_manifest(dataset=dataset, query=QUERY)
+    manifest, subsets, manifest_item = load_split_manifest(dataset=dataset)
+    label_counts, labels = load_split_label_counts(dataset=dataset)
+    assert labels[:3] == ['cat', 'dog', 'bird']
+    assert label_counts.shape == (len(manifest), len(labels))
+    for row, item_id in zip(label_counts, manifest['item_id']):
+        item = dataset._items[item_id.decode()]
+        expected = [sum(annotation.label == label for annotation in item._annotations) for label in labels]
+        assert row.tolist() == expected
+    info = manifest_item.metadata['user']['splitManifest']
+    assert info['labels'] == labels
+    totals = {subset: sum(counts.values()) for subset, counts in info['labelCounts'].items()}
+    assert sum(totals.values()) == int(label_counts.sum())
+
+
+def _quota_state():
+    from modules.subset_assignment import QuotaState
+    return QuotaState(population=['train', 'validation', 'test'], distribution=[80, 10, 10])
+
+
+def test_quota_counters_of_two_replicas(dataset, monkeypatch):
+    from modules import data_split
+    first, second = _quota_state(), _quota_state()
+    monkeypatch.setattr(data_split, 'REPLICA_ID', 'first')
+    for _ in range(30):
+        first.assign()
+    data_split.DataSplitter._sync_quota_state(state=first, dataset=dataset, node_id='split-node')
+    monkeypatch.setattr(data_split, 'REPLICA_ID', 'second')
+    data_split.DataSplitter._sync_quota_state(state=second, dataset=dataset, node_id='split-node')
+    for _ in range(20):
+        second.assign()
+    data_split.DataSplitter._sync_quota_state(state=second, dataset=dataset, node_id='split-node')
+    replicas = dataset.metadata['system']['dataSplit']['split-node']
+    assert sorted(replicas) == ['first', 'second']
+    assert second.counts.tolist() == [40, 5, 5]
+    assert first.n_pending == 0 and second.n_pending == 0
+
+
+def test_quota_counters_stay_pending_on_a_failed_update(dataset, monkeypatch):
+    from modules import data_split
+    state = _quota_state()
+    for _ in range(10):
+        state.assign()
+
+    def failed_update(system_metadata=False):
+        dataset.metadata['system'].pop('dataSplit', None)
+        raise data_split.dl.exceptions.ExceptionMain('503', 'Service Unavailable')
+
+    monkeypatch.setattr(dataset, 'update', failed_update)
+    data_split.DataSplitter._sync_quota_state(state=state, dataset=dataset, node_id='split-node')
+    assert state.n_pending == 10
+    monkeypatch.undo()
+    for _ in range(10):
+        state.assign()
+    data_split.DataSplitter._sync_quota_state(state=state, dataset=dataset, node_id='split-node')
+    assert state.n_pending == 0
+    shared = dataset.metadata['system']['dataSplit']['split-node'][data_split.REPLICA_ID]
+    assert sum(shared['groups'].values()) == 20
+
+
+def test_quota_counters_written_again_when_overwritten(dataset, monkeypatch):
+    import time
+    from modules import data_split
+    state = _quota_state()
+    for _ in range(10):
+        state.assign()
+    updates = list()
+
+    def overwritten_update(system_metadata=False):
+        # another replica writes the counters it read before this update
+        updates.append(system_metadata)
+        if len(updates) == 1:
+            other = {'groups': {'train': 4}, 'syncedAt': time.time()}
+            dataset.metadata['system']['dataSplit'] = {'split-node': {'other': other}}
+        return dataset
+
+    monkeypatch.setattr(dataset, 'update', overwritten_update)
+    data_split.DataSplitter._sync_quota_state(state=state, dataset=dataset, node_id='split-node')
+    assert len(updates) == 2
+    assert state.n_pending == 0
+    assert sorted(dataset.metadata['system']['dataSplit']['split-node']) == ['other', data_split.REPLICA_ID]
+    assert int(state.counts.sum()) == 14
+
+
+def test_split_manifest_updated_at_follows_annotation_edits(dataset):
+    import time
+    import numpy as np
+    from modules.data_split import DataSplitter
+    from modules.manifest import load_split_manifest
+    DataSplitter.split_filter(dataset=dataset, query=QUERY, split_config=SPLIT_CONFIG)
+    DataSplitter.export_split_manifest(dataset=dataset, query=QUERY)
+    before, _, _ = load_split_manifest(dataset=dataset, mmap_mode=None)
+    item = next(item for item in dataset._items.values() if len(item._annotations) > 0)
+    item_updated_at = item.updated_at
+    time.sleep(0.002)
+    item._annotations[0].update()
+    assert item.updated_at == item_updated_at
+    DataSplitter.export_split_manifest(dataset=dataset, query=QUERY)
+    after, _, _ = load_split_manifest(dataset=dataset, mmap_mode=None)
+    changed = before['updated_at'] != after['updated_at']
+    assert after['item_id'][changed].tolist() == [item.id.encode()]
+    latest = max(annotation.updated_at for annotation in item._annotations)
+    assert after['updated_at'][changed][0] == np.datetime64(latest.rstrip('Z'), 'ms').astype(np.int64)
+
+
+def test_quota_counters_fold_stale_replicas(dataset, monkeypatch):
+    import time
+    from modules import data_split
+    replicas = dataset.metadata['system'].setdefault('dataSplit', dict()).setdefault('split-node', dict())
+    stale_at = time.time() - 2 * data_split.QUOTA_STALE_S
+    for i_replica in range(500):
+        replicas[f'worker-{i_replica}'] = {'groups': {'train': 1}, 'labels': dict(), 'syncedAt': stale_at}
+    state = _quota_state()
+    data_split.DataSplitter._sync_quota_state(state=state, dataset=dataset, node_id='split-node')
+    replicas = dataset.metadata['system']['dataSplit']['split-node']
+    assert sorted(replicas) == [data_split.BASE_REPLICA_ID, data_split.REPLICA_ID]
+    assert replicas[data_split.BASE_REPLICA_ID]['groups'] == {'train': 500}
+    assert len(replicas[data_split.BASE_REPLICA_ID]['folded']) == data_split.QUOTA_FOLDED_IDS
+    assert state.counts.tolist() == [500, 0, 0]
+
+
+def test_quota_counters_of_a_folded_idle_replica(dataset, monkeypatch):
+    from modules import data_split
+    idle, active = _quota_state(), _quota_state()
+    monkeypatch.setattr(data_split, 'REPLICA_ID', 'idle')
+    for _ in range(10):
+        idle.assign()
+    data_split.DataSplitter._sync_quota_state(state=idle, dataset=dataset, node_id='split-node')
+    replicas = dataset.metadata['system']['dataSplit']['split-node']
+    replicas['idle']['syncedAt'] -= 2 * data_split.QUOTA_STALE_S
+    # another replica folds the idle one into the base entry
+    monkeypatch.setattr(data_split, 'REPLICA_ID', 'active')
+    data_split.DataSplitter._sync_quota_state(state=active, dataset=dataset, node_id='split-node')
+    assert 'idle' not in replicas
+    monkeypatch.setattr(data_split, 'REPLICA_ID', 'idle')
+    for _ in range(10):
+        idle.assign()
+    data_split.DataSplitter._sync_quota_state(state=idle, dataset=dataset, node_id='split-node')
+    shared = data_split.functools.reduce(data_split.merge_counters,
+                                         [data_split._entry_counters(entry) for entry in replicas.values()], None)
+    assert sum(shared['groups'].values()) == 20
+    assert int(idle.counts.sum()) == 20
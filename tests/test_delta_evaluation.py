@@ -0,0 +1,79 @@
+import time
+import pandas as pd
+import pytest
+
+TEST_SUBSET = {'filter': {'hidden': False}}
+
+
+@pytest.fixture
+def test_items(fake_backend):
+    dataset = fake_backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    items = fake_backend.populate_items(dataset=dataset, n_items=40, seed=0)
+    model = fake_backend.create_model(project=dataset.project, dataset=dataset, name='model')
+    return dataset, model, items
+
+
+def _sorted(scores: pd.DataFrame) -> pd.DataFrame:
+    columns = ['item_id', 'first_id', 'second_id']
+    return scores.astype(object).sort_values(columns, na_position='first').reset_index(drop=True)
+
+
+def _assert_same_as_full(dataset, model, matches):
+    from modules.delta_evaluation import update_item_matches
+    full = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET)
+    pd.testing.assert_frame_equal(_sorted(matches['scores']), _sorted(full['scores']))
+
+
+def test_unchanged_items_are_reused(test_items):
+    from modules.delta_evaluation import update_item_matches
+    dataset, model, items = test_items
+    first = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET)
+    assert first['n_matched'] == len(items)
+    second = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET, previous=first)
+    assert second['n_matched'] == 0
+    pd.testing.assert_frame_equal(_sorted(second['scores']), _sorted(first['scores']))
+
+
+def test_edited_annotation_without_item_update(test_items):
+    from modules.delta_evaluation import update_item_matches
+    dataset, model, items = test_items
+    first = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET)
+    item = next(item for item in items if item.annotations_count > 0)
+    item_updated_at = item.updated_at
+    annotation = item._annotations[0]
+    # the update times have a millisecond resolution, the edit comes after the evaluation
+    time.sleep(0.002)
+    annotation.label = 'bird' if annotation.label != 'bird' else 'cat'
+    annotation.update()
+    # editing an annotation does not touch its item
+    assert item.updated_at == item_updated_at
+    second = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET, previous=first)
+    assert second['n_matched'] == 1
+    assert second['latestUpdate']['updatedAt'] == annotation.updated_at
+    _assert_same_as_full(dataset, model, second)
+
+
+def test_added_and_removed_annotations(test_items, fake_backend):
+    from modules.delta_evaluation import update_item_matches
+    dataset, model, items = test_items
+    first = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET)
+    added_to = items[0]
+    dataset._add_annotation(item=added_to, label='dog',
+                            metadata={'system': dict(), 'user': {'model': {'name': 'model', 'confidence': 0.9}}})
+    removed_from = next(item for item in items[1:] if item.annotations_count > 0)
+    removed_from._annotations.pop()
+    second = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET, previous=first)
+    assert second['n_matched'] == 2
+    _assert_same_as_full(dataset, model, second)
+
+
+def test_items_leaving_the_subset_are_dropped(test_items):
+    from modules.delta_evaluation import update_item_matches
+    dataset, model, items = test_items
+    first = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET)
+    left = next(item for item in items if item.annotations_count > 0)
+    left.hidden = True
+    second = update_item_matches(dataset=dataset, model=model, query=TEST_SUBSET, previous=first)
+    assert second['n_matched'] == 0
+    assert left.id not in set(second['scores']['item_id'])
+    _assert_same_as_full(dataset, model, second)
@@ -0,0 +1,123 @@
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.evaluation import PR_COLUMNS, auc_pr, paired_bootstrap, precision_recall_sweep
+
+IOU_THRESHOLDS = [0.5, 0.75]
+LABELS = ['cat', 'dog']
+
+
+@pytest.fixture
+def scores():
+    # matched annotations of a model: matched pairs, missed ground truth (no second side) and false positives
+    # (no first side), with repeated confidences across labels and inside a label
+    rows = [
+        ('gt1', 'cat', 'p1', 'cat', 0.9, 0.8),
+        ('gt2', 'cat', 'p2', 'cat', 0.9, 0.6),
+        ('gt3', 'dog', 'p3', 'dog', 0.8, 0.9),
+        ('gt4', 'dog', 'p4', 'cat', 0.8, 0.55),
+        (None, None, 'p5', 'dog', 0.8, 0.0),
+        ('gt5', 'cat', 'p6', 'cat', 0.7, 0.76),
+        (None, None, 'p7', 'cat', 0.6, 0.0),
+        ('gt6', 'dog', 'p8', 'dog', 0.6, 0.4),
+        ('gt7', 'dog', None, None, None, 0.0),
+        ('gt8', 'cat', 'p9', 'cat', 0.3, 0.95),
+        (None, None, 'p10', 'dog', 0.3, 0.0),
+    ]
+    return pd.DataFrame(rows, columns=['first_id', 'first_label', 'second_id', 'second_label',
+                                       'second_confidence', 'geometry_score'])
+
+
+def _reference_curves(scores, tmp_path, iou_threshold):
+    """
+    Curves of dtlpymetrics calc_precision_recall (every point), reading the scores from a stand-in dataset
+    """
+    models = pytest.importorskip('dtlpymetrics.scoring.models')
+    scores_file = tmp_path / 'scores.csv'
+    scores.to_csv(scores_file, index=False)
+    scores_item = types.SimpleNamespace(download=lambda **kwargs: str(scores_file))
+    dataset = types.SimpleNamespace(
+        name='dataset',
+        labels=[types.SimpleNamespace(tag=label) for label in LABELS],
+        items=types.SimpleNamespace(list=lambda **kwargs: types.SimpleNamespace(all=lambda: [scores_item])))
+    stand_in = types.SimpleNamespace(Filters=models.dl.Filters,
+                                     datasets=types.SimpleNamespace(get=lambda **kwargs: dataset))
+    original = models.dl
+    models.dl = stand_in
+    try:
+        return models.calc_precision_recall(dataset_id='dataset', model_id='model', iou_threshold=iou_threshold,
+                                            method_type='every_point', each_label=True)
+    finally:
+        models.dl = original
+
+
+def _curves(pr_df):
+    return {key: curve[['precision', 'recall', 'confidence']].to_numpy(dtype=float)
+            for key, curve in pr_df.groupby(['data', 'label_name'], sort=True)}
+
+
+def test_precision_recall_sweep_matches_dtlpymetrics(scores, tmp_path):
+    sweep = precision_recall_sweep(scores=scores, iou_thresholds=IOU_THRESHOLDS, label_names=LABELS,
+                                   dataset_name='dataset')
+    assert list(sweep.columns) == PR_COLUMNS
+    for iou_threshold in IOU_THRESHOLDS:
+        expected = _curves(_reference_curves(scores=scores, tmp_path=tmp_path, iou_threshold=iou_threshold))
+        result = _curves(sweep.loc[sweep['iou_threshold'] == iou_threshold])
+        assert result.keys() == expected.keys()
+        for key in expected:
+            np.testing.assert_allclose(result[key], expected[key], err_msg=f'{key} at IoU {iou_threshold}')
+
+
+def test_precision_recall_sweep_label_without_detections(scores):
+    sweep = precision_recall_sweep(scores=scores, iou_thresholds=0.5, label_names=LABELS + ['bird'])
+    bird = sweep.loc[sweep['label_name'] == 'bird']
+    assert len(bird) == 1
+    assert bird[['precision', 'recall', 'confidence']].to_numpy().tolist() == [[0.0, 0.0, 0.0]]
+
+
+def test_auc_pr_matches_sklearn(scores):
+    metrics = pytest.importorskip('sklearn.metrics')
+    sweep = precision_recall_sweep(scores=scores, iou_thresholds=IOU_THRESHOLDS, label_names=LABELS)
+    areas = auc_pr(sweep)
+    assert len(areas) == len(IOU_THRESHOLDS) * (len(LABELS) + 1)
+    for _, row in areas.iterrows():
+        curve = sweep.loc[(sweep['iou_threshold'] == row['iou_threshold']) &
+                          (sweep['data'] == row['data']) &
+                          (sweep['label_name'] == row['label_name'])]
+        expected = metrics.auc(curve['recall'], curve['precision'])
+        assert row['auc_pr'] == pytest.approx(expected)
+
+
+def test_auc_pr_unordered_points(scores):
+    sweep = precision_recall_sweep(scores=scores, iou_thresholds=IOU_THRESHOLDS, label_names=LABELS)
+    shuffled = sweep.sample(frac=1.0, random_state=0)
+    expected = auc_pr(sweep).set_index(['iou_threshold', 'data', 'label_name'])['auc_pr']
+    result = auc_pr(shuffled).set_index(['iou_threshold', 'data', 'label_name'])['auc_pr']
+    pd.testing.assert_series_equal(result.sort_index(), expected.sort_index())
+
+
+def test_paired_bootstrap_reproducible():
+    differences = np.random.default_rng(0).normal(loc=0.02, scale=0.1, size=500)
+    first = paired_bootstrap(differences, n_resamples=2000, seed=7)
+    second = paired_bootstrap(differences, n_resamples=2000, seed=7)
+    assert first == second
+    assert first['n_items'] == 500
+    assert first['mean'] == pytest.approx(differences.mean())
+    assert first['lower_bound'] < first['mean']
+
+
+def test_paired_bootstrap_binned_reproducible():
+    # more distinct values than bins
+    differences = np.random.default_rng(1).normal(loc=0.1, scale=0.05, size=5000)
+    first = paired_bootstrap(differences, n_resamples=1000, seed=3, n_bins=64)
+    assert first == paired_bootstrap(differences, n_resamples=1000, seed=3, n_bins=64)
+    assert first['significant'] is True
+
+
+def test_paired_bootstrap_no_values():
+    result = paired_bootstrap([np.nan, np.nan], seed=0)
+    assert result['n_items'] == 0
+    assert result['significant'] is False
@@ -0,0 +1,58 @@
+import pytest
+
+from modules import io_executor
+from modules.io_executor import run_concurrently, with_retries
+
+
+class _PlatformError(Exception):
+    def __init__(self, status_code: str):
+        super().__init__(f'status {status_code}')
+        self.status_code = status_code
+
+
+def _failing(errors: list, result='done'):
+    calls = list()
+
+    def _call():
+        calls.append(len(calls))
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return _call, calls
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    delays = list()
+    monkeypatch.setattr(io_executor.time, 'sleep', delays.append)
+    return delays
+
+
+def test_retries_throttling_and_gateway_errors(no_sleep):
+    call, calls = _failing([_PlatformError('429'), _PlatformError('503')])
+    assert with_retries(call, backoff_s=0.1)() == 'done'
+    assert len(calls) == 3
+    assert len(no_sleep) == 2
+    # exponential backoff with jitter
+    assert 0.05 <= no_sleep[0] <= 0.1
+    assert 0.1 <= no_sleep[1] <= 0.2
+
+
+def test_other_errors_are_raised_at_once(no_sleep):
+    call, calls = _failing([_PlatformError('400')])
+    with pytest.raises(_PlatformError):
+        with_retries(call)()
+    assert len(calls) == 1
+    assert no_sleep == []
+
+
+def test_gives_up_after_max_retries(no_sleep):
+    call, calls = _failing([_PlatformError('429')] * 3)
+    with pytest.raises(_PlatformError):
+        with_retries(call, max_retries=2)()
+    assert len(calls) == 3
+
+
+def test_run_concurrently_keeps_the_call_order():
+    assert run_concurrently(*[with_retries(lambda value=value: value) for value in range(5)]) == list(range(5))
@@ -0,0 +1,52 @@
+import pytest
+
+TEST_SUBSET = {'filter': {'hidden': False}}
+
+
+@pytest.fixture
+def evaluated_dataset(fake_backend):
+    dataset = fake_backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    fake_backend.populate_items(dataset=dataset, n_items=30, seed=0)
+    model = fake_backend.create_model(project=dataset.project, dataset=dataset, name='model')
+    return dataset, model
+
+
+def test_evaluate_skips_entries_that_are_not_metrics(evaluated_dataset):
+    from modules.model_compare import ModelComparer
+    dataset, model = evaluated_dataset
+    compare_config = {
+        'precision_recall': {'iou_threshold': [0.5, 0.75], 'min_delta': 0, 'test_subset': TEST_SUBSET},
+        'annotation_scores': {'test_subset': TEST_SUBSET},
+        'wins': 'any',
+        'unknown_metric': {'test_subset': TEST_SUBSET},
+    }
+    evaluation = ModelComparer._evaluate(model=model, dataset=dataset, compare_config=compare_config)
+    assert set(evaluation) == {'precision_recall', 'annotation_scores'}
+    assert set(evaluation['precision_recall']['iou_threshold']) == {0.5, 0.75}
+    assert len(evaluation['annotation_scores']) > 0
+
+
+def test_compare_with_annotation_scores_only(evaluated_dataset, fake_backend, monkeypatch):
+    from benchmarks import fake_dtlpy
+    from modules.model_compare import ModelComparer
+    dataset, model = evaluated_dataset
+    candidate = fake_backend.create_model(project=dataset.project, dataset=dataset, name='candidate')
+    compare_config = {'annotation_scores': {'test_subset': TEST_SUBSET, 'n_resamples': 200}}
+    assert 'precision_recall' not in ModelComparer._prepare_compare_config(dict(compare_config))
+
+    def no_precision_recall(*args, **kwargs):
+        raise AssertionError('precision recall evaluated without a precision_recall entry')
+
+    monkeypatch.setattr(ModelComparer, '_calc_precision_recall', staticmethod(no_precision_recall))
+    pipeline = fake_backend.create_pipeline(node_id='compare-node', node_metadata=dict())
+    context = fake_dtlpy.Context(pipeline=pipeline, node_id='compare-node')
+    progress = fake_dtlpy.Progress()
+    winner, ranking = ModelComparer.compare_models_tournament(previous_model=model,
+                                                              candidate_models=[candidate],
+                                                              progress=progress,
+                                                              context=context,
+                                                              compare_config=compare_config,
+                                                              dataset=dataset)
+    assert ranking['previous_model_score'] is not None
+    assert progress.actions in (['update model'], ['discard'])
+    assert winner.id == (candidate.id if ranking['ranking'][0]['won'] else model.id)
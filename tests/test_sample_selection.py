@@ -0,0 +1,40 @@
+import pytest
+
+SPLIT_CONFIG = {
+    'groups': [
+        {'name': 'train', 'distribution': 80},
+        {'name': 'validation', 'distribution': 10},
+        {'name': 'test', 'distribution': 10},
+    ],
+    'itemMetadata': True,
+    'assignment': 'quota',
+}
+POOL = {'filter': {'$and': [{'hidden': False}, {'metadata.system.tags': {'$exists': False}}]}}
+
+
+@pytest.mark.parametrize('strategy', ['uncertainty', 'coreset'])
+def test_selection_to_batch_split(fake_backend, strategy):
+    from benchmarks import fake_dtlpy
+    from modules.data_split import DataSplitter
+    from modules.sample_selection import SampleSelector
+    dataset = fake_backend.create_dataset(labels=['cat', 'dog', 'bird'])
+    items = fake_backend.populate_items(dataset=dataset, n_items=60, model_annotation_ratio=0.0, seed=0)
+    model = fake_backend.create_model(project=dataset.project, dataset=dataset, name='model')
+    if strategy == 'coreset':
+        fake_backend.add_embeddings(dataset=dataset, items=items, dim=8, model=model)
+    else:
+        fake_backend.add_predictions(dataset=dataset, model=model, items=items, predictions_per_item=2)
+    pipeline = fake_backend.create_pipeline(node_id='selection-node',
+                                            node_metadata={'customNodeConfig': {'strategy': strategy,
+                                                                                'sampleSize': 20}})
+    context = fake_dtlpy.Context(pipeline=pipeline, node_id='selection-node')
+
+    selection = SampleSelector.select_samples(dataset=dataset, model=model, query=POOL, context=context)
+    # the selection output is the query input of the batch split node, a function node without a panel
+    summary = DataSplitter.split_filter(dataset=dataset, query=selection, split_config=SPLIT_CONFIG)
+
+    assert summary == {'train': 16, 'validation': 2, 'test': 2}
+    selected = [item for item in items if 'activeLearning' in item.metadata.get('user', dict())]
+    assert len(selected) == 20
+    tagged = [item for item in items if item.metadata.get('system', dict()).get('tags')]
+    assert sorted(item.id for item in tagged) == sorted(item.id for item in selected)
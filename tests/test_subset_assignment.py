@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from modules.subset_assignment import FNV_OFFSET, _fnv1a, assign_by_hash, hash_ids
+
+MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def _reference_hash(item_id: str, salt: str = '') -> int:
+    # byte by byte FNV-1a of salt + id, then the murmur3 64-bit finalizer
+    state = FNV_OFFSET
+    for byte in (salt + item_id).encode('utf-8'):
+        state = ((state ^ byte) * 0x100000001b3) & MASK
+    state ^= state >> 33
+    state = (state * 0xff51afd7ed558ccd) & MASK
+    state ^= state >> 33
+    state = (state * 0xc4ceb9fe1a85ec53) & MASK
+    state ^= state >> 33
+    return state
+
+
+@pytest.mark.parametrize('data, expected', [
+    (b'', 0xcbf29ce484222325),
+    (b'a', 0xaf63dc4c8601ec8c),
+    (b'foobar', 0x85944171f73967e8),
+])
+def test_fnv1a_known_values(data, expected):
+    assert _fnv1a(data) == expected
+
+
+def test_hash_ids_known_values():
+    hashes = hash_ids(['a', '64f1c2a9e3b7d1004d5e6f70', 'item-1'])
+    assert hashes.dtype == np.uint64
+    assert [int(value) for value in hashes] == [0x82a2a958a9bece5b, 0xb541c27d94b135c1, 0xe3d58280f7f95788]
+    assert int(hash_ids(['a'], salt='salt')[0]) == 0xb24d62b7ac89fe94
+
+
+def test_hash_ids_matches_scalar_reference():
+    # ids of different lengths, padded to the longest id in the vectorized pass
+    item_ids = ['', 'x', 'item-1', 'item-10', '64f1c2a9e3b7d1004d5e6f70', '64f1c2a9e3b7d1004d5e6f7']
+    for salt in ('', 'salt'):
+        assert [int(value) for value in hash_ids(item_ids, salt=salt)] == \
+               [_reference_hash(item_id, salt=salt) for item_id in item_ids]
+
+
+def test_hash_ids_independent_of_batch():
+    item_ids = [f'item-{i}' for i in range(100)]
+    batched = hash_ids(item_ids)
+    assert all(int(hash_ids([item_id])[0]) == int(value) for item_id, value in zip(item_ids, batched))
+    assert hash_ids([]).size == 0
+
+
+def test_assign_by_hash_distribution():
+    item_ids = [f'{i:024x}' for i in range(20000)]
+    indices = assign_by_hash(item_ids, distribution=[80, 10, 10])
+    np.testing.assert_array_equal(indices, assign_by_hash(item_ids, distribution=[80, 10, 10]))
+    shares = np.bincount(indices, minlength=3) / len(item_ids)
+    np.testing.assert_allclose(shares, [0.8, 0.1, 0.1], atol=0.01)
+    assert not np.array_equal(indices, assign_by_hash(item_ids, distribution=[80, 10, 10], salt='other'))